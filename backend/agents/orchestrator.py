@@ -14,6 +14,8 @@ import asyncio
 import json
 import logging
 import re
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import Any, AsyncGenerator, Sequence
@@ -31,6 +33,7 @@ from services.llm_adapter import (
     LLMConfig,
     OpenAIAdapter,
     StreamEvent,
+    SystemPrompt,
     get_adapter,
 )
 from services.llm_provider import resolve_llm_config
@@ -188,6 +191,68 @@ def _should_include_cross_conversation_history(user_message: str) -> bool:
     return any(pattern.search(text) for pattern in _CROSS_CONVERSATION_HISTORY_TRIGGER_PATTERNS)
 
 
+def _empty_context_profile() -> dict[str, Any]:
+    return {
+        "user_memories": [],
+        "job_memories": [],
+        "membership_title": None,
+        "reports_to_name": None,
+        "phone_number": None,
+        "participant_job_memories": [],
+        "global_command_memory": None,
+        "channel_personality_memory": None,
+        "is_private_memory_context": False,
+    }
+
+
+class _TurnSetup:
+    """Run a turn's setup loads concurrently, each after the stages it needs.
+
+    Every stage opens its own DB session, so independent stages overlap
+    instead of adding up on time-to-first-token. Timings are per stage,
+    excluding time spent waiting on dependencies.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._started: float = time.perf_counter()
+        self.timings_ms: dict[str, float] = {}
+
+    def add(
+        self,
+        name: str,
+        load: Callable[[], Awaitable[Any]],
+        *,
+        after: Sequence[str] = (),
+    ) -> None:
+        dependencies: list[asyncio.Task[Any]] = [self._tasks[dep] for dep in after if dep in self._tasks]
+
+        async def _run() -> Any:
+            if dependencies:
+                await asyncio.gather(*dependencies)
+            started: float = time.perf_counter()
+            try:
+                return await load()
+            finally:
+                self.timings_ms[name] = (time.perf_counter() - started) * 1000
+
+        self._tasks[name] = asyncio.create_task(_run())
+
+    async def results(self) -> dict[str, Any]:
+        """Wait for every stage; on failure cancel the rest and re-raise."""
+        try:
+            values: list[Any] = await asyncio.gather(*self._tasks.values())
+        except BaseException:
+            for task in self._tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(self._tasks, values))
+
+    def summary(self) -> str:
+        stages: str = " ".join(f"{name}={ms:.0f}ms" for name, ms in self.timings_ms.items())
+        return f"total={(time.perf_counter() - self._started) * 1000:.0f}ms {stages}"
+
+
 async def update_tool_result(
     conversation_id: str,
     tool_id: str,
@@ -648,6 +713,16 @@ class ChatOrchestrator:
             self._phone_number = None
 
     async def _build_systems_manifest(self) -> str | None:
+        """Return the connectors manifest, cached per organization (see services.context_cache)."""
+        from services.context_cache import get_or_load
+
+        try:
+            return await get_or_load("manifest", self.organization_id, (), self._render_systems_manifest)
+        except Exception:
+            logger.warning("Failed to build connectors manifest", exc_info=True)
+            return None
+
+    async def _render_systems_manifest(self) -> str | None:
         """Build a compact manifest of connected systems (names, capabilities, action names only).
 
         Full parameter docs are fetched on demand via get_connector_docs(connector).
@@ -655,112 +730,134 @@ class ChatOrchestrator:
         from connectors.registry import ConnectorMeta, discover_connectors, resolve_connector
         from models.integration import Integration
 
-        try:
-            async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
-                result = await session.execute(
-                    select(
-                        Integration.connector,
-                        Integration.last_sync_at,
-                        Integration.last_error,
-                        Integration.extra_data,
-                    )
-                    .where(
-                        Integration.organization_id == UUID(self.organization_id),
-                        Integration.is_active == True,  # noqa: E712
-                    )
-                    .order_by(Integration.connector)
+        async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
+            result = await session.execute(
+                select(
+                    Integration.connector,
+                    Integration.last_sync_at,
+                    Integration.last_error,
+                    Integration.extra_data,
                 )
-                rows = result.all()
-
-            active_providers: dict[str, dict[str, Any]] = {}
-            for row in rows:
-                active_providers[row[0]] = {
-                    "last_sync": row[1],
-                    "last_error": row[2],
-                    "extra_data": row[3],
-                }
+                .where(
+                    Integration.organization_id == UUID(self.organization_id),
+                    Integration.is_active == True,  # noqa: E712
+                )
+                .order_by(Integration.connector)
+            )
+            rows = result.all()
+
+        active_providers: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            active_providers[row[0]] = {
+                "last_sync": row[1],
+                "last_error": row[2],
+                "extra_data": row[3],
+            }
+
+        registry = discover_connectors()
+        all_slugs: set[str] = set(registry.keys()) | set(active_providers.keys())
+
+        lines: list[str] = [
+            "Call `get_connector_docs(connector)` to get detailed usage instructions and parameter reference before using a connector for the first time.",
+            "Cached query shortcuts: google_drive supports search:<text>, search:spreadsheet|document|presentation, type:spreadsheet|document|presentation, and file:<external_id>.",
+            "",
+        ]
+        for slug in sorted(all_slugs):
+            if slug not in active_providers:
+                continue
+            # Skip the base "mcp" template — only show dynamic mcp_* instances
+            if slug == "mcp":
+                continue
 
-            registry = discover_connectors()
-            all_slugs: set[str] = set(registry.keys()) | set(active_providers.keys())
+            connector_cls = resolve_connector(slug)
+            if connector_cls is None:
+                continue
 
-            lines: list[str] = [
-                "Call `get_connector_docs(connector)` to get detailed usage instructions and parameter reference before using a connector for the first time.",
-                "Cached query shortcuts: google_drive supports search:<text>, search:spreadsheet|document|presentation, type:spreadsheet|document|presentation, and file:<external_id>.",
-                "",
+            meta: ConnectorMeta = connector_cls.meta  # type: ignore[attr-defined]
+            caps: str = ", ".join(c.value for c in meta.capabilities)
+
+            provider_info: dict[str, Any] | None = active_providers.get(slug)
+            sync_status: str = ""
+            if provider_info:
+                if provider_info["last_error"]:
+                    sync_status = " (last sync failed)"
+                elif provider_info["last_sync"]:
+                    sync_status = f" (synced {provider_info['last_sync'].strftime('%Y-%m-%d %H:%M')} UTC)"
+
+            is_dynamic_mcp: bool = slug.startswith("mcp_")
+            extra: dict[str, Any] = (provider_info or {}).get("extra_data") or {}
+            display_name: str = extra.get("display_name", slug) if is_dynamic_mcp else meta.name
+
+            summary: str = meta.description or ""
+            action_names: list[str] = []
+            if meta.write_operations:
+                action_names.extend(op.name for op in meta.write_operations)
+            if meta.actions:
+                action_names.extend(act.name for act in meta.actions)
+            action_str: str = f" Actions: {', '.join(action_names)}" if action_names else ""
+
+            label: str = f"- **{slug}** ({display_name}) [{caps}]{sync_status} – {summary}{action_str}"
+            if is_dynamic_mcp:
+                mcp_tools: list[dict[str, Any]] = extra.get("tools", [])
+                if mcp_tools:
+                    tool_names: list[str] = [
+                        t.get("name", "") for t in mcp_tools if isinstance(t, dict)
+                    ]
+                    label += f" MCP tools: {', '.join(tool_names)}"
+            lines.append(label)
+
+        connected_block: str = (
+            "\n".join(lines) if len(lines) > 2 else "No connectors are currently connected."
+        )
+
+        # List connectors that exist but are not enabled for this org (no active Integration).
+        not_enabled_slugs: list[str] = sorted(
+            slug for slug in (set(registry.keys()) - set(active_providers.keys()))
+            if slug != "mcp"
+        )
+        not_enabled_block: str = ""
+        if not_enabled_slugs:
+            not_enabled_lines: list[str] = [
+                f"- **{slug}** ({registry[slug].meta.name})"  # type: ignore[attr-defined]
+                for slug in not_enabled_slugs
             ]
-            for slug in sorted(all_slugs):
-                if slug not in active_providers:
-                    continue
-                # Skip the base "mcp" template — only show dynamic mcp_* instances
-                if slug == "mcp":
-                    continue
-
-                connector_cls = resolve_connector(slug)
-                if connector_cls is None:
-                    continue
-
-                meta: ConnectorMeta = connector_cls.meta  # type: ignore[attr-defined]
-                caps: str = ", ".join(c.value for c in meta.capabilities)
-
-                provider_info: dict[str, Any] | None = active_providers.get(slug)
-                sync_status: str = ""
-                if provider_info:
-                    if provider_info["last_error"]:
-                        sync_status = " (last sync failed)"
-                    elif provider_info["last_sync"]:
-                        sync_status = f" (synced {provider_info['last_sync'].strftime('%Y-%m-%d %H:%M')} UTC)"
-
-                is_dynamic_mcp: bool = slug.startswith("mcp_")
-                extra: dict[str, Any] = (provider_info or {}).get("extra_data") or {}
-                display_name: str = extra.get("display_name", slug) if is_dynamic_mcp else meta.name
-
-                summary: str = meta.description or ""
-                action_names: list[str] = []
-                if meta.write_operations:
-                    action_names.extend(op.name for op in meta.write_operations)
-                if meta.actions:
-                    action_names.extend(act.name for act in meta.actions)
-                action_str: str = f" Actions: {', '.join(action_names)}" if action_names else ""
-
-                label: str = f"- **{slug}** ({display_name}) [{caps}]{sync_status} – {summary}{action_str}"
-                if is_dynamic_mcp:
-                    mcp_tools: list[dict[str, Any]] = extra.get("tools", [])
-                    if mcp_tools:
-                        tool_names: list[str] = [
-                            t.get("name", "") for t in mcp_tools if isinstance(t, dict)
-                        ]
-                        label += f" MCP tools: {', '.join(tool_names)}"
-                lines.append(label)
-
-            connected_block: str = (
-                "\n".join(lines) if len(lines) > 2 else "No connectors are currently connected."
+            not_enabled_block = (
+                "\n\n## Connectors not currently enabled\n"
+                + "\n".join(not_enabled_lines)
+                + "\n\nDo **not** call query_on_connector, write_on_connector, or run_on_connector for any of these — they are not connected. "
+                "If the user asks for something that would need one of them, offer to help them connect it using "
+                "`initiate_connector` which will open the OAuth authorization flow in their browser."
             )
 
-            # List connectors that exist but are not enabled for this org (no active Integration).
-            not_enabled_slugs: list[str] = sorted(
-                slug for slug in (set(registry.keys()) - set(active_providers.keys()))
-                if slug != "mcp"
-            )
-            not_enabled_block: str = ""
-            if not_enabled_slugs:
-                not_enabled_lines: list[str] = [
-                    f"- **{slug}** ({registry[slug].meta.name})"  # type: ignore[attr-defined]
-                    for slug in not_enabled_slugs
-                ]
-                not_enabled_block = (
-                    "\n\n## Connectors not currently enabled\n"
-                    + "\n".join(not_enabled_lines)
-                    + "\n\nDo **not** call query_on_connector, write_on_connector, or run_on_connector for any of these — they are not connected. "
-                    "If the user asks for something that would need one of them, offer to help them connect it using "
-                    "`initiate_connector` which will open the OAuth authorization flow in their browser."
-                )
+        return (connected_block + not_enabled_block) if (connected_block or not_enabled_block) else None
+
+    async def _load_context_profile(self) -> dict[str, Any]:
+        """Return the context profile, cached per organization, user and conversation.
+
+        See _query_context_profile for the keys. The phone number always comes
+        from this turn's user context rather than the cache.
+        """
+        from services.context_cache import get_or_load
 
-            return (connected_block + not_enabled_block) if (connected_block or not_enabled_block) else None
+        user_uuid: UUID | None = self._resolve_current_user_uuid()
+        workflow_slack_channel_id: str | None = _normalize_channel_scope_id(
+            "slack",
+            str((self.workflow_context or {}).get("slack_channel_id") or ""),
+        )
+        try:
+            profile: dict[str, Any] = await get_or_load(
+                "profile",
+                self.organization_id,
+                (str(user_uuid) if user_uuid else None, self.conversation_id, workflow_slack_channel_id),
+                self._query_context_profile,
+            )
         except Exception:
-            logger.warning("Failed to build connectors manifest", exc_info=True)
-            return None
+            logger.warning("Failed to load context profile", exc_info=True)
+            profile = _empty_context_profile()
+        profile["phone_number"] = getattr(self, "_phone_number", None)
+        return profile
 
-    async def _load_context_profile(self) -> dict[str, Any]:
+    async def _query_context_profile(self) -> dict[str, Any]:
         """Load the two-tier context profile: user and job memories + structured fields.
 
         Returns a dict with keys:
@@ -772,206 +869,192 @@ class ChatOrchestrator:
         """
         from models.org_member import OrgMember
 
-        profile: dict[str, Any] = {
-            "user_memories": [],
-            "job_memories": [],
-            "membership_title": None,
-            "reports_to_name": None,
-            "phone_number": getattr(self, "_phone_number", None),
-            "participant_job_memories": [],
-            "global_command_memory": None,
-            "channel_personality_memory": None,
-            "is_private_memory_context": False,
-        }
+        profile: dict[str, Any] = _empty_context_profile()
 
-        try:
-            async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
-                # Load all memories for this org in one query, then split by entity_type
-                result = await session.execute(
-                    select(Memory)
-                    .where(Memory.organization_id == UUID(self.organization_id))  # type: ignore[arg-type]
-                    .where(
-                        Memory.entity_type.in_(["user", "organization_member"])
-                    )
-                    .order_by(Memory.created_at.asc())
+        async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
+            # Load all memories for this org in one query, then split by entity_type
+            result = await session.execute(
+                select(Memory)
+                .where(Memory.organization_id == UUID(self.organization_id))  # type: ignore[arg-type]
+                .where(
+                    Memory.entity_type.in_(["user", "organization_member"])
                 )
-                all_memories: list[Memory] = list(result.scalars().all())
+                .order_by(Memory.created_at.asc())
+            )
+            all_memories: list[Memory] = list(result.scalars().all())
 
-                participant_user_ids: list[UUID] = []
-                conversation_scope: str | None = None
-                conversation_source: str | None = None
-                normalized_channel_id: str | None = None
-                if self.conversation_id:
-                    conversation_result = await session.execute(
-                        select(
-                            Conversation.participating_user_ids,
-                            Conversation.scope,
-                            Conversation.source,
-                            Conversation.source_channel_id,
-                        )
-                        .where(Conversation.id == UUID(self.conversation_id))
-                        .limit(1)
+            participant_user_ids: list[UUID] = []
+            conversation_scope: str | None = None
+            conversation_source: str | None = None
+            normalized_channel_id: str | None = None
+            if self.conversation_id:
+                conversation_result = await session.execute(
+                    select(
+                        Conversation.participating_user_ids,
+                        Conversation.scope,
+                        Conversation.source,
+                        Conversation.source_channel_id,
                     )
-                    conversation_row = conversation_result.one_or_none()
-                    if conversation_row:
-                        participant_user_ids = list(conversation_row[0] or [])
-                        conversation_scope = conversation_row[1]
-                        conversation_source = conversation_row[2]
-                        normalized_channel_id = _normalize_channel_scope_id(
-                            conversation_source,
-                            conversation_row[3],
-                        )
-                        profile["is_private_memory_context"] = _is_private_memory_context(
-                            source=conversation_source,
-                            scope=conversation_scope,
-                            normalized_channel_id=normalized_channel_id,
-                        )
-                workflow_slack_channel_id: str | None = _normalize_channel_scope_id(
-                    "slack",
-                    str((self.workflow_context or {}).get("slack_channel_id") or ""),
+                    .where(Conversation.id == UUID(self.conversation_id))
+                    .limit(1)
                 )
-                if workflow_slack_channel_id:
-                    if not normalized_channel_id:
-                        normalized_channel_id = workflow_slack_channel_id
-                    if not conversation_source:
-                        conversation_source = "slack"
-                    if workflow_slack_channel_id.startswith("D"):
-                        profile["is_private_memory_context"] = True
-
-                user_uuid: UUID | None = self._resolve_current_user_uuid()
-                org_uuid: UUID = UUID(self.organization_id)  # type: ignore[arg-type]
-
-                # Look up the user's org membership for structured fields
-                membership_id: UUID | None = None
-                if user_uuid:
-                    mem_result = await session.execute(
-                        select(OrgMember).where(
-                            OrgMember.user_id == user_uuid,
-                            OrgMember.organization_id == org_uuid,
-                        )
+                conversation_row = conversation_result.one_or_none()
+                if conversation_row:
+                    participant_user_ids = list(conversation_row[0] or [])
+                    conversation_scope = conversation_row[1]
+                    conversation_source = conversation_row[2]
+                    normalized_channel_id = _normalize_channel_scope_id(
+                        conversation_source,
+                        conversation_row[3],
                     )
-                    membership: OrgMember | None = mem_result.scalar_one_or_none()
-                    if membership:
-                        membership_id = membership.id
-                        profile["membership_title"] = membership.title
-
-                        # Resolve reports_to name
-                        if membership.reports_to_membership_id:
-                            mgr_result = await session.execute(
-                                select(OrgMember).where(
-                                    OrgMember.id == membership.reports_to_membership_id
-                                )
+                    profile["is_private_memory_context"] = _is_private_memory_context(
+                        source=conversation_source,
+                        scope=conversation_scope,
+                        normalized_channel_id=normalized_channel_id,
+                    )
+            workflow_slack_channel_id: str | None = _normalize_channel_scope_id(
+                "slack",
+                str((self.workflow_context or {}).get("slack_channel_id") or ""),
+            )
+            if workflow_slack_channel_id:
+                if not normalized_channel_id:
+                    normalized_channel_id = workflow_slack_channel_id
+                if not conversation_source:
+                    conversation_source = "slack"
+                if workflow_slack_channel_id.startswith("D"):
+                    profile["is_private_memory_context"] = True
+
+            user_uuid: UUID | None = self._resolve_current_user_uuid()
+            org_uuid: UUID = UUID(self.organization_id)  # type: ignore[arg-type]
+
+            # Look up the user's org membership for structured fields
+            membership_id: UUID | None = None
+            if user_uuid:
+                mem_result = await session.execute(
+                    select(OrgMember).where(
+                        OrgMember.user_id == user_uuid,
+                        OrgMember.organization_id == org_uuid,
+                    )
+                )
+                membership: OrgMember | None = mem_result.scalar_one_or_none()
+                if membership:
+                    membership_id = membership.id
+                    profile["membership_title"] = membership.title
+
+                    # Resolve reports_to name
+                    if membership.reports_to_membership_id:
+                        mgr_result = await session.execute(
+                            select(OrgMember).where(
+                                OrgMember.id == membership.reports_to_membership_id
                             )
-                            mgr: OrgMember | None = mgr_result.scalar_one_or_none()
-                            if mgr:
-                                from models.user import User
-
-                                mgr_user_result = await session.execute(
-                                    select(User.name).where(User.id == mgr.user_id)
-                                )
-                                mgr_name: str | None = mgr_user_result.scalar_one_or_none()
-                                title_suffix: str = f" ({mgr.title})" if mgr.title else ""
-                                profile["reports_to_name"] = (
-                                    f"{mgr_name}{title_suffix}" if mgr_name else None
-                                )
-
-                # Split memories by entity_type
-                for mem in all_memories:
-                    entry: dict[str, str] = {"id": str(mem.id), "content": mem.content}
-                    if mem.entity_type == "user" and user_uuid and mem.entity_id == user_uuid:
-                        if mem.category == "global_commands":
-                            profile["global_command_memory"] = entry
-                            continue
-                        profile["user_memories"].append(entry)
-                    elif (
-                        mem.entity_type == "organization_member"
-                        and membership_id
-                        and mem.entity_id == membership_id
-                    ):
-                        profile["job_memories"].append(entry)
-
-                # Include role memories from org_members for all participants in this conversation.
-                if not participant_user_ids and user_uuid:
-                    participant_user_ids = [user_uuid]
+                        )
+                        mgr: OrgMember | None = mgr_result.scalar_one_or_none()
+                        if mgr:
+                            from models.user import User
 
-                if participant_user_ids:
-                    from models.user import User
+                            mgr_user_result = await session.execute(
+                                select(User.name).where(User.id == mgr.user_id)
+                            )
+                            mgr_name: str | None = mgr_user_result.scalar_one_or_none()
+                            title_suffix: str = f" ({mgr.title})" if mgr.title else ""
+                            profile["reports_to_name"] = (
+                                f"{mgr_name}{title_suffix}" if mgr_name else None
+                            )
 
-                    members_result = await session.execute(
-                        select(OrgMember.id, OrgMember.user_id, OrgMember.title, User.name)
-                        .join(User, User.id == OrgMember.user_id)
-                        .where(
-                            OrgMember.organization_id == org_uuid,
-                            OrgMember.user_id.in_(participant_user_ids),
-                        )
+            # Split memories by entity_type
+            for mem in all_memories:
+                entry: dict[str, str] = {"id": str(mem.id), "content": mem.content}
+                if mem.entity_type == "user" and user_uuid and mem.entity_id == user_uuid:
+                    if mem.category == "global_commands":
+                        profile["global_command_memory"] = entry
+                        continue
+                    profile["user_memories"].append(entry)
+                elif (
+                    mem.entity_type == "organization_member"
+                    and membership_id
+                    and mem.entity_id == membership_id
+                ):
+                    profile["job_memories"].append(entry)
+
+            # Include role memories from org_members for all participants in this conversation.
+            if not participant_user_ids and user_uuid:
+                participant_user_ids = [user_uuid]
+
+            if participant_user_ids:
+                from models.user import User
+
+                members_result = await session.execute(
+                    select(OrgMember.id, OrgMember.user_id, OrgMember.title, User.name)
+                    .join(User, User.id == OrgMember.user_id)
+                    .where(
+                        OrgMember.organization_id == org_uuid,
+                        OrgMember.user_id.in_(participant_user_ids),
                     )
-                    member_rows = members_result.all()
-                    membership_by_user_id: dict[UUID, tuple[UUID, str | None, str | None]] = {
-                        row[1]: (row[0], row[2], row[3]) for row in member_rows
-                    }
-
-                    for participant_user_id in participant_user_ids:
-                        membership = membership_by_user_id.get(participant_user_id)
-                        if not membership:
-                            continue
+                )
+                member_rows = members_result.all()
+                membership_by_user_id: dict[UUID, tuple[UUID, str | None, str | None]] = {
+                    row[1]: (row[0], row[2], row[3]) for row in member_rows
+                }
 
-                        participant_membership_id, participant_title, participant_name = membership
-                        participant_role_memories = [
-                            {"id": str(mem.id), "content": mem.content}
-                            for mem in all_memories
-                            if (
-                                mem.entity_type == "organization_member"
-                                and mem.entity_id == participant_membership_id
-                            )
-                        ]
+                for participant_user_id in participant_user_ids:
+                    membership = membership_by_user_id.get(participant_user_id)
+                    if not membership:
+                        continue
 
-                        profile["participant_job_memories"].append(
-                            {
-                                "user_id": str(participant_user_id),
-                                "membership_id": str(participant_membership_id),
-                                "name": participant_name,
-                                "title": participant_title,
-                                "is_most_recent": participant_user_id == user_uuid,
-                                "memories": participant_role_memories,
-                            }
+                    participant_membership_id, participant_title, participant_name = membership
+                    participant_role_memories = [
+                        {"id": str(mem.id), "content": mem.content}
+                        for mem in all_memories
+                        if (
+                            mem.entity_type == "organization_member"
+                            and mem.entity_id == participant_membership_id
                         )
-
-                    missing_members = [
-                        str(participant_user_id)
-                        for participant_user_id in participant_user_ids
-                        if participant_user_id not in membership_by_user_id
                     ]
-                    if missing_members:
-                        logger.info(
-                            "Missing org_members rows for participants org=%s conversation=%s participants=%s",
-                            self.organization_id,
-                            self.conversation_id,
-                            missing_members,
-                        )
 
-                if normalized_channel_id and conversation_source:
-                    normalized_source: str = conversation_source.strip().lower()
-                    channel_memory_result = await session.execute(
-                        select(Memory)
-                        .where(
-                            Memory.organization_id == org_uuid,
-                            Memory.scope_type == "channel",
-                            Memory.scope_source == normalized_source,
-                            Memory.scope_channel_id == normalized_channel_id,
-                            Memory.category == "channel_personality",
-                        )
-                        .order_by(Memory.updated_at.desc().nullslast(), Memory.created_at.desc().nullslast())
-                        .limit(1)
-                    )
-                    channel_personality_memory = channel_memory_result.scalar_one_or_none()
-                    if channel_personality_memory:
-                        profile["channel_personality_memory"] = {
-                            "id": str(channel_personality_memory.id),
-                            "content": channel_personality_memory.content,
+                    profile["participant_job_memories"].append(
+                        {
+                            "user_id": str(participant_user_id),
+                            "membership_id": str(participant_membership_id),
+                            "name": participant_name,
+                            "title": participant_title,
+                            "is_most_recent": participant_user_id == user_uuid,
+                            "memories": participant_role_memories,
                         }
+                    )
 
-        except Exception:
-            logger.warning("Failed to load context profile", exc_info=True)
+                missing_members = [
+                    str(participant_user_id)
+                    for participant_user_id in participant_user_ids
+                    if participant_user_id not in membership_by_user_id
+                ]
+                if missing_members:
+                    logger.info(
+                        "Missing org_members rows for participants org=%s conversation=%s participants=%s",
+                        self.organization_id,
+                        self.conversation_id,
+                        missing_members,
+                    )
+
+            if normalized_channel_id and conversation_source:
+                normalized_source: str = conversation_source.strip().lower()
+                channel_memory_result = await session.execute(
+                    select(Memory)
+                    .where(
+                        Memory.organization_id == org_uuid,
+                        Memory.scope_type == "channel",
+                        Memory.scope_source == normalized_source,
+                        Memory.scope_channel_id == normalized_channel_id,
+                        Memory.category == "channel_personality",
+                    )
+                    .order_by(Memory.updated_at.desc().nullslast(), Memory.created_at.desc().nullslast())
+                    .limit(1)
+                )
+                channel_personality_memory = channel_memory_result.scalar_one_or_none()
+                if channel_personality_memory:
+                    profile["channel_personality_memory"] = {
+                        "id": str(channel_personality_memory.id),
+                        "content": channel_personality_memory.content,
+                    }
 
         return profile
 
@@ -1120,7 +1203,7 @@ class ChatOrchestrator:
         attachment_meta: list[dict[str, Any]] = []
         pre_generated_message_id: UUID | None = None
         if attachment_ids:
-            from services.file_handler import retrieve_file, StoredFile
+            from services.file_handler import aretrieve_file, StoredFile
 
             pre_generated_message_id = uuid4()
             conv_uuid = UUID(self.conversation_id) if self.conversation_id else None
@@ -1128,7 +1211,7 @@ class ChatOrchestrator:
             if conv_uuid and org_uuid:
                 async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
                     for aid in attachment_ids:
-                        sf: StoredFile | None = retrieve_file(aid)
+                        sf: StoredFile | None = await aretrieve_file(aid)
                         if sf is not None:
                             attachment_row = ChatAttachment(
                                 conversation_id=conv_uuid,
@@ -1163,16 +1246,44 @@ class ChatOrchestrator:
             meta_ids: list[str] = [str(m["attachment_id"]) for m in attachment_meta]
             text_for_model = user_message + _linear_attachment_tool_hint(meta_ids)
 
+        # Turn setup: independent loads run concurrently (see _TurnSetup).
+        is_workflow_run: bool = bool((self.workflow_context or {}).get("is_workflow"))
+        workflow_id: str | None = (self.workflow_context or {}).get("workflow_id")
+        setup = _TurnSetup()
+        setup.add("llm_config", lambda: resolve_llm_config(self.organization_id))
         # Skip history DB call for new conversations (zero messages to load).
+        if not skip_history:
+            setup.add("history", lambda: self._load_history(limit=20))
+        if self.user_id and (not self.user_name or not self.user_email or not self.organization_name):
+            setup.add("user_context", self._resolve_user_context)
+        if self.organization_id:
+            setup.add("systems_manifest", self._build_systems_manifest)
+        if self.organization_id and (self.user_id or self.conversation_id):
+            # The profile reads the phone number fetched with the user context.
+            setup.add("context_profile", self._load_context_profile, after=("user_context",))
+        if _should_include_cross_conversation_history(user_message):
+            logger.info(
+                "[Orchestrator] User requested cross-conversation history; loading supplemental context conversation_id=%s",
+                self.conversation_id,
+            )
+            setup.add("cross_conversation_history", self._load_cross_conversation_history)
+        if workflow_id and self.organization_id:
+            setup.add("workflow_notes", lambda: self._load_workflow_notes(workflow_id))
+        loaded: dict[str, Any] = await setup.results()
+        logger.info(
+            "[Orchestrator] Turn setup conversation_id=%s %s",
+            self.conversation_id,
+            setup.summary(),
+        )
+
+        history: list[dict[str, Any]] = loaded.get("history", [])
         if skip_history:
-            history: list[dict[str, Any]] = []
             logger.info("[Orchestrator] Skipped history load (new conversation)")
         else:
-            history = await self._load_history(limit=20)
             logger.info("[Orchestrator] Loaded %d history messages", len(history))
 
         # Build user content — may include attachment blocks (images, PDFs, text)
-        user_content: str | list[dict[str, Any]] = self._build_user_content(
+        user_content: str | list[dict[str, Any]] = await self._build_user_content(
             text_for_model, attachment_ids,
         )
 
@@ -1184,8 +1295,7 @@ class ChatOrchestrator:
         slack_recent_channel_context_message: str | None = None
 
         # Resolve per-org LLM provider/model/key
-        self._llm_config = await resolve_llm_config(self.organization_id)
-        is_workflow_run: bool = bool((self.workflow_context or {}).get("is_workflow"))
+        self._llm_config = loaded["llm_config"]
         workflow_model_override = (self.workflow_context or {}).get("workflow_model_override")
         selected_model: str = (
             str(workflow_model_override)
@@ -1233,11 +1343,7 @@ class ChatOrchestrator:
         content_blocks: list[dict[str, Any]] = []
 
         # Build system prompt: identity first, then behavioral rules, then reference material.
-        # Resolve user_name, user_email, organization_name if not already set.
-        if self.user_id and (not self.user_name or not self.user_email or not self.organization_name):
-            await self._resolve_user_context()
-
-        # 1. Identity: intro + current user + time (high-attention placement)
+        # 1. Identity: intro + current user (high-attention placement)
         system_prompt_parts: list[str] = [SYSTEM_PROMPT_INTRO]
 
         if self.user_email and self.user_id:
@@ -1262,16 +1368,6 @@ class ChatOrchestrator:
                 f"- Model provider: {self._llm_config.provider}\n"
             )
 
-        server_utc_now: str = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        time_block: str = "\n\n## Current Time Context\n"
-        time_block += f"- Server time (UTC): {server_utc_now}\n"
-        if self.local_time:
-            time_block += f"- User's local time: {self.local_time}\n"
-        if self.timezone:
-            time_block += f"- User's timezone: {self.timezone}\n"
-        time_block += "\n**Datetime**: When the user says \"today\", \"yesterday\", etc., use their local date in WHERE clauses—NOT CURRENT_DATE. Convert UTC results to their timezone when presenting."
-        system_prompt_parts.append(time_block)
-
         # 2. Main static content (behavioral rules, tool routing, schema ref, context gathering)
         system_prompt_parts.append(SYSTEM_PROMPT_MAIN)
 
@@ -1303,18 +1399,31 @@ class ChatOrchestrator:
 
         # 4. Connected connectors (trimmed preamble)
         if self.organization_id:
-            systems_manifest: str | None = await self._build_systems_manifest()
+            systems_manifest: str | None = loaded["systems_manifest"]
             if systems_manifest:
                 conn_block: str = "\n\n## Connected Connectors\n"
                 conn_block += "Use connector tools ONLY for connectors in the enabled list below. Call `get_connector_docs(connector)` before first use. If a connector is only under \"not currently enabled\", offer `initiate_connector` instead.\n\n"
                 conn_block += systems_manifest
                 system_prompt_parts.append(conn_block)
 
-        system_prompt = "".join(system_prompt_parts)
+        # Everything above is stable across turns and is the prompt-cache
+        # prefix; per-turn context (time, profile, notes) follows it.
+        stable_system_prompt: str = "".join(system_prompt_parts)
+
+        # 5. Current time (changes every turn, so it starts the per-turn tail)
+        server_utc_now: str = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        time_block: str = "\n\n## Current Time Context\n"
+        time_block += f"- Server time (UTC): {server_utc_now}\n"
+        if self.local_time:
+            time_block += f"- User's local time: {self.local_time}\n"
+        if self.timezone:
+            time_block += f"- User's timezone: {self.timezone}\n"
+        time_block += "\n**Datetime**: When the user says \"today\", \"yesterday\", etc., use their local date in WHERE clauses—NOT CURRENT_DATE. Convert UTC results to their timezone when presenting."
+        system_prompt = stable_system_prompt + time_block
 
         # Load and inject two-tier context profile (user, job memories + structured fields)
         if self.organization_id and (self.user_id or self.conversation_id):
-            profile: dict[str, Any] = await self._load_context_profile()
+            profile: dict[str, Any] = loaded["context_profile"]
 
             user_memories: list[dict[str, str]] = profile["user_memories"]
             job_memories: list[dict[str, str]] = profile["job_memories"]
@@ -1437,12 +1546,8 @@ class ChatOrchestrator:
                 for part in completeness_parts:
                     system_prompt += f"- {part}\n"
 
-        if _should_include_cross_conversation_history(user_message):
-            logger.info(
-                "[Orchestrator] User requested cross-conversation history; loading supplemental context conversation_id=%s",
-                self.conversation_id,
-            )
-            cross_conversation_history: list[dict[str, Any]] = await self._load_cross_conversation_history()
+        if "cross_conversation_history" in loaded:
+            cross_conversation_history: list[dict[str, Any]] = loaded["cross_conversation_history"]
             if cross_conversation_history:
                 source_channels: list[str] = sorted(
                     {
@@ -1474,10 +1579,9 @@ class ChatOrchestrator:
                     self.user_id,
                 )
 
-        workflow_id: str | None = (self.workflow_context or {}).get("workflow_id")
         if workflow_id and self.organization_id:
             system_prompt += "\n\n## Workflow Memory Rules\nIn workflow executions, NEVER use manage_memory. Use keep_notes for workflow-scoped notes. The canonical persistence field for workflow execution notes/state is workflow_runs.workflow_notes."
-            workflow_notes = await self._load_workflow_notes(workflow_id)
+            workflow_notes = loaded["workflow_notes"]
             if workflow_notes:
                 notes_context = "\n\n## Workflow Notes\n"
                 notes_context += "These are notes saved by prior runs of this workflow. Use them as workflow memory.\n\n"
@@ -1515,7 +1619,8 @@ class ChatOrchestrator:
             )
 
         # Stream responses with tool handling loop
-        async for chunk in self._stream_with_tools(messages, system_prompt, content_blocks, selected_model):
+        system_segments: list[str] = [stable_system_prompt, system_prompt[len(stable_system_prompt):]]
+        async for chunk in self._stream_with_tools(messages, system_segments, content_blocks, selected_model):
             yield chunk
         
         # Save conversation (user message was already saved at the start)
@@ -1541,7 +1646,7 @@ class ChatOrchestrator:
     async def _stream_with_tools(
         self,
         messages: list[dict[str, Any]],
-        system_prompt: str,
+        system_prompt: SystemPrompt,
         content_blocks: list[dict[str, Any]],
         model_name: str,
     ) -> AsyncGenerator[str, None]:
@@ -1684,10 +1789,20 @@ class ChatOrchestrator:
                                 current_tool_input_json = ""
 
                         elif event.type == "usage":
+                            logger.info(
+                                "[Orchestrator] Usage conversation_id=%s input=%s output=%s cache_read=%s cache_write=%s",
+                                self.conversation_id,
+                                event.input_tokens,
+                                event.output_tokens,
+                                event.cache_read_input_tokens,
+                                event.cache_creation_input_tokens,
+                            )
                             yield _json_dumps({
                                 "type": "context_usage",
                                 "input_tokens": event.input_tokens,
                                 "output_tokens": event.output_tokens,
+                                "cache_read_input_tokens": event.cache_read_input_tokens,
+                                "cache_creation_input_tokens": event.cache_creation_input_tokens,
                             })
 
                     final_message_received = True
@@ -1798,7 +1913,16 @@ class ChatOrchestrator:
                     "status": "running",
                     "status_text": format_tool_status(tool_name, tool_input, "running"),
                 })
-            
+
+            # Workflow runs execute in Celery workers with no subscribed socket,
+            # so announce the running tools to the org's clients over pub/sub.
+            if (
+                self.conversation_id
+                and self.organization_id
+                and (self.workflow_context or {}).get("is_workflow")
+            ):
+                asyncio.create_task(self._publish_running_tools_safe(tool_uses))
+
             # Early save: fire-and-forget so it doesn't block tool execution.
             # This persists the "running" tool_use blocks for reconnect catchup,
             # but the UI gets tool_call events via the yield above — no need to wait.
@@ -1978,7 +2102,7 @@ class ChatOrchestrator:
             messages.append({"role": "user", "content": tool_results})
 
     @staticmethod
-    def _build_user_content(
+    async def _build_user_content(
         user_message: str,
         attachment_ids: list[str] | None,
     ) -> str | list[dict[str, Any]]:
@@ -1993,7 +2117,7 @@ class ChatOrchestrator:
             return user_message
 
         from services.file_handler import (
-            retrieve_file,
+            aretrieve_file,
             remove_file,
             build_claude_content_blocks,
             StoredFile,
@@ -2001,7 +2125,7 @@ class ChatOrchestrator:
 
         stored_files: list[StoredFile] = []
         for aid in attachment_ids:
-            sf: StoredFile | None = retrieve_file(aid)
+            sf: StoredFile | None = await aretrieve_file(aid)
             if sf is not None:
                 stored_files.append(sf)
             else:
@@ -2076,6 +2200,23 @@ class ChatOrchestrator:
         except Exception as e:
             logger.warning("[Orchestrator] Background early INSERT failed: %s", e)
 
+    async def _publish_running_tools_safe(self, tool_uses: list[dict[str, Any]]) -> None:
+        """Fire-and-forget tool_progress events for newly started workflow tools."""
+        from api.websockets import broadcast_tool_progress
+
+        for tool_use in tool_uses:
+            try:
+                await broadcast_tool_progress(
+                    organization_id=str(self.organization_id),
+                    conversation_id=str(self.conversation_id),
+                    tool_id=str(tool_use["id"]),
+                    tool_name=str(tool_use["name"]),
+                    result={},
+                    status="running",
+                )
+            except Exception as e:
+                logger.warning("[Orchestrator] Publishing running tool status failed: %s", e)
+
     async def _update_tool_result_safe(
         self, conversation_id: str, tool_id: str, result: dict[str, Any], org_id: str | None,
     ) -> None:
@@ -146,7 +146,9 @@ You can add extra WHERE clauses (e.g. type = 'email') alongside the vector searc
 
 IMPORTANT: Do NOT add organization_id to WHERE clauses. Data is automatically scoped to the user's organization via row-level security. Adding organization_id filters will cause queries to return wrong results.
 
-IMPORTANT: Only SELECT queries are allowed. No INSERT, UPDATE, DELETE, DROP, etc.""",
+IMPORTANT: Only SELECT queries are allowed. No INSERT, UPDATE, DELETE, DROP, etc.
+
+RESULT PAGING: Each call returns at most 100 rows (fewer for wide rows). When more rows exist the result has has_more=true and a next_cursor; call run_sql_query again with only {"cursor": "<next_cursor>"} to get the next page. Include an ORDER BY so pages are stable, and prefer aggregating in SQL over paging through raw rows.""",
     input_schema={
         "type": "object",
         "properties": {
@@ -154,8 +156,12 @@ IMPORTANT: Only SELECT queries are allowed. No INSERT, UPDATE, DELETE, DROP, etc
                 "type": "string",
                 "description": "The SQL SELECT query to execute",
             },
+            "cursor": {
+                "type": "string",
+                "description": "next_cursor from a previous run_sql_query result, to fetch the next page (omit query)",
+            },
         },
-        "required": ["query"],
+        "required": [],
     },
     category=ToolCategory.LOCAL_READ,
     default_requires_approval=False,
@@ -87,6 +87,8 @@ from datetime import datetime as dt
 from typing import TypedDict
 
 from services.automated_agent_footer import ensure_automated_agent_footer
+from services.context_cache import invalidate_org_context
+from workers.events import invalidate_event_triggers
 
 class PendingOperationData(TypedDict):
     tool_name: str
@@ -1237,6 +1239,78 @@ async def _think(tool_input: dict[str, Any]) -> dict[str, Any]:
     return {"status": "success", "thought": thought}
 
 
+# run_sql_query result paging: rows are streamed from a server-side cursor and
+# a page stops at whichever budget is hit first. Larger results are returned
+# with a continuation handle (kept in Redis) instead of being materialized.
+_SQL_PAGE_MAX_ROWS: int = 100
+_SQL_PAGE_MAX_BYTES: int = 48_000
+_SQL_STREAM_CHUNK_ROWS: int = 50
+_SQL_CURSOR_TTL_SECONDS: int = 30 * 60
+_SQL_CURSOR_KEY_PREFIX: str = "sql_query_cursor:"
+
+
+async def _store_sql_cursor(state: dict[str, Any]) -> str | None:
+    """Persist a continuation handle for the next page of a query result."""
+    import secrets
+
+    import redis.asyncio as aioredis
+
+    from config import get_redis_connection_kwargs
+
+    token: str = secrets.token_urlsafe(12)
+    redis_client = aioredis.from_url(
+        settings.REDIS_URL, **get_redis_connection_kwargs(decode_responses=True)
+    )
+    try:
+        async with redis_client:
+            await redis_client.set(
+                f"{_SQL_CURSOR_KEY_PREFIX}{token}", json.dumps(state), ex=_SQL_CURSOR_TTL_SECONDS
+            )
+    except Exception:
+        logger.warning("[Tools._run_sql_query] Failed to store result cursor", exc_info=True)
+        return None
+    return token
+
+
+async def _load_sql_cursor(token: str) -> dict[str, Any] | None:
+    """Return the stored state for a continuation handle, or None if expired."""
+    import redis.asyncio as aioredis
+
+    from config import get_redis_connection_kwargs
+
+    redis_client = aioredis.from_url(
+        settings.REDIS_URL, **get_redis_connection_kwargs(decode_responses=True)
+    )
+    try:
+        async with redis_client:
+            raw: str | None = await redis_client.get(f"{_SQL_CURSOR_KEY_PREFIX}{token}")
+    except Exception:
+        logger.warning("[Tools._run_sql_query] Failed to load result cursor", exc_info=True)
+        return None
+    if not raw:
+        return None
+    try:
+        state: Any = json.loads(raw)
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _paginate_sql_query(query: str, offset: int) -> str:
+    """Bound *query* to one page (plus a look-ahead row) starting at *offset*.
+
+    When the query has no LIMIT/OFFSET of its own, the bound is appended
+    directly so the planner still sees it: ORDER BY keeps its top-N sort and
+    ``ORDER BY embedding <=> ...`` can use the pgvector index. Queries that
+    already carry a LIMIT/OFFSET are wrapped so their own bound still applies.
+    """
+    body: str = query.rstrip().rstrip(";").rstrip()
+    page_limit: int = _SQL_PAGE_MAX_ROWS + 1
+    if re.search(r"\b(LIMIT|OFFSET|FETCH)\b", body, re.IGNORECASE):
+        return f"SELECT * FROM ({body}) AS _sql_page LIMIT {page_limit} OFFSET {offset}"
+    return f"{body} LIMIT {page_limit} OFFSET {offset}"
+
+
 async def _run_sql_query(
     params: dict[str, Any], organization_id: str, user_id: str | None
 ) -> dict[str, Any]:
@@ -1250,13 +1324,36 @@ async def _run_sql_query(
     Supports ``semantic_embed('text')`` as an inline placeholder that is
     resolved to a real embedding vector before execution, enabling semantic
     search directly via SQL (e.g. ORDER BY embedding <=> semantic_embed('...')).
+
+    Rows are streamed from a server-side cursor and each call returns at most
+    ``_SQL_PAGE_MAX_ROWS`` rows / ``_SQL_PAGE_MAX_BYTES`` of serialized data.
+    When more rows remain the result carries ``next_cursor``; passing it back
+    as ``params["cursor"]`` re-runs the query from the next offset. Every run
+    is bounded with ``LIMIT``/``OFFSET`` (see ``_paginate_sql_query``) so the
+    server never executes an unbounded query; the cursor only steps through
+    pages. Continuations reuse the already-resolved ``semantic_embed`` vectors.
     """
     query: str = (params.get("query") or "").strip()
+    cursor_token: str = str(params.get("cursor") or "").strip()
+    offset: int = 0
+    resolved_query: str | None = None
+
+    if cursor_token:
+        cursor_state: dict[str, Any] | None = await _load_sql_cursor(cursor_token)
+        if (
+            cursor_state is None
+            or cursor_state.get("organization_id") != organization_id
+            or cursor_state.get("user_id") != user_id
+        ):
+            return {"error": "Result cursor expired or not found. Re-run the query to start over."}
+        query = str(cursor_state.get("query") or "")
+        offset = int(cursor_state.get("offset") or 0)
+        resolved_query = cursor_state.get("resolved_query") or None
 
     if not query:
         return {"error": "No query provided"}
 
-    logger.info("[Tools._run_sql_query] Query: %s", query)
+    logger.info("[Tools._run_sql_query] Query: %s (offset=%d)", query, offset)
 
     # Validate query is safe (SELECT only, no dangerous keywords)
     is_valid, error = _validate_sql_query(query)
@@ -1273,13 +1370,12 @@ async def _run_sql_query(
         return {"error": f"Access to tables not allowed: {disallowed}"}
 
     # Resolve semantic_embed('...') placeholders into real vectors
-    final_query, embed_error = await _resolve_semantic_embeds(query)
-    if embed_error is not None:
-        return {"error": embed_error}
+    if resolved_query is None:
+        resolved_query, embed_error = await _resolve_semantic_embeds(query)
+        if embed_error is not None:
+            return {"error": embed_error}
 
-    # Add LIMIT if not present to prevent huge result sets
-    if not re.search(r'\bLIMIT\b', final_query, re.IGNORECASE):
-        final_query = final_query.rstrip(';') + " LIMIT 100"
+    final_query: str = _paginate_sql_query(resolved_query, offset)
 
     rights_ctx = RightsContext(
         organization_id=organization_id,
@@ -1294,33 +1390,71 @@ async def _run_sql_query(
         rights_result.transformed_query if rights_result.transformed_query is not None else final_query
     )
 
+    data: list[dict[str, Any]] = []
+    columns: list[str] = []
+    truncated_reason: str | None = None
     try:
         async with get_session(
             organization_id=organization_id, user_id=user_id
         ) as session:
-            result = await session.execute(text(query_to_run))
-            rows = result.fetchall()
-            columns: list[str] = list(result.keys())
-
-            data: list[dict[str, Any]] = []
-            for row in rows:
-                row_dict: dict[str, Any] = {
-                    col: _serialize_value(row[i])
-                    for i, col in enumerate(columns)
-                }
-                data.append(row_dict)
-
-            logger.info("[Tools._run_sql_query] Query returned %d rows", len(data))
-
-            return {
-                "columns": columns,
-                "rows": data,
-                "row_count": len(data),
-            }
+            result = await session.stream(
+                text(query_to_run),
+                execution_options={"yield_per": _SQL_STREAM_CHUNK_ROWS},
+            )
+            try:
+                columns = list(result.keys())
+                page_bytes: int = 0
+                async for row in result:
+                    if len(data) >= _SQL_PAGE_MAX_ROWS:
+                        truncated_reason = "row_limit"
+                        break
+                    row_dict: dict[str, Any] = {
+                        col: _serialize_value(row[i])
+                        for i, col in enumerate(columns)
+                    }
+                    row_bytes: int = len(json.dumps(row_dict, default=str))
+                    if data and page_bytes + row_bytes > _SQL_PAGE_MAX_BYTES:
+                        truncated_reason = "size_limit"
+                        break
+                    data.append(row_dict)
+                    page_bytes += row_bytes
+            finally:
+                await result.close()
     except Exception as e:
         logger.error("[Tools._run_sql_query] Query execution failed: %s", str(e))
         return {"error": f"Query execution failed: {str(e)}"}
 
+    logger.info(
+        "[Tools._run_sql_query] Query returned %d rows (offset=%d, truncated=%s)",
+        len(data), offset, truncated_reason,
+    )
+
+    response: dict[str, Any] = {
+        "columns": columns,
+        "rows": data,
+        "row_count": len(data),
+    }
+    if offset:
+        response["offset"] = offset
+    if truncated_reason is not None:
+        response["has_more"] = True
+        response["truncated_reason"] = truncated_reason
+        next_cursor: str | None = await _store_sql_cursor({
+            "organization_id": organization_id,
+            "user_id": user_id,
+            "query": query,
+            "resolved_query": resolved_query,
+            "offset": offset + len(data),
+        })
+        if next_cursor is not None:
+            response["next_cursor"] = next_cursor
+            response["note"] = (
+                "More rows are available. Prefer aggregating or filtering in SQL; "
+                "if you really need the next page, call run_sql_query with "
+                f'{{"cursor": "{next_cursor}"}}.'
+            )
+    return response
+
 
 # Tables that can be written to via run_sql_write
 WRITABLE_TABLES: set[str] = {
@@ -1926,6 +2060,8 @@ async def _run_sql_write(
                 )
             
             rows_affected = result.rowcount
+            if table == "workflows":
+                await invalidate_event_triggers(organization_id)
             
             logger.info("[Tools._run_sql_write] %s completed, %d rows affected", operation, rows_affected)
             
@@ -6333,6 +6469,7 @@ async def execute_save_memory(
     async with get_session(organization_id=organization_id) as session:
         session.add(memory)
         await session.commit()
+    await invalidate_org_context(organization_id)
 
     return {
         "memory_id": str(memory.id),
@@ -6372,6 +6509,7 @@ async def _delete_memory(
 
         await session.delete(memory)
         await session.commit()
+    await invalidate_org_context(organization_id)
 
     return {"status": "deleted", "memory_id": memory_id}
 
@@ -6413,6 +6551,7 @@ async def _update_memory(
 
         memory.content = new_content
         await session.commit()
+    await invalidate_org_context(organization_id)
 
     return {"status": "updated", "memory_id": memory_id, "content": new_content}
 
@@ -6554,8 +6693,8 @@ async def _poll_bulk_operation(
 ) -> dict[str, Any]:
     """Poll a bulk operation until completion, broadcasting live progress via WebSocket.
 
-    Reads real-time progress from Redis counters (updated atomically by each
-    Celery item task) and checks the DB for terminal status.
+    Reads real-time progress from Redis counters (updated atomically by the
+    Celery batch tasks) and checks the DB for terminal status.
 
     Safety: max 4 hours, stale detection at 10 minutes with no progress.
     """
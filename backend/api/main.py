@@ -19,7 +19,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from api.websockets import websocket_endpoint
+from api.websockets import websocket_fanout, websocket_endpoint
 from api.routes import action_ledger, admin_dashboard, apps, artifacts, auth, billing, change_sessions, chat, connectors, daily_digests, data, deals, drive, memories, notifications, public, search, slack_events, slack_user_mappings, support, sync, teams_events, tool_settings, topic_graph, twilio_events, whatsapp_events, waitlist, workstreams, workflows
 from models.database import close_db, get_pool_status
 from services.task_manager import task_manager
@@ -43,6 +43,7 @@ async def lifespan(app: FastAPI):
     log_missing_env_vars(logging.getLogger("config"))
     await ensure_celery_workers_available()
     task_manager._start_reaper()
+    websocket_fanout.start()
     logging.info("Database connection pool ready")
 
     try:
@@ -50,9 +51,22 @@ async def lifespan(app: FastAPI):
     finally:
         logging.info("Shutting down, closing database connections...")
         task_manager._stop_reaper()
+        await websocket_fanout.stop()
+        from messengers.activity_buffer import activity_buffer
+
+        await activity_buffer.close()
         from connectors.code_sandbox import cleanup_all_sandboxes
 
         await cleanup_all_sandboxes()
+        from connectors.http_client import close_http_clients
+        from services.llm_adapter import close_llm_clients
+        from services.pdf_renderer import shutdown_pdf_renderer
+        from services.redis_pool import close_redis_clients
+
+        await close_http_clients()
+        await close_llm_clients()
+        await close_redis_clients()
+        shutdown_pdf_renderer()
         await close_db()
         logging.info("Database connections closed")
 
@@ -4,6 +4,8 @@ Admin dashboard routes for global admin analytics.
 Endpoints:
 - GET /api/admin-dashboard/credit-usage  — Credit usage by org per day (past 7 days)
 - GET /api/admin-dashboard/top-conversations — Most active conversations for top customers
+- GET /api/admin-dashboard/embedding-cache — Embedding cache hit/miss counters (this API process)
+- GET /api/admin-dashboard/activity-buffer — Messenger activity write-behind depth and flush latency (this API process)
 """
 from __future__ import annotations
 
@@ -24,7 +26,9 @@ from models.conversation import Conversation
 from models.credit_transaction import CreditTransaction
 from models.organization import Organization
 from models.user import User
+from messengers.activity_buffer import get_activity_buffer_stats
 from models.database import get_admin_session
+from services.embedding_cache import get_embedding_cache_stats
 from services.query_outcome_metrics import get_query_outcome_window_stats
 
 router = APIRouter()
@@ -39,6 +43,22 @@ async def get_query_outcome_rate(
     return await get_query_outcome_window_stats()
 
 
+@router.get("/embedding-cache")
+async def get_embedding_cache(
+    auth: AuthContext = Depends(require_global_admin_or_system_actor),
+) -> dict[str, float]:
+    """Return this process's embedding cache hit/miss counters."""
+    return get_embedding_cache_stats()
+
+
+@router.get("/activity-buffer")
+async def get_activity_buffer(
+    auth: AuthContext = Depends(require_global_admin_or_system_actor),
+) -> dict[str, float]:
+    """Return this process's messenger activity write-behind buffer counters."""
+    return get_activity_buffer_stats()
+
+
 @router.get("/credit-usage")
 async def get_credit_usage(
     auth: AuthContext = Depends(require_global_admin),
@@ -28,7 +28,7 @@ from models.database import get_session
 from models.user import User
 from models.visibility import normalize_visibility
 from services.org_admin import user_is_org_admin
-from services.pdf_generator import generate_pdf
+from services.pdf_renderer import PdfRenderBusyError, render_pdf
 
 router = APIRouter()
 
@@ -254,6 +254,16 @@ async def get_artifact(
         )
 
 
+async def _render_pdf(markdown_content: str) -> bytes:
+    """Render off the event loop; a full render queue becomes a retryable 503."""
+    try:
+        return await render_pdf(markdown_content)
+    except PdfRenderBusyError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "5"},
+        ) from exc
+
+
 @router.get("/{artifact_id}/download", response_model=None)
 async def download_artifact(
     artifact_id: str,
@@ -296,7 +306,7 @@ async def download_artifact(
 
         # When format=pdf is requested, generate PDF from any text-based content
         if format == "pdf" and content_type in ("markdown", "text", "pdf"):
-            pdf_bytes: bytes = generate_pdf(artifact.content)
+            pdf_bytes: bytes = await _render_pdf(artifact.content)
             pdf_filename: str = artifact.filename or "artifact.pdf"
             if not pdf_filename.endswith(".pdf"):
                 pdf_filename = pdf_filename.rsplit(".", 1)[0] + ".pdf"
@@ -322,7 +332,7 @@ async def download_artifact(
 
         # Fallback: route by stored content_type when no format override
         if content_type == "pdf":
-            pdf_bytes_fallback: bytes = generate_pdf(artifact.content)
+            pdf_bytes_fallback: bytes = await _render_pdf(artifact.content)
             return Response(
                 content=pdf_bytes_fallback,
                 media_type="application/pdf",
@@ -41,6 +41,7 @@ from models.database import get_admin_session, get_session
 from models.integration import Integration
 from models.user import User
 from models.organization import Organization
+from services.context_cache import invalidate_org_context
 from services.favicon import update_org_logo_from_website
 from services.nango import extract_connection_metadata, get_nango_client
 from services.slack_identity import upsert_slack_user_mappings_from_metadata
@@ -574,6 +575,8 @@ async def update_profile(
 
         await session.commit()
         await session.refresh(user)
+        # Names and titles appear in chat context profiles.
+        await invalidate_org_context(str(active_org_patch) if active_org_patch else None)
 
         return UserResponse(
             id=str(user.id),
@@ -2324,6 +2327,7 @@ async def update_organization_member(
                 target_membership.reports_to_membership_id = reports_to_uuid
 
         await session.commit()
+        await invalidate_org_context(str(org_uuid))
 
         logger.info(
             "Updated org member row org=%s target_user=%s by_user=%s title_updated=%s reports_to_updated=%s",
@@ -3225,6 +3229,7 @@ async def confirm_integration(
             integration_id = str(new_integration.id)
 
         await session.commit()
+    await invalidate_org_context(str(org_uuid))
 
     # Trigger initial sync in background (we use defaults, no sharing modal)
     # skip_initial_sync allows setup wizards (e.g. identity mapping) to defer
@@ -3597,6 +3602,7 @@ async def connect_builtin(
                 )
                 session.add(new_integration)
             await session.commit()
+        await invalidate_org_context(str(org_uuid))
     except HTTPException:
         raise
     except Exception as e:
@@ -3893,6 +3899,7 @@ async def nango_callback(
             integration_id = str(new_integration.id)
 
         await session.commit()
+    await invalidate_org_context(str(org_uuid))
 
     return {
         "status": "pending_sharing_config",
@@ -4398,6 +4405,7 @@ async def disconnect_integration(
             await db_session.delete(integ)
         await db_session.commit()
         print(f"Disconnect: Database deletion successful")
+    await invalidate_org_context(str(org_uuid))
 
     response: dict[str, Any] = {"status": "disconnected", "provider": provider}
     if delete_data:
@@ -42,7 +42,8 @@ from models.integration import Integration
 from models.org_member import OrgMember
 from models.user import User
 from connectors.slack import SlackConnector
-from services.file_handler import store_file, MAX_FILE_SIZE
+from services.context_cache import invalidate_org_context
+from services.file_handler import astore_file, MAX_FILE_SIZE
 from services.slack_identity import get_slack_user_ids_for_revtops_user
 
 
@@ -1234,6 +1235,7 @@ async def add_participant(
         conversation.updated_at = datetime.utcnow()
 
         await session.commit()
+        await invalidate_org_context(org_id)
 
         return AddParticipantResponse(
             success=True,
@@ -1287,6 +1289,7 @@ async def remove_participant(
         conversation.updated_at = datetime.utcnow()
 
         await session.commit()
+        await invalidate_org_context(org_id)
 
         return {"success": True}
 
@@ -1365,6 +1368,7 @@ async def update_scope(
                     ))
 
         await session.commit()
+        await invalidate_org_context(org_id)
 
         return ConversationResponse(
             id=conv_id,
@@ -1542,8 +1546,8 @@ async def upload_file(
     """
     Upload a file to attach to a chat message.
 
-    Files are stored temporarily in memory and consumed when the
-    message is sent via WebSocket. Max size: 10 MB.
+    Files are stored temporarily (see services.attachment_store) and consumed
+    when the message is sent via WebSocket. Max size: 10 MB.
     """
     if file.filename is None:
         raise HTTPException(status_code=400, detail="Filename is required")
@@ -1557,7 +1561,7 @@ async def upload_file(
         )
 
     try:
-        stored = store_file(
+        stored = await astore_file(
             filename=file.filename,
             data=data,
             content_type=file.content_type,
@@ -5,14 +5,20 @@ SECURITY: All endpoints use JWT authentication via the AuthContext dependency.
 User and organization are verified from the JWT token, NOT from query parameters.
 
 Allows users to browse their synced contacts, accounts, deals, and activities
-in a paginated table view.
+in a paginated table view. Pages are fetched by keyset cursor (sort value +
+id) rather than OFFSET, and totals come from the cached counts in
+services.table_counts.
 """
-from typing import Literal, Optional
+import base64
+from datetime import date, datetime
+from decimal import Decimal
+import json
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, or_, select, tuple_
 
 from api.auth_middleware import AuthContext, require_organization
 from models.account import Account
@@ -20,6 +26,7 @@ from models.activity import Activity
 from models.contact import Contact
 from models.database import get_session
 from models.deal import Deal
+from services.table_counts import get_filtered_count, get_table_counts
 
 router = APIRouter()
 
@@ -40,6 +47,7 @@ class DataResponse(BaseModel):
     columns: list[str]
     sort_by: Optional[str] = None
     sort_order: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 class TableSummary(BaseModel):
@@ -77,30 +85,15 @@ async def get_data_summary(
         organization_id=auth.organization_id_str,
         user_id=auth.user_id_str,
     ) as session:
-        # Count each table
-        contacts_count = await session.scalar(
-            select(func.count(Contact.id)).where(Contact.organization_id == org_uuid)
-        ) or 0
-        
-        accounts_count = await session.scalar(
-            select(func.count(Account.id)).where(Account.organization_id == org_uuid)
-        ) or 0
-        
-        deals_count = await session.scalar(
-            select(func.count(Deal.id)).where(Deal.organization_id == org_uuid)
-        ) or 0
-        
-        activities_count = await session.scalar(
-            select(func.count(Activity.id)).where(Activity.organization_id == org_uuid)
-        ) or 0
+        counts = await get_table_counts(session, org_uuid, auth.user_id_str)
 
     return DataSummaryResponse(
         organization_id=auth.organization_id_str or "",
         tables=[
-            TableSummary(name="contacts", display_name="Contacts", count=contacts_count),
-            TableSummary(name="accounts", display_name="Accounts", count=accounts_count),
-            TableSummary(name="deals", display_name="Deals", count=deals_count),
-            TableSummary(name="activities", display_name="Activities", count=activities_count),
+            TableSummary(name="contacts", display_name="Contacts", count=counts["contacts"]),
+            TableSummary(name="accounts", display_name="Accounts", count=counts["accounts"]),
+            TableSummary(name="deals", display_name="Deals", count=counts["deals"]),
+            TableSummary(name="activities", display_name="Activities", count=counts["activities"]),
         ],
     )
 
@@ -180,19 +173,69 @@ async def get_filter_options(
     )
 
 
+def _encode_cursor(sort_by: Optional[str], sort_order: str, value: Any, row_id: UUID) -> str:
+    """Opaque keyset cursor: the last row's sort value and id."""
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, (Decimal, UUID)):
+        value = str(value)
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": str(row_id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, sort_column: Any) -> tuple[dict[str, Any], Any, UUID]:
+    """Decode a cursor and coerce its sort value back to the column's type."""
+    try:
+        payload: dict[str, Any] = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        row_id = UUID(payload["id"])
+        value: Any = payload.get("v")
+        if value is not None and sort_column is not None:
+            python_type = sort_column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif python_type is Decimal:
+                value = Decimal(str(value))
+            elif python_type in (int, float, str):
+                value = python_type(value)
+    except (ValueError, KeyError, TypeError, NotImplementedError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    return payload, value, row_id
+
+
+def _keyset_predicate(sort_column: Any, id_column: Any, descending: bool, value: Any, row_id: UUID) -> Any:
+    """Rows strictly after (value, row_id) in ORDER BY sort_column, id.
+
+    Matches Postgres' default NULL placement: last for ASC, first for DESC.
+    """
+    if not descending:
+        if value is None:
+            return and_(sort_column.is_(None), id_column > row_id)
+        return or_(tuple_(sort_column, id_column) > tuple_(value, row_id), sort_column.is_(None))
+    if value is None:
+        return or_(and_(sort_column.is_(None), id_column < row_id), sort_column.isnot(None))
+    return tuple_(sort_column, id_column) < tuple_(value, row_id)
+
+
 @router.get("/{table}", response_model=DataResponse)
 async def get_data(
     table: str,
     auth: AuthContext = Depends(require_organization),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
     sort_order: Literal["asc", "desc"] = "asc",
     type_filter: Optional[str] = None,
     source_system: Optional[str] = None,
 ) -> DataResponse:
-    """Get paginated data from a synced table."""
+    """Get paginated data from a synced table.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to fetch the
+    next page; ``page`` (OFFSET) is still honoured when no cursor is given.
+    """
     org_uuid = auth.organization_id
 
     # Map table names to models and their display columns
@@ -249,27 +292,60 @@ async def get_data(
             search_field = getattr(model, config["search_field"])
             base_query = base_query.where(search_field.ilike(f"%{search}%"))
 
-        # Get total count
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total: int = await session.scalar(count_query) or 0
+        total: int = await get_filtered_count(
+            session,
+            org_uuid,
+            auth.user_id_str,
+            table,
+            {
+                "search": search,
+                "source_system": source_system,
+                "type_filter": type_filter if table == "activities" else None,
+            },
+            base_query,
+        )
 
-        # Determine sort column
+        # Determine sort column; id breaks ties so the order is total.
         effective_sort_by: Optional[str] = None
+        sort_column: Any = None
+        descending: bool = sort_order == "desc"
         if sort_by and sort_by in columns and hasattr(model, sort_by):
             sort_column = getattr(model, sort_by)
-            order_func = desc if sort_order == "desc" else asc
-            base_query = base_query.order_by(order_func(sort_column))
             effective_sort_by = sort_by
+            order_func = desc if descending else asc
+            base_query = base_query.order_by(order_func(sort_column), order_func(model.id))
         else:
             # Default sort by id
             base_query = base_query.order_by(model.id)
 
-        # Get paginated results
-        offset = (page - 1) * page_size
-        results = await session.execute(
-            base_query.offset(offset).limit(page_size)
-        )
-        rows_data = results.scalars().all()
+        if cursor:
+            payload, cursor_value, cursor_id = _decode_cursor(cursor, sort_column)
+            if payload.get("s") != effective_sort_by or (
+                effective_sort_by and payload.get("o") != sort_order
+            ):
+                raise HTTPException(status_code=400, detail="Cursor does not match the requested sort")
+            if sort_column is None:
+                base_query = base_query.where(model.id > cursor_id)
+            else:
+                base_query = base_query.where(
+                    _keyset_predicate(sort_column, model.id, descending, cursor_value, cursor_id)
+                )
+        elif page > 1:
+            base_query = base_query.offset((page - 1) * page_size)
+
+        # Fetch one extra row to know whether another page exists
+        results = await session.execute(base_query.limit(page_size + 1))
+        rows_data = list(results.scalars().all())
+        next_cursor: Optional[str] = None
+        if len(rows_data) > page_size:
+            rows_data = rows_data[:page_size]
+            last_row = rows_data[-1]
+            next_cursor = _encode_cursor(
+                effective_sort_by,
+                sort_order,
+                getattr(last_row, effective_sort_by) if effective_sort_by else None,
+                last_row.id,
+            )
 
         # Convert to response format
         rows: list[DataRow] = []
@@ -294,4 +370,5 @@ async def get_data(
         columns=columns,
         sort_by=effective_sort_by,
         sort_order=sort_order if effective_sort_by else None,
+        next_cursor=next_cursor,
     )
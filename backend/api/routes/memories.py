@@ -10,6 +10,7 @@ from sqlalchemy import and_, select
 
 from models.database import get_session
 from models.memory import Memory
+from services.context_cache import invalidate_org_context
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -164,6 +165,7 @@ async def create_user_memory(
         response = _build_memory_response(memory)
         memory_id = str(memory.id)
 
+    await invalidate_org_context(organization_id)
     logger.info("[Memories API] Created memory %s for user %s", memory_id, user_id)
     return response
 
@@ -203,6 +205,7 @@ async def update_user_memory(organization_id: str, memory_id: str, user_id: str,
         await session.refresh(memory)
         response = _build_memory_response(memory)
 
+        await invalidate_org_context(organization_id)
         logger.info("[Memories API] Updated memory %s for user %s", memory_id, user_id)
         return response
 
@@ -234,6 +237,7 @@ async def delete_user_memory(organization_id: str, memory_id: str, user_id: str)
         await session.delete(memory)
         await session.commit()
 
+    await invalidate_org_context(organization_id)
     logger.info("[Memories API] Deleted memory %s for user %s", memory_id, user_id)
     return {"status": "deleted", "memory_id": memory_id}
 
@@ -332,6 +336,7 @@ async def upsert_channel_memory(
 
         await session.commit()
         await session.refresh(memory)
+        await invalidate_org_context(organization_id)
         logger.info(
             "[Memories API] Channel personality %s org=%s source=%s channel_id=%s memory_id=%s",
             action,
@@ -377,6 +382,7 @@ async def delete_channel_memory(organization_id: str, source: str, channel_id: s
         await session.delete(memory)
         await session.commit()
 
+    await invalidate_org_context(organization_id)
     logger.info(
         "[Memories API] Channel personality deleted org=%s source=%s channel_id=%s memory_id=%s",
         organization_id,
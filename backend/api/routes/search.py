@@ -10,7 +10,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import select, or_
+from sqlalchemy import func, or_, select
 
 from api.auth_middleware import AuthContext, get_current_auth
 from models.database import get_session
@@ -20,6 +20,13 @@ from models.user import User
 
 router = APIRouter()
 
+_MAX_RESULTS_PER_TYPE = 50
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 # =============================================================================
 # Response Models
@@ -75,8 +82,9 @@ async def search(
     """
     Search deals and accounts by name.
     
-    Uses case-insensitive ILIKE matching on name fields.
-    Returns up to `limit` results per type.
+    Uses case-insensitive ILIKE matching on name fields (backed by pg_trgm
+    GIN indexes). Returns up to `limit` results per type; totals are counted
+    in SQL alongside the page.
     """
     # Validate inputs
     if not q or len(q.strip()) < 1:
@@ -100,114 +108,98 @@ async def search(
         )
 
     org_uuid: UUID = auth.organization_id
-    
-    search_pattern = f"%{q.strip()}%"
-    
-    async with get_session() as session:
-        # Search deals
+    limit = max(1, min(limit, _MAX_RESULTS_PER_TYPE))
+    search_pattern = f"%{_escape_like(q.strip())}%"
+
+    async with get_session(
+        organization_id=str(org_uuid),
+        user_id=str(auth.user_id) if auth.user_id else None,
+    ) as session:
+        # Deals: one joined query; COUNT(*) OVER () carries the pre-LIMIT total.
         deals_query = (
-            select(Deal)
+            select(
+                Deal.id,
+                Deal.name,
+                Deal.amount,
+                Deal.stage,
+                Deal.close_date,
+                Account.name.label("account_name"),
+                User.name.label("owner_name"),
+                User.email.label("owner_email"),
+                func.count().over().label("total"),
+            )
+            .outerjoin(Account, Account.id == Deal.account_id)
+            .outerjoin(User, User.id == Deal.owner_id)
             .where(
                 Deal.organization_id == org_uuid,
-                Deal.name.ilike(search_pattern),
+                Deal.name.ilike(search_pattern, escape="\\"),
             )
             .order_by(Deal.amount.desc().nullslast())
             .limit(limit)
         )
-        deals_result = await session.execute(deals_query)
-        deals = list(deals_result.scalars().all())
-        
-        # Get total count for deals
-        deals_count_query = (
-            select(Deal.id)
-            .where(
-                Deal.organization_id == org_uuid,
-                Deal.name.ilike(search_pattern),
+        deal_rows = (await session.execute(deals_query)).all()
+        total_deals: int = deal_rows[0].total if deal_rows else 0
+
+        deal_results: list[DealResult] = [
+            DealResult(
+                id=str(row.id),
+                name=row.name,
+                amount=float(row.amount) if row.amount else None,
+                stage=row.stage,
+                close_date=row.close_date.isoformat() if row.close_date else None,
+                account_name=row.account_name,
+                owner_name=row.owner_name or row.owner_email,
             )
+            for row in deal_rows
+        ]
+
+        # Accounts: deal counts come from a correlated COUNT evaluated only
+        # for the returned page.
+        deal_count_subquery = (
+            select(func.count(Deal.id))
+            .where(Deal.account_id == Account.id)
+            .correlate(Account)
+            .scalar_subquery()
         )
-        deals_count_result = await session.execute(deals_count_query)
-        total_deals = len(list(deals_count_result.scalars().all()))
-        
-        # Fetch related account names and owner names for deals
-        deal_results: list[DealResult] = []
-        for deal in deals:
-            account_name: Optional[str] = None
-            owner_name: Optional[str] = None
-            
-            if deal.account_id:
-                account = await session.get(Account, deal.account_id)
-                if account:
-                    account_name = account.name
-            
-            if deal.owner_id:
-                owner = await session.get(User, deal.owner_id)
-                if owner:
-                    owner_name = owner.name or owner.email
-            
-            deal_results.append(DealResult(
-                id=str(deal.id),
-                name=deal.name,
-                amount=float(deal.amount) if deal.amount else None,
-                stage=deal.stage,
-                close_date=deal.close_date.isoformat() if deal.close_date else None,
-                account_name=account_name,
-                owner_name=owner_name,
-            ))
-        
-        # Search accounts
         accounts_query = (
-            select(Account)
+            select(
+                Account.id,
+                Account.name,
+                Account.domain,
+                Account.industry,
+                Account.annual_revenue,
+                deal_count_subquery.label("deal_count"),
+                func.count().over().label("total"),
+            )
             .where(
                 Account.organization_id == org_uuid,
                 or_(
-                    Account.name.ilike(search_pattern),
-                    Account.domain.ilike(search_pattern),
+                    Account.name.ilike(search_pattern, escape="\\"),
+                    Account.domain.ilike(search_pattern, escape="\\"),
                 ),
             )
             .order_by(Account.annual_revenue.desc().nullslast())
             .limit(limit)
         )
-        accounts_result = await session.execute(accounts_query)
-        accounts = list(accounts_result.scalars().all())
-        
-        # Get total count for accounts
-        accounts_count_query = (
-            select(Account.id)
-            .where(
-                Account.organization_id == org_uuid,
-                or_(
-                    Account.name.ilike(search_pattern),
-                    Account.domain.ilike(search_pattern),
-                ),
+        account_rows = (await session.execute(accounts_query)).all()
+        total_accounts: int = account_rows[0].total if account_rows else 0
+
+        account_results: list[AccountResult] = [
+            AccountResult(
+                id=str(row.id),
+                name=row.name,
+                domain=row.domain,
+                industry=row.industry,
+                annual_revenue=float(row.annual_revenue) if row.annual_revenue else None,
+                deal_count=row.deal_count or 0,
             )
-        )
-        accounts_count_result = await session.execute(accounts_count_query)
-        total_accounts = len(list(accounts_count_result.scalars().all()))
-        
-        # Count deals per account
-        account_results: list[AccountResult] = []
-        for account in accounts:
-            # Count deals for this account
-            deal_count_query = (
-                select(Deal.id)
-                .where(Deal.account_id == account.id)
-            )
-            deal_count_result = await session.execute(deal_count_query)
-            deal_count = len(list(deal_count_result.scalars().all()))
-            
-            account_results.append(AccountResult(
-                id=str(account.id),
-                name=account.name,
-                domain=account.domain,
-                industry=account.industry,
-                annual_revenue=float(account.annual_revenue) if account.annual_revenue else None,
-                deal_count=deal_count,
-            ))
-        
-        return SearchResponse(
-            query=q,
-            deals=deal_results,
-            accounts=account_results,
-            total_deals=total_deals,
-            total_accounts=total_accounts,
-        )
+            for row in account_rows
+        ]
+
+    return SearchResponse(
+        query=q,
+        deals=deal_results,
+        accounts=account_results,
+        total_deals=total_deals,
+        total_accounts=total_accounts,
+    )
@@ -254,13 +254,13 @@ async def serve_media(token: str) -> Response:
     HMAC-signed and expires after 5 minutes, so this is safe to expose
     without authentication.
     """
-    from services.file_handler import verify_media_token, retrieve_file
+    from services.file_handler import aretrieve_file, verify_media_token
 
     upload_id: str | None = verify_media_token(token)
     if upload_id is None:
         raise HTTPException(status_code=403, detail="Invalid or expired media token")
 
-    stored = retrieve_file(upload_id)
+    stored = await aretrieve_file(upload_id)
     if stored is None:
         raise HTTPException(status_code=404, detail="Media not found")
 
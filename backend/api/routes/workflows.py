@@ -19,6 +19,7 @@ from models.workflow import Workflow, WorkflowRun
 from api.auth_middleware import AuthContext, require_organization
 from services.llm_provider import is_model_allowed
 from services.workflow_pause import get_workflow_execution_pause_until
+from workers.events import invalidate_event_triggers
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -475,10 +476,13 @@ async def create_workflow(
             llm_model=request.llm_model or None,
             output_config=request.output_config,
             is_enabled=request.is_enabled,
+            created_at=datetime.utcnow(),
         )
+        workflow.next_run_at = workflow.compute_next_run_at()
         session.add(workflow)
         await session.commit()
         await session.refresh(workflow)
+        await invalidate_event_triggers(org_uuid)
 
         return WorkflowResponse(**workflow.to_dict())
 
@@ -545,8 +549,10 @@ async def update_workflow(
             workflow.is_enabled = request.is_enabled
 
         workflow.updated_at = datetime.utcnow()
+        workflow.next_run_at = workflow.compute_next_run_at()
         await session.commit()
         await session.refresh(workflow)
+        await invalidate_event_triggers(org_uuid)
 
         return WorkflowResponse(**workflow.to_dict())
 
@@ -583,6 +589,7 @@ async def delete_workflow(
 
         await session.delete(workflow)
         await session.commit()
+        await invalidate_event_triggers(org_uuid)
 
         return {"status": "deleted", "workflow_id": workflow_id}
 
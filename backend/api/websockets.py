@@ -8,6 +8,7 @@ Responsibilities:
 - Handle CRM operation approvals
 - Stream task updates to subscribed clients
 - Broadcast sync progress events to clients
+- Fan events out across API replicas (services.websocket_fanout)
 
 Architecture:
 - WebSocket is a subscription mechanism, not the driver of agent processes
@@ -19,12 +20,13 @@ Architecture:
 import json
 import logging
 import asyncio
-from collections import defaultdict
-from typing import Dict, Optional, Set
+from typing import Optional, Set
 from uuid import UUID, uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from services.websocket_fanout import WebSocketFanout, org_channel, user_channel
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +64,11 @@ async def _fanout_message(websockets: Set[WebSocket], message: str) -> Set[WebSo
     return dead
 
 
+# One fan-out per process: local socket registry plus the cross-replica broker.
+# Its subscriber is started and stopped by the app lifespan.
+websocket_fanout = WebSocketFanout(_fanout_message)
+
+
 # =============================================================================
 # Sync Progress Broadcasting
 # =============================================================================
@@ -71,22 +78,21 @@ class SyncProgressBroadcaster:
     Manages WebSocket connections for broadcasting sync progress events.
     
     Clients are grouped by organization_id so we only send events to
-    users who belong to that organization.
+    users who belong to that organization. Events are published on the
+    org's fan-out channel, so they reach the org's sockets on every API
+    replica, whichever process raised them.
     """
     
-    def __init__(self) -> None:
-        # org_id -> set of websockets
-        self._connections: Dict[str, Set[WebSocket]] = defaultdict(set)
+    def __init__(self, fanout: WebSocketFanout) -> None:
+        self._fanout = fanout
     
-    def register(self, organization_id: str, websocket: WebSocket) -> None:
-        """Register a websocket for sync progress updates."""
-        self._connections[organization_id].add(websocket)
+    async def register(self, organization_id: str, websocket: WebSocket) -> None:
+        """Register a websocket for sync progress updates (waits for the subscription)."""
+        await self._fanout.add(org_channel(organization_id), websocket)
     
     def unregister(self, organization_id: str, websocket: WebSocket) -> None:
         """Unregister a websocket."""
-        self._connections[organization_id].discard(websocket)
-        if not self._connections[organization_id]:
-            del self._connections[organization_id]
+        self._fanout.discard(org_channel(organization_id), websocket)
     
     async def broadcast(
         self,
@@ -95,31 +101,15 @@ class SyncProgressBroadcaster:
         data: dict,
     ) -> None:
         """Broadcast an event to all connected clients for an organization."""
-        websockets = self._connections.get(organization_id, set())
-        if not websockets:
-            return
-        
         message = json.dumps({
             "type": event_type,
             **data,
         })
-        
-        # Send to all concurrently so one stalled client can't block fanout.
-        dead = await _fanout_message(websockets, message)
-        if dead:
-            logger.debug(
-                "sync fanout removed %s stale websocket(s) for organization %s",
-                len(dead),
-                organization_id,
-            )
-        
-        # Clean up dead connections
-        for ws in dead:
-            self._connections[organization_id].discard(ws)
+        await self._fanout.publish(org_channel(organization_id), message)
 
 
 # Global broadcaster instance
-sync_broadcaster = SyncProgressBroadcaster()
+sync_broadcaster = SyncProgressBroadcaster(websocket_fanout)
 
 
 async def broadcast_sync_progress(
@@ -166,7 +156,8 @@ async def broadcast_tool_progress(
     """
     Broadcast tool progress to all connected clients for an organization.
     
-    Called from tools during execution to update the UI with progress.
+    Called from tools during execution to update the UI with progress,
+    including from Celery workers, which hold no sockets themselves.
     
     Args:
         organization_id: The organization UUID
@@ -176,16 +167,17 @@ async def broadcast_tool_progress(
         result: Progress result dict
         status: "running" for progress, "complete" when done
     """
+    data: dict = {
+        "conversation_id": conversation_id,
+        "tool_id": tool_id,
+        "tool_name": tool_name,
+        "result": result,
+        "status": status,
+    }
     await sync_broadcaster.broadcast(
         organization_id=organization_id,
         event_type="tool_progress",
-        data={
-            "conversation_id": conversation_id,
-            "tool_id": tool_id,
-            "tool_name": tool_name,
-            "result": result,
-            "status": status,
-        },
+        data=data,
     )
 
 
@@ -201,23 +193,20 @@ class ConversationBroadcaster:
     participants in a shared conversation.
     """
     
-    def __init__(self) -> None:
-        # user_id -> set of websockets (a user can have multiple tabs open)
-        self._user_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
+    def __init__(self, fanout: WebSocketFanout) -> None:
+        self._fanout = fanout
     
-    def register(self, user_id: str, websocket: WebSocket) -> None:
-        """Register a websocket for a user."""
-        self._user_connections[user_id].add(websocket)
+    async def register(self, user_id: str, websocket: WebSocket) -> None:
+        """Register a websocket for a user (waits for the subscription)."""
+        await self._fanout.add(user_channel(user_id), websocket)
     
     def unregister(self, user_id: str, websocket: WebSocket) -> None:
         """Unregister a websocket."""
-        self._user_connections[user_id].discard(websocket)
-        if not self._user_connections[user_id]:
-            del self._user_connections[user_id]
+        self._fanout.discard(user_channel(user_id), websocket)
 
     def get_user_websockets(self, user_id: str) -> Set[WebSocket]:
-        """Return a copy of the set of websockets for a user (for subscription use)."""
-        return self._user_connections.get(user_id, set()).copy()
+        """Return a copy of this process's websockets for a user (for subscription use)."""
+        return set(self._fanout.local_sockets(user_channel(user_id)))
 
     async def broadcast_to_users(
         self,
@@ -231,29 +220,16 @@ class ConversationBroadcaster:
             "type": event_type,
             **data,
         })
-        
-        dead_connections: list[tuple[str, WebSocket]] = []
-        for user_id in user_ids:
-            if exclude_user_id and user_id == exclude_user_id:
-                continue
-            
-            websockets = self._user_connections.get(user_id, set())
-            dead_for_user = await _fanout_message(websockets, message)
-            dead_connections.extend((user_id, ws) for ws in dead_for_user)
-            if dead_for_user:
-                logger.debug(
-                    "conversation fanout removed %s stale websocket(s) for user %s",
-                    len(dead_for_user),
-                    user_id,
-                )
-        
-        # Clean up dead connections
-        for user_id, ws in dead_connections:
-            self._user_connections[user_id].discard(ws)
+        # All recipients go to the broker in one batch.
+        await self._fanout.publish_many([
+            (user_channel(user_id), message)
+            for user_id in dict.fromkeys(user_ids)
+            if not (exclude_user_id and user_id == exclude_user_id)
+        ])
 
 
 # Global conversation broadcaster instance
-conversation_broadcaster = ConversationBroadcaster()
+conversation_broadcaster = ConversationBroadcaster(websocket_fanout)
 
 
 async def broadcast_conversation_message(
@@ -339,9 +315,8 @@ async def _collect_running_workflow_tool_updates(organization_id: str) -> list[d
     """
     Collect running workflow tool states from persisted chat messages.
 
-    This is used to keep clients in sync when tool execution happens inside
-    Celery workers (separate process) where in-memory websocket broadcasters
-    are not shared with the API process.
+    Used once per connection so a client that connects mid-run sees tools
+    already running inside Celery workers; later changes are pushed.
     """
     from models.conversation import Conversation
 
@@ -408,50 +383,23 @@ async def _collect_running_workflow_tool_updates(organization_id: str) -> list[d
     return updates
 
 
-async def _stream_workflow_tool_status(websocket: WebSocket, organization_id: str) -> None:
-    """Poll persisted workflow tool states and push deltas to this websocket."""
-    last_sent: dict[str, str] = {}
-    consecutive_errors: int = 0
-    BASE_INTERVAL: float = 1.5
-    MAX_BACKOFF: float = 30.0
-    logger.info("[WebSocket] Starting workflow tool status stream for org %s", organization_id)
-    while True:
-        try:
-            updates = await _collect_running_workflow_tool_updates(organization_id)
-            consecutive_errors = 0
-            for update in updates:
-                key: str = f"{update['conversation_id']}:{update['tool_id']}"
-                signature: str = json.dumps(update.get("result") or {}, sort_keys=True, default=str)
-                signature = f"{update.get('status')}::{signature}"
-                if last_sent.get(key) == signature:
-                    continue
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "tool_progress",
-                            **update,
-                        }
-                    )
-                )
-                logger.debug(
-                    "[WebSocket] Sent workflow tool status: conv=%s tool=%s",
-                    update["conversation_id"],
-                    update["tool_id"],
-                )
-                last_sent[key] = signature
-        except Exception as exc:
-            consecutive_errors += 1
-            if consecutive_errors <= 3:
-                logger.warning("[WebSocket] Workflow status stream error: %s", exc)
-            elif consecutive_errors == 4:
-                logger.warning(
-                    "[WebSocket] Workflow status stream error (suppressing further): %s", exc
-                )
-        sleep_time: float = min(
-            BASE_INTERVAL * (2 ** consecutive_errors) if consecutive_errors > 0 else BASE_INTERVAL,
-            MAX_BACKOFF,
-        )
-        await asyncio.sleep(sleep_time)
+async def _send_workflow_tool_snapshot(websocket: WebSocket, organization_id: str) -> None:
+    """Send the current running workflow tool states once, for connect catchup.
+
+    Live changes after this arrive as ``tool_progress`` events on the org channel.
+    """
+    try:
+        updates = await _collect_running_workflow_tool_updates(organization_id)
+        for update in updates:
+            await websocket.send_text(json.dumps({"type": "tool_progress", **update}))
+        if updates:
+            logger.debug(
+                "[WebSocket] Sent %d running workflow tool state(s) for org %s",
+                len(updates),
+                organization_id,
+            )
+    except Exception as exc:
+        logger.warning("[WebSocket] Workflow tool snapshot failed: %s", exc)
 
 
 async def _execute_tool_approval(
@@ -628,18 +576,18 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         await websocket.close(code=1008, reason="You're on the waitlist. We'll notify you when you have access.")
         return
 
-    workflow_status_task: asyncio.Task[None] | None = None
+    workflow_snapshot_task: asyncio.Task[None] | None = None
 
     try:
         # Register for sync progress broadcasts
         if organization_id:
-            sync_broadcaster.register(organization_id, websocket)
-            workflow_status_task = asyncio.create_task(
-                _stream_workflow_tool_status(websocket, organization_id)
+            await sync_broadcaster.register(organization_id, websocket)
+            workflow_snapshot_task = asyncio.create_task(
+                _send_workflow_tool_snapshot(websocket, organization_id)
             )
         
         # Register for conversation message broadcasts (multi-user support)
-        conversation_broadcaster.register(user_id_str, websocket)
+        await conversation_broadcaster.register(user_id_str, websocket)
         
         # Send active tasks on connect for client catchup
         active_tasks = await task_manager.get_active_tasks(user_id_str, organization_id)
@@ -1046,10 +994,10 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     except WebSocketDisconnect:
         logger.info("User %s disconnected", user_id_str)
     finally:
-        if workflow_status_task:
-            workflow_status_task.cancel()
+        if workflow_snapshot_task:
+            workflow_snapshot_task.cancel()
             try:
-                await workflow_status_task
+                await workflow_snapshot_task
             except asyncio.CancelledError:
                 pass
         # Clean up subscriptions
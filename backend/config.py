@@ -66,6 +66,8 @@ class Settings(BaseSettings):
     DEFAULT_PRIMARY_MODEL: str = "claude-opus-4-6"
     DEFAULT_CHEAP_MODEL: str = "claude-haiku-4-5-20251001"
     ALL_MODEL_STRINGS: str = ""
+    # Per process and provider; extra calls queue instead of opening more connections.
+    LLM_MAX_CONCURRENT_REQUESTS: int = 64
 
     # Anthropic
     ANTHROPIC_API_KEY: Optional[str] = None
@@ -182,6 +184,17 @@ class Settings(BaseSettings):
     TOPIC_GRAPH_HEAT_RECENCY_HALF_LIFE_HOURS: float = 24.0
     TOPIC_GRAPH_FUZZY_MERGE_MIN_CONFIDENCE: float = 0.5
 
+    # PDF exports (WeasyPrint) render in a separate process pool, off the API event loop
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_MAX_PENDING: int = 16  # Beyond this, downloads get a 503 instead of queueing
+    PDF_RENDER_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Chat attachment uploads: per-process RAM budget before spilling to disk, and the
+    # cross-process tier ("redis" or "none") so any replica or worker can consume an upload
+    ATTACHMENT_MEMORY_BUDGET_BYTES: int = 256 * 1024 * 1024
+    ATTACHMENT_SPILL_DIR: Optional[str] = None  # Defaults to the system temp dir
+    ATTACHMENT_SHARED_STORE: str = "redis"
+
     # Credits
     NUM_GRACE_CREDITS: int = 5
 
@@ -111,7 +111,7 @@ class ApolloConnector(BaseConnector):
             json_data = {}
         json_data["api_key"] = api_key
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
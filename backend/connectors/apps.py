@@ -68,6 +68,7 @@ The App component receives NO props. Data is NOT passed in. You MUST call `useAp
 ## Rules
 - All SQL must be SELECT-only. No INSERT/UPDATE/DELETE.
 - Do NOT add organization_id to WHERE clauses (RLS handles it).
+- Query results are cached for 30 seconds (refreshed sooner when a sync lands). Set "cache_ttl_seconds" on a query to change that (0 = always live, max 3600).
 - frontend_code must export a default React component.
 
 ## CRITICAL — Styling rules (apps render inside a sandboxed iframe)
@@ -571,12 +572,13 @@ class AppsConnector(BaseConnector):
         app_id_str: str = str(app_uuid)
         org_uuid: UUID = UUID(self.organization_id)
 
-        async with get_session(organization_id=self.organization_id) as session:
-            from utils.transpile_jsx import transpile_jsx
+        from utils.transpile_jsx import transpile_jsx_async
 
-            transpile_result: tuple[str | None, ...] = transpile_jsx(frontend_code)
-            compiled_code: str | None = transpile_result[0] if transpile_result else None
+        # Transpile before opening the session so no connection is held meanwhile.
+        transpile_result: tuple[str | None, ...] | None = await transpile_jsx_async(frontend_code)
+        compiled_code: str | None = transpile_result[0] if transpile_result else None
 
+        async with get_session(organization_id=self.organization_id) as session:
             msg_id_str: str | None = str(message_id) if message_id else None
 
             app: App = App(
@@ -637,6 +639,14 @@ class AppsConnector(BaseConnector):
         org_uuid: UUID = UUID(self.organization_id)
         app_uuid: UUID = UUID(app_id_raw)
 
+        compiled_update: str | None = None
+        if new_frontend_code is not None and str(new_frontend_code).strip():
+            from utils.transpile_jsx import transpile_jsx_async
+
+            # Transpile before opening the session so no connection is held meanwhile.
+            transpile_result = await transpile_jsx_async(str(new_frontend_code))
+            compiled_update = transpile_result[0] if transpile_result else None
+
         async with get_session(organization_id=self.organization_id) as session:
             result = await session.execute(
                 select(App).where(
@@ -664,10 +674,7 @@ class AppsConnector(BaseConnector):
                 if not str(new_frontend_code).strip():
                     return {"error": "frontend_code cannot be empty"}
                 app.frontend_code = str(new_frontend_code)
-                from utils.transpile_jsx import transpile_jsx
-
-                transpile_result = transpile_jsx(app.frontend_code)
-                app.frontend_code_compiled = transpile_result[0] if transpile_result else None
+                app.frontend_code_compiled = compiled_update
 
             if new_title is not None:
                 app.title = str(new_title)
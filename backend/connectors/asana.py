@@ -114,7 +114,7 @@ class AsanaConnector(BaseConnector):
         headers: dict[str, str] = await self._get_headers()
         url: str = f"{ASANA_API_BASE}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.get(
                 url,
                 headers=headers,
@@ -139,7 +139,7 @@ class AsanaConnector(BaseConnector):
         headers: dict[str, str] = await self._get_headers()
         url: str = f"{ASANA_API_BASE}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.post(
                 url,
                 headers=headers,
@@ -164,7 +164,7 @@ class AsanaConnector(BaseConnector):
         headers: dict[str, str] = await self._get_headers()
         url: str = f"{ASANA_API_BASE}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.put(
                 url,
                 headers=headers,
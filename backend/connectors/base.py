@@ -42,16 +42,20 @@ promptly.
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+import inspect
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncContextManager, AsyncIterable, Optional
 from uuid import UUID
 
+import httpx
 from sqlalchemy import case, select, update
 
 from config import get_nango_integration_id
+from connectors.http_client import DEFAULT_TIMEOUT_SECONDS, pooled_http_client
 from connectors.registry import ConnectorMeta  # noqa: F401 – re-export for convenience
 from models.database import get_session
 from models.integration import Integration
+from services.context_cache import invalidate_org_context
 from services.nango import get_nango_client
 
 
@@ -132,6 +136,10 @@ class BaseConnector(ABC):
     # due to clock skew or eventual consistency in upstream APIs.
     _SYNC_SINCE_BUFFER: timedelta = timedelta(minutes=5)
 
+    # Records per committed batch when a ``sync_*`` method yields an async
+    # iterator. Clamped further by the Postgres bind-parameter limit.
+    _STREAM_BATCH_SIZE: int = 1000
+
     def __init__(
         self,
         organization_id: str,
@@ -464,8 +472,8 @@ class BaseConnector(ABC):
 
         Returns a dict of entity-type → count-synced.  Supports both old-style
         connectors (``sync_*`` does its own DB upserts, returns ``int``) and
-        new-style connectors (``sync_*`` returns a ``list`` of Pydantic record
-        objects and the engine handles persistence).
+        new-style connectors (``sync_*`` returns a ``list`` or async iterator
+        of Pydantic record objects and the engine handles persistence).
         """
         await self.ensure_sync_active("sync_all:start")
 
@@ -479,7 +487,10 @@ class BaseConnector(ABC):
             if method is None:
                 continue
 
-            raw = await method()
+            raw = method()
+            if inspect.isawaitable(raw):
+                # Async generators (streaming syncs) are consumed by the engine.
+                raw = await raw
             count = await self._handle_sync_result(entity, raw)
             await self.ensure_sync_active(f"sync_all:after_{entity}")
 
@@ -488,27 +499,96 @@ class BaseConnector(ABC):
 
         return result
 
-    async def _handle_sync_result(self, entity: str, raw: int | list[Any]) -> int:
-        """Route old-style (int) vs new-style (list) sync results."""
+    async def _handle_sync_result(
+        self,
+        entity: str,
+        raw: int | list[Any] | AsyncIterable[Any],
+    ) -> int:
+        """Route old-style (int), new-style (list) and streaming sync results.
+
+        Async iterators are persisted in bounded batches via
+        :func:`connectors.persistence.persist_record_stream`; each committed
+        batch is checkpointed on the integration and broadcast as progress.
+        """
         if isinstance(raw, int):
             return raw
 
+        kwargs: dict[str, Any] = {}
+        if entity == "activities" and self._integration:
+            kwargs["integration_id"] = self._integration.id
+            kwargs["owner_user_id"] = self._integration.user_id
+            kwargs["visibility"] = (
+                "team" if self._integration.share_synced_data else "owner_only"
+            )
+
         if isinstance(raw, list):
             from connectors.persistence import persist_records
 
-            kwargs: dict[str, Any] = {}
-            if entity == "activities" and self._integration:
-                kwargs["integration_id"] = self._integration.id
-                kwargs["owner_user_id"] = self._integration.user_id
-                kwargs["visibility"] = (
-                    "team" if self._integration.share_synced_data else "owner_only"
-                )
             return await persist_records(
                 self.organization_id, entity, raw, self.source_system, **kwargs
             )
 
+        if hasattr(raw, "__aiter__"):
+            from connectors.persistence import persist_record_stream
+
+            async def _on_batch(batch_count: int, total: int) -> None:
+                await self._record_stream_checkpoint(entity, total)
+
+            return await persist_record_stream(
+                self.organization_id,
+                entity,
+                raw,
+                self.source_system,
+                batch_size=self._STREAM_BATCH_SIZE,
+                on_batch=_on_batch,
+                **kwargs,
+            )
+
         return 0
 
+    async def _record_stream_checkpoint(self, entity: str, total: int) -> None:
+        """Checkpoint a committed streaming batch and report progress.
+
+        Stores the running count as ``sync_stats["<entity>_checkpoint"]`` so an
+        interrupted sync shows how far it got (``update_last_sync`` replaces
+        the stats on success), then broadcasts ``sync_progress`` to the org.
+        """
+        from api.websockets import broadcast_sync_progress
+        from sqlalchemy.orm.attributes import flag_modified
+
+        if self._integration:
+            async with get_session(organization_id=self.organization_id) as session:
+                integration: Integration | None = await session.get(Integration, self._integration.id)
+                if integration:
+                    stats: dict[str, Any] = dict(integration.sync_stats or {})
+                    stats[f"{entity}_checkpoint"] = total
+                    integration.sync_stats = stats
+                    flag_modified(integration, "sync_stats")
+                    await session.commit()
+
+        await broadcast_sync_progress(
+            organization_id=self.organization_id,
+            provider=self.source_system,
+            count=total,
+            step=entity,
+        )
+
+    def http_client(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        follow_redirects: bool = False,
+    ) -> AsyncContextManager[httpx.AsyncClient]:
+        """Borrow this provider's pooled, keep-alive HTTP client.
+
+        Use as ``async with self.http_client(timeout=30.0) as client:``. The
+        client is shared across requests, retries and connector instances in
+        the process and is not closed when the block exits.
+        """
+        return pooled_http_client(
+            self.source_system, timeout=timeout, follow_redirects=follow_redirects
+        )
+
     async def get_oauth_token(self) -> tuple[str, str]:
         """
         Retrieve OAuth token from Nango.
@@ -648,6 +728,8 @@ class BaseConnector(ABC):
                     print(f"[Sync] Saving sync_stats={counts} to integration {integration.id}")
                 await session.commit()
                 print(f"[Sync] Committed update_last_sync for {self.source_system}")
+        # The chat connectors manifest shows each connector's sync status.
+        await invalidate_org_context(self.organization_id)
 
     async def mark_sync_started(self) -> None:
         """Persist a ``sync_started_at`` timestamp in ``sync_stats`` so any
@@ -706,6 +788,7 @@ class BaseConnector(ABC):
             if integration:
                 integration.last_error = error[:500]  # Truncate long errors
                 await session.commit()
+        await invalidate_org_context(self.organization_id)
 
     # ------------------------------------------------------------------
     # Capability methods – override in subclasses as needed
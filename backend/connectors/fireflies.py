@@ -15,7 +15,6 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-import httpx
 from sqlalchemy import select
 
 from api.websockets import broadcast_sync_progress
@@ -79,7 +78,7 @@ class FirefliesConnector(BaseConnector):
             op_name,
             list(variables.keys()) if variables else [],
         )
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             try:
                 response = await client.post(
                     FIREFLIES_API_BASE,
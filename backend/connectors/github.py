@@ -9,12 +9,13 @@ OAuth is handled through Nango (GitHub App or OAuth App).
 """
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import uuid as uuid_mod
 from datetime import datetime
 from types import SimpleNamespace
-from typing import Any, Optional, TypedDict
+from typing import Any, Awaitable, Callable, Optional, TypedDict
 from uuid import UUID
 
 import httpx
@@ -208,6 +209,29 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
 """,
     )
 
+    # Repos synced at once. Kept below the DB pool size (pool + overflow) so
+    # concurrent upserts don't queue on connections.
+    _REPO_SYNC_CONCURRENCY: int = 4
+    # Rows per multi-row INSERT ... ON CONFLICT statement.
+    _UPSERT_CHUNK_SIZE: int = 500
+    _PR_UPSERT_UPDATE_COLUMNS: tuple[str, ...] = (
+        "title",
+        "body",
+        "state",
+        "merged_by_login",
+        "merge_commit_sha",
+        "updated_date",
+        "merged_date",
+        "closed_date",
+        "additions",
+        "deletions",
+        "changed_files",
+        "commits_count",
+        "labels",
+        "reviewers",
+        "user_id",
+    )
+
     def __init__(
         self,
         organization_id: str,
@@ -308,7 +332,7 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
     ) -> Any:
         """GET from the GitHub REST API. Returns parsed JSON."""
         headers: dict[str, str] = await self._get_headers()
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with self.http_client(timeout=30.0, follow_redirects=True) as client:
             resp: httpx.Response = await client.get(
                 f"{GITHUB_API_BASE}{path}",
                 headers=headers,
@@ -324,7 +348,7 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
     ) -> Any:
         """POST to the GitHub REST API. Returns parsed JSON."""
         headers: dict[str, str] = await self._get_headers()
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with self.http_client(timeout=30.0, follow_redirects=True) as client:
             resp: httpx.Response = await client.post(
                 f"{GITHUB_API_BASE}{path}",
                 headers=headers,
@@ -340,7 +364,7 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
     ) -> Any:
         """PUT to the GitHub REST API. Returns parsed JSON."""
         headers: dict[str, str] = await self._get_headers()
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with self.http_client(timeout=30.0, follow_redirects=True) as client:
             resp: httpx.Response = await client.put(
                 f"{GITHUB_API_BASE}{path}",
                 headers=headers,
@@ -365,7 +389,7 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
         request_params: dict[str, Any] = {"per_page": 100, **(params or {})}
         url: str = f"{GITHUB_API_BASE}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with self.http_client(timeout=30.0, follow_redirects=True) as client:
             for _ in range(max_pages):
                 resp: httpx.Response = await client.get(
                     url, headers=headers, params=request_params
@@ -468,6 +492,76 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
         self._login_cache[login] = None
         return None
 
+    async def _resolve_users_by_logins(
+        self, logins_to_emails: dict[str, str | None]
+    ) -> dict[str, UUID | None]:
+        """
+        Batch version of :meth:`_resolve_user_by_login` for a whole page of records.
+
+        Uncached logins are resolved with one identity-mapping query and one
+        email query, and every result (including misses) is memoized in
+        ``_login_cache`` for the rest of the sync.
+        """
+        pending: dict[str, str | None] = {
+            login: email
+            for login, email in logins_to_emails.items()
+            if login and login not in self._login_cache
+        }
+        if pending:
+            org_uuid: UUID = UUID(self.organization_id)
+            async with get_session(organization_id=self.organization_id) as session:
+                result = await session.execute(
+                    select(
+                        ExternalIdentityMapping.external_userid,
+                        ExternalIdentityMapping.user_id,
+                    )
+                    .where(
+                        ExternalIdentityMapping.organization_id == org_uuid,
+                        ExternalIdentityMapping.external_userid.in_(list(pending)),
+                        ExternalIdentityMapping.source == "github",
+                        ExternalIdentityMapping.user_id.is_not(None),
+                    )
+                )
+                for login, mapped_user_id in result.all():
+                    self._login_cache.setdefault(login, mapped_user_id)
+
+                unresolved_emails: dict[str, str] = {
+                    login: email
+                    for login, email in pending.items()
+                    if email and login not in self._login_cache
+                }
+                if unresolved_emails:
+                    m_sub = select(OrgMember.user_id).where(
+                        OrgMember.organization_id == org_uuid,
+                        OrgMember.status.in_(_GITHUB_ORG_MEMBER_ACTIVE),
+                    )
+                    result = await session.execute(
+                        select(User.email, User.id).where(
+                            or_(
+                                User.id.in_(m_sub),
+                                and_(
+                                    User.is_guest.is_(True),
+                                    User.guest_organization_id == org_uuid,
+                                ),
+                            ),
+                            User.email.in_(set(unresolved_emails.values())),
+                        )
+                    )
+                    user_id_by_email: dict[str, UUID] = {}
+                    for email, matched_user_id in result.all():
+                        user_id_by_email.setdefault(email, matched_user_id)
+                    for login, email in unresolved_emails.items():
+                        if email in user_id_by_email:
+                            self._login_cache[login] = user_id_by_email[email]
+
+            for login in pending:
+                self._login_cache.setdefault(login, None)
+
+        return {
+            login: self._login_cache.get(login) if login else None
+            for login in logins_to_emails
+        }
+
     async def _ensure_github_identity_mapping(
         self,
         session: Any,
@@ -1571,30 +1665,50 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
             )
             return 0
 
-        count: int = 0
-        for repo in tracked_repos:
-            try:
-                data: dict[str, Any] = await self._gh_get(
-                    f"/repos/{repo['full_name']}"
+        async def _refresh(repo: _TrackedRepoSnapshot) -> int:
+            data: dict[str, Any] = await self._gh_get(
+                f"/repos/{repo['full_name']}"
+            )
+            async with get_session(organization_id=self.organization_id) as session:
+                db_repo: GitHubRepository | None = await session.get(
+                    GitHubRepository, repo["id"]
                 )
-                async with get_session(organization_id=self.organization_id) as session:
-                    db_repo: GitHubRepository | None = await session.get(
-                        GitHubRepository, repo["id"]
+                if db_repo:
+                    db_repo.description = data.get("description")
+                    db_repo.default_branch = data.get("default_branch", "main")
+                    db_repo.is_private = data.get("private", False)
+                    db_repo.language = data.get("language")
+                    db_repo.updated_at = datetime.utcnow()
+                    await session.commit()
+            return 1
+
+        return await self._run_for_each_repo(tracked_repos, _refresh, "refresh repo")
+
+    async def _run_for_each_repo(
+        self,
+        repos: list[_TrackedRepoSnapshot],
+        sync_one: Callable[[_TrackedRepoSnapshot], Awaitable[int]],
+        label: str,
+    ) -> int:
+        """Run *sync_one* across repos with bounded concurrency and sum the counts.
+
+        A failing repo is logged and skipped so one bad repo doesn't fail the
+        whole stage.
+        """
+        semaphore = asyncio.Semaphore(self._REPO_SYNC_CONCURRENCY)
+
+        async def _guarded(repo: _TrackedRepoSnapshot) -> int:
+            async with semaphore:
+                try:
+                    return await sync_one(repo)
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to %s for %s: %s", label, repo["full_name"], exc
                     )
-                    if db_repo:
-                        db_repo.description = data.get("description")
-                        db_repo.default_branch = data.get("default_branch", "main")
-                        db_repo.is_private = data.get("private", False)
-                        db_repo.language = data.get("language")
-                        db_repo.updated_at = datetime.utcnow()
-                        await session.commit()
-                count += 1
-            except Exception as exc:
-                logger.warning(
-                    "Failed to refresh repo %s: %s", repo["full_name"], exc
-                )
+                    return 0
 
-        return count
+        counts: list[int] = await asyncio.gather(*(_guarded(repo) for repo in repos))
+        return sum(counts)
 
     # ── Sync: Commits ────────────────────────────────────────────────────
 
@@ -1613,17 +1727,9 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
         if not tracked_repos:
             return 0
 
-        total_count: int = 0
-        for repo in tracked_repos:
-            try:
-                count: int = await self._sync_commits_for_repo(repo)
-                total_count += count
-            except Exception as exc:
-                logger.warning(
-                    "Failed to sync commits for %s: %s", repo["full_name"], exc
-                )
-
-        return total_count
+        return await self._run_for_each_repo(
+            tracked_repos, self._sync_commits_for_repo, "sync commits"
+        )
 
     async def _sync_commits_for_repo(self, repo: _TrackedRepoSnapshot) -> int:
         """Fetch and upsert commits for a single repo."""
@@ -1636,54 +1742,56 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
             params=commit_params,
         )
 
-        count: int = 0
-        async with get_session(organization_id=self.organization_id) as session:
-            for c in raw_commits:
-                commit_data: dict[str, Any] = c.get("commit", {})
-                author_info: dict[str, Any] = commit_data.get("author", {})
-                committer_info: dict[str, Any] = commit_data.get("committer", {})
-                gh_author: dict[str, Any] | None = c.get("author")  # GitHub user
-
-                author_email: str | None = author_info.get("email")
-                author_login: str | None = (
-                    gh_author["login"] if gh_author else None
-                )
-                user_id: UUID | None = await self._resolve_user_by_login(
-                    author_login, author_email
-                )
+        user_ids: dict[str, UUID | None] = await self._resolve_users_by_logins(
+            {
+                c["author"]["login"]: c.get("commit", {}).get("author", {}).get("email")
+                for c in raw_commits
+                if c.get("author") and c["author"].get("login")
+            }
+        )
 
-                # Parse dates
-                author_date: datetime = self._parse_gh_date(
-                    author_info.get("date", "")
-                )
-                committed_date: datetime | None = self._parse_gh_date_optional(
+        # Keyed by SHA: a multi-row ON CONFLICT must not touch a row twice.
+        rows_by_sha: dict[str, dict[str, Any]] = {}
+        for c in raw_commits:
+            commit_data: dict[str, Any] = c.get("commit", {})
+            author_info: dict[str, Any] = commit_data.get("author", {})
+            committer_info: dict[str, Any] = commit_data.get("committer", {})
+            gh_author: dict[str, Any] | None = c.get("author")  # GitHub user
+
+            author_login: str | None = (
+                gh_author["login"] if gh_author else None
+            )
+            rows_by_sha[c["sha"]] = {
+                "organization_id": org_uuid,
+                "repository_id": repo["id"],
+                "sha": c["sha"],
+                "message": commit_data.get("message", ""),
+                "author_name": author_info.get("name", "Unknown"),
+                "author_email": author_info.get("email"),
+                "author_login": author_login,
+                "author_date": self._parse_gh_date(author_info.get("date", "")),
+                "committer_name": committer_info.get("name"),
+                "committer_email": committer_info.get("email"),
+                "committed_date": self._parse_gh_date_optional(
                     committer_info.get("date")
-                )
+                ),
+                "url": c.get("html_url", ""),
+                "user_id": user_ids.get(author_login) if author_login else None,
+            }
 
+        rows: list[dict[str, Any]] = list(rows_by_sha.values())
+        async with get_session(organization_id=self.organization_id) as session:
+            for start in range(0, len(rows), self._UPSERT_CHUNK_SIZE):
                 stmt = pg_insert(GitHubCommit).values(
-                    organization_id=org_uuid,
-                    repository_id=repo["id"],
-                    sha=c["sha"],
-                    message=commit_data.get("message", ""),
-                    author_name=author_info.get("name", "Unknown"),
-                    author_email=author_email,
-                    author_login=author_login,
-                    author_date=author_date,
-                    committer_name=committer_info.get("name"),
-                    committer_email=committer_info.get("email"),
-                    committed_date=committed_date,
-                    url=c.get("html_url", ""),
-                    user_id=user_id,
-                ).on_conflict_do_update(
+                    rows[start:start + self._UPSERT_CHUNK_SIZE]
+                )
+                stmt = stmt.on_conflict_do_update(
                     index_elements=["organization_id", "repository_id", "sha"],
-                    set_={
-                        "user_id": user_id,
-                    },
+                    set_={"user_id": stmt.excluded.user_id},
                 )
                 await session.execute(stmt)
-                count += 1
-
             await session.commit()
+        count: int = len(rows)
 
         # Update last_sync_at on the repo
         async with get_session(organization_id=self.organization_id) as session:
@@ -1708,17 +1816,9 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
         if not tracked_repos:
             return 0
 
-        total_count: int = 0
-        for repo in tracked_repos:
-            try:
-                count: int = await self._sync_prs_for_repo(repo)
-                total_count += count
-            except Exception as exc:
-                logger.warning(
-                    "Failed to sync PRs for %s: %s", repo["full_name"], exc
-                )
-
-        return total_count
+        return await self._run_for_each_repo(
+            tracked_repos, self._sync_prs_for_repo, "sync PRs"
+        )
 
     async def _sync_prs_for_repo(self, repo: _TrackedRepoSnapshot) -> int:
         """Fetch and upsert PRs for a single repo."""
@@ -1728,111 +1828,94 @@ Use `run_sql_query` on `github_repositories`, `github_commits`, `github_pull_req
             params={"state": "all", "sort": "updated", "direction": "desc"},
         )
 
-        count: int = 0
-        async with get_session(organization_id=self.organization_id) as session:
+        if self.sync_since:
+            # Results are sorted by updated desc; stop at the first stale PR.
+            fresh_prs: list[dict[str, Any]] = []
             for pr in raw_prs:
-                if self.sync_since and pr.get("updated_at"):
-                    updated_at: datetime | None = self._parse_gh_date_optional(pr["updated_at"])
-                    if updated_at and updated_at < self.sync_since:
-                        break
-                user_info: dict[str, Any] = pr.get("user", {})
-                author_login: str = user_info.get("login", "unknown")
-                merged_by: dict[str, Any] | None = pr.get("merged_by")
-
-                # Determine state
-                state: str
-                if pr.get("merged_at"):
-                    state = "merged"
-                elif pr.get("state") == "closed":
-                    state = "closed"
-                else:
-                    state = "open"
-
-                # Extract labels
-                labels: list[str] = [
-                    lbl["name"] for lbl in pr.get("labels", []) if "name" in lbl
-                ]
-
-                # Extract requested reviewers
-                reviewers: list[str] = [
-                    rev["login"]
-                    for rev in pr.get("requested_reviewers", [])
-                    if "login" in rev
-                ]
-
-                # Resolve PR author to internal user
-                pr_user_id: UUID | None = await self._resolve_user_by_login(
-                    author_login
-                )
+                updated_at: datetime | None = self._parse_gh_date_optional(pr.get("updated_at"))
+                if updated_at and updated_at < self.sync_since:
+                    break
+                fresh_prs.append(pr)
+            raw_prs = fresh_prs
+
+        user_ids: dict[str, UUID | None] = await self._resolve_users_by_logins(
+            {(pr.get("user") or {}).get("login", "unknown"): None for pr in raw_prs}
+        )
+
+        # Keyed by PR number: a multi-row ON CONFLICT must not touch a row twice.
+        rows_by_number: dict[int, dict[str, Any]] = {}
+        for pr in raw_prs:
+            user_info: dict[str, Any] = pr.get("user", {})
+            author_login: str = user_info.get("login", "unknown")
+            merged_by: dict[str, Any] | None = pr.get("merged_by")
+
+            # Determine state
+            state: str
+            if pr.get("merged_at"):
+                state = "merged"
+            elif pr.get("state") == "closed":
+                state = "closed"
+            else:
+                state = "open"
 
+            # Extract labels
+            labels: list[str] = [
+                lbl["name"] for lbl in pr.get("labels", []) if "name" in lbl
+            ]
+
+            # Extract requested reviewers
+            reviewers: list[str] = [
+                rev["login"]
+                for rev in pr.get("requested_reviewers", [])
+                if "login" in rev
+            ]
+
+            rows_by_number[pr["number"]] = {
+                "organization_id": org_uuid,
+                "repository_id": repo["id"],
+                "github_pr_id": pr["id"],
+                "number": pr["number"],
+                "title": pr.get("title", ""),
+                "body": pr.get("body"),
+                "state": state,
+                "author_login": author_login,
+                "author_avatar_url": user_info.get("avatar_url"),
+                "merged_by_login": merged_by["login"] if merged_by else None,
+                "merge_commit_sha": pr.get("merge_commit_sha"),
+                "created_date": self._parse_gh_date(pr["created_at"]),
+                "updated_date": self._parse_gh_date_optional(pr.get("updated_at")),
+                "merged_date": self._parse_gh_date_optional(pr.get("merged_at")),
+                "closed_date": self._parse_gh_date_optional(pr.get("closed_at")),
+                "additions": pr.get("additions"),
+                "deletions": pr.get("deletions"),
+                "changed_files": pr.get("changed_files"),
+                "commits_count": pr.get("commits"),
+                "labels": labels or None,
+                "reviewers": reviewers or None,
+                "url": pr.get("html_url", ""),
+                "user_id": user_ids.get(author_login),
+            }
+
+        rows: list[dict[str, Any]] = list(rows_by_number.values())
+        async with get_session(organization_id=self.organization_id) as session:
+            for start in range(0, len(rows), self._UPSERT_CHUNK_SIZE):
                 stmt = pg_insert(GitHubPullRequest).values(
-                    organization_id=org_uuid,
-                    repository_id=repo["id"],
-                    github_pr_id=pr["id"],
-                    number=pr["number"],
-                    title=pr.get("title", ""),
-                    body=pr.get("body"),
-                    state=state,
-                    author_login=author_login,
-                    author_avatar_url=user_info.get("avatar_url"),
-                    merged_by_login=(
-                        merged_by["login"] if merged_by else None
-                    ),
-                    merge_commit_sha=pr.get("merge_commit_sha"),
-                    created_date=self._parse_gh_date(pr["created_at"]),
-                    updated_date=self._parse_gh_date_optional(
-                        pr.get("updated_at")
-                    ),
-                    merged_date=self._parse_gh_date_optional(
-                        pr.get("merged_at")
-                    ),
-                    closed_date=self._parse_gh_date_optional(
-                        pr.get("closed_at")
-                    ),
-                    additions=pr.get("additions"),
-                    deletions=pr.get("deletions"),
-                    changed_files=pr.get("changed_files"),
-                    commits_count=pr.get("commits"),
-                    labels=labels or None,
-                    reviewers=reviewers or None,
-                    url=pr.get("html_url", ""),
-                    user_id=pr_user_id,
-                ).on_conflict_do_update(
+                    rows[start:start + self._UPSERT_CHUNK_SIZE]
+                )
+                stmt = stmt.on_conflict_do_update(
                     index_elements=[
                         "organization_id",
                         "repository_id",
                         "number",
                     ],
                     set_={
-                        "title": pr.get("title", ""),
-                        "body": pr.get("body"),
-                        "state": state,
-                        "merged_by_login": (
-                            merged_by["login"] if merged_by else None
-                        ),
-                        "merge_commit_sha": pr.get("merge_commit_sha"),
-                        "updated_date": self._parse_gh_date_optional(
-                            pr.get("updated_at")
-                        ),
-                        "merged_date": self._parse_gh_date_optional(
-                            pr.get("merged_at")
-                        ),
-                        "closed_date": self._parse_gh_date_optional(
-                            pr.get("closed_at")
-                        ),
-                        "additions": pr.get("additions"),
-                        "deletions": pr.get("deletions"),
-                        "changed_files": pr.get("changed_files"),
-                        "commits_count": pr.get("commits"),
-                        "labels": labels or None,
-                        "reviewers": reviewers or None,
-                        "user_id": pr_user_id,
+                        col: getattr(stmt.excluded, col)
+                        for col in self._PR_UPSERT_UPDATE_COLUMNS
                     },
                 )
                 await session.execute(stmt)
-                count += 1
-
             await session.commit()
+        count: int = len(rows)
 
         logger.info("Synced %d PRs for %s", count, repo["full_name"])
         return count
@@ -103,7 +103,7 @@ Send an email via the user's connected Gmail account. Emails are sent from the a
         headers = await self._get_headers()
         url = f"{GMAIL_API_BASE}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -516,7 +516,7 @@ Send an email via the user's connected Gmail account. Emails are sent from the a
         headers = await self._get_headers()
         url = f"{GMAIL_API_BASE}/users/me/messages/send"
         
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             try:
                 response = await client.post(
                     url,
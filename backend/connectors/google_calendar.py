@@ -157,7 +157,7 @@ class GoogleCalendarConnector(BaseConnector):
         headers = await self._get_headers()
         url = f"{GOOGLE_CALENDAR_API_BASE}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -180,7 +180,7 @@ class GoogleCalendarConnector(BaseConnector):
         headers = await self._get_headers()
         url = f"{GOOGLE_MEET_API_BASE}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -705,7 +705,7 @@ class GoogleCalendarConnector(BaseConnector):
         if not token:
             return ""
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             resp = await client.get(
                 f"https://www.googleapis.com/drive/v3/files/{doc_id}/export",
                 headers={"Authorization": f"Bearer {token}"},
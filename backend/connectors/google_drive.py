@@ -9,7 +9,8 @@ Google Drive connector for syncing file metadata, reading, creating, and editing
 
 Flow:
 1. User connects Google account via OAuth (Nango)
-2. Sync crawls Drive and stores file metadata in shared_files table (source='google_drive')
+2. First sync crawls Drive and stores file metadata in shared_files table (source='google_drive');
+   later syncs replay the Drive Changes API from a page token stored on the integration
 3. Agent can search files by name and read their text content
 4. Agent can create new folders and files in the user's Drive
 5. Agent can edit existing files (user must have edit permission on the file)
@@ -25,11 +26,12 @@ from typing import Any, Optional
 from uuid import UUID, uuid4
 
 import httpx
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam, delete, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from config import settings, get_nango_integration_id
 from connectors.base import BaseConnector
+from connectors.persistence import _max_rows_per_statement
 from connectors.registry import (
     AuthType, Capability, ConnectorAction, ConnectorMeta, ConnectorScope,
 )
@@ -84,6 +86,22 @@ EXPORT_MIME_MAP: dict[str, str] = {
 # File fields we request from Drive API
 FILE_FIELDS: str = "id,name,mimeType,parents,modifiedTime,size,webViewLink,trashed"
 LIST_FIELDS: str = f"nextPageToken,files({FILE_FIELDS})"
+CHANGES_FIELDS: str = f"nextPageToken,newStartPageToken,changes(fileId,removed,file({FILE_FIELDS}))"
+
+# Integration.extra_data key holding the changes.list cursor between syncs
+CHANGES_PAGE_TOKEN_KEY: str = "drive_changes_page_token"
+
+# shared_files columns refreshed when an existing row is upserted
+SHARED_FILE_UPSERT_COLUMNS: tuple[str, ...] = (
+    "name",
+    "mime_type",
+    "parent_external_id",
+    "folder_path",
+    "web_view_link",
+    "file_size",
+    "source_modified_at",
+    "synced_at",
+)
 
 # Max content length we'll return to the agent (characters)
 MAX_CONTENT_LENGTH: int = 100_000
@@ -586,23 +604,45 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
 
     async def sync_file_metadata(self) -> dict[str, int]:
         """
-        Crawl the user's entire Drive and upsert file metadata into the database.
+        Sync the user's Drive file metadata into the database.
+
+        The first run crawls the whole Drive with ``files.list``. Every run
+        stores a ``changes.list`` page token on the integration, so later runs
+        only replay what changed since, resolving folder paths against the
+        folder rows already in shared_files. A rejected token, or a manual
+        resync with an explicit ``since``, falls back to a full crawl.
 
         Returns counts of files synced by type.
         """
         await self.get_oauth_token()
 
-        all_files: list[dict[str, Any]] = []
+        page_token: Optional[str] = await self._get_changes_page_token()
+        if page_token and self._sync_since_override is None:
+            counts: Optional[dict[str, int]] = await self._sync_changes(page_token)
+            if counts is not None:
+                return counts
+            logger.warning(
+                "[GoogleDrive] Changes page token rejected for org=%s user=%s; running full crawl",
+                self.organization_id,
+                self.user_id,
+            )
+
+        return await self._sync_full_crawl()
+
+    async def _sync_full_crawl(self) -> dict[str, int]:
+        """Crawl the entire Drive with files.list and upsert every file."""
+        # Keyed by file id: files.list can return the same file on more than one
+        # page, and a repeated id in one upsert statement fails in Postgres.
+        crawled: dict[str, dict[str, Any]] = {}
         page_token: Optional[str] = None
 
-        drive_query: str = "trashed=false"
-        if self.sync_since:
-            drive_query += f" and modifiedTime > '{self.sync_since.isoformat()}Z'"
+        async with self.http_client(timeout=60.0) as client:
+            # Taken before crawling so edits made during the crawl are replayed next run.
+            start_page_token: str = await self._fetch_start_page_token(client)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
             while True:
                 params: dict[str, Any] = {
-                    "q": drive_query,
+                    "q": "trashed=false",
                     "fields": LIST_FIELDS,
                     "pageSize": 1000,
                     "supportsAllDrives": "true",
@@ -628,107 +668,349 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
                     )
 
                 data: dict[str, Any] = response.json()
-                files: list[dict[str, Any]] = data.get("files", [])
-                all_files.extend(files)
+                for file_data in data.get("files", []):
+                    crawled[file_data["id"]] = file_data
 
                 page_token = data.get("nextPageToken")
                 if not page_token:
                     break
 
-        # Build folder-path lookup
+        all_files: list[dict[str, Any]] = list(crawled.values())
         folder_paths: dict[str, str] = self._build_folder_paths(all_files)
+        synced_at: datetime = datetime.utcnow()
+        rows: list[dict[str, Any]] = [
+            self._file_row(file_data, folder_paths, synced_at) for file_data in all_files
+        ]
 
-        # Upsert into database
-        org_uuid: UUID = UUID(self.organization_id)
-        user_uuid: UUID = UUID(self.user_id)
-        counts: dict[str, int] = {"folders": 0, "docs": 0, "sheets": 0, "slides": 0, "other": 0}
+        async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
+            await self._upsert_file_rows(session, rows)
+            await self._store_changes_page_token(session, start_page_token)
+            await session.commit()
+
+        counts: dict[str, int] = self._count_by_type(all_files)
+        logger.info(
+            "[GoogleDrive] Full crawl synced %d files for org=%s user=%s: %s",
+            sum(counts.values()),
+            self.organization_id,
+            self.user_id,
+            counts,
+        )
+        return counts
+
+    async def _sync_changes(self, page_token: str) -> Optional[dict[str, int]]:
+        """
+        Replay changes.list from *page_token* and apply them to shared_files.
+
+        Returns counts of changed files by type, or None when Drive no longer
+        accepts the token (the caller then runs a full crawl).
+        """
+        changed: dict[str, dict[str, Any]] = {}
+        removed: set[str] = set()
+
+        async with self.http_client(timeout=60.0) as client:
+            while True:
+                params: dict[str, Any] = {
+                    "pageToken": page_token,
+                    "fields": CHANGES_FIELDS,
+                    "pageSize": 1000,
+                    "includeRemoved": "true",
+                    "spaces": "drive",
+                    "supportsAllDrives": "true",
+                    "includeItemsFromAllDrives": "true",
+                }
+                response = await client.get(
+                    f"{DRIVE_API_BASE}/changes",
+                    headers=self._get_headers(),
+                    params=params,
+                )
+
+                if response.status_code in (400, 404, 410):
+                    logger.info(
+                        "[GoogleDrive] changes.list rejected page token: %s %s",
+                        response.status_code,
+                        response.text,
+                    )
+                    return None
+                if response.status_code != 200:
+                    logger.error(
+                        "[GoogleDrive] Failed to list changes: %s %s",
+                        response.status_code,
+                        response.text,
+                    )
+                    raise ValueError(
+                        f"Failed to list Drive changes: {response.status_code}"
+                    )
+
+                data: dict[str, Any] = response.json()
+                for change in data.get("changes", []):
+                    file_id: Optional[str] = change.get("fileId")
+                    if not file_id:
+                        # Shared-drive level change, not a file.
+                        continue
+                    file_data: Optional[dict[str, Any]] = change.get("file")
+                    if change.get("removed") or not file_data or file_data.get("trashed"):
+                        removed.add(file_id)
+                        changed.pop(file_id, None)
+                    else:
+                        changed[file_id] = file_data
+                        removed.discard(file_id)
+
+                next_page_token: Optional[str] = data.get("nextPageToken")
+                if next_page_token:
+                    page_token = next_page_token
+                    continue
+                new_start_page_token: str = data.get("newStartPageToken") or page_token
+                break
 
+        changed_files: list[dict[str, Any]] = list(changed.values())
         async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
-            for file_data in all_files:
-                file_id: str = file_data["id"]
-                mime_type: str = file_data.get("mimeType", "")
-                parent_ids: list[str] = file_data.get("parents", [])
-                parent_id: Optional[str] = parent_ids[0] if parent_ids else None
-
-                # Determine folder path
-                folder_path: str = folder_paths.get(parent_id, "/") if parent_id else "/"
-
-                # Count by type
-                if mime_type == GOOGLE_FOLDER_MIME:
-                    counts["folders"] += 1
-                elif mime_type == GOOGLE_DOC_MIME:
-                    counts["docs"] += 1
-                elif mime_type == GOOGLE_SHEET_MIME:
-                    counts["sheets"] += 1
-                elif mime_type == GOOGLE_SLIDES_MIME:
-                    counts["slides"] += 1
-                else:
-                    counts["other"] += 1
-
-                # Parse modified time (strip tz to match TIMESTAMP WITHOUT TIME ZONE column)
-                modified_time: Optional[datetime] = None
-                raw_modified: Optional[str] = file_data.get("modifiedTime")
-                if raw_modified:
-                    try:
-                        dt = datetime.fromisoformat(
-                            raw_modified.replace("Z", "+00:00")
-                        )
-                        modified_time = dt.replace(tzinfo=None)
-                    except ValueError:
-                        pass
-
-                # Parse file size
-                file_size: Optional[int] = None
-                raw_size: Optional[str] = file_data.get("size")
-                if raw_size:
-                    try:
-                        file_size = int(raw_size)
-                    except ValueError:
-                        pass
-
-                # Upsert
-                stmt = pg_insert(SharedFile).values(
-                    id=uuid4(),
-                    organization_id=org_uuid,
-                    user_id=user_uuid,
-                    source="google_drive",
-                    external_id=file_id,
-                    name=file_data.get("name", ""),
-                    mime_type=mime_type,
-                    parent_external_id=parent_id,
-                    folder_path=folder_path,
-                    web_view_link=file_data.get("webViewLink"),
-                    file_size=file_size,
-                    source_modified_at=modified_time,
-                    synced_at=datetime.utcnow(),
-                ).on_conflict_do_update(
-                    index_elements=["organization_id", "user_id", "source", "external_id"],
-                    set_={
-                        "name": file_data.get("name", ""),
-                        "mime_type": mime_type,
-                        "parent_external_id": parent_id,
-                        "folder_path": folder_path,
-                        "web_view_link": file_data.get("webViewLink"),
-                        "file_size": file_size,
-                        "source_modified_at": modified_time,
-                        "synced_at": datetime.utcnow(),
-                    },
+            if changed_files or removed:
+                result = await session.execute(
+                    select(
+                        SharedFile.external_id,
+                        SharedFile.name,
+                        SharedFile.parent_external_id,
+                    ).where(
+                        *self._shared_file_scope(),
+                        SharedFile.mime_type == GOOGLE_FOLDER_MIME,
+                    )
+                )
+                folder_rows: list[tuple[str, str, Optional[str]]] = [tuple(row) for row in result.all()]
+                folder_paths, moved_paths = self._apply_folder_changes(
+                    folder_rows, changed_files, removed
                 )
-                await session.execute(stmt)
 
+                synced_at: datetime = datetime.utcnow()
+                await self._upsert_file_rows(
+                    session,
+                    [self._file_row(f, folder_paths, synced_at) for f in changed_files],
+                )
+                await self._repath_children(session, moved_paths)
+                await self._delete_files(session, removed)
+            await self._store_changes_page_token(session, new_start_page_token)
             await session.commit()
 
-        total_files: int = sum(counts.values())
+        counts: dict[str, int] = self._count_by_type(changed_files)
         logger.info(
-            "[GoogleDrive] Synced %d files for org=%s user=%s: %s",
-            total_files,
+            "[GoogleDrive] Incremental sync for org=%s user=%s: %s changed, %d removed",
             self.organization_id,
             self.user_id,
             counts,
+            len(removed),
         )
         return counts
 
-    def _build_folder_paths(self, files: list[dict[str, Any]]) -> dict[str, str]:
+    async def _fetch_start_page_token(self, client: httpx.AsyncClient) -> str:
+        """Return the changes.list cursor for 'now'."""
+        response = await client.get(
+            f"{DRIVE_API_BASE}/changes/startPageToken",
+            headers=self._get_headers(),
+            params={"supportsAllDrives": "true"},
+        )
+        if response.status_code != 200:
+            logger.error(
+                "[GoogleDrive] Failed to get start page token: %s %s",
+                response.status_code,
+                response.text,
+            )
+            raise ValueError(
+                f"Failed to get Drive start page token: {response.status_code}"
+            )
+        return response.json()["startPageToken"]
+
+    async def _get_changes_page_token(self) -> Optional[str]:
+        """Load the changes.list cursor persisted by the previous sync, if any."""
+        async with get_session(organization_id=self.organization_id, user_id=self.user_id) as session:
+            result = await session.execute(
+                select(Integration.extra_data).where(*self._integration_scope())
+            )
+            extra_data: Optional[dict[str, Any]] = result.scalar_one_or_none()
+        return (extra_data or {}).get(CHANGES_PAGE_TOKEN_KEY)
+
+    async def _store_changes_page_token(self, session: Any, page_token: str) -> None:
+        """Persist the changes.list cursor in the integration's extra_data (caller commits)."""
+        result = await session.execute(
+            select(Integration).where(*self._integration_scope())
+        )
+        integration: Optional[Integration] = result.scalar_one_or_none()
+        if integration is None:
+            return
+        # Reassign rather than mutate so SQLAlchemy sees the JSONB change.
+        integration.extra_data = {
+            **(integration.extra_data or {}),
+            CHANGES_PAGE_TOKEN_KEY: page_token,
+        }
+
+    def _integration_scope(self) -> list[Any]:
+        return [
+            Integration.organization_id == UUID(self.organization_id),
+            Integration.connector == "google_drive",
+            Integration.user_id == UUID(self.user_id),
+        ]
+
+    def _shared_file_scope(self) -> list[Any]:
+        return [
+            SharedFile.organization_id == UUID(self.organization_id),
+            SharedFile.user_id == UUID(self.user_id),
+            SharedFile.source == "google_drive",
+        ]
+
+    def _file_row(
+        self,
+        file_data: dict[str, Any],
+        folder_paths: dict[str, str],
+        synced_at: datetime,
+    ) -> dict[str, Any]:
+        """Map a Drive file resource onto a shared_files row."""
+        parent_ids: list[str] = file_data.get("parents", [])
+        parent_id: Optional[str] = parent_ids[0] if parent_ids else None
+
+        # Parse modified time (strip tz to match TIMESTAMP WITHOUT TIME ZONE column)
+        modified_time: Optional[datetime] = None
+        raw_modified: Optional[str] = file_data.get("modifiedTime")
+        if raw_modified:
+            try:
+                dt = datetime.fromisoformat(raw_modified.replace("Z", "+00:00"))
+                modified_time = dt.replace(tzinfo=None)
+            except ValueError:
+                pass
+
+        # Parse file size
+        file_size: Optional[int] = None
+        raw_size: Optional[str] = file_data.get("size")
+        if raw_size:
+            try:
+                file_size = int(raw_size)
+            except ValueError:
+                pass
+
+        return {
+            "id": uuid4(),
+            "organization_id": UUID(self.organization_id),
+            "user_id": UUID(self.user_id),
+            "source": "google_drive",
+            "external_id": file_data["id"],
+            "name": file_data.get("name", ""),
+            "mime_type": file_data.get("mimeType", ""),
+            "parent_external_id": parent_id,
+            "folder_path": folder_paths.get(parent_id, "/") if parent_id else "/",
+            "web_view_link": file_data.get("webViewLink"),
+            "file_size": file_size,
+            "source_modified_at": modified_time,
+            "synced_at": synced_at,
+        }
+
+    @staticmethod
+    def _count_by_type(files: list[dict[str, Any]]) -> dict[str, int]:
+        counts: dict[str, int] = {"folders": 0, "docs": 0, "sheets": 0, "slides": 0, "other": 0}
+        for file_data in files:
+            mime_type: str = file_data.get("mimeType", "")
+            if mime_type == GOOGLE_FOLDER_MIME:
+                counts["folders"] += 1
+            elif mime_type == GOOGLE_DOC_MIME:
+                counts["docs"] += 1
+            elif mime_type == GOOGLE_SHEET_MIME:
+                counts["sheets"] += 1
+            elif mime_type == GOOGLE_SLIDES_MIME:
+                counts["slides"] += 1
+            else:
+                counts["other"] += 1
+        return counts
+
+    @staticmethod
+    def _upsert_statements(rows: list[dict[str, Any]]) -> list[Any]:
+        """Build multi-row ON CONFLICT upserts for *rows*, split under the bind-param cap."""
+        if not rows:
+            return []
+        excluded = pg_insert(SharedFile).excluded
+        set_: dict[str, Any] = {
+            col: getattr(excluded, col) for col in SHARED_FILE_UPSERT_COLUMNS
+        }
+        chunk_size: int = _max_rows_per_statement(len(rows[0]))
+        return [
+            pg_insert(SharedFile)
+            .values(rows[start:start + chunk_size])
+            .on_conflict_do_update(
+                index_elements=["organization_id", "user_id", "source", "external_id"],
+                set_=set_,
+            )
+            for start in range(0, len(rows), chunk_size)
+        ]
+
+    async def _upsert_file_rows(self, session: Any, rows: list[dict[str, Any]]) -> None:
+        for stmt in self._upsert_statements(rows):
+            await session.execute(stmt)
+
+    async def _repath_children(self, session: Any, moved_paths: dict[str, str]) -> None:
+        """Point every row inside a renamed or moved folder at the folder's new path."""
+        if not moved_paths:
+            return
+        table = SharedFile.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.organization_id == UUID(self.organization_id),
+                table.c.user_id == UUID(self.user_id),
+                table.c.source == "google_drive",
+                table.c.parent_external_id == bindparam("folder_id"),
+            )
+            .values(folder_path=bindparam("new_path"))
+        )
+        await session.execute(
+            stmt,
+            [{"folder_id": fid, "new_path": path} for fid, path in moved_paths.items()],
+        )
+
+    async def _delete_files(self, session: Any, external_ids: set[str]) -> None:
+        """Drop rows for files that were deleted, trashed, or lost access to."""
+        ids: list[str] = sorted(external_ids)
+        chunk_size: int = _max_rows_per_statement(1)
+        for start in range(0, len(ids), chunk_size):
+            await session.execute(
+                delete(SharedFile).where(
+                    *self._shared_file_scope(),
+                    SharedFile.external_id.in_(ids[start:start + chunk_size]),
+                )
+            )
+
+    @classmethod
+    def _apply_folder_changes(
+        cls,
+        folder_rows: list[tuple[str, str, Optional[str]]],
+        changed_files: list[dict[str, Any]],
+        removed_ids: set[str],
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """
+        Apply changed and removed folders to the stored folder tree.
+
+        *folder_rows* are (external_id, name, parent_external_id) for the
+        folders already synced. Returns (folder_paths, moved_paths): the path
+        of every known folder after the changes, and the subset whose path
+        differs from before (renamed or moved folders and everything below).
+        """
+        folder_names: dict[str, str] = {fid: name for fid, name, _ in folder_rows}
+        folder_parents: dict[str, Optional[str]] = {fid: parent for fid, _, parent in folder_rows}
+        old_paths: dict[str, str] = cls._resolve_folder_paths(folder_names, folder_parents)
+
+        for f in changed_files:
+            if f.get("mimeType") == GOOGLE_FOLDER_MIME:
+                folder_names[f["id"]] = f.get("name", "")
+                parents: list[str] = f.get("parents", [])
+                folder_parents[f["id"]] = parents[0] if parents else None
+        for fid in removed_ids:
+            folder_names.pop(fid, None)
+            folder_parents.pop(fid, None)
+
+        new_paths: dict[str, str] = cls._resolve_folder_paths(folder_names, folder_parents)
+        moved_paths: dict[str, str] = {
+            fid: path
+            for fid, path in new_paths.items()
+            if fid in old_paths and old_paths[fid] != path
+        }
+        return new_paths, moved_paths
+
+    @classmethod
+    def _build_folder_paths(cls, files: list[dict[str, Any]]) -> dict[str, str]:
         """
         Build a mapping of folder_id → full folder path from the file list.
 
@@ -745,7 +1027,14 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
                 parents: list[str] = f.get("parents", [])
                 folder_parents[fid] = parents[0] if parents else None
 
-        # Resolve full paths with cycle protection
+        return cls._resolve_folder_paths(folder_names, folder_parents)
+
+    @staticmethod
+    def _resolve_folder_paths(
+        folder_names: dict[str, str],
+        folder_parents: dict[str, Optional[str]],
+    ) -> dict[str, str]:
+        """Resolve full paths for every folder, with cycle protection."""
         cache: dict[str, str] = {}
 
         def resolve(folder_id: str, depth: int = 0) -> str:
@@ -838,7 +1127,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
             f" and trashed=false"
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp = await client.get(
                 f"{DRIVE_API_BASE}/files",
                 headers=self._get_headers(),
@@ -929,7 +1218,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
 
     async def _get_live_file_snapshot(self, external_id: str) -> Optional[dict[str, Any]]:
         """Fetch file metadata directly from Drive when local synced metadata is missing."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             response = await client.get(
                 f"{DRIVE_API_BASE}/files/{external_id}",
                 headers=self._get_headers(),
@@ -986,7 +1275,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
         mime_type: str = file_snapshot["mime_type"]
         file_name: str = file_snapshot["name"]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             # Google Workspace files need export
             export_mime: Optional[str] = EXPORT_MIME_MAP.get(mime_type)
             if export_mime:
@@ -1161,7 +1450,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
 
         await self.get_oauth_token()
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             create_body: dict[str, Any] = {
                 "name": name.strip(),
                 "mimeType": GOOGLE_FOLDER_MIME,
@@ -1226,7 +1515,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
 
         await self.get_oauth_token()
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             # Step 1: Create the empty file via Drive API
             create_body: dict[str, Any] = {
                 "name": title,
@@ -1310,7 +1599,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
         mime_type: str = file_snapshot["mime_type"]
         file_name: str = file_snapshot["name"]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             edit_error: Optional[str] = None
 
             if mime_type == GOOGLE_DOC_MIME:
@@ -1366,7 +1655,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
         if mime_type != GOOGLE_DOC_MIME:
             return {"error": "insert_text only works on Google Docs, not Sheets or Slides."}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             # Fetch doc structure to map line -> character index
             doc_resp = await client.get(
                 f"{DOCS_API_BASE}/documents/{external_id}",
@@ -1475,7 +1764,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
         # Resolve the target sheet tab
         range_notation: str = f"'{sheet}'" if sheet else "Sheet1"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             # If no sheet name given, discover the first sheet's actual name
             if not sheet:
                 meta_resp = await client.get(
@@ -1533,7 +1822,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
         if mime_type != GOOGLE_SHEET_MIME:
             return {"error": "update_cells only works on Google Sheets."}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             resp = await client.put(
                 f"{SHEETS_API_BASE}/spreadsheets/{external_id}/values/{range_notation}",
                 headers={**self._get_headers(), "Content-Type": "application/json"},
@@ -2157,7 +2446,7 @@ Call via `run_on_connector(connector='google_drive', action='edit_file', params=
             external_id = data.get("external_id") or data.get("file_id")
             if external_id and operation in ("insert_text", "edit_file", "append_rows"):
                 token, _ = await self.get_oauth_token()
-                async with httpx.AsyncClient() as client:
+                async with self.http_client() as client:
                     resp = await client.get(
                         f"https://www.googleapis.com/drive/v3/files/{external_id}",
                         headers={"Authorization": f"Bearer {token}"},
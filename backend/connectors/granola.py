@@ -78,7 +78,7 @@ class GranolaMcpClient:
         if params is not None:
             payload["params"] = params
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             response: httpx.Response = await client.post(
                 GRANOLA_MCP_URL,
                 headers=self._headers(),
@@ -130,7 +130,7 @@ class GranolaMcpClient:
             "clientInfo": {"name": "basebase", "version": "1.0.0"},
         })
         # Send initialized notification (no id, no response expected)
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with self.http_client(timeout=10.0) as client:
             await client.post(
                 GRANOLA_MCP_URL,
                 headers=self._headers(),
@@ -0,0 +1,171 @@
+"""
+Shared, connection-pooled HTTP clients for connectors.
+
+Opening a fresh ``httpx.AsyncClient`` per request (and per retry) pays a new
+TCP + TLS handshake for every API page. Connectors instead borrow a
+long-lived client from this module: one pool per event loop, provider and
+client configuration (timeout / redirect policy), with keep-alive and HTTP/2
+when the ``h2`` package is installed.
+
+Every pooled client is governed: requests wait on the distributed,
+per-provider rate budget in ``connectors.rate_governor`` and responses feed
+``Retry-After`` / rate-limit headers back into it.
+
+Pooled clients are shared across organizations and users, so they never keep
+cookies: a ``Set-Cookie`` on one tenant's response (session or load-balancer
+affinity) must not ride along on another tenant's request to the same host.
+
+Clients are bound to the event loop that created them, because httpx
+connections cannot be shared across loops. Lifecycle:
+
+- Celery workers: ``workers.run_async`` resets the registry whenever it
+  creates a new loop, ``worker_process_init`` resets it after fork, and
+  ``worker_process_shutdown`` closes the pools.
+- API: the FastAPI lifespan calls :func:`close_http_clients` on shutdown.
+
+Usage from a connector (``BaseConnector.http_client`` wraps this)::
+
+    async with self.http_client(timeout=30.0) as client:
+        response = await client.get(url, headers=headers)
+
+The context manager does **not** close the pooled client on exit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
+import logging
+from typing import Any, AsyncIterator
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE: bool = True
+except ImportError:  # pragma: no cover - depends on optional install
+    _HTTP2_AVAILABLE = False
+
+# Matches httpx's own default so migrated call sites keep their behaviour.
+DEFAULT_TIMEOUT_SECONDS: float = 5.0
+
+_POOL_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+_ClientKey = tuple[str, float, bool]
+
+_clients_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that neither stores nor returns any cookie."""
+
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+    def return_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+
+def _cookieless_jar() -> CookieJar:
+    return CookieJar(policy=_RejectAllCookiesPolicy())
+
+
+def _governance_hooks(provider: str) -> dict[str, list[Any]]:
+    """httpx event hooks that route a provider's traffic through its governor."""
+
+    async def _before_request(request: httpx.Request) -> None:
+        from connectors.rate_governor import get_rate_governor
+
+        await get_rate_governor(provider, request).acquire()
+
+    async def _after_response(response: httpx.Response) -> None:
+        from connectors.rate_governor import get_rate_governor
+
+        await get_rate_governor(provider, response.request).observe(response)
+
+    return {"request": [_before_request], "response": [_after_response]}
+
+
+def get_http_client(
+    provider: str,
+    *,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    follow_redirects: bool = False,
+) -> httpx.AsyncClient:
+    """Return the pooled client for *provider* on the running event loop.
+
+    Must be called from inside a coroutine. Callers must not close the
+    returned client.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients_by_loop.setdefault(loop, {})
+    key: _ClientKey = (provider, float(timeout), follow_redirects)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            limits=_POOL_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+            event_hooks=_governance_hooks(provider),
+            cookies=_cookieless_jar(),
+        )
+        clients[key] = client
+        logger.debug(
+            "Created pooled HTTP client provider=%s timeout=%s follow_redirects=%s http2=%s",
+            provider, timeout, follow_redirects, _HTTP2_AVAILABLE,
+        )
+    return client
+
+
+@asynccontextmanager
+async def pooled_http_client(
+    provider: str,
+    *,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    follow_redirects: bool = False,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client for *provider* without closing it on exit.
+
+    Drop-in replacement for ``async with httpx.AsyncClient(...) as client``.
+    """
+    yield get_http_client(provider, timeout=timeout, follow_redirects=follow_redirects)
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client (and rate governor) owned by the running loop."""
+    from connectors.rate_governor import close_rate_governors
+
+    await close_rate_governors()
+    loop = asyncio.get_running_loop()
+    clients = _clients_by_loop.pop(loop, {})
+    for key, client in clients.items():
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning("Failed to close pooled HTTP client %s", key, exc_info=True)
+    if clients:
+        logger.info("Closed %d pooled HTTP client(s)", len(clients))
+
+
+def reset_http_clients() -> None:
+    """Forget all pooled clients without awaiting their shutdown.
+
+    Used after fork and when a worker replaces its event loop: the old
+    connections belong to a loop that can no longer drive them.
+    """
+    from connectors.rate_governor import reset_rate_governors
+
+    reset_rate_governors()
+    _clients_by_loop.clear()
@@ -9,12 +9,11 @@ Responsibilities:
 - Upsert normalized data to database
 """
 
-import asyncio
 import logging
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 import httpx
 from sqlalchemy import and_, or_, select
@@ -48,6 +47,9 @@ HUBSPOT_API_BASE = "https://api.hubapi.com"
 
 _HUBSPOT_ORG_MEMBER_ACTIVE: tuple[str, ...] = ("active", "onboarding")
 
+# Rows per upsert statement (and commit) while streaming synced pages.
+_UPSERT_BATCH_SIZE: int = 500
+
 _HUBSPOT_EMAIL_EVENTS_QUERY_KEYS: frozenset[str] = frozenset({
     "appId",
     "campaignId",
@@ -643,7 +645,7 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
 
         last_exc: Optional[httpx.HTTPStatusError] = None
         for attempt in range(_max_retries + 1):
-            async with httpx.AsyncClient() as client:
+            async with self.http_client() as client:
                 response: httpx.Response = await client.request(
                     method=method,
                     url=url,
@@ -653,12 +655,10 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                     timeout=30.0,
                 )
 
-                # Retry on 429 rate limit
+                # Retry on 429 rate limit; the pooled client's rate governor
+                # holds the next request until Retry-After has elapsed.
                 if response.status_code == 429 and attempt < _max_retries:
-                    retry_after: float = float(response.headers.get("Retry-After", "10"))
-                    wait_secs: float = min(retry_after, 30.0)
-                    print(f"[HubSpot] 429 rate limited on {endpoint}, retrying in {wait_secs}s (attempt {attempt + 1}/{_max_retries})")
-                    await asyncio.sleep(wait_secs)
+                    print(f"[HubSpot] 429 rate limited on {endpoint}, retrying after Retry-After={response.headers.get('Retry-After', '?')}s (attempt {attempt + 1}/{_max_retries})")
                     continue
 
                 # If error, try to get detailed error message from HubSpot
@@ -689,17 +689,17 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
         assert last_exc is not None
         raise last_exc
 
-    async def _paginate_results(
+    async def _iter_result_pages(
         self,
         endpoint: str,
         properties: list[str],
         limit: int = 100,
         associations: Optional[list[str]] = None,
-    ) -> list[dict[str, Any]]:
-        """Paginate through HubSpot API results."""
-        all_results: list[dict[str, Any]] = []
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield HubSpot list API results one page at a time."""
         after: Optional[str] = None
         page_count = 0
+        result_count = 0
 
         while True:
             params: dict[str, Any] = {
@@ -713,8 +713,8 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
 
             data = await self._make_request("GET", endpoint, params=params)
             results = data.get("results", [])
-            all_results.extend(results)
             page_count += 1
+            result_count += len(results)
             
             # Log first page for debugging - include raw response keys on empty
             if page_count == 1:
@@ -727,6 +727,9 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                     if "status" in data:
                         print(f"[HubSpot] {endpoint}: status: {data.get('status')}")
 
+            if results:
+                yield results
+
             # Check for pagination
             paging = data.get("paging", {})
             next_link = paging.get("next", {})
@@ -736,24 +739,36 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 break
         
         if page_count > 1:
-            print(f"[HubSpot] {endpoint}: fetched {page_count} pages, {len(all_results)} total results")
+            print(f"[HubSpot] {endpoint}: fetched {page_count} pages, {result_count} total results")
 
+    async def _paginate_results(
+        self,
+        endpoint: str,
+        properties: list[str],
+        limit: int = 100,
+        associations: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Paginate through HubSpot API results."""
+        all_results: list[dict[str, Any]] = []
+        async for results in self._iter_result_pages(
+            endpoint, properties, limit=limit, associations=associations,
+        ):
+            all_results.extend(results)
         return all_results
 
-    async def _search_results_since(
+    async def _iter_search_pages(
         self,
         object_type: str,
         properties: list[str],
         since: datetime,
         associations: Optional[list[str]] = None,
         limit: int = 100,
-    ) -> list[dict[str, Any]]:
-        """Paginate through HubSpot Search API filtered by hs_lastmodifieddate.
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield HubSpot Search API pages filtered by hs_lastmodifieddate.
 
         The search API supports POST ``/crm/v3/objects/{type}/search`` with
         ``filterGroups`` for date-based incremental fetching.
         """
-        all_results: list[dict[str, Any]] = []
         after: int = 0
         iso_ms: str = since.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
@@ -784,7 +799,8 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 json_data=body,
             )
             results: list[dict[str, Any]] = data.get("results", [])
-            all_results.extend(results)
+            if results:
+                yield results
 
             paging: dict[str, Any] = data.get("paging", {})
             next_link: dict[str, Any] = paging.get("next", {})
@@ -793,24 +809,107 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 break
             after = int(after_val)
 
+    async def _search_results_since(
+        self,
+        object_type: str,
+        properties: list[str],
+        since: datetime,
+        associations: Optional[list[str]] = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Collect every HubSpot Search API page modified since *since*."""
+        all_results: list[dict[str, Any]] = []
+        async for results in self._iter_search_pages(
+            object_type, properties, since, associations=associations, limit=limit,
+        ):
+            all_results.extend(results)
         return all_results
 
-    async def _paginate_or_search(
+    def _iter_pages_or_search(
         self,
         endpoint: str,
         object_type: str,
         properties: list[str],
         associations: Optional[list[str]] = None,
-    ) -> list[dict[str, Any]]:
-        """Use incremental search when sync_since is available, otherwise full list."""
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Page iterator: incremental search when sync_since is set, otherwise full list."""
         if self.sync_since:
-            return await self._search_results_since(
+            return self._iter_search_pages(
                 object_type, properties, self.sync_since, associations=associations,
             )
-        return await self._paginate_results(
+        return self._iter_result_pages(
             endpoint, properties, associations=associations,
         )
 
+    async def _paginate_or_search(
+        self,
+        endpoint: str,
+        object_type: str,
+        properties: list[str],
+        associations: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Use incremental search when sync_since is available, otherwise full list."""
+        all_results: list[dict[str, Any]] = []
+        async for results in self._iter_pages_or_search(
+            endpoint, object_type, properties, associations=associations,
+        ):
+            all_results.extend(results)
+        return all_results
+
+    async def _upsert_pages(
+        self,
+        model: Any,
+        pages: AsyncIterator[list[dict[str, Any]]],
+        build_rows: Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]],
+        update_cols: list[str],
+        step: str,
+        label: str,
+    ) -> int:
+        """Upsert rows built from each fetched page before the next is requested.
+
+        Rows are written in batches of ``_UPSERT_BATCH_SIZE`` with one commit
+        per batch, so a full backfill holds at most one batch plus one API
+        page in memory. The session is only held while a batch is written.
+
+        If a later page fails, the batches already committed stay written and
+        their row count is attached to the exception as ``committed_count``.
+        """
+        pending: list[dict[str, Any]] = []
+        count: int = 0
+
+        async def _flush(batch: list[dict[str, Any]]) -> None:
+            nonlocal count
+            async with get_session(organization_id=self.organization_id) as session:
+                stmt = pg_insert(model).values(batch)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={col: stmt.excluded[col] for col in update_cols},
+                )
+                await session.execute(stmt)
+                await session.commit()
+            count += len(batch)
+            await broadcast_sync_progress(
+                organization_id=self.organization_id,
+                provider=self.source_system,
+                count=count,
+                status="syncing",
+                step=step,
+            )
+            print(f"[HubSpot] {label}: {count}")
+
+        try:
+            async for page in pages:
+                pending.extend(await build_rows(page))
+                while len(pending) >= _UPSERT_BATCH_SIZE:
+                    batch, pending = pending[:_UPSERT_BATCH_SIZE], pending[_UPSERT_BATCH_SIZE:]
+                    await _flush(batch)
+            if pending:
+                await _flush(pending)
+        except Exception as exc:
+            exc.committed_count = count  # type: ignore[attr-defined]
+            raise
+        return count
+
     async def sync_pipelines(self) -> int:
         """
         Sync all deal pipelines and stages from HubSpot.
@@ -953,13 +1052,6 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
             "pipeline",
         ]
 
-        raw_deals = await self._paginate_or_search(
-            "/crm/v3/objects/deals",
-            "deals",
-            properties=properties,
-            associations=["companies"],
-        )
-
         # Pre-load owner email cache
         await self._ensure_owner_email_cache()
 
@@ -990,68 +1082,61 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 existing_map[row[0]] = row[1]
         print(f"[HubSpot] Pre-loaded {len(existing_map)} existing deal IDs")
 
-        # Build all row dicts in memory
-        rows: list[dict[str, Any]] = []
-        for raw_deal in raw_deals:
-            # Extract associated company ID from associations
-            deal_account_id: Optional[uuid.UUID] = None
-            associations = raw_deal.get("associations", {})
-            companies_assoc = associations.get("companies", {})
-            company_results: list[dict[str, Any]] = companies_assoc.get("results", [])
-            if company_results:
-                hs_company_id: Optional[str] = company_results[0].get("id")
-                if hs_company_id:
-                    deal_account_id = hs_company_id_to_account_id.get(hs_company_id)
-
-            deal: Deal = await self._normalize_deal(
-                raw_deal,
-                existing_id=existing_map.get(raw_deal.get("id", "")),
-                account_id=deal_account_id,
-            )
-            rows.append({
-                "id": deal.id, "organization_id": deal.organization_id,
-                "source_system": deal.source_system, "source_id": deal.source_id,
-                "name": deal.name, "amount": deal.amount, "stage": deal.stage,
-                "probability": deal.probability,
-                "pipeline_id": deal.pipeline_id, "close_date": deal.close_date,
-                "created_date": deal.created_date,
-                "last_modified_date": deal.last_modified_date,
-                "owner_id": deal.owner_id,
-                "account_id": deal.account_id,
-                "visible_to_user_ids": deal.visible_to_user_ids,
-                "custom_fields": deal.custom_fields,
-                "synced_at": datetime.utcnow(), "sync_status": "synced",
-            })
+        async def _build_rows(raw_deals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            rows: list[dict[str, Any]] = []
+            for raw_deal in raw_deals:
+                # Extract associated company ID from associations
+                deal_account_id: Optional[uuid.UUID] = None
+                associations = raw_deal.get("associations", {})
+                companies_assoc = associations.get("companies", {})
+                company_results: list[dict[str, Any]] = companies_assoc.get("results", [])
+                if company_results:
+                    hs_company_id: Optional[str] = company_results[0].get("id")
+                    if hs_company_id:
+                        deal_account_id = hs_company_id_to_account_id.get(hs_company_id)
+
+                deal: Deal = await self._normalize_deal(
+                    raw_deal,
+                    existing_id=existing_map.get(raw_deal.get("id", "")),
+                    account_id=deal_account_id,
+                )
+                rows.append({
+                    "id": deal.id, "organization_id": deal.organization_id,
+                    "source_system": deal.source_system, "source_id": deal.source_id,
+                    "name": deal.name, "amount": deal.amount, "stage": deal.stage,
+                    "probability": deal.probability,
+                    "pipeline_id": deal.pipeline_id, "close_date": deal.close_date,
+                    "created_date": deal.created_date,
+                    "last_modified_date": deal.last_modified_date,
+                    "owner_id": deal.owner_id,
+                    "account_id": deal.account_id,
+                    "visible_to_user_ids": deal.visible_to_user_ids,
+                    "custom_fields": deal.custom_fields,
+                    "synced_at": datetime.utcnow(), "sync_status": "synced",
+                })
+            return rows
 
-        # Bulk upsert in batches
-        BATCH_SIZE: int = 500
         update_cols: list[str] = [
             "name", "amount", "stage", "probability", "pipeline_id", "close_date",
             "created_date", "last_modified_date", "owner_id", "account_id",
             "visible_to_user_ids", "custom_fields", "synced_at",
         ]
-        async with get_session(organization_id=self.organization_id) as session:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch: list[dict[str, Any]] = rows[i : i + BATCH_SIZE]
-                stmt = pg_insert(Deal).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={col: stmt.excluded[col] for col in update_cols},
-                )
-                await session.execute(stmt)
-                await session.commit()
-                count: int = i + len(batch)
-                await broadcast_sync_progress(
-                    organization_id=self.organization_id,
-                    provider=self.source_system,
-                    count=count,
-                    status="syncing",
-                    step="deals",
-                )
-                print(f"[HubSpot] Deals: {count}/{len(rows)}")
-        print(f"[HubSpot] Committed {len(rows)} deals")
+        count: int = await self._upsert_pages(
+            Deal,
+            self._iter_pages_or_search(
+                "/crm/v3/objects/deals",
+                "deals",
+                properties=properties,
+                associations=["companies"],
+            ),
+            _build_rows,
+            update_cols,
+            step="deals",
+            label="Deals",
+        )
+        print(f"[HubSpot] Committed {count} deals")
 
-        return len(rows)
+        return count
 
     async def _normalize_deal(
         self,
@@ -1160,10 +1245,6 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
             "hs_lastmodifieddate",
         ]
 
-        raw_companies = await self._paginate_or_search(
-            "/crm/v3/objects/companies", "companies", properties=properties,
-        )
-
         # Pre-load owner email cache so _normalize_account doesn't trigger per-row fetches
         await self._ensure_owner_email_cache()
 
@@ -1180,49 +1261,40 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 existing_map[row[0]] = row[1]
         print(f"[HubSpot] Pre-loaded {len(existing_map)} existing account IDs")
 
-        # Build all row dicts in memory
-        rows: list[dict[str, Any]] = []
-        for raw_company in raw_companies:
-            account: Account = await self._normalize_account(
-                raw_company, existing_id=existing_map.get(raw_company.get("id", ""))
-            )
-            rows.append({
-                "id": account.id, "organization_id": account.organization_id,
-                "source_system": account.source_system, "source_id": account.source_id,
-                "name": account.name, "domain": account.domain,
-                "industry": account.industry, "employee_count": account.employee_count,
-                "annual_revenue": account.annual_revenue, "owner_id": account.owner_id,
-                "synced_at": datetime.utcnow(), "sync_status": "synced",
-            })
+        async def _build_rows(raw_companies: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            rows: list[dict[str, Any]] = []
+            for raw_company in raw_companies:
+                account: Account = await self._normalize_account(
+                    raw_company, existing_id=existing_map.get(raw_company.get("id", ""))
+                )
+                rows.append({
+                    "id": account.id, "organization_id": account.organization_id,
+                    "source_system": account.source_system, "source_id": account.source_id,
+                    "name": account.name, "domain": account.domain,
+                    "industry": account.industry, "employee_count": account.employee_count,
+                    "annual_revenue": account.annual_revenue, "owner_id": account.owner_id,
+                    "synced_at": datetime.utcnow(), "sync_status": "synced",
+                })
+            return rows
 
-        # Bulk upsert in batches (single SQL per batch instead of per-row)
-        BATCH_SIZE: int = 500
+        # Bulk upsert per batch (single SQL per batch instead of per-row)
         update_cols: list[str] = [
             "name", "domain", "industry", "employee_count",
             "annual_revenue", "owner_id", "synced_at",
         ]
-        async with get_session(organization_id=self.organization_id) as session:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch: list[dict[str, Any]] = rows[i : i + BATCH_SIZE]
-                stmt = pg_insert(Account).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={col: stmt.excluded[col] for col in update_cols},
-                )
-                await session.execute(stmt)
-                await session.commit()
-                count: int = i + len(batch)
-                await broadcast_sync_progress(
-                    organization_id=self.organization_id,
-                    provider=self.source_system,
-                    count=count,
-                    status="syncing",
-                    step="accounts",
-                )
-                print(f"[HubSpot] Accounts: {count}/{len(rows)}")
-        print(f"[HubSpot] Committed {len(rows)} accounts")
+        count: int = await self._upsert_pages(
+            Account,
+            self._iter_pages_or_search(
+                "/crm/v3/objects/companies", "companies", properties=properties,
+            ),
+            _build_rows,
+            update_cols,
+            step="accounts",
+            label="Accounts",
+        )
+        print(f"[HubSpot] Committed {count} accounts")
 
-        return len(rows)
+        return count
 
     async def _normalize_account(
         self, hs_company: dict[str, Any], existing_id: Optional[uuid.UUID] = None
@@ -1289,20 +1361,6 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
             "hs_lastmodifieddate",
         ]
 
-        # Fetch contacts with company associations
-        print(f"[HubSpot] Fetching contacts for org {self.organization_id}...")
-        try:
-            raw_contacts = await self._paginate_or_search(
-                "/crm/v3/objects/contacts",
-                "contacts",
-                properties=properties,
-                associations=["companies"],
-            )
-            print(f"[HubSpot] Fetched {len(raw_contacts)} contacts from API")
-        except Exception as e:
-            print(f"[HubSpot] ERROR fetching contacts: {e}")
-            raise
-
         # Build a map of HubSpot company IDs to internal account IDs
         hs_company_id_to_account_id: dict[str, uuid.UUID] = {}
         async with get_session(organization_id=self.organization_id) as session:
@@ -1329,65 +1387,65 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                 existing_map[row[0]] = row[1]
         print(f"[HubSpot] Pre-loaded {len(existing_map)} existing contact IDs")
 
-        # Build all row dicts in memory
         org_uuid: uuid.UUID = uuid.UUID(self.organization_id)
-        rows: list[dict[str, Any]] = []
-        for raw_contact in raw_contacts:
-            hs_id: str = raw_contact.get("id", "")
-
-            # Extract associated company ID
-            account_id: Optional[uuid.UUID] = None
-            associations = raw_contact.get("associations", {})
-            companies_assoc = associations.get("companies", {})
-            company_results: list[dict[str, Any]] = companies_assoc.get("results", [])
-            if company_results:
-                hs_company_id: Optional[str] = company_results[0].get("id")
-                if hs_company_id:
-                    account_id = hs_company_id_to_account_id.get(hs_company_id)
-
-            contact: Contact = self._normalize_contact(
-                raw_contact,
-                existing_id=existing_map.get(hs_id),
-                account_id=account_id,
-            )
-            rows.append({
-                "id": contact.id, "organization_id": org_uuid,
-                "source_system": self.source_system, "source_id": hs_id,
-                "name": contact.name, "email": contact.email,
-                "title": contact.title, "phone": contact.phone,
-                "account_id": contact.account_id,
-                "custom_fields": contact.custom_fields,
-                "synced_at": datetime.utcnow(), "sync_status": "synced",
-            })
 
-        # Bulk upsert in batches
-        BATCH_SIZE: int = 500
+        async def _build_rows(raw_contacts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            rows: list[dict[str, Any]] = []
+            for raw_contact in raw_contacts:
+                hs_id: str = raw_contact.get("id", "")
+
+                # Extract associated company ID
+                account_id: Optional[uuid.UUID] = None
+                associations = raw_contact.get("associations", {})
+                companies_assoc = associations.get("companies", {})
+                company_results: list[dict[str, Any]] = companies_assoc.get("results", [])
+                if company_results:
+                    hs_company_id: Optional[str] = company_results[0].get("id")
+                    if hs_company_id:
+                        account_id = hs_company_id_to_account_id.get(hs_company_id)
+
+                contact: Contact = self._normalize_contact(
+                    raw_contact,
+                    existing_id=existing_map.get(hs_id),
+                    account_id=account_id,
+                )
+                rows.append({
+                    "id": contact.id, "organization_id": org_uuid,
+                    "source_system": self.source_system, "source_id": hs_id,
+                    "name": contact.name, "email": contact.email,
+                    "title": contact.title, "phone": contact.phone,
+                    "account_id": contact.account_id,
+                    "custom_fields": contact.custom_fields,
+                    "synced_at": datetime.utcnow(), "sync_status": "synced",
+                })
+            return rows
+
         update_cols: list[str] = [
             "name", "email", "title", "phone", "account_id", "custom_fields",
             "synced_at",
         ]
-        async with get_session(organization_id=self.organization_id) as session:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch: list[dict[str, Any]] = rows[i : i + BATCH_SIZE]
-                stmt = pg_insert(Contact).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={col: stmt.excluded[col] for col in update_cols},
-                )
-                await session.execute(stmt)
-                await session.commit()
-                count: int = i + len(batch)
-                await broadcast_sync_progress(
-                    organization_id=self.organization_id,
-                    provider=self.source_system,
-                    count=count,
-                    status="syncing",
-                    step="contacts",
-                )
-                print(f"[HubSpot] Contacts: {count}/{len(rows)}")
-        print(f"[HubSpot] Committed {len(rows)} contacts")
+        # Fetch contacts with company associations
+        print(f"[HubSpot] Fetching contacts for org {self.organization_id}...")
+        try:
+            count: int = await self._upsert_pages(
+                Contact,
+                self._iter_pages_or_search(
+                    "/crm/v3/objects/contacts",
+                    "contacts",
+                    properties=properties,
+                    associations=["companies"],
+                ),
+                _build_rows,
+                update_cols,
+                step="contacts",
+                label="Contacts",
+            )
+        except Exception as e:
+            print(f"[HubSpot] ERROR syncing contacts: {e}")
+            raise
+        print(f"[HubSpot] Committed {count} contacts")
 
-        return len(rows)
+        return count
 
     def _normalize_contact(
         self,
@@ -1504,32 +1562,28 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
             elif engagement_type == "notes":
                 properties = ["hs_timestamp", "hs_note_body"]
 
-            try:
-                raw_engagements: list[dict[str, Any]] = await self._paginate_or_search(
-                    f"/crm/v3/objects/{engagement_type}",
-                    engagement_type,
-                    properties=properties,
-                    associations=["deals", "contacts", "companies"],
-                )
-
-                if not raw_engagements:
-                    continue
-
-                # Build existing source_id -> UUID map
-                existing_map: dict[str, uuid.UUID] = {}
-                async with get_session(organization_id=self.organization_id) as session:
-                    result = await session.execute(
-                        select(Activity.source_id, Activity.id).where(
-                            Activity.organization_id == org_uuid,
-                            Activity.source_system == self.source_system,
-                            Activity.source_id.isnot(None),
+            # Build existing source_id -> UUID map, once the first page arrives
+            existing_map: Optional[dict[str, uuid.UUID]] = None
+
+            async def _build_rows(
+                raw_engagements: list[dict[str, Any]],
+                engagement_type: str = engagement_type,
+            ) -> list[dict[str, Any]]:
+                nonlocal existing_map
+                if existing_map is None:
+                    existing_map = {}
+                    async with get_session(organization_id=self.organization_id) as session:
+                        result = await session.execute(
+                            select(Activity.source_id, Activity.id).where(
+                                Activity.organization_id == org_uuid,
+                                Activity.source_system == self.source_system,
+                                Activity.source_id.isnot(None),
+                            )
                         )
-                    )
-                    for row in result.all():
-                        existing_map[row[0]] = row[1]
-                print(f"[HubSpot] Pre-loaded {len(existing_map)} existing activity IDs for {engagement_type}")
+                        for row in result.all():
+                            existing_map[row[0]] = row[1]
+                    print(f"[HubSpot] Pre-loaded {len(existing_map)} existing activity IDs for {engagement_type}")
 
-                # Build row dicts
                 rows: list[dict[str, Any]] = []
                 for raw_engagement in raw_engagements:
                     activity: Activity = self._normalize_engagement(
@@ -1579,37 +1633,34 @@ Notes are activities attached to deals (or contacts/companies). Use HubSpot **so
                         "account_id": account_id,
                         "synced_at": datetime.utcnow(),
                     })
+                return rows
 
-                # Bulk upsert in batches
-                BATCH_SIZE: int = 500
-                update_cols: list[str] = [
-                    "type", "subject", "description", "activity_date",
-                    "deal_id", "contact_id", "account_id", "synced_at",
-                ]
-                async with get_session(organization_id=self.organization_id) as session:
-                    for i in range(0, len(rows), BATCH_SIZE):
-                        batch: list[dict[str, Any]] = rows[i : i + BATCH_SIZE]
-                        stmt = pg_insert(Activity).values(batch)
-                        stmt = stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={col: stmt.excluded[col] for col in update_cols},
-                        )
-                        await session.execute(stmt)
-                        await session.commit()
-                        count: int = i + len(batch)
-                        await broadcast_sync_progress(
-                            organization_id=self.organization_id,
-                            provider=self.source_system,
-                            count=count,
-                            status="syncing",
-                            step="activities",
-                        )
-                        print(f"[HubSpot] Activities ({engagement_type}): {count}/{len(rows)}")
-                total_count += len(rows)
-                print(f"[HubSpot] Committed {len(rows)} {engagement_type}")
-            except httpx.HTTPStatusError:
-                # Some engagement types might not be available
+            update_cols: list[str] = [
+                "type", "subject", "description", "activity_date",
+                "deal_id", "contact_id", "account_id", "synced_at",
+            ]
+            try:
+                count: int = await self._upsert_pages(
+                    Activity,
+                    self._iter_pages_or_search(
+                        f"/crm/v3/objects/{engagement_type}",
+                        engagement_type,
+                        properties=properties,
+                        associations=["deals", "contacts", "companies"],
+                    ),
+                    _build_rows,
+                    update_cols,
+                    step="activities",
+                    label=f"Activities ({engagement_type})",
+                )
+            except httpx.HTTPStatusError as exc:
+                # Some engagement types might not be available; pages committed
+                # before the failure still count.
+                total_count += getattr(exc, "committed_count", 0)
                 continue
+            total_count += count
+            if count:
+                print(f"[HubSpot] Committed {count} {engagement_type}")
 
         return total_count
 
@@ -8,7 +8,6 @@ Uses OAuth 2.0 client_credentials flow; credentials stored in integration.extra_
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
@@ -107,7 +106,7 @@ class ISpotTvConnector(BaseConnector):
             return self._token
 
         client_id, client_secret = await self._get_credentials()
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response: httpx.Response = await client.post(
                 ISPOT_TOKEN_URL,
                 data={
@@ -153,7 +152,7 @@ class ISpotTvConnector(BaseConnector):
         }
         last_exc: httpx.HTTPStatusError | None = None
         for attempt in range(_max_retries + 1):
-            async with httpx.AsyncClient() as client:
+            async with self.http_client() as client:
                 response: httpx.Response = await client.request(
                     method=method,
                     url=url,
@@ -162,18 +161,14 @@ class ISpotTvConnector(BaseConnector):
                     timeout=60.0,
                 )
                 if response.status_code == 429 and attempt < _max_retries:
-                    retry_after: float = float(
-                        response.headers.get("Retry-After", "60")
-                    )
-                    wait_secs: float = min(retry_after, 60.0)
+                    # The rate governor blocks the next request for Retry-After.
                     logger.warning(
-                        "iSpot.tv 429 on %s, retry in %ss (attempt %s/%s)",
+                        "iSpot.tv 429 on %s, retry after %ss (attempt %s/%s)",
                         path,
-                        wait_secs,
+                        response.headers.get("Retry-After", "?"),
                         attempt + 1,
                         _max_retries,
                     )
-                    await asyncio.sleep(wait_secs)
                     continue
                 if response.status_code >= 400:
                     err_text = response.text[:500] if response.text else ""
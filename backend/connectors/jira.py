@@ -116,7 +116,7 @@ class JiraConnector(BaseConnector):
             return self._cloud_id
 
         headers: dict[str, str] = await self._get_headers()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.get(
                 "https://api.atlassian.com/oauth/token/accessible-resources",
                 headers=headers,
@@ -148,7 +148,7 @@ class JiraConnector(BaseConnector):
         base_url: str = await self._get_base_url()
         url: str = f"{base_url}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.get(
                 url,
                 headers=headers,
@@ -167,7 +167,7 @@ class JiraConnector(BaseConnector):
         base_url: str = await self._get_base_url()
         url: str = f"{base_url}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.post(
                 url,
                 headers=headers,
@@ -188,7 +188,7 @@ class JiraConnector(BaseConnector):
         base_url: str = await self._get_base_url()
         url: str = f"{base_url}{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.put(
                 url,
                 headers=headers,
@@ -239,7 +239,7 @@ Use `write_on_connector(connector='linear', operation='...', data={...})` with `
         if variables:
             payload["variables"] = variables
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.http_client(timeout=30.0) as client:
             resp: httpx.Response = await client.post(
                 LINEAR_API_URL,
                 headers=headers,
@@ -663,7 +663,7 @@ Use `write_on_connector(connector='linear', operation='...', data={...})` with `
             if isinstance(h, dict) and h.get("key") is not None and h.get("value") is not None:
                 put_headers[str(h["key"])] = str(h["value"])
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self.http_client(timeout=120.0) as client:
             resp: httpx.Response = await client.put(
                 upload_url,
                 content=data,
@@ -97,7 +97,7 @@ class GenericMcpClient:
         if params is not None:
             payload["params"] = params
 
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+        async with self.http_client(timeout=DEFAULT_TIMEOUT) as client:
             response: httpx.Response = await client.post(
                 self._endpoint_url,
                 headers=self._headers(),
@@ -148,7 +148,7 @@ class GenericMcpClient:
             "capabilities": {},
             "clientInfo": MCP_CLIENT_INFO,
         })
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with self.http_client(timeout=10.0) as client:
             await client.post(
                 self._endpoint_url,
                 headers=self._headers(),
@@ -14,8 +14,6 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-import httpx
-
 from connectors.base import BaseConnector
 from connectors.registry import AuthType, Capability, ConnectorMeta, ConnectorScope
 from models.activity import Activity
@@ -76,7 +74,7 @@ class MicrosoftCalendarConnector(BaseConnector):
         headers = await self._get_headers()
         url = f"{MICROSOFT_GRAPH_API_BASE}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -95,7 +93,7 @@ class MicrosoftCalendarConnector(BaseConnector):
         while True:
             if next_link:
                 # For pagination, use the full URL
-                async with httpx.AsyncClient() as client:
+                async with self.http_client() as client:
                     headers = await self._get_headers()
                     response = await client.get(next_link, headers=headers, timeout=30.0)
                     response.raise_for_status()
@@ -138,7 +136,7 @@ class MicrosoftCalendarConnector(BaseConnector):
 
         while len(events) < max_results:
             if next_link:
-                async with httpx.AsyncClient() as client:
+                async with self.http_client() as client:
                     headers = await self._get_headers()
                     response = await client.get(next_link, headers=headers, timeout=30.0)
                     response.raise_for_status()
@@ -71,7 +71,7 @@ class MicrosoftMailConnector(BaseConnector):
         headers = await self._get_headers()
         url = f"{MICROSOFT_GRAPH_API_BASE}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -89,7 +89,7 @@ class MicrosoftMailConnector(BaseConnector):
 
         while True:
             if next_link:
-                async with httpx.AsyncClient() as client:
+                async with self.http_client() as client:
                     headers = await self._get_headers()
                     response = await client.get(next_link, headers=headers, timeout=30.0)
                     response.raise_for_status()
@@ -129,7 +129,7 @@ class MicrosoftMailConnector(BaseConnector):
 
         while len(emails) < max_results:
             if next_link:
-                async with httpx.AsyncClient() as client:
+                async with self.http_client() as client:
                     headers = await self._get_headers()
                     response = await client.get(next_link, headers=headers, timeout=30.0)
                     response.raise_for_status()
@@ -364,7 +364,7 @@ class MicrosoftMailConnector(BaseConnector):
         headers = await self._get_headers()
         url = f"{MICROSOFT_GRAPH_API_BASE}/me/sendMail"
         
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             try:
                 response = await client.post(
                     url,
@@ -4,6 +4,9 @@ Persistence layer for the new-style connector return types.
 When a connector's ``sync_*`` method returns a ``list`` of Pydantic record
 objects (rather than doing its own DB upserts and returning an ``int``),
 the sync engine delegates to :func:`persist_records` to handle the upsert.
+When it returns an async iterator of records instead, the engine uses
+:func:`persist_record_stream`, which flushes bounded batches as they arrive
+so memory stays flat regardless of sync size.
 
 This module extracts the upsert logic that was previously duplicated across
 individual connectors into a single, reusable function.
@@ -13,11 +16,11 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Sequence
+from typing import Any, AsyncIterable, Awaitable, Callable, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select, text
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from models.database import get_session
@@ -124,6 +127,110 @@ def _get_table_config(entity: str) -> dict[str, Any] | None:
     return configs.get(entity)
 
 
+# ---------------------------------------------------------------------------
+# Row building / batched upserts
+# ---------------------------------------------------------------------------
+
+# Postgres caps a single statement at 32767 bind parameters; a multi-row
+# INSERT uses one parameter per column per row.
+_PG_MAX_BIND_PARAMS: int = 32767
+
+# Default number of records flushed per transaction in streaming mode.
+DEFAULT_STREAM_BATCH_SIZE: int = 1000
+
+# Called after each streamed batch commits with (batch_count, total_persisted).
+BatchCallback = Callable[[int, int], Awaitable[None]]
+
+
+def _max_rows_per_statement(columns_per_row: int) -> int:
+    """Largest row count that keeps one INSERT under the bind-parameter cap."""
+    return max(1, _PG_MAX_BIND_PARAMS // max(1, columns_per_row))
+
+
+def _build_row(
+    record: BaseModel,
+    entity: str,
+    field_map: dict[str, str],
+    org_uuid: UUID,
+    now: datetime,
+    source_system: str,
+    activity_fields: dict[str, Any],
+) -> dict[str, Any]:
+    """Map a Pydantic record onto a DB row dict for the entity's table."""
+    record_dict = record.model_dump(exclude_none=False)
+    row: dict[str, Any] = {"organization_id": org_uuid, "synced_at": now}
+    for pydantic_field, db_column in field_map.items():
+        if pydantic_field in record_dict:
+            row[db_column] = record_dict[pydantic_field]
+    if "source_system" in row and not row["source_system"]:
+        row["source_system"] = source_system
+    if entity == "activities":
+        row.update(activity_fields)
+    return row
+
+
+def _activity_fields(
+    integration_id: UUID | None,
+    owner_user_id: UUID | None,
+    visibility: str | None,
+) -> dict[str, Any]:
+    """Return the activity visibility columns that were explicitly provided."""
+    fields: dict[str, Any] = {}
+    if integration_id is not None:
+        fields["integration_id"] = integration_id
+    if owner_user_id is not None:
+        fields["owner_user_id"] = owner_user_id
+    if visibility is not None:
+        fields["visibility"] = visibility
+    return fields
+
+
+async def _upsert_rows(
+    session: Any,
+    entity: str,
+    config: dict[str, Any],
+    rows: list[dict[str, Any]],
+    now: datetime,
+) -> None:
+    """Execute the ON CONFLICT upsert for *rows*, split under the bind-param cap.
+
+    Does not commit; the caller owns the transaction boundary.
+    """
+    model_cls = config["model"]
+    conflict_keys: list[str] = config["conflict_keys"]
+    field_map: dict[str, str] = config["field_map"]
+    table = model_cls.__table__
+
+    update_cols: dict[str, Any] = {
+        col: getattr(pg_insert(table).excluded, col)
+        for col in field_map.values()
+        if col not in conflict_keys
+    }
+    update_cols["synced_at"] = now
+    if entity == "activities":
+        for col in ("integration_id", "owner_user_id", "visibility"):
+            if col in rows[0]:
+                update_cols[col] = getattr(pg_insert(table).excluded, col)
+
+    on_conflict_kwargs: dict[str, Any] = {
+        "index_elements": conflict_keys,
+        "set_": update_cols,
+    }
+    # The activities table has a partial unique index (source_id IS NOT NULL)
+    # so ON CONFLICT must include the WHERE predicate to match it.
+    if entity == "activities":
+        on_conflict_kwargs["index_where"] = text("source_id IS NOT NULL")
+
+    chunk_size = _max_rows_per_statement(len(rows[0]))
+    for start in range(0, len(rows), chunk_size):
+        stmt = (
+            pg_insert(table)
+            .values(rows[start:start + chunk_size])
+            .on_conflict_do_update(**on_conflict_kwargs)
+        )
+        await session.execute(stmt)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -144,6 +251,9 @@ async def persist_records(
 
     For entity='activities', pass integration_id, owner_user_id, visibility
     to set activity visibility (owner_only vs team) per share_synced_data.
+
+    All rows are written in one transaction. For large or unbounded syncs use
+    :func:`persist_record_stream`, which commits in bounded batches.
     """
     if not records:
         return 0
@@ -153,59 +263,17 @@ async def persist_records(
         logger.warning("No persistence config for entity type %r – skipping", entity)
         return 0
 
-    model_cls = config["model"]
-    conflict_keys: list[str] = config["conflict_keys"]
-    field_map: dict[str, str] = config["field_map"]
-
     org_uuid = UUID(organization_id)
     now = datetime.utcnow()
+    activity_fields = _activity_fields(integration_id, owner_user_id, visibility)
 
-    rows: list[dict[str, Any]] = []
-    for record in records:
-        record_dict = record.model_dump(exclude_none=False)
-        row: dict[str, Any] = {"organization_id": org_uuid, "synced_at": now}
-        for pydantic_field, db_column in field_map.items():
-            if pydantic_field in record_dict:
-                row[db_column] = record_dict[pydantic_field]
-        if "source_system" in row and not row["source_system"]:
-            row["source_system"] = source_system
-        if entity == "activities":
-            if integration_id is not None:
-                row["integration_id"] = integration_id
-            if owner_user_id is not None:
-                row["owner_user_id"] = owner_user_id
-            if visibility is not None:
-                row["visibility"] = visibility
-        rows.append(row)
+    rows: list[dict[str, Any]] = [
+        _build_row(record, entity, config["field_map"], org_uuid, now, source_system, activity_fields)
+        for record in records
+    ]
 
     async with get_session(organization_id=organization_id, user_id=str(owner_user_id) if owner_user_id else None) as session:
-        table = model_cls.__table__
-        update_cols: dict[str, Any] = {
-            col: getattr(pg_insert(table).excluded, col)
-            for col in field_map.values()
-            if col not in conflict_keys
-        }
-        update_cols["synced_at"] = now
-        if entity == "activities":
-            for col in ("integration_id", "owner_user_id", "visibility"):
-                if col in rows[0]:
-                    update_cols[col] = getattr(pg_insert(table).excluded, col)
-
-        on_conflict_kwargs: dict[str, Any] = {
-            "index_elements": conflict_keys,
-            "set_": update_cols,
-        }
-        # The activities table has a partial unique index (source_id IS NOT NULL)
-        # so ON CONFLICT must include the WHERE predicate to match it.
-        if entity == "activities":
-            on_conflict_kwargs["index_where"] = text("source_id IS NOT NULL")
-
-        stmt = (
-            pg_insert(table)
-            .values(rows)
-            .on_conflict_do_update(**on_conflict_kwargs)
-        )
-        await session.execute(stmt)
+        await _upsert_rows(session, entity, config, rows, now)
         await session.commit()
 
     logger.info(
@@ -213,3 +281,76 @@ async def persist_records(
         len(rows), entity, organization_id, source_system,
     )
     return len(rows)
+
+
+async def persist_record_stream(
+    organization_id: str,
+    entity: str,
+    records: AsyncIterable[BaseModel],
+    source_system: str,
+    *,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    on_batch: BatchCallback | None = None,
+    integration_id: UUID | None = None,
+    owner_user_id: UUID | None = None,
+    visibility: str | None = None,
+) -> int:
+    """Upsert an async stream of Pydantic records in bounded, committed batches.
+
+    At most one batch of rows is held in memory at a time. Each batch is
+    upserted and committed in its own session, so a failure mid-stream keeps
+    everything flushed before it. ``batch_size`` is clamped so a batch never
+    exceeds the Postgres bind-parameter limit in a single statement.
+
+    ``on_batch(batch_count, total_persisted)`` is awaited after every commit;
+    the sync engine uses it for checkpointing and progress broadcasts.
+
+    Returns the total number of records persisted.
+    """
+    config = _get_table_config(entity)
+    if config is None:
+        logger.warning("No persistence config for entity type %r – skipping", entity)
+        return 0
+
+    org_uuid = UUID(organization_id)
+    activity_fields = _activity_fields(integration_id, owner_user_id, visibility)
+    session_user_id = str(owner_user_id) if owner_user_id else None
+
+    # organization_id + synced_at + mapped fields (+ activity visibility).
+    row_width = 2 + len(config["field_map"]) + len(activity_fields)
+    batch_limit = max(1, min(batch_size, _max_rows_per_statement(row_width)))
+
+    total = 0
+    pending: list[BaseModel] = []
+
+    async def _flush() -> None:
+        nonlocal total
+        now = datetime.utcnow()
+        rows = [
+            _build_row(record, entity, config["field_map"], org_uuid, now, source_system, activity_fields)
+            for record in pending
+        ]
+        pending.clear()
+        async with get_session(organization_id=organization_id, user_id=session_user_id) as session:
+            await _upsert_rows(session, entity, config, rows, now)
+            await session.commit()
+        total += len(rows)
+        logger.debug(
+            "Flushed %d %s records for org %s (source=%s, total=%d)",
+            len(rows), entity, organization_id, source_system, total,
+        )
+        if on_batch is not None:
+            await on_batch(len(rows), total)
+
+    async for record in records:
+        pending.append(record)
+        if len(pending) >= batch_limit:
+            await _flush()
+    if pending:
+        await _flush()
+
+    logger.info(
+        "Persisted %d %s records for org %s (source=%s, streamed)",
+        total, entity, organization_id, source_system,
+    )
+    return total
@@ -0,0 +1,395 @@
+"""
+Distributed, provider-aware rate governor for connector HTTP traffic.
+
+Every pooled connector client (see ``connectors.http_client``) runs its
+requests through this governor via httpx event hooks:
+
+- **before** each request a token is taken from a Redis-backed bucket keyed
+  by provider, upstream host, rate-limit bucket (e.g. Slack method tier) and
+  a fingerprint of the caller's credentials (``Authorization``, API-key
+  headers or an ``api_key`` query param), so every Celery process and API
+  replica syncing the same workspace shares one budget;
+- **after** each response the bucket adapts to what the upstream reported:
+  ``Retry-After`` blocks the bucket for everyone, and rate-limit headers
+  (``X-RateLimit-*``, ``RateLimit-*``, HubSpot's ``X-HubSpot-RateLimit-*``)
+  cap the refill rate to the real remaining allowance.
+
+Connector retry loops therefore do not need their own sleeps on 429: the
+next request simply waits in :meth:`ProviderRateGovernor.acquire`.
+
+If Redis is unreachable the governor falls back to an in-process bucket
+for a short cool-off period rather than failing the request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import logging
+import time
+from typing import Optional, Protocol
+import weakref
+
+import httpx
+import redis.asyncio as aioredis
+
+from config import settings
+from services.redis_pool import get_redis_client
+from workers.rate_limiter import AdaptiveRedisRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Configured ceiling for one provider bucket."""
+
+    rate_per_minute: int
+    burst: Optional[int] = None
+
+
+_DEFAULT_POLICY: RateLimitPolicy = RateLimitPolicy(rate_per_minute=600, burst=50)
+
+# Documented per-app/per-token ceilings. Headers refine these at runtime.
+_PROVIDER_POLICIES: dict[str, RateLimitPolicy] = {
+    "hubspot": RateLimitPolicy(rate_per_minute=600, burst=100),  # 100 / 10s
+    "github": RateLimitPolicy(rate_per_minute=80, burst=40),  # 5000 / hour
+    "linear": RateLimitPolicy(rate_per_minute=80, burst=40),  # 5000 / hour
+    "asana": RateLimitPolicy(rate_per_minute=150, burst=25),
+    "apollo": RateLimitPolicy(rate_per_minute=200, burst=20),
+    "ispot_tv": RateLimitPolicy(rate_per_minute=60, burst=10),
+}
+
+# Slack Web API tiers (requests per minute, per method, per workspace).
+_SLACK_TIER_POLICIES: dict[str, RateLimitPolicy] = {
+    "tier1": RateLimitPolicy(rate_per_minute=1, burst=1),
+    "tier2": RateLimitPolicy(rate_per_minute=20, burst=5),
+    "tier3": RateLimitPolicy(rate_per_minute=50, burst=10),
+    "tier4": RateLimitPolicy(rate_per_minute=100, burst=20),
+    "special": RateLimitPolicy(rate_per_minute=60, burst=5),  # chat.postMessage ≈ 1/s
+}
+
+_SLACK_METHOD_TIERS: dict[str, str] = {
+    "conversations.list": "tier2",
+    "users.list": "tier2",
+    "conversations.history": "tier3",
+    "conversations.replies": "tier3",
+    "conversations.info": "tier3",
+    "conversations.join": "tier3",
+    "conversations.members": "tier4",
+    "conversations.open": "tier3",
+    "users.info": "tier4",
+    "users.lookupByEmail": "tier3",
+    "files.info": "tier4",
+    "files.getUploadURLExternal": "tier4",
+    "files.completeUploadExternal": "tier4",
+    "reactions.add": "tier3",
+    "chat.postMessage": "special",
+    "chat.update": "tier3",
+}
+
+# Fraction of the configured rate a 429 leaves behind (multiplicative decrease).
+_BACKOFF_FACTOR: float = 0.5
+# Default block when a 429 carries no usable Retry-After.
+_DEFAULT_RETRY_AFTER_SECONDS: float = 5.0
+# Upper bound on a single shared block so a bogus header can't stall syncs.
+_MAX_BLOCK_SECONDS: float = 300.0
+# How long to stay on the in-process fallback after a Redis failure.
+_REDIS_COOLOFF_SECONDS: float = 60.0
+# Longest a request waits for a token before proceeding anyway.
+_ACQUIRE_TIMEOUT_SECONDS: float = 300.0
+
+
+class _Limiter(Protocol):
+    async def acquire(self, timeout: float = ...) -> bool: ...
+    async def block_for(self, seconds: float) -> None: ...
+    async def cap_rate(self, rate_per_minute: float) -> None: ...
+    async def current_rate_per_minute(self) -> float: ...
+
+
+class _LocalRateLimiter:
+    """In-process token bucket with the same interface as the Redis one."""
+
+    def __init__(self, policy: RateLimitPolicy) -> None:
+        self._rate: float = policy.rate_per_minute / 60.0
+        self._cap: float | None = None
+        self._max_tokens: float = float(policy.burst or max(1, policy.rate_per_minute // 6))
+        self._tokens: float = self._max_tokens
+        self._last_refill: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self, timeout: float = 120.0) -> bool:
+        deadline: float = time.monotonic() + timeout
+        async with self._lock:
+            while True:
+                now: float = time.monotonic()
+                rate: float = min(self._rate, self._cap) if self._cap else self._rate
+                if now < self._blocked_until:
+                    wait: float = self._blocked_until - now
+                else:
+                    self._tokens = min(self._max_tokens, self._tokens + (now - self._last_refill) * rate)
+                    self._last_refill = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return True
+                    wait = (1 - self._tokens) / rate
+                if now + wait > deadline:
+                    return False
+                await asyncio.sleep(wait)
+
+    async def block_for(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def cap_rate(self, rate_per_minute: float) -> None:
+        cap: float = max(rate_per_minute, 1.0) / 60.0
+        self._cap = cap if cap < self._rate else None
+
+    async def current_rate_per_minute(self) -> float:
+        rate: float = min(self._rate, self._cap) if self._cap else self._rate
+        return rate * 60.0
+
+
+def slack_method_tier(url: httpx.URL | str) -> str:
+    """Return the Slack rate-limit tier bucket for a Web API URL."""
+    method: str = httpx.URL(str(url)).path.rstrip("/").rsplit("/", 1)[-1]
+    return _SLACK_METHOD_TIERS.get(method, "tier3")
+
+
+def bucket_for_request(provider: str, request: httpx.Request) -> str:
+    """Return the rate-limit bucket a request counts against."""
+    if provider == "slack" and request.url.host == "slack.com":
+        return slack_method_tier(request.url)
+    return "default"
+
+
+def policy_for(provider: str, bucket: str) -> RateLimitPolicy:
+    """Return the configured policy for a provider bucket."""
+    if provider == "slack" and bucket in _SLACK_TIER_POLICIES:
+        return _SLACK_TIER_POLICIES[bucket]
+    return _PROVIDER_POLICIES.get(provider, _DEFAULT_POLICY)
+
+
+# Where providers carry credentials besides ``Authorization`` (Apollo and
+# Exa use ``X-Api-Key``; ScrapingBee takes an ``api_key`` query param).
+_CREDENTIAL_HEADERS: tuple[str, ...] = ("authorization", "x-api-key", "api-key")
+_CREDENTIAL_QUERY_PARAMS: tuple[str, ...] = ("api_key",)
+
+
+def _credential_fingerprint(request: httpx.Request) -> str:
+    """Stable, non-reversible id for the credential a request is sent with."""
+    parts: list[str] = [
+        f"{name}={request.headers[name]}" for name in _CREDENTIAL_HEADERS if request.headers.get(name)
+    ]
+    parts.extend(
+        f"?{name}={request.url.params[name]}"
+        for name in _CREDENTIAL_QUERY_PARAMS
+        if request.url.params.get(name)
+    )
+    if not parts:
+        return "anon"
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _seconds_until_reset(raw: str) -> float | None:
+    """Normalize a reset header (epoch ms, epoch s, or delta seconds)."""
+    try:
+        value: float = float(raw)
+    except ValueError:
+        return None
+    if value > 1e12:
+        return max(0.0, value / 1000.0 - time.time())
+    if value > 1e9:
+        return max(0.0, value - time.time())
+    return max(0.0, value)
+
+
+@dataclass(frozen=True)
+class RateLimitHeaders:
+    """Rate-limit state reported by an upstream response."""
+
+    remaining: int | None = None
+    reset_in_seconds: float | None = None
+    window_limit_per_minute: float | None = None
+
+
+def parse_rate_limit_headers(headers: httpx.Headers) -> RateLimitHeaders:
+    """Extract remaining / reset / window limit from common header dialects."""
+    remaining_raw: str | None = (
+        headers.get("x-ratelimit-remaining")
+        or headers.get("x-ratelimit-requests-remaining")
+        or headers.get("ratelimit-remaining")
+        or headers.get("x-hubspot-ratelimit-remaining")
+    )
+    reset_raw: str | None = (
+        headers.get("x-ratelimit-reset")
+        or headers.get("x-ratelimit-requests-reset")
+        or headers.get("ratelimit-reset")
+    )
+
+    remaining: int | None = None
+    if remaining_raw is not None:
+        try:
+            remaining = int(float(remaining_raw))
+        except ValueError:
+            remaining = None
+
+    reset_in: float | None = _seconds_until_reset(reset_raw) if reset_raw else None
+
+    window_limit: float | None = None
+    hubspot_max: str | None = headers.get("x-hubspot-ratelimit-max")
+    hubspot_interval_ms: str | None = headers.get("x-hubspot-ratelimit-interval-milliseconds")
+    if hubspot_max and hubspot_interval_ms:
+        try:
+            interval_s: float = float(hubspot_interval_ms) / 1000.0
+            if interval_s > 0:
+                window_limit = float(hubspot_max) / interval_s * 60.0
+                if reset_in is None and remaining is not None:
+                    reset_in = interval_s
+        except ValueError:
+            window_limit = None
+
+    return RateLimitHeaders(
+        remaining=remaining,
+        reset_in_seconds=reset_in,
+        window_limit_per_minute=window_limit,
+    )
+
+
+class ProviderRateGovernor:
+    """Shared rate budget for one provider bucket and credential."""
+
+    def __init__(
+        self,
+        provider: str,
+        bucket: str,
+        fingerprint: str,
+        redis_client: aioredis.Redis,
+        host: str = "",
+    ) -> None:
+        self.provider: str = provider
+        self.bucket: str = bucket
+        self.policy: RateLimitPolicy = policy_for(provider, bucket)
+        self._redis_limiter: AdaptiveRedisRateLimiter = AdaptiveRedisRateLimiter(
+            settings.REDIS_URL,
+            key=f"connector:{provider}:{host}:{bucket}:{fingerprint}",
+            rate_per_minute=self.policy.rate_per_minute,
+            burst=self.policy.burst,
+            redis_client=redis_client,
+        )
+        self._local_limiter: _LocalRateLimiter = _LocalRateLimiter(self.policy)
+        self._redis_down_until: float = 0.0
+
+    async def _call(self, name: str, *args: float) -> object:
+        """Invoke a limiter method on Redis, falling back to the local bucket."""
+        if time.monotonic() >= self._redis_down_until:
+            try:
+                return await getattr(self._redis_limiter, name)(*args)
+            except (aioredis.RedisError, OSError) as exc:
+                self._redis_down_until = time.monotonic() + _REDIS_COOLOFF_SECONDS
+                logger.warning(
+                    "[RateGovernor] Redis unavailable for %s/%s, using in-process limits for %ds: %s",
+                    self.provider, self.bucket, int(_REDIS_COOLOFF_SECONDS), exc,
+                )
+        return await getattr(self._local_limiter, name)(*args)
+
+    async def acquire(self) -> None:
+        """Wait for a token; proceeds (with a warning) if the wait times out."""
+        acquired = await self._call("acquire", _ACQUIRE_TIMEOUT_SECONDS)
+        if not acquired:
+            logger.warning(
+                "[RateGovernor] Gave up waiting for %s/%s token after %ds; sending anyway",
+                self.provider, self.bucket, int(_ACQUIRE_TIMEOUT_SECONDS),
+            )
+
+    async def observe(self, response: httpx.Response) -> None:
+        """Adapt the shared budget to the rate-limit signals in *response*."""
+        retry_after: float | None = parse_retry_after(response.headers.get("retry-after"))
+
+        if response.status_code == 429:
+            block: float = min(
+                retry_after if retry_after is not None else _DEFAULT_RETRY_AFTER_SECONDS,
+                _MAX_BLOCK_SECONDS,
+            )
+            current = float(await self._call("current_rate_per_minute"))
+            await self._call("block_for", block)
+            await self._call("cap_rate", current * _BACKOFF_FACTOR)
+            logger.warning(
+                "[RateGovernor] 429 from %s/%s: blocking %.1fs, rate %.0f -> %.0f/min",
+                self.provider, self.bucket, block, current, current * _BACKOFF_FACTOR,
+            )
+            return
+
+        if response.status_code == 503 and retry_after is not None:
+            await self._call("block_for", min(retry_after, _MAX_BLOCK_SECONDS))
+            return
+
+        limits: RateLimitHeaders = parse_rate_limit_headers(response.headers)
+        if limits.remaining is not None and limits.reset_in_seconds is not None:
+            if limits.remaining <= 0:
+                await self._call("block_for", min(limits.reset_in_seconds, _MAX_BLOCK_SECONDS))
+                return
+            if limits.reset_in_seconds > 0:
+                allowance: float = limits.remaining / limits.reset_in_seconds * 60.0
+                if allowance < self.policy.rate_per_minute * 0.9:
+                    await self._call("cap_rate", allowance)
+                    return
+        if (
+            limits.window_limit_per_minute is not None
+            and limits.window_limit_per_minute < self.policy.rate_per_minute * 0.9
+        ):
+            await self._call("cap_rate", limits.window_limit_per_minute)
+
+
+# (provider, host, bucket, credential fingerprint)
+_GovernorKey = tuple[str, str, str, str]
+
+
+_GovernorCache = dict[_GovernorKey, ProviderRateGovernor]
+
+_governors_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _GovernorCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rate_governor(provider: str, request: httpx.Request) -> ProviderRateGovernor:
+    """Return the governor for *request* on the running event loop."""
+    governors = _governors_by_loop.setdefault(asyncio.get_running_loop(), {})
+    bucket: str = bucket_for_request(provider, request)
+    host: str = request.url.host
+    key: _GovernorKey = (provider, host, bucket, _credential_fingerprint(request))
+    governor = governors.get(key)
+    if governor is None:
+        governor = ProviderRateGovernor(provider, bucket, key[3], get_redis_client(), host=host)
+        governors[key] = governor
+    return governor
+
+
+async def close_rate_governors() -> None:
+    """Forget the running loop's governors (the pooled Redis client is shared)."""
+    _governors_by_loop.pop(asyncio.get_running_loop(), None)
+
+
+def reset_rate_governors() -> None:
+    """Forget all governors without awaiting (after fork / loop replacement)."""
+    _governors_by_loop.clear()
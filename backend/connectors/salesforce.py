@@ -94,7 +94,7 @@ class SalesforceConnector(BaseConnector):
         instance_url = await self._get_instance_url()
         url = f"{instance_url}/services/data/{SF_API_VERSION}{endpoint}"
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             response = await client.request(
                 method=method,
                 url=url,
@@ -121,7 +121,7 @@ class SalesforceConnector(BaseConnector):
         url = f"{instance_url}/services/data/{SF_API_VERSION}/query"
         params = {"q": soql}
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             while True:
                 response = await client.get(
                     url,
@@ -443,17 +443,6 @@ Returns normalized messages for one channel since a cutoff (does not write to th
         }
 
     _MAX_RETRIES: int = 5
-    _MIN_REQUEST_INTERVAL: float = 1.5  # seconds between Slack API calls (Tier 3 ≈ 50/min)
-    _last_request_time: float = 0.0
-
-    async def _throttle(self) -> None:
-        """Pre-emptive throttle to stay under Slack's per-minute rate limit."""
-        import time
-        now: float = time.monotonic()
-        elapsed: float = now - self._last_request_time
-        if elapsed < self._MIN_REQUEST_INTERVAL:
-            await asyncio.sleep(self._MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.monotonic()
 
     async def _make_request(
         self,
@@ -462,13 +451,17 @@ Returns normalized messages for one channel since a cutoff (does not write to th
         params: Optional[dict[str, Any]] = None,
         json_data: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        """Make an authenticated request to Slack API with rate-limit retry."""
-        await self._throttle()
+        """Make an authenticated request to Slack API with rate-limit retry.
+
+        Pacing is handled by the shared per-tier rate governor on the pooled
+        client; a 429 blocks the bucket for ``Retry-After`` in every process,
+        so retries here simply re-enter the governor's queue.
+        """
         headers: dict[str, str] = await self._get_headers()
         url: str = f"{SLACK_API_BASE}/{endpoint}"
 
         for attempt in range(self._MAX_RETRIES + 1):
-            async with httpx.AsyncClient() as client:
+            async with self.http_client() as client:
                 if method == "GET":
                     response: httpx.Response = await client.get(
                         url, headers=headers, params=params, timeout=30.0
@@ -479,19 +472,13 @@ Returns normalized messages for one channel since a cutoff (does not write to th
                     )
 
                 if response.status_code == 429 and attempt < self._MAX_RETRIES:
-                    retry_after: float = float(
-                        response.headers.get("Retry-After", str(2 ** attempt))
-                    )
-                    wait_time: float = retry_after + 10.0
                     logger.warning(
-                        "[Slack API] 429 rate-limited on %s (attempt %d/%d), retrying in %.1fs (Retry-After: %.0fs + 10s buffer)",
+                        "[Slack API] 429 rate-limited on %s (attempt %d/%d), retrying after Retry-After: %ss",
                         endpoint,
                         attempt + 1,
                         self._MAX_RETRIES,
-                        wait_time,
-                        retry_after,
+                        response.headers.get("Retry-After", "?"),
                     )
-                    await asyncio.sleep(wait_time)
                     continue
 
                 if response.status_code >= 500 and attempt < self._MAX_RETRIES:
@@ -1731,7 +1718,7 @@ Returns normalized messages for one channel since a cutoff (does not write to th
                 "Slack files.getUploadURLExternal did not return upload_url and file_id"
             )
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             files: dict[str, tuple[str, bytes]] = {"file": (filename, content)}
             upload_resp: httpx.Response = await client.post(
                 upload_url, files=files, timeout=60.0
@@ -1777,7 +1764,7 @@ Returns normalized messages for one channel since a cutoff (does not write to th
         # Remove Content-Type for raw file download
         headers.pop("Content-Type", None)
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
+        async with self.http_client(follow_redirects=True) as client:
             response: httpx.Response = await client.get(
                 url_private, headers=headers, timeout=60.0,
             )
@@ -12,9 +12,8 @@ import logging
 import time
 from typing import Any
 
-import httpx
-
 from config import settings
+from connectors.http_client import pooled_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +45,7 @@ async def get_bot_framework_token() -> str:
     tenant: str = settings.MICROSOFT_TENANT_ID or "botframework.com"
     token_url: str = _BOT_FRAMEWORK_TOKEN_URL_TEMPLATE.format(tenant=tenant)
 
-    async with httpx.AsyncClient() as client:
+    async with pooled_http_client("teams") as client:
         response = await client.post(
             token_url,
             data={
@@ -86,7 +85,7 @@ async def get_graph_token(tenant_id: str) -> str:
         )
 
     token_url: str = f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
-    async with httpx.AsyncClient() as client:
+    async with pooled_http_client("teams") as client:
         response = await client.post(
             token_url,
             data={
@@ -149,7 +148,7 @@ async def post_message(
         payload["replyToId"] = reply_to_id
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with pooled_http_client("teams") as client:
             response = await client.post(
                 url,
                 json=payload,
@@ -186,7 +185,7 @@ async def send_typing_indicator(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with pooled_http_client("teams") as client:
             await client.post(
                 url,
                 json=payload,
@@ -214,7 +213,7 @@ async def get_user_info(tenant_id: str, user_aad_id: str) -> dict[str, Any] | No
     try:
         token = await get_graph_token(tenant_id)
         url = f"{MICROSOFT_GRAPH_API_BASE}/users/{user_aad_id}"
-        async with httpx.AsyncClient() as client:
+        async with pooled_http_client("teams") as client:
             response = await client.get(
                 url,
                 headers={
@@ -246,7 +245,7 @@ async def download_teams_file(
     """
     token: str = bot_token or await get_bot_framework_token()
     try:
-        async with httpx.AsyncClient() as client:
+        async with pooled_http_client("teams") as client:
             response = await client.get(
                 download_url,
                 headers={"Authorization": f"Bearer {token}"},
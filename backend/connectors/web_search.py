@@ -128,7 +128,7 @@ class WebSearchConnector(BaseConnector):
             return {"error": "Web search not configured (no PERPLEXITY_API_KEY or OPENAI_API_KEY)", "query": query}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self.http_client(timeout=30.0) as client:
                 response: httpx.Response = await client.post(
                     "https://api.perplexity.ai/chat/completions",
                     headers={
@@ -172,7 +172,7 @@ class WebSearchConnector(BaseConnector):
         if not settings.EXA_API_KEY:
             return {"error": "Exa search is not configured (no EXA_API_KEY)", "query": query, "provider": "exa"}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with self.http_client(timeout=60.0) as client:
                 response: httpx.Response = await client.post(
                     "https://api.exa.ai/search",
                     headers={"x-api-key": settings.EXA_API_KEY, "Content-Type": "application/json"},
@@ -268,7 +268,7 @@ class WebSearchConnector(BaseConnector):
         return self._truncate(url, body, mode="html", max_chars=100_000)
 
     async def _fetch_direct(self, url: str) -> str:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with self.http_client(timeout=30.0, follow_redirects=True) as client:
             response: httpx.Response = await client.get(
                 url,
                 headers={
@@ -293,7 +293,7 @@ class WebSearchConnector(BaseConnector):
         if premium_proxy:
             sb_params["premium_proxy"] = "true"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with self.http_client(timeout=60.0) as client:
             response: httpx.Response = await client.get("https://app.scrapingbee.com/api/v1/", params=sb_params)
             if response.status_code != 200:
                 raise Exception(f"ScrapingBee returned status {response.status_code}: {response.text[:500]}")
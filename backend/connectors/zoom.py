@@ -85,7 +85,7 @@ class ZoomConnector(BaseConnector):
         url = f"{ZOOM_API_BASE}/{endpoint}"
         logger.debug("Zoom API request", extra={"method": method, "url": url, "params": params})
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             if method == "GET":
                 response = await client.get(url, headers=headers, params=params, timeout=30.0)
             else:
@@ -194,7 +194,7 @@ class ZoomConnector(BaseConnector):
         org_uuid: uuid.UUID = uuid.UUID(self.organization_id)
         token, _ = await self.get_oauth_token()
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Bypass RLS so we see activities written by other users' integrations.
             # Otherwise owner_only rows from teammate syncs are invisible and we hit
             # uq_activities_org_source on INSERT for the same Zoom transcript id.
@@ -0,0 +1,46 @@
+"""Add trigram indexes for name search on deals and accounts.
+
+Revision ID: 136_search_trgm_indexes
+Revises: 135_chan_mem_scope
+Create Date: 2026-10-16
+
+/api/search matches ``name ILIKE '%q%'`` (and ``domain`` for accounts);
+a leading wildcard cannot use a btree, so large orgs fell back to
+sequential scans. pg_trgm GIN indexes serve those predicates directly.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "136_search_trgm_indexes"
+down_revision: Union[str, Sequence[str], None] = "135_chan_mem_scope"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+assert len(revision) <= 32
+assert not isinstance(down_revision, str) or len(down_revision) <= 32
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_deals_name_trgm ON deals "
+        "USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_accounts_name_trgm ON accounts "
+        "USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_accounts_domain_trgm ON accounts "
+        "USING gin (domain gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_accounts_domain_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_accounts_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_deals_name_trgm")
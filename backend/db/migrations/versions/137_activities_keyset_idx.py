@@ -0,0 +1,45 @@
+"""Add composite indexes for keyset pagination of activities.
+
+Revision ID: 137_activities_keyset_idx
+Revises: 136_search_trgm_indexes
+Create Date: 2026-10-16
+
+The data inspector pages activities with ``WHERE organization_id = :org AND
+(sort_col, id) > (:last_value, :last_id) ORDER BY sort_col, id``. These
+indexes let deep pages seek straight to the cursor instead of sorting the
+org's whole activity set on every request.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "137_activities_keyset_idx"
+down_revision: Union[str, Sequence[str], None] = "136_search_trgm_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+assert len(revision) <= 32
+assert not isinstance(down_revision, str) or len(down_revision) <= 32
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_activities_org_id",
+        "activities",
+        ["organization_id", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_activities_org_date_id",
+        "activities",
+        ["organization_id", "activity_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_org_date_id", table_name="activities")
+    op.drop_index("ix_activities_org_id", table_name="activities")
@@ -0,0 +1,90 @@
+"""Add workflows.next_run_at with a partial index for the scheduler.
+
+Revision ID: 138_workflow_next_run_at
+Revises: 137_activities_keyset_idx
+Create Date: 2026-10-16
+
+The scheduled-workflow checker used to load every enabled schedule workflow
+each minute and re-parse its cron. It now selects only rows whose
+``next_run_at`` is due (or not yet computed) through this index, with
+``FOR UPDATE SKIP LOCKED``.
+
+Existing rows start with NULL and are computed on the scheduler's first
+pass. Workflows are also written through raw SQL (``run_sql_write``), so a
+trigger clears ``next_run_at`` whenever the schedule-relevant columns change
+and the writer did not set it, letting the scheduler recompute it.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "138_workflow_next_run_at"
+down_revision: Union[str, Sequence[str], None] = "137_activities_keyset_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+assert len(revision) <= 32
+assert not isinstance(down_revision, str) or len(down_revision) <= 32
+
+
+def upgrade() -> None:
+    op.add_column("workflows", sa.Column("next_run_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_workflows_schedule_next_run_at",
+        "workflows",
+        ["next_run_at"],
+        unique=False,
+        postgresql_where=sa.text("is_enabled AND trigger_type = 'schedule'"),
+    )
+
+    bind = op.get_bind()
+    bind.execute(
+        sa.text(
+            """
+            CREATE OR REPLACE FUNCTION reset_workflow_next_run_at()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+                IF (
+                    NEW.trigger_type IS DISTINCT FROM OLD.trigger_type
+                    OR NEW.trigger_config IS DISTINCT FROM OLD.trigger_config
+                    OR NEW.is_enabled IS DISTINCT FROM OLD.is_enabled
+                ) AND NEW.next_run_at IS NOT DISTINCT FROM OLD.next_run_at THEN
+                    NEW.next_run_at := NULL;
+                END IF;
+                RETURN NEW;
+            END;
+            $$;
+            """
+        )
+    )
+    bind.execute(
+        sa.text(
+            """
+            DROP TRIGGER IF EXISTS trg_reset_workflow_next_run_at ON workflows;
+            CREATE TRIGGER trg_reset_workflow_next_run_at
+            BEFORE UPDATE ON workflows
+            FOR EACH ROW
+            EXECUTE FUNCTION reset_workflow_next_run_at();
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    bind.execute(
+        sa.text(
+            """
+            DROP TRIGGER IF EXISTS trg_reset_workflow_next_run_at ON workflows;
+            DROP FUNCTION IF EXISTS reset_workflow_next_run_at();
+            """
+        )
+    )
+    op.drop_index("ix_workflows_schedule_next_run_at", table_name="workflows")
+    op.drop_column("workflows", "next_run_at")
@@ -0,0 +1,40 @@
+"""Add a partial index for embedding freshly synced activities.
+
+Revision ID: 139_activities_unembedded_idx
+Revises: 138_workflow_next_run_at
+Create Date: 2026-10-16
+
+After a sync, the embedding step reads ``WHERE organization_id = :org AND
+embedding IS NULL AND synced_at >= :sync_start ORDER BY synced_at DESC, id
+DESC``. The partial index only holds un-embedded rows, so it stays small
+and lets each page seek straight to the rows that sync wrote.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "139_activities_unembedded_idx"
+down_revision: Union[str, Sequence[str], None] = "138_workflow_next_run_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+assert len(revision) <= 32
+assert not isinstance(down_revision, str) or len(down_revision) <= 32
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_activities_org_unembedded_synced",
+        "activities",
+        ["organization_id", "synced_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("embedding IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_org_unembedded_synced", table_name="activities")
@@ -164,7 +164,7 @@ def _is_safe_twilio_media_url(url: str) -> bool:
 
 async def _download_twilio_media(media_items: list[dict[str, str]]) -> list[str]:
     """Download MMS/WhatsApp media from Twilio CDN, return upload IDs."""
-    from services.file_handler import MAX_FILE_SIZE, store_file
+    from services.file_handler import MAX_FILE_SIZE, astore_file
 
     account_sid: str | None = settings.TWILIO_ACCOUNT_SID
     auth_token: str | None = settings.TWILIO_AUTH_TOKEN
@@ -198,7 +198,7 @@ async def _download_twilio_media(media_items: list[dict[str, str]]) -> list[str]
 
                 ext: str = content_type.split("/")[-1].split(";")[0]
                 filename: str = f"mms_media_{i}.{ext}"
-                stored = store_file(filename=filename, data=data, content_type=content_type)
+                stored = await astore_file(filename=filename, data=data, content_type=content_type)
                 attachment_ids.append(stored.upload_id)
                 logger.info("Downloaded media %d (%s, %d bytes) → %s", i, content_type, len(data), stored.upload_id)
             except Exception as exc:
@@ -224,9 +224,14 @@ def _build_public_media_url(upload_id: str) -> str | None:
     return f"{media_base}/media/{token}"
 
 
-def _extract_image_artifacts(chunk: str) -> list[str]:
-    """Extract public media URLs from a JSON artifact chunk."""
-    from services.file_handler import NATIVE_IMAGE_MIMES, store_file
+async def _extract_image_artifacts(chunk: str) -> list[str]:
+    """Extract public media URLs from a JSON artifact chunk.
+
+    Twilio fetches the URL from the public media route, possibly on another
+    replica, right after the reply is sent, so the file must be in the
+    shared tier before the URL is handed out.
+    """
+    from services.file_handler import NATIVE_IMAGE_MIMES, astore_file
 
     try:
         payload: dict[str, Any] = json.loads(chunk)
@@ -249,7 +254,7 @@ def _extract_image_artifacts(chunk: str) -> list[str]:
         data: bytes = base64.b64decode(content)
         ext: str = mime_type.split("/")[-1]
         filename: str = f"artifact_{artifact.get('id', 'unknown')}.{ext}"
-        stored = store_file(filename=filename, data=data, content_type=mime_type)
+        stored = await astore_file(filename=filename, data=data, content_type=mime_type)
         url: str | None = _build_public_media_url(stored.upload_id)
         if url:
             return [url]
@@ -633,8 +638,8 @@ class TwilioPhoneMessenger(BaseMessenger):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_media_from_chunk(chunk: str) -> list[str]:
-        return _extract_image_artifacts(chunk)
+    async def _extract_media_from_chunk(chunk: str) -> list[str]:
+        return await _extract_image_artifacts(chunk)
 
     # ------------------------------------------------------------------
     # Customisable messages
@@ -23,18 +23,18 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, case, or_, select, text
+from sqlalchemy import and_, case, or_, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from config import settings
 from messengers._stream_breaks import find_safe_break
+from messengers.activity_buffer import activity_buffer
 from messengers.base import (
     BaseMessenger,
     InboundMessage,
     MessageType,
     OutboundResponse,
 )
-from models.activity import Activity
 from models.conversation import Conversation
 from models.database import get_admin_session, get_session
 from models.integration import Integration
@@ -44,6 +44,7 @@ from models.org_member import OrgMember
 from models.organization import Organization
 from models.user import User
 from services.anthropic_health import user_message_for_agent_stream_failure
+from services.context_cache import invalidate_org_context
 
 logger = logging.getLogger(__name__)
 
@@ -710,7 +711,8 @@ class WorkspaceMessenger(BaseMessenger):
                 merged: list[UUID] = _merge_participating_user_ids(
                     conversation.participating_user_ids, revtops_user_id,
                 )
-                if merged != (conversation.participating_user_ids or []):
+                participants_changed: bool = merged != (conversation.participating_user_ids or [])
+                if participants_changed:
                     conversation.participating_user_ids = merged
                     changed = True
 
@@ -729,6 +731,9 @@ class WorkspaceMessenger(BaseMessenger):
 
                 if changed:
                     await session.commit()
+                if participants_changed:
+                    # Cached context profiles embed the participants' job memories.
+                    await invalidate_org_context(organization_id)
                 return str(conversation.id)
 
             source_label: str = {
@@ -765,7 +770,7 @@ class WorkspaceMessenger(BaseMessenger):
     # ------------------------------------------------------------------
 
     async def download_attachments(self, message: InboundMessage) -> list[str]:
-        from services.file_handler import MAX_FILE_SIZE, store_file
+        from services.file_handler import MAX_FILE_SIZE, astore_file
 
         if not message.raw_attachments:
             return []
@@ -786,7 +791,7 @@ class WorkspaceMessenger(BaseMessenger):
             if len(data) > MAX_FILE_SIZE:
                 logger.warning("[%s] File %s too large (%d bytes)", self.meta.slug, filename, len(data))
                 continue
-            stored = store_file(filename=filename, data=data, content_type=content_type)
+            stored = await astore_file(filename=filename, data=data, content_type=content_type)
             attachment_ids.append(stored.upload_id)
 
         return attachment_ids
@@ -1242,54 +1247,43 @@ class WorkspaceMessenger(BaseMessenger):
         except (ValueError, TypeError):
             pass
 
-        try:
-            async with get_session(organization_id=organization_id) as session:
-                custom_fields: dict[str, Any] = {
-                    "channel_id": channel_id,
-                    "user_id": message.external_user_id,
-                    "sender_slack_id": message.external_user_id,
-                    "thread_ts": thread_id,
-                }
-                raw_files: Any = message.raw_attachments or []
-                if isinstance(raw_files, list):
-                    persisted_files: list[dict[str, Any]] = [
-                        file_data
-                        for file_data in raw_files
-                        if isinstance(file_data, dict)
-                    ]
-                    if persisted_files:
-                        custom_fields["files"] = persisted_files
-                        logger.debug(
-                            "[%s] Persisting %d attachment(s) in activity cache source_id=%s",
-                            self.meta.slug,
-                            len(persisted_files),
-                            source_id,
-                        )
-                if channel_name:
-                    custom_fields["channel_name"] = channel_name
-
-                stmt = pg_insert(Activity).values(
-                    id=_uuid.uuid4(),
-                    organization_id=UUID(organization_id),
-                    source_system=self.meta.slug,
-                    source_id=source_id,
-                    type=f"{self.meta.slug}_message",
-                    subject=subject,
-                    description=message.text[:1000] if message.text else "",
-                    activity_date=activity_date,
-                    custom_fields=custom_fields,
-                    synced_at=datetime.utcnow(),
-                ).on_conflict_do_nothing(
-                    index_elements=["organization_id", "source_system", "source_id"],
-                    index_where=text("source_id IS NOT NULL"),
+        custom_fields: dict[str, Any] = {
+            "channel_id": channel_id,
+            "user_id": message.external_user_id,
+            "sender_slack_id": message.external_user_id,
+            "thread_ts": thread_id,
+        }
+        raw_files: Any = message.raw_attachments or []
+        if isinstance(raw_files, list):
+            persisted_files: list[dict[str, Any]] = [
+                file_data
+                for file_data in raw_files
+                if isinstance(file_data, dict)
+            ]
+            if persisted_files:
+                custom_fields["files"] = persisted_files
+                logger.debug(
+                    "[%s] Persisting %d attachment(s) in activity cache source_id=%s",
+                    self.meta.slug,
+                    len(persisted_files),
+                    source_id,
                 )
-                await session.execute(stmt)
-                await session.commit()
-        except Exception as exc:
-            logger.error(
-                "[%s] Failed to persist activity for %s: %s",
-                self.meta.slug, source_id, exc,
-            )
+        if channel_name:
+            custom_fields["channel_name"] = channel_name
+
+        # Written by the write-behind buffer in multi-row inserts.
+        await activity_buffer.add(organization_id, {
+            "id": _uuid.uuid4(),
+            "organization_id": UUID(organization_id),
+            "source_system": self.meta.slug,
+            "source_id": source_id,
+            "type": f"{self.meta.slug}_message",
+            "subject": subject,
+            "description": message.text[:1000] if message.text else "",
+            "activity_date": activity_date,
+            "custom_fields": custom_fields,
+            "synced_at": datetime.utcnow(),
+        })
 
     # ------------------------------------------------------------------
     # User info caching
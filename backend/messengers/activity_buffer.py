@@ -0,0 +1,191 @@
+"""
+Write-behind buffer for messenger channel activity rows.
+
+``WorkspaceMessenger.persist_channel_activity`` runs on the Slack/Teams
+event-handling path for every non-DM channel message the bot sees. Rather
+than opening a session and inserting one row per message, it hands the row
+to :data:`activity_buffer`, which coalesces rows per organization and writes
+them with multi-row ``INSERT ... ON CONFLICT DO NOTHING`` statements once
+``max_rows`` are pending or the oldest row has waited ``max_delay_seconds``.
+
+Rows are deduplicated on ``(source_system, source_id)`` while buffered; the
+first one wins, matching ``DO NOTHING``. If ``max_pending`` rows pile up
+(e.g. the database is slow), ``add`` flushes inline so callers feel the
+back-pressure instead of the process growing without bound.
+
+The API lifespan calls :meth:`ActivityWriteBuffer.close` on shutdown so
+buffered rows are written. A failed flush logs and drops its rows, as the
+old per-message insert did. Counters are exposed through
+:func:`get_activity_buffer_stats` (admin dashboard).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from models.activity import Activity
+from models.database import get_session
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement (10 bind parameters each, far below Postgres' limit).
+_INSERT_CHUNK_ROWS: int = 500
+
+_stats: dict[str, float] = {
+    "rows_enqueued": 0,
+    "rows_coalesced": 0,
+    "rows_written": 0,
+    "rows_dropped": 0,
+    "flushes": 0,
+    "flush_errors": 0,
+    "last_flush_ms": 0.0,
+    "max_flush_ms": 0.0,
+    "total_flush_ms": 0.0,
+}
+
+
+async def _insert_activity_rows(organization_id: str, rows: list[dict[str, Any]]) -> None:
+    async with get_session(organization_id=organization_id) as session:
+        for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+            stmt = pg_insert(Activity).values(rows[start:start + _INSERT_CHUNK_ROWS]).on_conflict_do_nothing(
+                index_elements=["organization_id", "source_system", "source_id"],
+                index_where=text("source_id IS NOT NULL"),
+            )
+            await session.execute(stmt)
+        await session.commit()
+
+
+class ActivityWriteBuffer:
+    """Coalesce activity rows and flush them in batches from a background task."""
+
+    def __init__(
+        self,
+        *,
+        max_rows: int = 500,
+        max_delay_seconds: float = 1.0,
+        max_pending: int = 20_000,
+    ) -> None:
+        self._max_rows: int = max_rows
+        self._max_delay_seconds: float = max_delay_seconds
+        self._max_pending: int = max_pending
+        self._pending: dict[str, dict[tuple[str, str], dict[str, Any]]] = {}
+        self._depth: int = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._has_rows: asyncio.Event | None = None
+        self._full: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    @property
+    def depth(self) -> int:
+        """Rows waiting to be written."""
+        return self._depth
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new loop (tests): the old primitives are unusable.
+            self._loop = loop
+            self._has_rows = asyncio.Event()
+            self._full = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run(), name="activity-write-buffer")
+
+    async def add(self, organization_id: str, row: dict[str, Any]) -> None:
+        """Queue an ``Activity`` row (column -> value) for *organization_id*."""
+        self._ensure_flusher()
+        assert self._has_rows is not None and self._full is not None
+
+        org_rows = self._pending.setdefault(organization_id, {})
+        key: tuple[str, str] = (row["source_system"], row["source_id"])
+        if key in org_rows:
+            _stats["rows_coalesced"] += 1
+            return
+        org_rows[key] = row
+        self._depth += 1
+        _stats["rows_enqueued"] += 1
+
+        self._has_rows.set()
+        if self._depth >= self._max_rows:
+            self._full.set()
+        if self._depth >= self._max_pending:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write every buffered row now."""
+        if self._flush_lock is None:
+            return
+        async with self._flush_lock:
+            pending, self._pending, self._depth = self._pending, {}, 0
+            if self._has_rows is not None:
+                self._has_rows.clear()
+            if self._full is not None:
+                self._full.clear()
+            if not pending:
+                return
+
+            started: float = time.perf_counter()
+            for organization_id, rows_by_key in pending.items():
+                rows: list[dict[str, Any]] = list(rows_by_key.values())
+                try:
+                    await _insert_activity_rows(organization_id, rows)
+                    _stats["rows_written"] += len(rows)
+                except Exception as exc:
+                    _stats["flush_errors"] += 1
+                    _stats["rows_dropped"] += len(rows)
+                    logger.error(
+                        "[activity_buffer] Failed to persist %d activity row(s) for org %s: %s",
+                        len(rows), organization_id, exc,
+                    )
+            elapsed_ms: float = (time.perf_counter() - started) * 1000
+            _stats["flushes"] += 1
+            _stats["last_flush_ms"] = elapsed_ms
+            _stats["max_flush_ms"] = max(_stats["max_flush_ms"], elapsed_ms)
+            _stats["total_flush_ms"] += elapsed_ms
+
+    async def _run(self) -> None:
+        assert self._has_rows is not None and self._full is not None
+        while True:
+            await self._has_rows.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self._max_delay_seconds)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("[activity_buffer] Flush failed")
+
+    async def close(self) -> None:
+        """Stop the background flusher and write whatever is still buffered."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done():
+            # Holding the lock means the flusher is not mid-write when cancelled.
+            assert self._flush_lock is not None
+            async with self._flush_lock:
+                flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+
+activity_buffer: ActivityWriteBuffer = ActivityWriteBuffer()
+
+
+def get_activity_buffer_stats() -> dict[str, float]:
+    """Process-local buffer depth, throughput and flush latency counters."""
+    stats: dict[str, float] = dict(_stats)
+    stats["depth"] = activity_buffer.depth
+    stats["avg_flush_ms"] = _stats["total_flush_ms"] / _stats["flushes"] if _stats["flushes"] else 0.0
+    return stats
+
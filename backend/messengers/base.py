@@ -343,7 +343,7 @@ class BaseMessenger(ABC):
                 ):
                     if chunk.startswith("{"):
                         outbound_media_urls.extend(
-                            self._extract_media_from_chunk(chunk)
+                            await self._extract_media_from_chunk(chunk)
                         )
                     else:
                         full_response += chunk
@@ -498,9 +498,10 @@ class BaseMessenger(ABC):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_media_from_chunk(chunk: str) -> list[str]:
+    async def _extract_media_from_chunk(chunk: str) -> list[str]:
         """Extract public media URLs from a JSON orchestrator chunk.
 
         Override in subclasses that support rich media (e.g. MMS images).
+        Returned URLs must already be fetchable from any replica.
         """
         return []
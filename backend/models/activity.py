@@ -35,6 +35,17 @@ class Activity(Base):
         Index("ix_activities_source_system", "source_system"),
         Index("ix_activities_org_source_system", "organization_id", "source_system"),
         Index("ix_activities_org_type", "organization_id", "type"),
+        # Keyset pagination in the data inspector (default id order / by date).
+        Index("ix_activities_org_id", "organization_id", "id"),
+        Index("ix_activities_org_date_id", "organization_id", "activity_date", "id"),
+        # Post-sync embedding: newest un-embedded rows a sync just wrote.
+        Index(
+            "ix_activities_org_unembedded_synced",
+            "organization_id",
+            "synced_at",
+            "id",
+            postgresql_where=text("embedding IS NULL"),
+        ),
         Index(
             "uq_activities_org_source",
             "organization_id",
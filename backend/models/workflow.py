@@ -15,7 +15,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -39,6 +39,12 @@ class Workflow(Base):
     __table_args__ = (
         Index("ix_workflows_org_enabled", "organization_id", "is_enabled"),
         Index("ix_workflows_trigger_type", "trigger_type"),
+        # The scheduler only ever reads due, enabled schedule workflows.
+        Index(
+            "ix_workflows_schedule_next_run_at",
+            "next_run_at",
+            postgresql_where=text("is_enabled AND trigger_type = 'schedule'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -123,6 +129,10 @@ class Workflow(Base):
     archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     is_enabled: Mapped[bool] = mapped_column(default=True, nullable=False)
     last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Next cron fire time for schedule workflows, maintained by the scheduler.
+    # NULL means "not computed yet": a database trigger resets it whenever
+    # trigger_type, trigger_config or is_enabled change without setting it.
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
@@ -168,6 +178,18 @@ class Workflow(Base):
             "updated_at": f"{self.updated_at.isoformat()}Z",
         }
     
+    def compute_next_run_at(self, after: Optional[datetime] = None) -> Optional[datetime]:
+        """Return the next cron fire time after *after* (default: last run or creation).
+
+        None when the workflow is not an enabled schedule workflow with a cron.
+        """
+        cron_expr = (self.trigger_config or {}).get("cron")
+        if not self.is_enabled or self.trigger_type != "schedule" or not cron_expr:
+            return None
+        from croniter import croniter
+
+        return croniter(cron_expr, after or self.last_run_at or self.created_at).get_next(datetime)
+
     @property
     def has_prompt(self) -> bool:
         """Check if this workflow uses the new prompt-based execution."""
@@ -3,13 +3,19 @@
 One-time backfill: transpile all existing apps that have frontend_code
 but no frontend_code_compiled.
 
+Apps are processed in batches: each batch is transpiled concurrently with
+``transpile_jsx_batch`` (identical sources run esbuild once) and committed
+before the next is loaded.
+
 Usage:
     cd backend && python scripts/backfill_compiled_apps.py
+    cd backend && python scripts/backfill_compiled_apps.py --batch-size 200
 
 Requires esbuild to be installed (esbuild binary on PATH).
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -21,46 +27,51 @@ from sqlalchemy import select, func
 
 from models.database import get_admin_session
 from models.app import App
-from utils.transpile_jsx import transpile_jsx
+from utils.transpile_jsx import transpile_jsx_batch
 
 
-async def backfill() -> None:
+async def backfill(batch_size: int) -> None:
+    pending = (
+        App.frontend_code_compiled.is_(None),
+        App.frontend_code.isnot(None),
+    )
     async with get_admin_session() as session:
         # Count apps needing backfill
-        count_result = await session.execute(
-            select(func.count(App.id)).where(
-                App.frontend_code_compiled.is_(None),
-                App.frontend_code.isnot(None),
-            )
-        )
+        count_result = await session.execute(select(func.count(App.id)).where(*pending))
         total = count_result.scalar_one()
         print(f"Found {total} apps to backfill")
 
         if total == 0:
             return
 
-        result = await session.execute(
-            select(App).where(
-                App.frontend_code_compiled.is_(None),
-                App.frontend_code.isnot(None),
-            )
-        )
-        apps = result.scalars().all()
-
         success = 0
         failed = 0
-        for app in apps:
-            transpile_result = transpile_jsx(app.frontend_code)
-            if transpile_result:
-                app.frontend_code_compiled = transpile_result[0]
-                success += 1
-            else:
-                failed += 1
-            print(f"  [{success + failed}/{total}] {app.id} — {'OK' if transpile_result else 'SKIP'}")
-
-        await session.commit()
+        last_id = None
+        while True:
+            query = select(App).where(*pending).order_by(App.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(App.id > last_id)
+            apps = (await session.execute(query)).scalars().all()
+            if not apps:
+                break
+            last_id = apps[-1].id
+
+            results = await transpile_jsx_batch([app.frontend_code for app in apps])
+            for app, transpile_result in zip(apps, results):
+                if transpile_result:
+                    app.frontend_code_compiled = transpile_result[0]
+                    success += 1
+                else:
+                    failed += 1
+                print(f"  [{success + failed}/{total}] {app.id} — {'OK' if transpile_result else 'SKIP'}")
+
+            await session.commit()
+
         print(f"\nDone: {success} compiled, {failed} skipped")
 
 
 if __name__ == "__main__":
-    asyncio.run(backfill())
+    parser = argparse.ArgumentParser(description="Backfill frontend_code_compiled for apps.")
+    parser.add_argument("--batch-size", type=int, default=100, help="apps transpiled and committed per batch")
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop latency while PDF exports run.
+
+Starts a 10 ms ticker on the event loop (standing in for websocket traffic)
+and fires ``--exports`` concurrent PDF exports of distinct documents, first
+the old way (``generate_pdf`` called inline in the handler) and then through
+``services.pdf_renderer.render_pdf`` (process pool). Reports how late the
+ticker woke up (p50 / p99 / max) and the wall time for all exports, then the
+latency of a repeated download served from the render cache.
+
+WeasyPrint needs Pango; where it is not installed, pass ``--synthetic`` to
+replace the render with a CPU-bound stand-in of ``--synthetic-ms`` per
+document (the pool still runs it in spawned processes).
+
+Usage:
+  python3 scripts/benchmark_pdf_rendering.py
+  python3 scripts/benchmark_pdf_rendering.py --exports 16 --sections 400
+  python3 scripts/benchmark_pdf_rendering.py --synthetic --synthetic-ms 800
+
+Run from backend/ or project root.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+_backend: Path = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from services import pdf_renderer  # noqa: E402
+
+# Read by spawned pool workers too (they inherit the environment).
+_SYNTHETIC_SECONDS_ENV = "PDF_BENCHMARK_SYNTHETIC_SECONDS"
+
+
+def _synthetic_render(markdown_content: str, custom_css: Optional[str]) -> bytes:
+    """Burn CPU (holding the GIL) for the configured stand-in render time."""
+    deadline = time.perf_counter() + float(os.environ.get(_SYNTHETIC_SECONDS_ENV, "0.5"))
+    acc = 0
+    while time.perf_counter() < deadline:
+        acc = (acc * 31 + len(markdown_content)) % 1_000_003
+    return f"%PDF-synthetic {acc}".encode()
+
+
+def _report_markdown(index: int, sections: int) -> str:
+    parts: list[str] = [f"# Quarterly pipeline report #{index}\n"]
+    for section in range(sections):
+        parts.append(f"## Region {section}\n")
+        parts.append("Deals moved forward steadily this quarter with **strong** expansion.\n")
+        parts.append("| Stage | Deals | Amount |\n|---|---|---|\n")
+        parts.extend(f"| Stage {row} | {row * 3} | ${row * 1250:,} |\n" for row in range(8))
+        parts.append("\n")
+    return "".join(parts)
+
+
+async def _measure(
+    label: str,
+    export: Callable[[str], Awaitable[bytes]],
+    documents: list[str],
+    tick_seconds: float = 0.01,
+) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def _ticker() -> None:
+        while not stop.is_set():
+            expected = time.perf_counter() + tick_seconds
+            await asyncio.sleep(tick_seconds)
+            lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(tick_seconds * 3)
+    started = time.perf_counter()
+    await asyncio.gather(*(export(doc) for doc in documents))
+    wall = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0
+    print(
+        f"{label:<8} exports={len(documents):<3} wall={wall:6.2f}s  "
+        f"loop lag p50={statistics.median(lags) if lags else 0.0:7.1f}ms "
+        f"p99={p99:7.1f}ms max={lags[-1] if lags else 0.0:7.1f}ms  ticks={len(lags)}"
+    )
+
+
+async def _run(args: argparse.Namespace, render: Callable[[str, Optional[str]], bytes]) -> None:
+    inline_docs = [_report_markdown(n, args.sections) for n in range(args.exports)]
+    pool_docs = [_report_markdown(n + args.exports, args.sections) for n in range(args.exports)]
+
+    async def _inline(doc: str) -> bytes:
+        # Previous behaviour: the handler rendered synchronously on the loop.
+        await asyncio.sleep(0)
+        return render(doc, None)
+
+    await _measure("inline", _inline, inline_docs)
+
+    # Warm the pool so process start-up is not billed to the first batch.
+    await pdf_renderer.render_pdf("# warm-up")
+    await _measure("pool", pdf_renderer.render_pdf, pool_docs)
+
+    started = time.perf_counter()
+    await pdf_renderer.render_pdf(pool_docs[0])
+    print(f"cached   repeat download served in {(time.perf_counter() - started) * 1000:.2f}ms")
+    print(f"stats    {pdf_renderer.get_pdf_render_stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exports", type=int, default=8, help="concurrent exports per phase")
+    parser.add_argument("--sections", type=int, default=150, help="sections per generated report")
+    parser.add_argument("--workers", type=int, default=None, help="override PDF_RENDER_WORKERS")
+    parser.add_argument("--synthetic", action="store_true", help="CPU-bound stand-in instead of WeasyPrint")
+    parser.add_argument("--synthetic-ms", type=float, default=500.0, help="stand-in render time per document")
+    args = parser.parse_args()
+
+    settings = pdf_renderer.settings
+    if args.workers is not None:
+        settings.PDF_RENDER_WORKERS = args.workers
+    settings.PDF_RENDER_MAX_PENDING = max(settings.PDF_RENDER_MAX_PENDING, args.exports + 1)
+
+    render: Callable[[str, Optional[str]], bytes]
+    if args.synthetic:
+        os.environ[_SYNTHETIC_SECONDS_ENV] = str(args.synthetic_ms / 1000)
+        render = _synthetic_render
+        pdf_renderer._render = _synthetic_render
+    else:
+        from services.pdf_generator import generate_pdf
+
+        render = generate_pdf
+
+    print(f"workers={settings.PDF_RENDER_WORKERS} sections={args.sections} synthetic={args.synthetic}")
+    try:
+        asyncio.run(_run(args, render))
+    finally:
+        pdf_renderer.shutdown_pdf_renderer()
+
+
+if __name__ == "__main__":
+    main()
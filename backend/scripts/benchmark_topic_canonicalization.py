@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark topic-graph node canonicalization: indexed vs brute force.
+
+Builds a synthetic day of topic-graph input (tokens plus 2-/3-gram phrases
+extracted from Zipf-distributed documents, the same way
+``generate_topic_graph_for_org_day`` does) and times
+``services.topic_graph._canonicalize`` against the previous all-pairs
+implementation, ``_canonicalize_bruteforce``. Mappings are compared on the
+inputs both implementations ran on.
+
+The brute-force pass is quadratic, so by default it runs on a sample and
+its 100k-node time is extrapolated; pass ``--full-baseline`` to run it on
+the whole input (expect hours).
+
+Usage:
+  python3 scripts/benchmark_topic_canonicalization.py
+  python3 scripts/benchmark_topic_canonicalization.py --nodes 100000 --baseline-nodes 10000
+  python3 scripts/benchmark_topic_canonicalization.py --full-baseline
+
+Run from backend/ or project root.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+_backend: Path = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from services.topic_graph import (  # noqa: E402
+    _canonicalize,
+    _canonicalize_bruteforce,
+    _extract_candidate_nodes,
+)
+
+
+def _synthetic_nodes(target: int, vocab_size: int, seed: int) -> list[str]:
+    """Return ``target`` unique raw nodes extracted from synthetic documents."""
+    rng = random.Random(seed)
+    vocab: list[str] = [f"topic{i:05d}" for i in range(vocab_size)]
+    # Zipf-like weights: a few hot terms, a long tail of rare ones.
+    weights: list[float] = [1.0 / (rank + 1) for rank in range(vocab_size)]
+    seen: set[str] = set()
+    nodes: list[str] = []
+    while len(nodes) < target:
+        doc = " ".join(rng.choices(vocab, weights=weights, k=rng.randint(5, 40)))
+        for node in _extract_candidate_nodes(doc):
+            if node not in seen:
+                seen.add(node)
+                nodes.append(node)
+                if len(nodes) >= target:
+                    break
+    return nodes
+
+
+def _time(fn, *args) -> tuple[float, dict[str, str]]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000, help="unique raw nodes to generate")
+    parser.add_argument("--vocab", type=int, default=20_000, help="synthetic vocabulary size")
+    parser.add_argument("--min-conf", type=float, default=0.5, help="fuzzy merge threshold")
+    parser.add_argument("--baseline-nodes", type=int, default=5_000, help="sample size for the brute-force run")
+    parser.add_argument("--full-baseline", action="store_true", help="run brute force on every node")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    nodes = _synthetic_nodes(args.nodes, args.vocab, args.seed)
+    print(f"Generated {len(nodes):,} unique nodes (vocab={args.vocab:,}, min_conf={args.min_conf})")
+
+    indexed_seconds, indexed_mapping = _time(_canonicalize, nodes, args.min_conf)
+    canonical_count = len(set(indexed_mapping.values()))
+    print(f"indexed     : {indexed_seconds:8.2f}s  ({canonical_count:,} canonical nodes)")
+
+    baseline_input = nodes if args.full_baseline else nodes[: args.baseline_nodes]
+    baseline_seconds, baseline_mapping = _time(_canonicalize_bruteforce, baseline_input, args.min_conf)
+    sample_indexed = indexed_mapping if args.full_baseline else _canonicalize(baseline_input, args.min_conf)
+    identical = sample_indexed == baseline_mapping
+
+    if args.full_baseline:
+        print(f"brute force : {baseline_seconds:8.2f}s")
+        print(f"speedup     : {baseline_seconds / max(indexed_seconds, 1e-9):8.1f}x")
+    else:
+        scale = (len(nodes) / max(len(baseline_input), 1)) ** 2
+        projected = baseline_seconds * scale
+        print(f"brute force : {baseline_seconds:8.2f}s on {len(baseline_input):,} nodes")
+        print(f"  projected : {projected:8.0f}s on {len(nodes):,} nodes (quadratic extrapolation)")
+        print(f"speedup     : {projected / max(indexed_seconds, 1e-9):8.1f}x (projected)")
+    print(f"mappings identical on {len(baseline_input):,} nodes: {identical}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Load test cross-replica websocket fan-out (services.websocket_fanout).
+
+Spreads thousands of fake websockets over several simulated API processes
+(one ``WebSocketFanout`` each), publishes org and user events from a
+separate publisher process (standing in for a Celery worker), and checks
+that every socket subscribed to a channel received every event on it
+exactly once. Reports delivery latency and throughput.
+
+By default the processes share an in-memory broker. Pass ``--redis`` to
+go through Redis pub/sub at ``settings.REDIS_URL`` instead.
+
+Usage:
+  python3 scripts/load_test_websocket_fanout.py
+  python3 scripts/load_test_websocket_fanout.py --sockets 20000 --processes 16 --events 500
+  python3 scripts/load_test_websocket_fanout.py --redis
+
+Run from backend/ or project root.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_backend: Path = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from api.websockets import _fanout_message  # noqa: E402
+from services.websocket_fanout import (  # noqa: E402
+    FanoutBroker,
+    InMemoryFanoutBroker,
+    RedisFanoutBroker,
+    WebSocketFanout,
+    org_channel,
+    user_channel,
+)
+
+
+class _FakeSocket:
+    """Records event ids and delivery latency; optionally slow to send."""
+
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self.received: Counter[str] = Counter()
+        self.latencies: list[float] = []
+
+    async def send_text(self, message: str) -> None:
+        if self.delay_seconds:
+            await asyncio.sleep(self.delay_seconds)
+        event = json.loads(message)
+        self.received[event["id"]] += 1
+        self.latencies.append(time.perf_counter() - event["sent_at"])
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run(args: argparse.Namespace) -> bool:
+    rng = random.Random(args.seed)
+    broker: FanoutBroker = RedisFanoutBroker() if args.redis else InMemoryFanoutBroker()
+    processes = [WebSocketFanout(_fanout_message, broker) for _ in range(args.processes)]
+    publisher = WebSocketFanout(_fanout_message, broker)
+
+    # channel -> sockets on it, across all processes
+    subscribers: dict[str, list[_FakeSocket]] = {}
+    for i in range(args.sockets):
+        ws = _FakeSocket(args.slow_delay if rng.random() < args.slow_fraction else 0.0)
+        process = processes[rng.randrange(args.processes)]
+        for channel in (org_channel(f"org-{i % args.orgs}"), user_channel(f"user-{i % args.users}")):
+            await process.add(channel, ws)
+            subscribers.setdefault(channel, []).append(ws)
+
+    for process in processes:
+        process.start()
+    await asyncio.sleep(0.5)  # let subscriptions settle
+
+    channels = sorted(subscribers)
+    org_channels = [channel for channel in channels if channel.startswith("org:")]
+    user_channels = [channel for channel in channels if channel.startswith("user:")]
+    expected: dict[str, list[_FakeSocket]] = {}
+    started = time.perf_counter()
+    for burst_start in range(0, args.events, args.burst):
+        burst = []
+        for n in range(burst_start, min(burst_start + args.burst, args.events)):
+            channel = rng.choice(org_channels if rng.random() < args.org_share else user_channels)
+            event_id = f"e{n}"
+            expected[event_id] = subscribers[channel]
+            burst.append((channel, json.dumps({"type": "load_test", "id": event_id, "sent_at": time.perf_counter()})))
+        await publisher.publish_many(burst)
+
+    all_sockets = list({id(ws): ws for sockets in subscribers.values() for ws in sockets}.values())
+    deadline = time.perf_counter() + args.timeout
+    total_expected = sum(len(sockets) for sockets in expected.values())
+    while time.perf_counter() < deadline:
+        for process in processes:
+            await process.drain()
+        delivered = sum(sum(ws.received.values()) for ws in all_sockets)
+        if delivered >= total_expected:
+            break
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+
+    for process in processes:
+        await process.stop()
+
+    missing = duplicated = 0
+    for event_id, sockets in expected.items():
+        for ws in sockets:
+            count = ws.received[event_id]
+            missing += count == 0
+            duplicated += count > 1
+    latencies = [latency for ws in all_sockets for latency in ws.latencies]
+
+    print(
+        f"{args.sockets:,} sockets on {args.processes} processes, {len(channels):,} channels, "
+        f"{args.events:,} events ({'redis' if args.redis else 'in-memory'} broker)"
+    )
+    print(f"deliveries  : {len(latencies):,} of {total_expected:,} expected in {elapsed:.2f}s")
+    print(f"throughput  : {len(latencies) / max(elapsed, 1e-9):,.0f} deliveries/s")
+    print(f"latency p50 : {_percentile(latencies, 0.50) * 1000:8.1f} ms")
+    print(f"latency p99 : {_percentile(latencies, 0.99) * 1000:8.1f} ms")
+    if isinstance(broker, InMemoryFanoutBroker):
+        print(f"broker round trips: {broker.publish_calls:,}")
+    print(f"missing: {missing:,}  duplicated: {duplicated:,}")
+    return missing == 0 and duplicated == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", type=int, default=5_000, help="fake websockets to connect")
+    parser.add_argument("--processes", type=int, default=8, help="simulated API processes")
+    parser.add_argument("--orgs", type=int, default=50)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--events", type=int, default=200, help="events to publish")
+    parser.add_argument("--org-share", type=float, default=0.5, help="share of events sent to org channels")
+    parser.add_argument("--burst", type=int, default=20, help="events published together")
+    parser.add_argument("--slow-fraction", type=float, default=0.01, help="share of sockets that send slowly")
+    parser.add_argument("--slow-delay", type=float, default=0.2, help="send delay of slow sockets (seconds)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for deliveries")
+    parser.add_argument("--redis", action="store_true", help="use Redis pub/sub instead of the in-memory broker")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if not asyncio.run(_run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
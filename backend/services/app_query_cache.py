@@ -0,0 +1,246 @@
+"""
+In-process result cache for app named queries.
+
+``run_named_app_query`` serves both the authenticated app runtime and
+``/public/apps/{id}/queries/{name}``, which anyone holding a public link can
+call. A dashboard shared in a busy channel used to fire the same heavy
+SELECT (up to 5000 rows) once per viewer. :func:`get_or_run` caches the
+serialized :class:`AppQueryResponse` under a key built from:
+
+- app id, query name and a hash of the final SQL and bound params, so an
+  edited query or different params never share an entry;
+- the organization's data version, a Redis counter (``app_query_data:<org>:version``)
+  that :func:`invalidate_app_query_results` bumps when a sync finishes, so
+  the next request after a sync re-runs the query.
+
+Concurrent requests for the same key are coalesced (singleflight): one
+request runs the query on its session and the rest await its result. The
+data version lookup is coalesced and memoized for a few seconds the same
+way, so a burst of viewers costs one Redis GET and one app query.
+
+Entries live for the query's ``cache_ttl_seconds`` hint from ``app.queries``
+(default :data:`DEFAULT_TTL_SECONDS`; ``0`` disables caching). The TTL also
+bounds staleness for writes that do not bump the version: agent writes,
+deletes and messenger activity, which is written continuously and would
+otherwise keep every ``activities`` query from ever hitting the cache.
+Errors are never cached, and if Redis is unavailable queries run uncached. The cache is per
+process and bounded by :data:`_MAX_CACHED_ROWS`; counters are exposed
+through :func:`get_app_query_cache_stats`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from services.redis_pool import get_redis_client
+
+if TYPE_CHECKING:
+    from services.app_query_runner import AppQueryResponse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TTL_SECONDS = 30
+MAX_TTL_SECONDS = 60 * 60
+# How long one data version lookup is reused for the same org.
+_DATA_VERSION_TTL_SECONDS = 5.0
+_VERSION_KEY_PREFIX = "app_query_data:"
+# Refreshed on every bump, so an active org's version never resets.
+_VERSION_KEY_TTL_SECONDS = 7 * 24 * 60 * 60
+# Total rows held across all entries; least recently used entries go first.
+_MAX_CACHED_ROWS = 200_000
+
+_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "coalesced": 0,
+    "uncached": 0,
+    "evictions": 0,
+    "version_lookups": 0,
+}
+
+
+class _LeaderCancelled(Exception):
+    """The request running a shared load was cancelled; waiters retry."""
+
+
+_inflight: dict[Hashable, asyncio.Future[Any]] = {}
+_results: "OrderedDict[str, tuple[float, AppQueryResponse]]" = OrderedDict()
+_cached_rows = 0
+_versions: dict[str, tuple[float, str]] = {}
+async def _singleflight(key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+    """Run *load* once for concurrent callers sharing *key*."""
+    while True:
+        pending = _inflight.get(key)
+        if pending is None:
+            break
+        _stats["coalesced"] += 1
+        try:
+            return await asyncio.shield(pending)
+        except _LeaderCancelled:
+            continue
+
+    future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await load()
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
+        # Nobody may be waiting; mark the exception retrieved.
+        if future.done() and not future.cancelled():
+            future.exception()
+
+
+def cache_ttl_seconds(query_spec: dict[str, Any]) -> int:
+    """Return the result TTL requested by a query spec, clamped to sane bounds."""
+    raw: Any = query_spec.get("cache_ttl_seconds", DEFAULT_TTL_SECONDS)
+    try:
+        ttl = int(raw)
+    except (TypeError, ValueError):
+        return DEFAULT_TTL_SECONDS
+    return max(0, min(ttl, MAX_TTL_SECONDS))
+
+
+def _version_key(organization_id: str) -> str:
+    return f"{_VERSION_KEY_PREFIX}{organization_id}:version"
+
+
+async def _load_data_version(organization_id: str) -> str:
+    _stats["version_lookups"] += 1
+    return await get_redis_client().get(_version_key(organization_id)) or "0"
+
+
+async def _data_version(organization_id: str) -> str:
+    memo = _versions.get(organization_id)
+    if memo is not None and memo[0] > time.monotonic():
+        return memo[1]
+
+    async def _load() -> str:
+        version = await _load_data_version(organization_id)
+        _versions[organization_id] = (time.monotonic() + _DATA_VERSION_TTL_SECONDS, version)
+        return version
+
+    return await _singleflight(("version", organization_id), _load)
+
+
+async def invalidate_app_query_results(organization_id: str | None) -> None:
+    """Bump an organization's data version (called when a sync finishes).
+
+    Other processes notice within ``_DATA_VERSION_TTL_SECONDS``.
+    """
+    if not organization_id:
+        return
+    key = _version_key(str(organization_id))
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.incr(key)
+        pipe.expire(key, _VERSION_KEY_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        logger.debug("App query data version bump failed for org %s", organization_id, exc_info=True)
+    _versions.pop(str(organization_id), None)
+
+
+def _store(key: str, ttl: int, response: AppQueryResponse) -> None:
+    global _cached_rows
+    rows = len(response.data)
+    if rows > _MAX_CACHED_ROWS:
+        return
+    previous = _results.pop(key, None)
+    if previous is not None:
+        _cached_rows -= len(previous[1].data)
+    _results[key] = (time.monotonic() + ttl, response)
+    _cached_rows += rows
+    while _cached_rows > _MAX_CACHED_ROWS and _results:
+        _, (_, evicted) = _results.popitem(last=False)
+        _cached_rows -= len(evicted.data)
+        _stats["evictions"] += 1
+
+
+def _lookup(key: str) -> AppQueryResponse | None:
+    global _cached_rows
+    entry = _results.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+        del _results[key]
+        _cached_rows -= len(response.data)
+        return None
+    _results.move_to_end(key)
+    return response
+
+
+async def get_or_run(
+    *,
+    app_id: str,
+    organization_id: str,
+    query_name: str,
+    sql: str,
+    params: dict[str, Any],
+    ttl_seconds: int,
+    run: Callable[[], Awaitable[AppQueryResponse]],
+) -> AppQueryResponse:
+    """Return the cached result for this query, or *run* it once and cache it."""
+    if ttl_seconds <= 0:
+        _stats["uncached"] += 1
+        return await run()
+
+    try:
+        version = await _data_version(organization_id)
+    except Exception:
+        logger.debug("App query data version lookup failed for org %s", organization_id, exc_info=True)
+        _stats["uncached"] += 1
+        return await run()
+
+    statement_hash = hashlib.sha256(
+        json.dumps([sql, params], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    key = f"{app_id}:{query_name}:{statement_hash}:{version}"
+
+    cached = _lookup(key)
+    if cached is not None:
+        _stats["hits"] += 1
+        return cached
+
+    async def _load() -> AppQueryResponse:
+        _stats["misses"] += 1
+        response = await run()
+        _store(key, ttl_seconds, response)
+        return response
+
+    return await _singleflight(("result", key), _load)
+
+
+def clear_app_query_cache() -> None:
+    """Drop every cached result and data version (tests, manual resets)."""
+    global _cached_rows
+    _results.clear()
+    _versions.clear()
+    _cached_rows = 0
+
+
+def get_app_query_cache_stats() -> dict[str, int]:
+    """Process-local hit/miss counters and current cache size."""
+    stats: dict[str, int] = dict(_stats)
+    stats["entries"] = len(_results)
+    stats["cached_rows"] = _cached_rows
+    stats["inflight"] = len(_inflight)
+    return stats
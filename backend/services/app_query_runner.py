@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from access_control import RightsContext, check_sql
 from models.app import App
+from services import app_query_cache
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +72,11 @@ async def run_named_app_query(
     params: dict[str, Any],
     session: AsyncSession,
 ) -> AppQueryResponse:
-    """Run a named query from `app.queries` with rights checks and RLS session."""
+    """Run a named query from `app.queries` with rights checks and RLS session.
+
+    Results are served from :mod:`services.app_query_cache` for the query's
+    ``cache_ttl_seconds`` (see that module for keys and invalidation).
+    """
     queries: dict[str, Any] = app.queries or {}
     query_spec: dict[str, Any] | None = queries.get(query_name)
 
@@ -122,22 +127,33 @@ async def run_named_app_query(
         rights_result.transformed_params if rights_result.transformed_params is not None else bound_params
     )
 
-    try:
-        raw_result = await session.execute(text(query_to_run), params_to_use)
-        rows = raw_result.mappings().all()
-        columns: list[str] = list(raw_result.keys()) if rows else []
-
-        data: list[dict[str, Any]] = [
-            {
-                k: json_serial(v)
-                if not isinstance(v, (str, int, float, bool, type(None)))
-                else v
-                for k, v in dict(row).items()
-            }
-            for row in rows
-        ]
-
-        return AppQueryResponse(data=data, columns=columns)
-    except Exception as exc:
-        logger.error("App query execution failed: %s", exc)
-        raise HTTPException(status_code=400, detail=f"Query error: {exc}") from exc
+    async def _execute() -> AppQueryResponse:
+        try:
+            raw_result = await session.execute(text(query_to_run), params_to_use)
+            rows = raw_result.mappings().all()
+            columns: list[str] = list(raw_result.keys()) if rows else []
+
+            data: list[dict[str, Any]] = [
+                {
+                    k: json_serial(v)
+                    if not isinstance(v, (str, int, float, bool, type(None)))
+                    else v
+                    for k, v in dict(row).items()
+                }
+                for row in rows
+            ]
+
+            return AppQueryResponse(data=data, columns=columns)
+        except Exception as exc:
+            logger.error("App query execution failed: %s", exc)
+            raise HTTPException(status_code=400, detail=f"Query error: {exc}") from exc
+
+    return await app_query_cache.get_or_run(
+        app_id=str(app.id),
+        organization_id=organization_id,
+        query_name=query_name,
+        sql=query_to_run,
+        params=params_to_use,
+        ttl_seconds=app_query_cache.cache_ttl_seconds(query_spec),
+        run=_execute,
+    )
@@ -0,0 +1,377 @@
+"""
+Storage tiers for uploaded chat attachments (used by ``services.file_handler``).
+
+An upload is consumed by whichever process runs the turn, which is not
+necessarily the API replica that accepted it (another replica, or a Celery
+worker for messenger turns). Uploads therefore live in two tiers:
+
+- :class:`LocalAttachmentStore`, per process: metadata plus bytes in memory
+  up to a byte budget. Past the budget the oldest files spill to a private
+  directory on local disk and are read back through ``mmap`` on access, so
+  large PDFs/XLSX waiting to be consumed do not sit in RAM. Expired entries
+  are swept on access at most every :data:`_SWEEP_INTERVAL_SECONDS`.
+- A shared backend (:class:`SharedAttachmentBackend`) that every process
+  can read. :class:`RedisAttachmentBackend` is used in production;
+  :class:`InMemoryAttachmentBackend` stands in for it in tests.
+
+Counters are exposed through :func:`get_attachment_store_stats`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import redis.asyncio as aioredis
+
+from config import settings
+from services.redis_pool import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_SWEEP_INTERVAL_SECONDS = 60.0
+_REDIS_KEY_PREFIX = "attachments:"
+
+_stats: dict[str, int] = {
+    "stored": 0,
+    "spilled": 0,
+    "local_hits": 0,
+    "shared_hits": 0,
+    "misses": 0,
+    "expired": 0,
+    "shared_errors": 0,
+}
+
+
+@dataclass
+class AttachmentEntry:
+    """Metadata for one stored upload; ``data`` is None once spilled to disk."""
+    upload_id: str
+    filename: str
+    mime_type: str
+    size: int
+    created_at: float
+    data: bytes | None = None
+    path: str | None = field(default=None, repr=False)
+
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "mime_type": self.mime_type,
+            "size": self.size,
+            "created_at": self.created_at,
+        }
+
+
+def _read_mapped(path: str) -> bytes:
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return bytes(mapped)
+
+
+class LocalAttachmentStore:
+    """Per-process attachment tier with a memory budget and disk spill."""
+
+    def __init__(
+        self,
+        *,
+        memory_budget_bytes: int,
+        ttl_seconds: int,
+        spill_dir: str | None = None,
+    ) -> None:
+        self._memory_budget_bytes: int = memory_budget_bytes
+        self._ttl_seconds: int = ttl_seconds
+        self._spill_root: str = spill_dir or tempfile.gettempdir()
+        self._spill_dir: str | None = None
+        self._entries: "OrderedDict[str, AttachmentEntry]" = OrderedDict()
+        self._memory_bytes: int = 0
+        self._spilled_bytes: int = 0
+        self._next_sweep: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def spilled_bytes(self) -> int:
+        return self._spilled_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, entry: AttachmentEntry) -> None:
+        with self._lock:
+            self._sweep_if_due()
+            self._drop(entry.upload_id)
+            self._entries[entry.upload_id] = entry
+            self._memory_bytes += len(entry.data or b"")
+            self._spill_over_budget()
+
+    def get(self, upload_id: str) -> tuple[AttachmentEntry, bytes] | None:
+        with self._lock:
+            self._sweep_if_due()
+            entry = self._entries.get(upload_id)
+            if entry is None:
+                return None
+            if time.time() - entry.created_at > self._ttl_seconds:
+                self._drop(upload_id)
+                _stats["expired"] += 1
+                return None
+            if entry.data is not None:
+                return entry, entry.data
+            path = entry.path
+        # Disk read outside the lock; a concurrent remove just fails the read.
+        try:
+            return entry, _read_mapped(path) if path else b""
+        except OSError as exc:
+            logger.warning("Spilled upload %s unreadable: %s", upload_id, exc)
+            return None
+
+    def delete(self, upload_id: str) -> None:
+        with self._lock:
+            self._drop(upload_id)
+
+    def _drop(self, upload_id: str) -> None:
+        """Must be called under _lock."""
+        entry = self._entries.pop(upload_id, None)
+        if entry is None:
+            return
+        if entry.data is not None:
+            self._memory_bytes -= len(entry.data)
+        if entry.path is not None:
+            self._spilled_bytes -= entry.size
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+    def _sweep_if_due(self) -> None:
+        """Drop expired entries. Must be called under _lock."""
+        now: float = time.time()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+        expired: list[str] = [
+            uid for uid, entry in self._entries.items()
+            if now - entry.created_at > self._ttl_seconds
+        ]
+        for uid in expired:
+            self._drop(uid)
+        if expired:
+            _stats["expired"] += len(expired)
+            logger.info("Cleaned up %d expired upload(s)", len(expired))
+
+    def _spill_over_budget(self) -> None:
+        """Move the oldest in-memory files to disk. Must be called under _lock."""
+        if self._memory_bytes <= self._memory_budget_bytes:
+            return
+        for entry in list(self._entries.values()):
+            if self._memory_bytes <= self._memory_budget_bytes:
+                break
+            if not entry.data:
+                continue
+            try:
+                path = os.path.join(self._ensure_spill_dir(), entry.upload_id)
+                with open(path, "wb") as fh:
+                    fh.write(entry.data)
+            except OSError as exc:
+                logger.warning("Could not spill upload %s to disk: %s", entry.upload_id, exc)
+                return
+            self._memory_bytes -= len(entry.data)
+            self._spilled_bytes += entry.size
+            entry.data, entry.path = None, path
+            _stats["spilled"] += 1
+
+    def _ensure_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            # Private to this process, so replicas sharing a volume never collide.
+            self._spill_dir = tempfile.mkdtemp(prefix="attachments-", dir=self._spill_root)
+        return self._spill_dir
+
+
+# =============================================================================
+# Shared backends
+# =============================================================================
+
+
+class SharedAttachmentBackend(Protocol):
+    async def put(self, upload_id: str, metadata: dict[str, Any], data: bytes, ttl_seconds: int) -> None: ...
+
+    async def get(self, upload_id: str) -> tuple[dict[str, Any], bytes] | None: ...
+
+    async def delete(self, upload_id: str) -> None: ...
+
+
+class RedisAttachmentBackend:
+    """Stores each upload as one Redis hash (``meta`` JSON + raw ``data``)."""
+
+    def _client(self) -> aioredis.Redis:
+        return get_redis_client(decode_responses=False)
+
+    async def put(self, upload_id: str, metadata: dict[str, Any], data: bytes, ttl_seconds: int) -> None:
+        key = _REDIS_KEY_PREFIX + upload_id
+        pipe = self._client().pipeline(transaction=True)
+        pipe.hset(key, mapping={"meta": json.dumps(metadata), "data": data})
+        pipe.expire(key, ttl_seconds)
+        await pipe.execute()
+
+    async def get(self, upload_id: str) -> tuple[dict[str, Any], bytes] | None:
+        raw: list[bytes | None] = await self._client().hmget(_REDIS_KEY_PREFIX + upload_id, ["meta", "data"])
+        meta, data = raw
+        if meta is None or data is None:
+            return None
+        return json.loads(meta), data
+
+    async def delete(self, upload_id: str) -> None:
+        await self._client().delete(_REDIS_KEY_PREFIX + upload_id)
+
+
+class InMemoryAttachmentBackend:
+    """Process-local stand-in for the shared tier (tests)."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, tuple[dict[str, Any], bytes]] = {}
+
+    async def put(self, upload_id: str, metadata: dict[str, Any], data: bytes, ttl_seconds: int) -> None:
+        self.items[upload_id] = (dict(metadata), data)
+
+    async def get(self, upload_id: str) -> tuple[dict[str, Any], bytes] | None:
+        return self.items.get(upload_id)
+
+    async def delete(self, upload_id: str) -> None:
+        self.items.pop(upload_id, None)
+
+
+# =============================================================================
+# Two-tier store
+# =============================================================================
+
+
+class AttachmentStore:
+    """Local tier in front of an optional shared backend.
+
+    The sync methods serve callers that cannot await (they still write
+    through to the shared tier in the background when a loop is running);
+    async callers should prefer :meth:`aput` / :meth:`aget`, which wait for
+    the shared tier.
+    """
+
+    def __init__(
+        self,
+        local: LocalAttachmentStore,
+        shared: SharedAttachmentBackend | None,
+        *,
+        ttl_seconds: int,
+    ) -> None:
+        self.local: LocalAttachmentStore = local
+        self.shared: SharedAttachmentBackend | None = shared
+        self._ttl_seconds: int = ttl_seconds
+        self._background: set[asyncio.Task[None]] = set()
+
+    def put(self, entry: AttachmentEntry) -> None:
+        data: bytes = entry.data or b""
+        self.local.put(entry)
+        _stats["stored"] += 1
+        self._in_background(self._share(entry.upload_id, entry.metadata(), data))
+
+    async def aput(self, entry: AttachmentEntry) -> None:
+        data: bytes = entry.data or b""
+        self.local.put(entry)
+        _stats["stored"] += 1
+        await self._share(entry.upload_id, entry.metadata(), data)
+
+    def get(self, upload_id: str) -> tuple[AttachmentEntry, bytes] | None:
+        found = self.local.get(upload_id)
+        _stats["local_hits" if found is not None else "misses"] += 1
+        return found
+
+    async def aget(self, upload_id: str) -> tuple[AttachmentEntry, bytes] | None:
+        found = self.local.get(upload_id)
+        if found is not None:
+            _stats["local_hits"] += 1
+            return found
+        if self.shared is not None:
+            try:
+                shared = await self.shared.get(upload_id)
+            except Exception as exc:
+                _stats["shared_errors"] += 1
+                logger.warning("Shared attachment lookup failed for %s: %s", upload_id, exc)
+                shared = None
+            if shared is not None:
+                metadata, data = shared
+                entry = AttachmentEntry(upload_id=upload_id, data=data, **metadata)
+                self.local.put(entry)
+                _stats["shared_hits"] += 1
+                return entry, data
+        _stats["misses"] += 1
+        return None
+
+    def delete(self, upload_id: str) -> None:
+        self.local.delete(upload_id)
+        if self.shared is not None:
+            self._in_background(self._unshare(upload_id))
+
+    async def _share(self, upload_id: str, metadata: dict[str, Any], data: bytes) -> None:
+        if self.shared is None:
+            return
+        try:
+            await self.shared.put(upload_id, metadata, data, self._ttl_seconds)
+        except Exception as exc:
+            _stats["shared_errors"] += 1
+            logger.warning("Could not share upload %s across processes: %s", upload_id, exc)
+
+    async def _unshare(self, upload_id: str) -> None:
+        assert self.shared is not None
+        try:
+            await self.shared.delete(upload_id)
+        except Exception as exc:
+            _stats["shared_errors"] += 1
+            logger.warning("Could not delete shared upload %s: %s", upload_id, exc)
+
+    def _in_background(self, coro: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync scripts): the local tier is all there is.
+            coro.close()
+            return
+        task = loop.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+def build_attachment_store(*, ttl_seconds: int) -> AttachmentStore:
+    """Create the store configured by ``ATTACHMENT_*`` settings."""
+    shared: SharedAttachmentBackend | None = (
+        RedisAttachmentBackend() if settings.ATTACHMENT_SHARED_STORE == "redis" else None
+    )
+    return AttachmentStore(
+        LocalAttachmentStore(
+            memory_budget_bytes=settings.ATTACHMENT_MEMORY_BUDGET_BYTES,
+            ttl_seconds=ttl_seconds,
+            spill_dir=settings.ATTACHMENT_SPILL_DIR,
+        ),
+        shared,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def get_attachment_store_stats() -> dict[str, int]:
+    """Process-local counters plus the local tier's current size."""
+    from services.file_handler import attachment_store
+
+    local = attachment_store.local
+    stats: dict[str, int] = dict(_stats)
+    stats["entries"] = len(local)
+    stats["memory_bytes"] = local.memory_bytes
+    stats["spilled_bytes"] = local.spilled_bytes
+    return stats
@@ -0,0 +1,92 @@
+"""Versioned per-organization cache for chat turn context.
+
+Every chat turn used to rebuild the connector manifest (``Integration`` rows
+plus ``discover_connectors()``) and the context profile (memories,
+``OrgMember`` fields, conversation participants) although both change
+rarely. :func:`get_or_load` caches them in Redis under keys that embed a
+per-organization version number:
+
+- ``chat_context:<org>:v<n>:manifest``
+- ``chat_context:<org>:v<n>:profile:<user>:<conversation>:<channel>``
+
+:func:`invalidate_org_context` bumps the version, which orphans every entry
+for the organization at once (they age out on their TTL). Call it whenever
+something that feeds the manifest or the profile is written: integrations
+connected or disconnected, syncs finishing or failing, memory writes,
+membership edits and conversation participant/scope changes. The entry TTL
+bounds staleness for any writer that is missed.
+
+Redis failures fall back to loading directly; the cache never fails a turn.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from services.redis_pool import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_KEY_PREFIX = "chat_context:"
+_ENTRY_TTL_SECONDS = 10 * 60
+# Outlives every entry, so a version key never resets while entries remain.
+_VERSION_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _version_key(organization_id: str) -> str:
+    return f"{_KEY_PREFIX}{organization_id}:version"
+
+
+def _entry_key(organization_id: str, version: str, kind: str, scope: Sequence[str | None]) -> str:
+    parts: list[str] = [kind, *(part or "-" for part in scope)]
+    return f"{_KEY_PREFIX}{organization_id}:v{version}:{':'.join(parts)}"
+
+
+async def get_or_load(
+    kind: str,
+    organization_id: str,
+    scope: Sequence[str | None],
+    load: Callable[[], Awaitable[T]],
+) -> T:
+    """Return the cached ``kind`` entry for *scope*, loading and storing it on a miss.
+
+    *load* must return a JSON-serializable value. Exceptions from *load*
+    propagate and nothing is cached.
+    """
+    key: str | None = None
+    try:
+        redis_client = get_redis_client()
+        version: str = await redis_client.get(_version_key(organization_id)) or "0"
+        key = _entry_key(organization_id, version, kind, scope)
+        cached: str | None = await redis_client.get(key)
+        if cached is not None:
+            return json.loads(cached)["value"]
+    except Exception:
+        logger.debug("Context cache read failed kind=%s org=%s", kind, organization_id, exc_info=True)
+
+    value: T = await load()
+    if key is None:
+        return value
+    try:
+        await get_redis_client().set(key, json.dumps({"value": value}, default=str), ex=_ENTRY_TTL_SECONDS)
+    except Exception:
+        logger.debug("Context cache write failed kind=%s org=%s", kind, organization_id, exc_info=True)
+    return value
+
+
+async def invalidate_org_context(organization_id: str | None) -> None:
+    """Drop every cached manifest/profile for an organization."""
+    if not organization_id:
+        return
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.incr(_version_key(str(organization_id)))
+        pipe.expire(_version_key(str(organization_id)), _VERSION_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        logger.debug("Context cache invalidation failed for org %s", organization_id, exc_info=True)
@@ -0,0 +1,142 @@
+"""
+Two-tier cache for text embeddings.
+
+Embeddings are deterministic for a given model and input, so identical text
+never needs a second OpenAI round trip. Entries are keyed by model and a
+SHA-256 of the normalized text and stored as packed float32 vectors:
+
+- L1: an in-process LRU (``_L1_MAX_ENTRIES`` vectors, ~6 KB each).
+- L2: Redis, shared by API and worker processes, with a TTL.
+
+Redis errors are treated as misses; the cache never fails an embedding call.
+Hit/miss counters are available from :func:`get_embedding_cache_stats`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import logging
+import struct
+import threading
+import unicodedata
+from typing import Optional
+
+from services.redis_pool import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_L1_MAX_ENTRIES = 2048
+_REDIS_KEY_PREFIX = "embeddings:cache:"
+_REDIS_TTL_SECONDS = 14 * 24 * 60 * 60
+
+_l1: "OrderedDict[str, bytes]" = OrderedDict()
+_l1_lock = threading.Lock()
+_stats: dict[str, int] = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "stores": 0, "redis_errors": 0}
+def normalize_embedding_text(text: str) -> str:
+    """Canonical form used for cache keys (Unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+    return f"{_REDIS_KEY_PREFIX}{model}:{digest}"
+
+
+def _pack(vector: list[float]) -> bytes:
+    return struct.pack(f"<{len(vector)}f", *vector)
+
+
+def _unpack(blob: bytes) -> list[float]:
+    return list(struct.unpack(f"<{len(blob) // 4}f", blob))
+
+
+def _l1_get(key: str) -> Optional[bytes]:
+    with _l1_lock:
+        blob = _l1.get(key)
+        if blob is not None:
+            _l1.move_to_end(key)
+        return blob
+
+
+def _l1_put(key: str, blob: bytes) -> None:
+    with _l1_lock:
+        _l1[key] = blob
+        _l1.move_to_end(key)
+        while len(_l1) > _L1_MAX_ENTRIES:
+            _l1.popitem(last=False)
+
+
+async def get_cached_embeddings(model: str, texts: list[str]) -> list[Optional[list[float]]]:
+    """Return cached vectors aligned with *texts* (``None`` for misses)."""
+    keys: list[str] = [embedding_cache_key(model, t) for t in texts]
+    results: list[Optional[list[float]]] = [None] * len(texts)
+    l2_lookups: dict[str, list[int]] = {}
+
+    for i, key in enumerate(keys):
+        blob = _l1_get(key)
+        if blob is not None:
+            results[i] = _unpack(blob)
+            _stats["l1_hits"] += 1
+        else:
+            l2_lookups.setdefault(key, []).append(i)
+
+    if l2_lookups:
+        lookup_keys: list[str] = list(l2_lookups)
+        blobs: list[Optional[bytes]] = [None] * len(lookup_keys)
+        try:
+            blobs = await get_redis_client(decode_responses=False).mget(lookup_keys)
+        except Exception:
+            _stats["redis_errors"] += 1
+            logger.debug("Embedding cache lookup failed; treating as misses", exc_info=True)
+        for key, blob in zip(lookup_keys, blobs):
+            positions = l2_lookups[key]
+            if blob:
+                _l1_put(key, blob)
+                vector = _unpack(blob)
+                for i in positions:
+                    results[i] = vector
+                _stats["l2_hits"] += len(positions)
+            else:
+                _stats["misses"] += len(positions)
+
+    return results
+
+
+async def store_embeddings(model: str, texts: list[str], vectors: list[list[float]]) -> None:
+    """Write freshly generated vectors to both cache tiers."""
+    if not texts:
+        return
+    entries: dict[str, bytes] = {}
+    for text, vector in zip(texts, vectors):
+        key = embedding_cache_key(model, text)
+        blob = _pack(vector)
+        _l1_put(key, blob)
+        entries[key] = blob
+    _stats["stores"] += len(entries)
+
+    try:
+        pipe = get_redis_client(decode_responses=False).pipeline(transaction=False)
+        for key, blob in entries.items():
+            pipe.set(key, blob, ex=_REDIS_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        _stats["redis_errors"] += 1
+        logger.debug("Embedding cache store failed", exc_info=True)
+
+
+def get_embedding_cache_stats() -> dict[str, float]:
+    """Process-local hit/miss counters and the combined hit rate."""
+    stats: dict[str, float] = dict(_stats)
+    lookups = _stats["l1_hits"] + _stats["l2_hits"] + _stats["misses"]
+    stats["hit_rate"] = (_stats["l1_hits"] + _stats["l2_hits"]) / lookups if lookups else 0.0
+    stats["l1_entries"] = len(_l1)
+    return stats
+
+
+def clear_embedding_cache() -> None:
+    """Drop the in-process tier and reset counters (Redis entries expire on their own)."""
+    with _l1_lock:
+        _l1.clear()
+    for name in _stats:
+        _stats[name] = 0
@@ -4,112 +4,380 @@ Background job to generate embeddings for activities.
 This runs after data sync to ensure all activities have searchable embeddings.
 Embeddings are stored as native pgvector vector(1536) columns and searched
 via SQL cosine distance (<=>).
+
+The backfill is a streaming pipeline so it never holds a session (or a full
+result set) open across OpenAI calls:
+
+1. Keyset-paginated reads (``id > cursor ORDER BY id``) of just the id and
+   text columns of un-embedded activities, prefetching the next page while
+   the current one is embedded.
+2. Concurrent embedding requests, bounded by ``EMBEDDING_MAX_IN_FLIGHT``.
+3. One bulk ``UPDATE ... FROM (VALUES ...)`` per page, in its own short
+   session.
+
+The id of the last written page is kept in Redis, so an interrupted or
+``limit``-capped run resumes where it stopped. A resumed run that reaches the
+end of the keyset wraps around once to pick up rows below the cursor (newly
+synced ids or rows whose embedding request failed).
+
+Activity ids are random UUIDs, so the id order says nothing about recency.
+After a sync, :func:`embed_recently_synced_activities` therefore embeds the
+rows that sync wrote first (``synced_at >= sync start``, newest first, through
+a partial index on un-embedded rows) without touching the cursor; the id
+cursor only drives the backlog sweep that uses whatever budget is left.
 """
 
+import asyncio
+from datetime import datetime
 import logging
-from typing import Optional
+from typing import Any, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, text, tuple_
 
 from models.activity import Activity
 from models.database import get_session
+from services.embedding_cache import get_embedding_cache_stats
 from services.embeddings import (
     EmbeddingService,
     build_searchable_text,
     get_embedding_service,
 )
+from services.redis_pool import get_redis_client
 
 logger = logging.getLogger(__name__)
 
-EMBEDDING_BATCH_SIZE = 50
+# Texts per embeddings API request.
+EMBEDDING_BATCH_SIZE = 100
+# Activities read (and written back) per keyset page.
+EMBEDDING_PAGE_SIZE = 500
+# Embedding requests allowed in flight at once, across pages.
+EMBEDDING_MAX_IN_FLIGHT = 4
+# Rows handled by the post-sync step; the cursor carries the rest to the next sync.
+POST_SYNC_EMBEDDING_LIMIT = 5000
 
+_CURSOR_KEY_PREFIX = "embeddings:activity_backfill_cursor:"
+_CURSOR_TTL_SECONDS = 7 * 24 * 60 * 60
 
-async def generate_embeddings_for_organization(
+
+def _cursor_key(organization_id: str) -> str:
+    return f"{_CURSOR_KEY_PREFIX}{organization_id}"
+
+
+async def _load_cursor(organization_id: str) -> Optional[UUID]:
+    """Return the last activity id written by a previous run, if any."""
+    try:
+        raw_value = await get_redis_client().get(_cursor_key(organization_id))
+    except Exception:
+        logger.warning("Failed to read embedding backfill cursor for org %s", organization_id, exc_info=True)
+        return None
+    if not raw_value:
+        return None
+    try:
+        return UUID(raw_value)
+    except ValueError:
+        logger.warning("Ignoring malformed embedding backfill cursor %r", raw_value)
+        return None
+
+
+async def _save_cursor(organization_id: str, cursor: Optional[UUID]) -> None:
+    """Persist (or clear, when *cursor* is None) the backfill cursor."""
+    try:
+        if cursor is None:
+            await get_redis_client().delete(_cursor_key(organization_id))
+        else:
+            await get_redis_client().set(
+                _cursor_key(organization_id), str(cursor), ex=_CURSOR_TTL_SECONDS
+            )
+    except Exception:
+        logger.warning("Failed to store embedding backfill cursor for org %s", organization_id, exc_info=True)
+
+
+async def _fetch_page(
+    organization_id: str,
+    after_id: Optional[UUID],
+    until_id: Optional[UUID],
+    page_size: int,
+) -> list[Any]:
+    """Read the next keyset page of un-embedded activities (text columns only)."""
+    query = (
+        select(
+            Activity.id,
+            Activity.type,
+            Activity.subject,
+            Activity.description,
+            Activity.custom_fields,
+        )
+        .where(Activity.organization_id == organization_id)
+        .where(Activity.embedding.is_(None))
+        .order_by(Activity.id)
+        .limit(page_size)
+    )
+    if after_id is not None:
+        query = query.where(Activity.id > after_id)
+    if until_id is not None:
+        query = query.where(Activity.id <= until_id)
+
+    async with get_session(organization_id=organization_id) as session:
+        result = await session.execute(query)
+        return list(result.all())
+
+
+async def _fetch_recent_page(
+    organization_id: str,
+    synced_since: datetime,
+    before: Optional[tuple[datetime, UUID]],
+    page_size: int,
+) -> list[Any]:
+    """Read the next page of un-embedded activities synced since *synced_since*, newest first."""
+    query = (
+        select(
+            Activity.id,
+            Activity.synced_at,
+            Activity.type,
+            Activity.subject,
+            Activity.description,
+            Activity.custom_fields,
+        )
+        .where(Activity.organization_id == organization_id)
+        .where(Activity.embedding.is_(None))
+        .where(Activity.synced_at >= synced_since)
+        .order_by(Activity.synced_at.desc(), Activity.id.desc())
+        .limit(page_size)
+    )
+    if before is not None:
+        query = query.where(tuple_(Activity.synced_at, Activity.id) < before)
+
+    async with get_session(organization_id=organization_id) as session:
+        result = await session.execute(query)
+        return list(result.all())
+
+
+async def _write_embeddings(
+    organization_id: str,
+    updates: list[tuple[UUID, str, list[float]]],
+) -> None:
+    """Write ``(id, searchable_text, embedding)`` rows with one bulk UPDATE."""
+    if not updates:
+        return
+
+    values_sql: list[str] = []
+    params: dict[str, Any] = {"organization_id": organization_id}
+    for i, (activity_id, searchable, embedding) in enumerate(updates):
+        values_sql.append(f"(CAST(:id_{i} AS uuid), CAST(:text_{i} AS text), CAST(:vec_{i} AS text))")
+        params[f"id_{i}"] = activity_id
+        params[f"text_{i}"] = searchable
+        params[f"vec_{i}"] = "[" + ",".join(str(v) for v in embedding) + "]"
+
+    statement = text(
+        "UPDATE activities AS a "
+        "SET searchable_text = v.searchable_text, embedding = CAST(v.embedding AS vector) "
+        f"FROM (VALUES {', '.join(values_sql)}) AS v(id, searchable_text, embedding) "
+        "WHERE a.id = v.id AND a.organization_id = CAST(:organization_id AS uuid)"
+    )
+    async with get_session(organization_id=organization_id) as session:
+        await session.execute(statement, params)
+        await session.commit()
+
+
+async def _embed_page(
+    rows: list[Any],
+    embedding_service: EmbeddingService,
+    semaphore: asyncio.Semaphore,
+) -> list[tuple[UUID, str, list[float]]]:
+    """Embed one page, splitting it into concurrent API requests."""
+    pending: list[tuple[UUID, str]] = []
+    for row in rows:
+        searchable: str = build_searchable_text(
+            subject=row.subject,
+            description=row.description,
+            custom_fields=row.custom_fields,
+            activity_type=row.type,
+        )
+        if searchable.strip():
+            pending.append((row.id, searchable))
+
+    async def _embed_chunk(chunk: list[tuple[UUID, str]]) -> list[tuple[UUID, str, list[float]]]:
+        async with semaphore:
+            try:
+                embeddings: list[list[float]] = await embedding_service.generate_embeddings_batch(
+                    [searchable for _, searchable in chunk]
+                )
+            except Exception as e:
+                logger.error("Error generating embeddings for batch: %s", e)
+                return []
+        return [
+            (activity_id, searchable, embedding)
+            for (activity_id, searchable), embedding in zip(chunk, embeddings)
+        ]
+
+    chunks = [
+        pending[i : i + EMBEDDING_BATCH_SIZE]
+        for i in range(0, len(pending), EMBEDDING_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(_embed_chunk(chunk) for chunk in chunks))
+    return [update for chunk_updates in results for update in chunk_updates]
+
+
+def _resolve_embedding_service(
+    embedding_service: Optional[EmbeddingService],
+) -> Optional[EmbeddingService]:
+    if embedding_service is not None:
+        return embedding_service
+    try:
+        return get_embedding_service()
+    except ValueError as e:
+        logger.warning("Skipping embedding generation: %s", e)
+        return None
+
+
+async def embed_recently_synced_activities(
     organization_id: str,
+    synced_since: datetime,
     limit: Optional[int] = None,
     embedding_service: Optional[EmbeddingService] = None,
 ) -> int:
     """
-    Generate embeddings for activities that don't have them.
+    Embed the activities a sync just wrote, newest first.
+
+    Leaves the backfill cursor alone; rows that fail to embed here are
+    picked up by the backlog sweep in :func:`generate_embeddings_for_organization`.
 
     Args:
         organization_id: The organization to process
-        limit: Max number of activities to process (None = all)
+        synced_since: When the sync started; rows with an older ``synced_at`` are skipped
+        limit: Max number of activities to read (None = all)
         embedding_service: Optional embedding service instance
 
     Returns:
-        Number of activities processed
+        Number of activities embedded
     """
+    embedding_service = _resolve_embedding_service(embedding_service)
     if embedding_service is None:
-        try:
-            embedding_service = get_embedding_service()
-        except ValueError as e:
-            logger.warning("Skipping embedding generation: %s", e)
-            return 0
+        return 0
 
+    semaphore = asyncio.Semaphore(EMBEDDING_MAX_IN_FLIGHT)
+    remaining: Optional[int] = limit if limit else None
     total_processed: int = 0
 
-    async with get_session(organization_id=organization_id) as session:
-        query = (
-            select(Activity)
-            .where(Activity.organization_id == organization_id)
-            .where(Activity.embedding.is_(None))
-            .order_by(Activity.synced_at.desc())
+    def _prefetch(before: Optional[tuple[datetime, UUID]]) -> Optional[asyncio.Task[list[Any]]]:
+        page_size = EMBEDDING_PAGE_SIZE if remaining is None else min(EMBEDDING_PAGE_SIZE, remaining)
+        if page_size <= 0:
+            return None
+        return asyncio.create_task(
+            _fetch_recent_page(organization_id, synced_since, before, page_size)
         )
 
-        if limit:
-            query = query.limit(limit)
+    next_page: Optional[asyncio.Task[list[Any]]] = _prefetch(None)
+    try:
+        while next_page is not None:
+            rows: list[Any] = await next_page
+            next_page = None
+            if not rows:
+                break
+            if remaining is not None:
+                remaining -= len(rows)
+            next_page = _prefetch((rows[-1].synced_at, rows[-1].id))
 
-        result = await session.execute(query)
-        activities: list[Activity] = list(result.scalars().all())
+            updates = await _embed_page(rows, embedding_service, semaphore)
+            await _write_embeddings(organization_id, updates)
+            total_processed += len(updates)
+    finally:
+        if next_page is not None and not next_page.done():
+            next_page.cancel()
+
+    logger.info(
+        "Embedded %d activities synced since %s for org %s",
+        total_processed, synced_since.isoformat(), organization_id,
+    )
+    return total_processed
 
-        if not activities:
-            logger.info("No activities need embeddings for org %s", organization_id)
-            return 0
 
-        logger.info("Generating embeddings for %d activities", len(activities))
+async def generate_embeddings_for_organization(
+    organization_id: str,
+    limit: Optional[int] = None,
+    embedding_service: Optional[EmbeddingService] = None,
+) -> int:
+    """
+    Generate embeddings for activities that don't have them.
+
+    Args:
+        organization_id: The organization to process
+        limit: Max number of activities to read this run (None = all); the
+            stored cursor lets the next run continue from here
+        embedding_service: Optional embedding service instance
 
-        for i in range(0, len(activities), EMBEDDING_BATCH_SIZE):
-            batch: list[Activity] = activities[i : i + EMBEDDING_BATCH_SIZE]
+    Returns:
+        Number of activities embedded
+    """
+    embedding_service = _resolve_embedding_service(embedding_service)
+    if embedding_service is None:
+        return 0
 
-            texts: list[str] = []
-            valid_activities: list[Activity] = []
+    start_cursor: Optional[UUID] = await _load_cursor(organization_id)
+    semaphore = asyncio.Semaphore(EMBEDDING_MAX_IN_FLIGHT)
+    remaining: Optional[int] = limit if limit else None
+    total_processed: int = 0
+    total_read: int = 0
 
-            for activity in batch:
-                searchable: str = build_searchable_text(
-                    subject=activity.subject,
-                    description=activity.description,
-                    custom_fields=activity.custom_fields,
-                    activity_type=activity.type,
-                )
+    # First walk (cursor, end]; a resumed run then wraps to (start, cursor].
+    passes: list[tuple[Optional[UUID], Optional[UUID]]] = [(start_cursor, None)]
+    if start_cursor is not None:
+        passes.append((None, start_cursor))
 
-                if searchable.strip():
-                    texts.append(searchable)
-                    valid_activities.append(activity)
-                    activity.searchable_text = searchable
+    for pass_index, (after_id, until_id) in enumerate(passes):
+        exhausted: bool = False
+        next_page: Optional[asyncio.Task[list[Any]]] = None
 
-            if not texts:
-                continue
+        def _prefetch(cursor: Optional[UUID]) -> Optional[asyncio.Task[list[Any]]]:
+            page_size = EMBEDDING_PAGE_SIZE if remaining is None else min(EMBEDDING_PAGE_SIZE, remaining)
+            if page_size <= 0:
+                return None
+            return asyncio.create_task(
+                _fetch_page(organization_id, cursor, until_id, page_size)
+            )
 
-            try:
-                embeddings: list[list[float]] = (
-                    await embedding_service.generate_embeddings_batch(texts)
-                )
+        next_page = _prefetch(after_id)
+        try:
+            while next_page is not None:
+                rows: list[Any] = await next_page
+                next_page = None
+                if not rows:
+                    exhausted = True
+                    break
 
-                for activity, embedding in zip(valid_activities, embeddings):
-                    # Store as native pgvector vector (list[float])
-                    activity.embedding = embedding
-                    total_processed += 1
+                total_read += len(rows)
+                if remaining is not None:
+                    remaining -= len(rows)
+                page_cursor: UUID = rows[-1].id
+                # Overlap reading the next page with embedding this one.
+                next_page = _prefetch(page_cursor)
 
-                await session.commit()
+                updates = await _embed_page(rows, embedding_service, semaphore)
+                await _write_embeddings(organization_id, updates)
+                total_processed += len(updates)
+                await _save_cursor(organization_id, page_cursor)
                 logger.info(
-                    "Processed batch %d, total: %d",
-                    i // EMBEDDING_BATCH_SIZE + 1,
-                    total_processed,
+                    "Embedded %d/%d activities in page, total: %d",
+                    len(updates), len(rows), total_processed,
                 )
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
 
-            except Exception as e:
-                logger.error("Error generating embeddings for batch: %s", e)
-                await session.rollback()
+        if not exhausted:
+            # Stopped on the limit; the stored cursor resumes from here.
+            break
+        if pass_index == len(passes) - 1:
+            # Whole keyset walked: start the next run from the beginning.
+            await _save_cursor(organization_id, None)
 
+    if total_read == 0:
+        logger.info("No activities need embeddings for org %s", organization_id)
+    else:
+        cache_stats = get_embedding_cache_stats()
+        logger.info(
+            "Embedding backfill for org %s: %d/%d embedded (cache hit rate %.1f%%)",
+            organization_id, total_processed, total_read, cache_stats["hit_rate"] * 100,
+        )
     return total_processed
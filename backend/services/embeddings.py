@@ -4,7 +4,8 @@ Embedding service for semantic search.
 Uses OpenAI's text-embedding-3-small model to generate embeddings
 for activities (emails, meetings, slack messages, etc.)
 
-Embeddings are stored as native pgvector vector(1536) columns.
+Embeddings are stored as native pgvector vector(1536) columns. Identical
+text is embedded once: see services.embedding_cache.
 """
 
 from typing import Optional
@@ -12,6 +13,11 @@ from typing import Optional
 from openai import AsyncOpenAI
 
 from config import settings
+from services.embedding_cache import (
+    embedding_cache_key,
+    get_cached_embeddings,
+    store_embeddings,
+)
 
 # Embedding model configuration
 EMBEDDING_MODEL = "text-embedding-3-small"
@@ -22,10 +28,11 @@ MAX_TOKENS = 8191  # Model limit
 class EmbeddingService:
     """Service for generating and managing embeddings."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True) -> None:
         """Initialize the embedding service."""
         self._api_key = api_key or settings.OPENAI_API_KEY
         self._client: Optional[AsyncOpenAI] = None
+        self._use_cache = use_cache
 
     @property
     def client(self) -> AsyncOpenAI:
@@ -49,17 +56,8 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Cannot generate embedding for empty text")
 
-        # Truncate to approximate token limit (rough estimate: 4 chars per token)
-        max_chars = MAX_TOKENS * 4
-        if len(text) > max_chars:
-            text = text[:max_chars]
-
-        response = await self.client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text,
-        )
-
-        return response.data[0].embedding
+        embeddings = await self.generate_embeddings_batch([text])
+        return embeddings[0]
 
     async def generate_embeddings_batch(
         self, texts: list[str], batch_size: int = 100
@@ -67,6 +65,10 @@ class EmbeddingService:
         """
         Generate embeddings for multiple texts.
 
+        Empty texts are skipped, so the result is aligned with the non-empty
+        inputs. Vectors are served from the embedding cache where possible;
+        only distinct uncached texts are sent to OpenAI.
+
         Args:
             texts: List of texts to embed
             batch_size: Number of texts to process at once
@@ -74,25 +76,44 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        embeddings: list[list[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            # Filter empty strings and truncate
-            max_chars = MAX_TOKENS * 4
-            batch = [t[:max_chars] if len(t) > max_chars else t for t in batch if t.strip()]
-
-            if not batch:
-                continue
+        # Filter empty strings and truncate
+        max_chars = MAX_TOKENS * 4
+        inputs: list[str] = [t[:max_chars] if len(t) > max_chars else t for t in texts if t.strip()]
+        if not inputs:
+            return []
+
+        if self._use_cache:
+            cached = await get_cached_embeddings(EMBEDDING_MODEL, inputs)
+        else:
+            cached = [None] * len(inputs)
+
+        # Deduplicate misses by cache key so repeated text is embedded once.
+        pending: dict[str, str] = {}
+        for text, vector in zip(inputs, cached):
+            if vector is None:
+                pending.setdefault(embedding_cache_key(EMBEDDING_MODEL, text), text)
+
+        generated: dict[str, list[float]] = {}
+        pending_items: list[tuple[str, str]] = list(pending.items())
+        for i in range(0, len(pending_items), batch_size):
+            batch = pending_items[i : i + batch_size]
 
             response = await self.client.embeddings.create(
                 model=EMBEDDING_MODEL,
-                input=batch,
+                input=[text for _, text in batch],
             )
 
-            for item in response.data:
-                embeddings.append(item.embedding)
+            batch_vectors: list[list[float]] = [item.embedding for item in response.data]
+            for (key, _), vector in zip(batch, batch_vectors):
+                generated[key] = vector
+            if self._use_cache:
+                await store_embeddings(EMBEDDING_MODEL, [text for _, text in batch], batch_vectors)
 
+        embeddings: list[list[float]] = []
+        for text, vector in zip(inputs, cached):
+            if vector is None:
+                vector = generated[embedding_cache_key(EMBEDDING_MODEL, text)]
+            embeddings.append(vector)
         return embeddings
 
 
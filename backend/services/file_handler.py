@@ -2,9 +2,13 @@
 Temporary file storage and content extraction for chat attachments.
 
 Handles:
-- Temp storage of uploaded files keyed by upload_id
+- Temp storage of uploaded files keyed by upload_id (``services.attachment_store``:
+  memory up to a budget, then local disk, plus a shared tier so an upload
+  accepted by one process can be consumed by any other)
 - Content extraction / base64 encoding for building Claude API content blocks
 - Automatic cleanup after retrieval
+- Caching of parsed text blocks (PDF text, XLSX CSV, DOCX/PPTX XML) by content
+  hash, so history replays do not re-parse the same attachment every turn
 
 Supported file types:
 - Images (jpeg, png, gif, webp) → sent as native Claude image blocks
@@ -19,6 +23,7 @@ from __future__ import annotations
 
 import base64
 import csv
+import functools
 import hashlib
 import hmac
 import io
@@ -27,9 +32,13 @@ import mimetypes
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from services.attachment_store import AttachmentEntry, AttachmentStore, build_attachment_store
+
 logger = logging.getLogger(__name__)
 
 # Max file size: 10 MB
@@ -89,15 +98,42 @@ class StoredFile:
     created_at: float = field(default_factory=time.time)
 
 
-# In-memory store — keyed by upload_id
-_store: dict[str, StoredFile] = {}
-_lock: threading.Lock = threading.Lock()
+attachment_store: AttachmentStore = build_attachment_store(ttl_seconds=FILE_TTL_SECONDS)
+
+
+def _new_entry(filename: str, data: bytes, content_type: str | None) -> AttachmentEntry:
+    if len(data) > MAX_FILE_SIZE:
+        raise ValueError(f"File exceeds maximum size of {MAX_FILE_SIZE // (1024 * 1024)} MB")
+
+    mime: str = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    return AttachmentEntry(
+        upload_id=str(uuid.uuid4()),
+        filename=filename,
+        mime_type=mime,
+        size=len(data),
+        created_at=time.time(),
+        data=data,
+    )
+
+
+def _to_stored_file(entry: AttachmentEntry, data: bytes) -> StoredFile:
+    return StoredFile(
+        upload_id=entry.upload_id,
+        filename=entry.filename,
+        mime_type=entry.mime_type,
+        size=entry.size,
+        data=data,
+        created_at=entry.created_at,
+    )
 
 
 def store_file(filename: str, data: bytes, content_type: str | None = None) -> StoredFile:
     """
     Store an uploaded file and return its metadata.
 
+    The shared tier is written in the background; async callers should use
+    :func:`astore_file` so the upload is visible to other processes on return.
+
     Args:
         filename: Original filename from the upload
         data: Raw file bytes
@@ -109,51 +145,35 @@ def store_file(filename: str, data: bytes, content_type: str | None = None) -> S
     Raises:
         ValueError: If file exceeds MAX_FILE_SIZE
     """
-    if len(data) > MAX_FILE_SIZE:
-        raise ValueError(f"File exceeds maximum size of {MAX_FILE_SIZE // (1024 * 1024)} MB")
+    entry: AttachmentEntry = _new_entry(filename, data, content_type)
+    attachment_store.put(entry)
+    logger.info("Stored file %s (%s, %d bytes) as %s", filename, entry.mime_type, len(data), entry.upload_id)
+    return _to_stored_file(entry, data)
 
-    mime: str = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
-    upload_id: str = str(uuid.uuid4())
 
-    stored = StoredFile(
-        upload_id=upload_id,
-        filename=filename,
-        mime_type=mime,
-        size=len(data),
-        data=data,
-    )
+async def astore_file(filename: str, data: bytes, content_type: str | None = None) -> StoredFile:
+    """Like :func:`store_file`, but returns once the shared tier has the file."""
+    entry: AttachmentEntry = _new_entry(filename, data, content_type)
+    await attachment_store.aput(entry)
+    logger.info("Stored file %s (%s, %d bytes) as %s", filename, entry.mime_type, len(data), entry.upload_id)
+    return _to_stored_file(entry, data)
 
-    with _lock:
-        _store[upload_id] = stored
-        _cleanup_expired()
 
-    logger.info("Stored file %s (%s, %d bytes) as %s", filename, mime, len(data), upload_id)
-    return stored
+def retrieve_file(upload_id: str) -> StoredFile | None:
+    """Retrieve a file stored by this process (non-destructive)."""
+    found = attachment_store.get(upload_id)
+    return _to_stored_file(*found) if found is not None else None
 
 
-def retrieve_file(upload_id: str) -> StoredFile | None:
-    """Retrieve a stored file by upload_id (non-destructive)."""
-    with _lock:
-        return _store.get(upload_id)
+async def aretrieve_file(upload_id: str) -> StoredFile | None:
+    """Retrieve a stored file, falling back to the shared tier (non-destructive)."""
+    found = await attachment_store.aget(upload_id)
+    return _to_stored_file(*found) if found is not None else None
 
 
 def remove_file(upload_id: str) -> None:
     """Remove a stored file after it's been consumed."""
-    with _lock:
-        _store.pop(upload_id, None)
-
-
-def _cleanup_expired() -> None:
-    """Remove files older than FILE_TTL_SECONDS. Must be called under _lock."""
-    now: float = time.time()
-    expired: list[str] = [
-        uid for uid, sf in _store.items()
-        if now - sf.created_at > FILE_TTL_SECONDS
-    ]
-    for uid in expired:
-        del _store[uid]
-    if expired:
-        logger.info("Cleaned up %d expired upload(s)", len(expired))
+    attachment_store.delete(upload_id)
 
 
 # ---------------------------------------------------------------------------
@@ -309,6 +329,44 @@ def _pdf_block(sf: StoredFile) -> dict[str, Any]:
     }
 
 
+# Parsed text blocks keyed by (parser, SHA-256 of the bytes, filename), bounded by
+# total characters. _load_history rebuilds attachment blocks on every turn.
+_PARSED_CACHE_MAX_CHARS: int = 20_000_000
+_parsed_blocks: "OrderedDict[tuple[str, str, str], dict[str, Any]]" = OrderedDict()
+_parsed_chars: int = 0
+_parsed_lock: threading.Lock = threading.Lock()
+
+
+def _cached_text_block(
+    build: Callable[[StoredFile], dict[str, Any]],
+) -> Callable[[StoredFile], dict[str, Any]]:
+    """Memoize a text-block parser on the file's content hash."""
+
+    @functools.wraps(build)
+    def wrapper(sf: StoredFile) -> dict[str, Any]:
+        global _parsed_chars
+        key: tuple[str, str, str] = (build.__name__, hashlib.sha256(sf.data).hexdigest(), sf.filename)
+        with _parsed_lock:
+            cached: dict[str, Any] | None = _parsed_blocks.get(key)
+            if cached is not None:
+                _parsed_blocks.move_to_end(key)
+                return dict(cached)
+
+        block: dict[str, Any] = build(sf)
+        chars: int = len(block.get("text", ""))
+        with _parsed_lock:
+            if key not in _parsed_blocks and chars <= _PARSED_CACHE_MAX_CHARS:
+                _parsed_blocks[key] = block
+                _parsed_chars += chars
+                while _parsed_chars > _PARSED_CACHE_MAX_CHARS:
+                    _, evicted = _parsed_blocks.popitem(last=False)
+                    _parsed_chars -= len(evicted.get("text", ""))
+        return dict(block)
+
+    return wrapper
+
+
+@_cached_text_block
 def pdf_to_text_block(sf: StoredFile) -> dict[str, Any]:
     """Extract PDF text via pymupdf — used as a fallback when the provider
     doesn't support native ``document`` content blocks."""
@@ -337,6 +395,7 @@ def pdf_to_text_block(sf: StoredFile) -> dict[str, Any]:
     }
 
 
+@_cached_text_block
 def _xlsx_to_text_block(sf: StoredFile) -> dict[str, Any]:
     """Parse XLSX to CSV text using openpyxl."""
     try:
@@ -385,6 +444,7 @@ def _xlsx_to_text_block(sf: StoredFile) -> dict[str, Any]:
         }
 
 
+@_cached_text_block
 def _docx_to_text_block(sf: StoredFile) -> dict[str, Any]:
     """Extract the main document XML from a DOCX and send it raw — Claude groks XML natively."""
     import zipfile
@@ -410,6 +470,7 @@ def _docx_to_text_block(sf: StoredFile) -> dict[str, Any]:
         }
 
 
+@_cached_text_block
 def _pptx_to_text_block(sf: StoredFile) -> dict[str, Any]:
     """Extract all slide XML from a PPTX and concatenate — same ZIP-of-XML approach as DOCX."""
     import zipfile
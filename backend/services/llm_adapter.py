@@ -7,18 +7,35 @@ Two adapter implementations cover five providers:
 
 Both yield a common StreamEvent protocol so the orchestrator and services
 are decoupled from vendor-specific SDK details.
+
+``get_adapter`` hands out pooled adapters: one per provider, base URL and
+API key on each event loop, sharing a keep-alive HTTP pool per provider and
+a per-provider cap on in-flight requests. The API lifespan and the Celery
+worker loop call :func:`close_llm_clients` / :func:`reset_llm_clients`, the
+same way they manage ``connectors.http_client``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import inspect
 import json
 import logging
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Literal, Protocol
+from typing import Any, AsyncIterator, Callable, Literal, Protocol, TypeVar
 
+import anthropic
+import httpx
+import openai
 from anthropic import APIStatusError as AnthropicAPIStatusError, AsyncAnthropic
 from openai import APIStatusError as OpenAIAPIStatusError, AsyncOpenAI
 
+from config import settings
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -27,6 +44,11 @@ logger = logging.getLogger(__name__)
 
 LLMProvider = Literal["anthropic", "minimax", "openai", "gemini", "qwen"]
 
+# A system prompt is one string or ordered segments, most stable first.
+# Segment boundaries are where providers with prompt caching place cache
+# breakpoints; other providers just join the segments.
+SystemPrompt = str | list[str]
+
 PROVIDER_BASE_URLS: dict[str, str] = {
     "minimax": "https://api.minimax.io/anthropic",
     "gemini": "https://generativelanguage.googleapis.com/v1beta/openai/",
@@ -76,6 +98,9 @@ class StreamEvent:
     tool_input_json: str | None = None
     input_tokens: int | None = None
     output_tokens: int | None = None
+    # Portions of input_tokens read from / written to the provider's prompt cache.
+    cache_read_input_tokens: int | None = None
+    cache_creation_input_tokens: int | None = None
 
 
 @dataclass
@@ -109,6 +134,10 @@ class ToolDef:
     input_schema: dict[str, Any]
 
 
+def _join_system(system: SystemPrompt) -> str:
+    return system if isinstance(system, str) else "".join(system)
+
+
 def _downgrade_document_blocks_for_messages(
     messages: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
@@ -189,7 +218,7 @@ class LLMAdapter(Protocol):
         self,
         *,
         model: str,
-        system: str,
+        system: SystemPrompt,
         messages: list[dict[str, Any]],
         tools: list[ToolDef] | None = None,
         thinking: bool = False,
@@ -221,6 +250,59 @@ class LLMAdapter(Protocol):
 # ---------------------------------------------------------------------------
 
 
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _holds_request_slot(method: _Method) -> _Method:
+    """Run an adapter call (coroutine or stream) inside its provider request slot."""
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def _stream(self: Any, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            async with self._request_slot():
+                async for item in method(self, *args, **kwargs):
+                    yield item
+
+        return _stream  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    async def _call(self: Any, *args: Any, **kwargs: Any) -> Any:
+        async with self._request_slot():
+            return await method(self, *args, **kwargs)
+
+    return _call  # type: ignore[return-value]
+
+
+def _slot_for(limiter: asyncio.Semaphore | None) -> contextlib.AbstractAsyncContextManager[Any]:
+    return limiter if limiter is not None else contextlib.nullcontext()
+
+
+_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+# Blocks the Messages API will not accept a cache_control marker on.
+_UNCACHEABLE_BLOCK_TYPES: frozenset[str] = frozenset({"thinking", "redacted_thinking"})
+
+
+def _with_cache_breakpoint(msg: dict[str, Any]) -> dict[str, Any] | None:
+    """Return a copy of *msg* with its last cacheable block marked, or None."""
+    content: Any = msg.get("content")
+    if isinstance(content, str):
+        if not content:
+            return None
+        return {**msg, "content": [{"type": "text", "text": content, "cache_control": _CACHE_CONTROL}]}
+    if not isinstance(content, list):
+        return None
+    for idx in range(len(content) - 1, -1, -1):
+        block: Any = content[idx]
+        if not isinstance(block, dict) or block.get("type") in _UNCACHEABLE_BLOCK_TYPES:
+            continue
+        if block.get("type") == "text" and not block.get("text"):
+            continue
+        new_content: list[Any] = list(content)
+        new_content[idx] = {**block, "cache_control": _CACHE_CONTROL}
+        return {**msg, "content": new_content}
+    return None
+
+
 class AnthropicAdapter:
     """Adapter for Anthropic Messages API (also used by MiniMax via base_url)."""
 
@@ -230,20 +312,31 @@ class AnthropicAdapter:
         api_key: str,
         base_url: str | None = None,
         supports_document_blocks: bool = True,
+        supports_prompt_caching: bool = True,
+        http_client: httpx.AsyncClient | None = None,
+        limiter: asyncio.Semaphore | None = None,
     ) -> None:
         kwargs: dict[str, Any] = {"api_key": api_key}
         if base_url is not None:
             kwargs["base_url"] = base_url
+        if http_client is not None:
+            kwargs["http_client"] = http_client
         self._client: AsyncAnthropic = AsyncAnthropic(**kwargs)
         self._supports_document_blocks: bool = supports_document_blocks
+        self._supports_prompt_caching: bool = supports_prompt_caching
+        self._limiter: asyncio.Semaphore | None = limiter
+
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        return _slot_for(self._limiter)
 
     # -- streaming ----------------------------------------------------------
 
+    @_holds_request_slot
     async def stream(
         self,
         *,
         model: str,
-        system: str,
+        system: SystemPrompt,
         messages: list[dict[str, Any]],
         tools: list[ToolDef] | None = None,
         thinking: bool = False,
@@ -253,37 +346,77 @@ class AnthropicAdapter:
         api_kwargs: dict[str, Any] = {
             "model": model,
             "max_tokens": max_tokens,
-            "system": system,
+            "system": _join_system(system),
             "messages": api_messages,
         }
         if tools:
             api_kwargs["tools"] = self.format_tools(tools)
         if thinking:
             api_kwargs["thinking"] = {"type": "adaptive"}
+        if self._supports_prompt_caching:
+            self._add_cache_breakpoints(api_kwargs, system)
 
-        self._current_block_type = "text"
+        # Per-call state: pooled adapters serve concurrent streams.
+        block_types: list[str] = ["text"]
         async with self._client.messages.stream(**api_kwargs) as stream:
             async for event in stream:
-                for se in self._translate_event(event):
+                for se in self._translate_event(event, block_types):
                     yield se
 
             final = await stream.get_final_message()
             if final and hasattr(final, "usage"):
+                cache_read: int = getattr(final.usage, "cache_read_input_tokens", None) or 0
+                cache_creation: int = getattr(final.usage, "cache_creation_input_tokens", None) or 0
                 yield StreamEvent(
                     type="usage",
-                    input_tokens=final.usage.input_tokens,
+                    # Anthropic reports cached tokens separately; report the full prompt size.
+                    input_tokens=final.usage.input_tokens + cache_read + cache_creation,
                     output_tokens=final.usage.output_tokens,
+                    cache_read_input_tokens=cache_read,
+                    cache_creation_input_tokens=cache_creation,
                 )
 
-    _current_block_type: str = "text"
+    # -- prompt caching -----------------------------------------------------
 
-    def _translate_event(self, event: Any) -> list[StreamEvent]:
-        """Translate a single Anthropic stream event into common StreamEvents."""
+    def _add_cache_breakpoints(self, api_kwargs: dict[str, Any], system: SystemPrompt) -> None:
+        """Mark the stable request prefix as cacheable (at most 4 breakpoints).
+
+        The cached prefix is tools, then system, then messages, so one
+        breakpoint goes on the last tool, one on each of the last two system
+        segments (the stable part shared across turns and the per-turn
+        tail), and one on the newest message. Each tool-loop iteration then
+        reads everything the previous iteration sent from cache.
+        """
+        tools: list[dict[str, Any]] | None = api_kwargs.get("tools")
+        if tools:
+            tools[-1] = {**tools[-1], "cache_control": _CACHE_CONTROL}
+
+        segments: list[str] = [system] if isinstance(system, str) else system
+        system_blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": segment} for segment in segments if segment
+        ]
+        for block in system_blocks[-2:]:
+            block["cache_control"] = _CACHE_CONTROL
+        if system_blocks:
+            api_kwargs["system"] = system_blocks
+
+        messages: list[dict[str, Any]] = api_kwargs["messages"]
+        if messages:
+            marked: dict[str, Any] | None = _with_cache_breakpoint(messages[-1])
+            if marked is not None:
+                api_kwargs["messages"] = [*messages[:-1], marked]
+
+    def _translate_event(self, event: Any, block_types: list[str]) -> list[StreamEvent]:
+        """Translate a single Anthropic stream event into common StreamEvents.
+
+        *block_types* holds the type of the open content block; it is
+        updated on ``content_block_start``.
+        """
         results: list[StreamEvent] = []
 
         if event.type == "content_block_start":
             block = event.content_block
-            self._current_block_type = block.type
+            block_types[0] = block.type
             if block.type == "thinking":
                 results.append(StreamEvent(type="thinking_start"))
             elif block.type == "text":
@@ -311,9 +444,9 @@ class AnthropicAdapter:
                 )
 
         elif event.type == "content_block_stop":
-            if self._current_block_type == "tool_use":
+            if block_types[0] == "tool_use":
                 results.append(StreamEvent(type="tool_use_stop"))
-            elif self._current_block_type == "thinking":
+            elif block_types[0] == "thinking":
                 results.append(StreamEvent(type="thinking_stop"))
             else:
                 results.append(StreamEvent(type="text_stop"))
@@ -322,6 +455,7 @@ class AnthropicAdapter:
 
     # -- non-streaming (simple calls) --------------------------------------
 
+    @_holds_request_slot
     async def complete(
         self,
         *,
@@ -398,12 +532,20 @@ class OpenAIAdapter:
         api_key: str,
         base_url: str | None = None,
         supports_document_blocks: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        limiter: asyncio.Semaphore | None = None,
     ) -> None:
         kwargs: dict[str, Any] = {"api_key": api_key}
         if base_url is not None:
             kwargs["base_url"] = base_url
+        if http_client is not None:
+            kwargs["http_client"] = http_client
         self._client: AsyncOpenAI = AsyncOpenAI(**kwargs)
         self._supports_document_blocks: bool = supports_document_blocks
+        self._limiter: asyncio.Semaphore | None = limiter
+
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        return _slot_for(self._limiter)
 
     def _build_token_limit_kwargs(self, *, model: str, max_tokens: int) -> dict[str, int]:
         """Map token limit parameter name based on OpenAI model requirements."""
@@ -457,18 +599,19 @@ class OpenAIAdapter:
 
     # -- streaming ----------------------------------------------------------
 
+    @_holds_request_slot
     async def stream(
         self,
         *,
         model: str,
-        system: str,
+        system: SystemPrompt,
         messages: list[dict[str, Any]],
         tools: list[ToolDef] | None = None,
         thinking: bool = False,
         max_tokens: int = 32768,
     ) -> AsyncIterator[StreamEvent]:
         api_messages: list[dict[str, Any]] = [
-            {"role": "system", "content": system}
+            {"role": "system", "content": _join_system(system)}
         ] + self.format_messages_for_api(messages)
 
         api_kwargs: dict[str, Any] = {
@@ -573,14 +716,18 @@ class OpenAIAdapter:
 
         # Usage (from last chunk if available)
         if chunk and hasattr(chunk, "usage") and chunk.usage:
+            # OpenAI-compatible APIs cache prompt prefixes automatically.
+            prompt_details: Any = getattr(chunk.usage, "prompt_tokens_details", None)
             yield StreamEvent(
                 type="usage",
                 input_tokens=chunk.usage.prompt_tokens,
                 output_tokens=chunk.usage.completion_tokens,
+                cache_read_input_tokens=getattr(prompt_details, "cached_tokens", None) or 0,
             )
 
     # -- non-streaming (simple calls) --------------------------------------
 
+    @_holds_request_slot
     async def complete(
         self,
         *,
@@ -811,31 +958,134 @@ _PROVIDERS_WITHOUT_DOCUMENT_BLOCKS: frozenset[str] = frozenset({
     "gemini",
     "qwen",
 })
+# Providers that accept Anthropic ``cache_control`` breakpoints.
+_PROVIDERS_WITH_PROMPT_CACHING: frozenset[str] = frozenset({"anthropic"})
 _PROVIDER_ALIASES: dict[str, str] = {
     "alibaba": "qwen",
 }
 
 
-def get_adapter(config: LLMConfig) -> AnthropicAdapter | OpenAIAdapter:
-    """Create the appropriate adapter for a resolved LLM config."""
-    provider: str = _PROVIDER_ALIASES.get(config.provider, config.provider)
+_LLM_POOL_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+_Adapter = AnthropicAdapter | OpenAIAdapter
+# (provider, base_url, sha256 of the API key)
+_AdapterKey = tuple[str, str | None, str]
+
+
+@dataclass
+class _LoopLLMClients:
+    """Adapters, HTTP pools and request limiters owned by one event loop."""
+
+    adapters: dict[_AdapterKey, _Adapter] = field(default_factory=dict)
+    http_clients: dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    limiters: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+_llm_clients_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLLMClients]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _build_adapter(
+    provider: str,
+    config: LLMConfig,
+    *,
+    http_client: httpx.AsyncClient | None = None,
+    limiter: asyncio.Semaphore | None = None,
+) -> _Adapter:
+    base_url: str | None = config.base_url or PROVIDER_BASE_URLS.get(provider)
+    supports_docs: bool = provider not in _PROVIDERS_WITHOUT_DOCUMENT_BLOCKS
 
     if provider in ("anthropic", "minimax"):
-        base_url: str | None = config.base_url or PROVIDER_BASE_URLS.get(provider)
-        supports_docs: bool = provider not in _PROVIDERS_WITHOUT_DOCUMENT_BLOCKS
         return AnthropicAdapter(
             api_key=config.api_key,
             base_url=base_url,
             supports_document_blocks=supports_docs,
+            supports_prompt_caching=provider in _PROVIDERS_WITH_PROMPT_CACHING,
+            http_client=http_client,
+            limiter=limiter,
         )
 
     if provider in ("openai", "gemini", "qwen"):
-        base_url = config.base_url or PROVIDER_BASE_URLS.get(provider)
-        supports_docs: bool = provider not in _PROVIDERS_WITHOUT_DOCUMENT_BLOCKS
         return OpenAIAdapter(
             api_key=config.api_key,
             base_url=base_url,
             supports_document_blocks=supports_docs,
+            http_client=http_client,
+            limiter=limiter,
         )
 
     raise ValueError(f"Unsupported LLM provider: {config.provider}")
+
+
+def _new_http_client(provider: str) -> httpx.AsyncClient:
+    # The SDK defaults (timeouts, redirects) with a longer keep-alive.
+    if provider in ("anthropic", "minimax"):
+        return anthropic.DefaultAsyncHttpxClient(limits=_LLM_POOL_LIMITS)
+    return openai.DefaultAsyncHttpxClient(limits=_LLM_POOL_LIMITS)
+
+
+def get_adapter(config: LLMConfig) -> AnthropicAdapter | OpenAIAdapter:
+    """Return the adapter for a resolved LLM config.
+
+    Inside a running event loop the adapter is pooled: configs with the same
+    provider, base URL and API key share one adapter, each provider shares
+    one keep-alive HTTP pool, and at most ``LLM_MAX_CONCURRENT_REQUESTS``
+    calls per provider are in flight. Outside a loop a fresh, unpooled
+    adapter is returned. Callers must not close the adapter's client.
+    """
+    provider: str = _PROVIDER_ALIASES.get(config.provider, config.provider)
+    if provider not in ("anthropic", "minimax", "openai", "gemini", "qwen"):
+        raise ValueError(f"Unsupported LLM provider: {config.provider}")
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _build_adapter(provider, config)
+
+    pool = _llm_clients_by_loop.get(loop)
+    if pool is None:
+        pool = _llm_clients_by_loop[loop] = _LoopLLMClients()
+    base_url: str | None = config.base_url or PROVIDER_BASE_URLS.get(provider)
+    key: _AdapterKey = (provider, base_url, hashlib.sha256(config.api_key.encode()).hexdigest())
+    http_client = pool.http_clients.get(provider)
+    adapter = pool.adapters.get(key)
+    if adapter is not None and http_client is not None and not http_client.is_closed:
+        return adapter
+
+    if http_client is None or http_client.is_closed:
+        http_client = pool.http_clients[provider] = _new_http_client(provider)
+    limiter = pool.limiters.get(provider)
+    if limiter is None:
+        limiter = pool.limiters[provider] = asyncio.Semaphore(settings.LLM_MAX_CONCURRENT_REQUESTS)
+    adapter = pool.adapters[key] = _build_adapter(
+        provider, config, http_client=http_client, limiter=limiter,
+    )
+    logger.debug("Created pooled LLM adapter provider=%s base_url=%s", provider, base_url)
+    return adapter
+
+
+async def close_llm_clients() -> None:
+    """Close every pooled LLM HTTP client owned by the running loop."""
+    pool = _llm_clients_by_loop.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    for provider, client in pool.http_clients.items():
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning("Failed to close pooled LLM client provider=%s", provider, exc_info=True)
+    if pool.http_clients:
+        logger.info("Closed %d pooled LLM client(s)", len(pool.http_clients))
+
+
+def reset_llm_clients() -> None:
+    """Forget all pooled adapters without awaiting their shutdown.
+
+    Used after fork and when a worker replaces its event loop.
+    """
+    _llm_clients_by_loop.clear()
@@ -0,0 +1,218 @@
+"""
+Asynchronous PDF rendering for artifact downloads.
+
+WeasyPrint is CPU-bound and holds the GIL for seconds on long reports, so
+calling :func:`services.pdf_generator.generate_pdf` from a request handler
+stalled the whole API event loop (and every websocket on the replica).
+:func:`render_pdf` runs it in a small process pool instead:
+
+- ``PDF_RENDER_WORKERS`` spawned processes render; each is recycled after
+  :data:`_MAX_TASKS_PER_CHILD` documents so WeasyPrint/fontconfig memory
+  growth stays bounded. A pool broken by a crashed worker is replaced and
+  the render retried once.
+- At most ``PDF_RENDER_MAX_PENDING`` distinct renders may be queued or
+  running; beyond that :class:`PdfRenderBusyError` is raised so the route
+  can answer 503 instead of piling up work.
+- Rendered bytes are cached in process, keyed by a SHA-256 of the markdown,
+  the extra CSS and :data:`_RENDER_VERSION`, up to
+  ``PDF_RENDER_CACHE_MAX_BYTES`` (least recently used first out). Concurrent
+  requests for the same content share one render.
+
+The API lifespan calls :func:`shutdown_pdf_renderer`. Counters are exposed
+through :func:`get_pdf_render_stats`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when pdf_generator's output changes (CSS, markdown extensions) so
+# cached bytes from the old renderer are not served.
+_RENDER_VERSION = "1"
+_MAX_TASKS_PER_CHILD = 50
+
+_stats: dict[str, float] = {
+    "renders": 0,
+    "render_errors": 0,
+    "cache_hits": 0,
+    "coalesced": 0,
+    "rejected_busy": 0,
+    "evictions": 0,
+    "pool_restarts": 0,
+    "last_render_ms": 0.0,
+    "max_render_ms": 0.0,
+    "total_render_ms": 0.0,
+}
+
+_executor: Executor | None = None
+_inflight: dict[str, asyncio.Future[bytes]] = {}
+_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cached_bytes = 0
+
+
+class PdfRenderBusyError(RuntimeError):
+    """Too many PDF renders are already queued; retry shortly."""
+
+
+def _render(markdown_content: str, custom_css: Optional[str]) -> bytes:
+    """Render in a pool process (imports WeasyPrint there, not in the API)."""
+    from services.pdf_generator import generate_pdf
+
+    return generate_pdf(markdown_content, custom_css)
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe.
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=_MAX_TASKS_PER_CHILD,
+        )
+    return _executor
+
+
+def _cache_key(markdown_content: str, custom_css: Optional[str]) -> str:
+    digest = hashlib.sha256()
+    for part in (_RENDER_VERSION, custom_css or "", markdown_content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_get(key: str) -> bytes | None:
+    pdf_bytes = _cache.get(key)
+    if pdf_bytes is not None:
+        _cache.move_to_end(key)
+    return pdf_bytes
+
+
+def _cache_put(key: str, pdf_bytes: bytes) -> None:
+    global _cached_bytes
+    budget: int = settings.PDF_RENDER_CACHE_MAX_BYTES
+    if len(pdf_bytes) > budget // 4:
+        return
+    previous = _cache.pop(key, None)
+    if previous is not None:
+        _cached_bytes -= len(previous)
+    _cache[key] = pdf_bytes
+    _cached_bytes += len(pdf_bytes)
+    while _cached_bytes > budget and _cache:
+        _, evicted = _cache.popitem(last=False)
+        _cached_bytes -= len(evicted)
+        _stats["evictions"] += 1
+
+
+def _discard_broken_executor(executor: Executor) -> None:
+    """Drop *executor* so the next render builds a fresh pool."""
+    global _executor
+    if _executor is executor:
+        _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_render(markdown_content: str, custom_css: Optional[str], retry: bool = True) -> bytes:
+    """Run one render in the pool, replacing the pool if it has broken.
+
+    A worker killed mid-render (OOM killer, a WeasyPrint or fontconfig
+    crash) marks the whole ``ProcessPoolExecutor`` broken; without a reset
+    every later export on this replica would fail.
+    """
+    executor: Executor = _get_executor()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, _render, markdown_content, custom_css,
+        )
+    except BrokenProcessPool:
+        _stats["pool_restarts"] += 1
+        _discard_broken_executor(executor)
+        logger.warning("[PDFRenderer] Render pool broke; starting a new one")
+        if not retry:
+            raise
+    return await _run_render(markdown_content, custom_css, retry=False)
+
+
+async def _render_off_loop(key: str, markdown_content: str, custom_css: Optional[str]) -> bytes:
+    started: float = time.perf_counter()
+    try:
+        pdf_bytes: bytes = await _run_render(markdown_content, custom_css)
+    except Exception:
+        _stats["render_errors"] += 1
+        raise
+    elapsed_ms: float = (time.perf_counter() - started) * 1000
+    _stats["renders"] += 1
+    _stats["last_render_ms"] = elapsed_ms
+    _stats["max_render_ms"] = max(_stats["max_render_ms"], elapsed_ms)
+    _stats["total_render_ms"] += elapsed_ms
+    _cache_put(key, pdf_bytes)
+    return pdf_bytes
+
+
+def _finish_render(key: str, task: asyncio.Task[bytes]) -> None:
+    _inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        # Retrieved here so an abandoned failure is not reported as unhandled.
+        logger.warning("[PDFRenderer] Render failed: %s", task.exception())
+
+
+async def render_pdf(markdown_content: str, custom_css: Optional[str] = None) -> bytes:
+    """
+    Render markdown to PDF bytes without blocking the event loop.
+
+    Raises:
+        PdfRenderBusyError: ``PDF_RENDER_MAX_PENDING`` renders are in flight.
+    """
+    key: str = _cache_key(markdown_content, custom_css)
+    cached = _cache_get(key)
+    if cached is not None:
+        _stats["cache_hits"] += 1
+        return cached
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    if len(_inflight) >= settings.PDF_RENDER_MAX_PENDING:
+        _stats["rejected_busy"] += 1
+        raise PdfRenderBusyError("Too many PDF exports in progress")
+
+    # A task, not a bare await: the render and cache fill complete even if
+    # the request that started it disconnects.
+    task: asyncio.Task[bytes] = asyncio.get_running_loop().create_task(
+        _render_off_loop(key, markdown_content, custom_css)
+    )
+    _inflight[key] = task
+    task.add_done_callback(lambda done: _finish_render(key, done))
+    return await asyncio.shield(task)
+
+
+def shutdown_pdf_renderer() -> None:
+    """Stop the render pool; queued renders are cancelled."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_pdf_render_stats() -> dict[str, float]:
+    """Process-local render latency, cache and back-pressure counters."""
+    stats: dict[str, float] = dict(_stats)
+    stats["inflight"] = len(_inflight)
+    stats["cache_entries"] = len(_cache)
+    stats["cached_bytes"] = _cached_bytes
+    stats["avg_render_ms"] = _stats["total_render_ms"] / _stats["renders"] if _stats["renders"] else 0.0
+    return stats
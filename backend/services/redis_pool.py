@@ -0,0 +1,65 @@
+"""
+Pooled async Redis clients shared by the API and Celery workers.
+
+``redis.asyncio`` connections are bound to the event loop that opened them,
+so :func:`get_redis_client` keeps one client (and connection pool) per
+running loop and per ``decode_responses`` mode. Callers must not close the
+returned client:
+
+- API: the FastAPI lifespan calls :func:`close_redis_clients` on shutdown.
+- Workers: ``run_async`` calls :func:`reset_redis_clients` when it replaces
+  its loop, the fork handler calls it in new children, and
+  ``close_worker_loop`` closes the clients on process exit.
+
+Pub/sub listeners should hold their own ``PubSub`` from the pooled client
+and close only that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+
+import redis.asyncio as aioredis
+
+from config import get_redis_connection_kwargs, settings
+
+logger = logging.getLogger(__name__)
+
+_clients_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[bool, aioredis.Redis]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_redis_client(*, decode_responses: bool = True) -> aioredis.Redis:
+    """Pooled client for the running loop; callers must not close it.
+
+    Args:
+        decode_responses: ``False`` for binary values (packed vectors,
+            attachment bytes).
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients_by_loop.setdefault(loop, {})
+    client = clients.get(decode_responses)
+    if client is None:
+        client = aioredis.from_url(
+            settings.REDIS_URL, **get_redis_connection_kwargs(decode_responses=decode_responses)
+        )
+        clients[decode_responses] = client
+    return client
+
+
+async def close_redis_clients() -> None:
+    """Close the pooled clients owned by the running loop."""
+    clients = _clients_by_loop.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning("Failed to close pooled Redis client", exc_info=True)
+
+
+def reset_redis_clients() -> None:
+    """Forget all pooled clients without awaiting (after fork / loop replacement)."""
+    _clients_by_loop.clear()
@@ -0,0 +1,161 @@
+"""Cached row counts for the data inspector.
+
+Exact ``COUNT(*)`` over an org's activities gets slow once the table holds
+millions of rows, and the data browser asks for the same counts on every
+page. Counts are cached in one Redis hash per organization and viewing user
+(RLS hides other members' owner-only activities, so counts differ per user):
+
+- ``summary:<table>`` fields hold the unfiltered per-table counts, computed
+  together in a single statement.
+- ``filtered:<table>:<digest>`` fields hold totals for filtered browser
+  queries (search / source / type filters).
+
+Hash keys embed a per-organization version
+(``data_counts:<org>:v<n>:<user>``). The hash expires after
+``_COUNTS_TTL_SECONDS``, and :func:`invalidate_table_counts` bumps the
+version when a sync finishes, which orphans the org's hashes at once (they
+age out on their TTL), so counts are at most a few minutes stale between
+syncs. ``pg_class.reltuples`` estimates are not used because they are
+table-wide rather than per organization.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from models.account import Account
+from models.activity import Activity
+from models.contact import Contact
+from models.deal import Deal
+from services.redis_pool import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_COUNTS_KEY_PREFIX = "data_counts:"
+_COUNTS_TTL_SECONDS = 5 * 60
+# Outlives every hash, so a version key never resets while hashes remain.
+_VERSION_TTL_SECONDS = 7 * 24 * 60 * 60
+
+SUMMARY_TABLE_MODELS: dict[str, Any] = {
+    "contacts": Contact,
+    "accounts": Account,
+    "deals": Deal,
+    "activities": Activity,
+}
+
+
+def _version_key(organization_id: str) -> str:
+    return f"{_COUNTS_KEY_PREFIX}{organization_id}:version"
+
+
+def _counts_key(organization_id: str, version: str, user_id: str | None) -> str:
+    return f"{_COUNTS_KEY_PREFIX}{organization_id}:v{version}:{user_id or '-'}"
+
+
+def _filtered_field(table: str, filters: dict[str, Any]) -> str:
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"filtered:{table}:{digest[:16]}"
+
+
+async def _read_fields(
+    organization_id: str, user_id: str | None, fields: list[str],
+) -> tuple[str | None, list[int | None]]:
+    """Return the current counts key and the cached *fields* under it.
+
+    The key is ``None`` when Redis is unavailable; callers then skip caching.
+    """
+    try:
+        redis_client = get_redis_client()
+        version: str = await redis_client.get(_version_key(organization_id)) or "0"
+        key = _counts_key(organization_id, version, user_id)
+        values = await redis_client.hmget(key, fields)
+    except Exception:
+        logger.debug("Table count cache read failed for org %s", organization_id, exc_info=True)
+        return None, [None] * len(fields)
+    return key, [int(value) if value is not None else None for value in values]
+
+
+async def _write_fields(key: str | None, mapping: dict[str, int]) -> None:
+    if key is None:
+        return
+    try:
+        redis_client = get_redis_client()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping=mapping)
+        pipe.ttl(key)
+        _, ttl = await pipe.execute()
+        # Only a freshly created hash gets a TTL; later writes must not
+        # extend the lifetime of counts cached earlier.
+        if ttl == -1:
+            await redis_client.expire(key, _COUNTS_TTL_SECONDS)
+    except Exception:
+        logger.debug("Table count cache write failed for %s", key, exc_info=True)
+
+
+async def get_table_counts(
+    session: AsyncSession,
+    organization_id: UUID,
+    user_id: str | None,
+) -> dict[str, int]:
+    """Return unfiltered row counts for every inspector table."""
+    tables = list(SUMMARY_TABLE_MODELS)
+    cache_key, cached = await _read_fields(
+        str(organization_id), user_id, [f"summary:{table}" for table in tables]
+    )
+    if all(value is not None for value in cached):
+        return {table: int(value or 0) for table, value in zip(tables, cached)}
+
+    # One round trip for all tables instead of sequential COUNTs.
+    statement = select(*(
+        select(func.count(model.id))
+        .where(model.organization_id == organization_id)
+        .scalar_subquery()
+        .label(table)
+        for table, model in SUMMARY_TABLE_MODELS.items()
+    ))
+    row = (await session.execute(statement)).one()
+    counts: dict[str, int] = {table: int(getattr(row, table) or 0) for table in tables}
+    await _write_fields(cache_key, {f"summary:{table}": count for table, count in counts.items()})
+    return counts
+
+
+async def get_filtered_count(
+    session: AsyncSession,
+    organization_id: UUID,
+    user_id: str | None,
+    table: str,
+    filters: dict[str, Any],
+    filtered_query: Select,
+) -> int:
+    """Return the row count of *filtered_query*, cached per table and filter set."""
+    if not any(filters.values()) and table in SUMMARY_TABLE_MODELS:
+        return (await get_table_counts(session, organization_id, user_id))[table]
+
+    field = _filtered_field(table, filters)
+    cache_key, (cached,) = await _read_fields(str(organization_id), user_id, [field])
+    if cached is not None:
+        return cached
+
+    count_query = select(func.count()).select_from(filtered_query.order_by(None).subquery())
+    total = int(await session.scalar(count_query) or 0)
+    await _write_fields(cache_key, {field: total})
+    return total
+
+
+async def invalidate_table_counts(organization_id: str) -> None:
+    """Drop cached counts for an organization (called after a sync writes data)."""
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.incr(_version_key(organization_id))
+        pipe.expire(_version_key(organization_id), _VERSION_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        logger.debug("Table count cache invalidation failed for org %s", organization_id, exc_info=True)
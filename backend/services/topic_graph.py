@@ -115,7 +115,8 @@ def _similarity(a: str, b: str) -> float:
     return len(aset & bset) / len(aset | bset)
 
 
-def _canonicalize(raw_nodes: list[str], min_conf: float) -> dict[str, str]:
+def _canonicalize_bruteforce(raw_nodes: list[str], min_conf: float) -> dict[str, str]:
+    """Reference O(N x canonical) canonicalizer; see :func:`_canonicalize`."""
     ordered = sorted(set(n.strip() for n in raw_nodes if n.strip()))
     canonical: list[str] = []
     mapping: dict[str, str] = {}
@@ -135,6 +136,67 @@ def _canonicalize(raw_nodes: list[str], min_conf: float) -> dict[str, str]:
     return mapping
 
 
+def _canonicalize(raw_nodes: list[str], min_conf: float) -> dict[str, str]:
+    """Map each raw node to its canonical node via token-set Jaccard merging.
+
+    Nodes are visited in sorted order; a node merges into the earliest
+    canonical node with the highest Jaccard score if that score reaches
+    ``min_conf``, otherwise it becomes a new canonical node.
+
+    Produces the same mapping as :func:`_canonicalize_bruteforce` but only
+    scores canonical nodes that share a token with the candidate, using an
+    inverted index bucketed by token-set size. A set of size ``m`` can only
+    reach Jaccard ``t`` against sets of size ``ceil(m*t)..floor(m/t)``, so
+    other buckets are skipped entirely.
+    """
+    if min_conf <= 0:
+        # Every node "matches" at score 0, so nothing can be pruned.
+        return _canonicalize_bruteforce(raw_nodes, min_conf)
+
+    ordered = sorted(set(n.strip() for n in raw_nodes if n.strip()))
+    canonical: list[str] = []
+    canonical_sizes: list[int] = []
+    # token -> size -> canonical indices (ascending, i.e. insertion order)
+    index: dict[str, dict[int, list[int]]] = defaultdict(lambda: defaultdict(list))
+    mapping: dict[str, str] = {}
+
+    for node in ordered:
+        tokens = set(node.lower().split())
+        size = len(tokens)
+        best = 0.0
+        best_idx = -1
+        if size:
+            min_size = math.ceil(size * min_conf - 1e-9)
+            max_size = math.floor(size / min_conf + 1e-9)
+            overlaps: dict[int, int] = defaultdict(int)
+            for token in tokens:
+                by_size = index.get(token)
+                if not by_size:
+                    continue
+                for other_size, postings in by_size.items():
+                    if min_size <= other_size <= max_size:
+                        for idx in postings:
+                            overlaps[idx] += 1
+            for idx, overlap in overlaps.items():
+                score = overlap / (size + canonical_sizes[idx] - overlap)
+                if score > best or (score == best and idx < best_idx):
+                    best = score
+                    best_idx = idx
+
+        if best_idx >= 0 and best >= min_conf:
+            mapping[node] = canonical[best_idx]
+            continue
+
+        mapping[node] = node
+        idx = len(canonical)
+        canonical.append(node)
+        canonical_sizes.append(size)
+        for token in tokens:
+            index[token][size].append(idx)
+
+    return mapping
+
+
 async def _collect_activity_docs(org_id: str, graph_date: date) -> list[CandidateDoc]:
     start, end = _utc_bounds(graph_date)
     async with get_admin_session() as session:
@@ -0,0 +1,483 @@
+"""
+Cross-process websocket fan-out.
+
+A websocket lives in the API process that accepted it, but events are
+raised everywhere: Celery workers report sync and tool progress, and a
+shared-conversation message handled on one API replica must reach
+participants connected to another. Every event is therefore published to a
+broker channel, and each API process delivers it to the sockets it holds:
+
+- ``org:<organization_id>``: sync progress, tool progress, summaries, ...
+- ``user:<user_id>``: conversation messages and notifications.
+
+Each process holds one broker subscription and subscribes only to the
+channels it has local sockets for, so traffic scales with where users are
+connected rather than with the number of replicas.
+
+Registering a socket (:meth:`WebSocketFanout.add`) waits until the broker
+has confirmed the channel's subscription. Until a channel is confirmed (and
+while the subscription is reconnecting) events this process publishes on it
+are delivered to its own sockets directly, and the broker echo of those
+events is skipped. Events other processes publish during a reconnect cannot
+be recovered from pub/sub; the gap is logged and counted in
+``WebSocketFanout.subscription_gaps``.
+
+Publishing is batched: events published within ``PUBLISH_BATCH_WINDOW_SECONDS``
+of each other go to the broker in one round trip. If the broker is
+unreachable, an event is delivered to the publishing process's own sockets
+only, which matches the old in-process behaviour.
+
+Brokers are pluggable (:class:`FanoutBroker`). :class:`RedisFanoutBroker` is
+used in production. :class:`InMemoryFanoutBroker` connects several
+:class:`WebSocketFanout` instances in one process, for tests and
+``scripts/load_test_websocket_fanout.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+import logging
+from typing import Any, Protocol
+
+from services.redis_pool import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_BATCH_WINDOW_SECONDS: float = 0.005
+SUBSCRIBE_CONFIRM_TIMEOUT_SECONDS: float = 2.0
+
+_REDIS_CHANNEL_PREFIX = "ws:"
+# Always subscribed so a Redis subscription with no socket channels stays open.
+_CONTROL_CHANNEL = "_control"
+_RECONNECT_BASE_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 30.0
+# How long a locally delivered event waits for its broker echo to be skipped.
+_ECHO_GUARD_SECONDS = 5.0
+
+DeliverFn = Callable[[set[Any], str], Awaitable[set[Any]]]
+
+
+def org_channel(organization_id: str) -> str:
+    return f"org:{organization_id}"
+
+
+def user_channel(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+# =============================================================================
+# Brokers
+# =============================================================================
+
+
+class BrokerSubscription(Protocol):
+    async def subscribe(self, channels: list[str]) -> None: ...
+
+    async def unsubscribe(self, channels: list[str]) -> None: ...
+
+    def messages(self) -> AsyncIterator[tuple[str, str]]: ...
+
+    async def close(self) -> None: ...
+
+
+class FanoutBroker(Protocol):
+    async def publish_many(self, messages: list[tuple[str, str]]) -> None: ...
+
+    def open_subscription(self) -> BrokerSubscription: ...
+
+
+class _RedisSubscription:
+    def __init__(self) -> None:
+        # Holds one connection from the pooled client until closed.
+        self._pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+
+    async def subscribe(self, channels: list[str]) -> None:
+        await self._pubsub.subscribe(*(_REDIS_CHANNEL_PREFIX + c for c in channels))
+
+    async def unsubscribe(self, channels: list[str]) -> None:
+        await self._pubsub.unsubscribe(*(_REDIS_CHANNEL_PREFIX + c for c in channels))
+
+    async def messages(self) -> AsyncIterator[tuple[str, str]]:
+        await self._pubsub.subscribe(_REDIS_CHANNEL_PREFIX + _CONTROL_CHANNEL)
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            channel = str(message["channel"])[len(_REDIS_CHANNEL_PREFIX):]
+            yield channel, str(message["data"])
+
+    async def close(self) -> None:
+        await self._pubsub.aclose()
+
+
+class RedisFanoutBroker:
+    """Redis pub/sub broker; publishes go through one pipeline per batch."""
+
+    async def publish_many(self, messages: list[tuple[str, str]]) -> None:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for channel, message in messages:
+            pipe.publish(_REDIS_CHANNEL_PREFIX + channel, message)
+        await pipe.execute()
+
+    def open_subscription(self) -> BrokerSubscription:
+        return _RedisSubscription()
+
+
+_DROPPED: Any = object()
+
+
+class _MemorySubscription:
+    def __init__(self, broker: "InMemoryFanoutBroker") -> None:
+        self._broker = broker
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    def put(self, channel: str, message: str) -> None:
+        self._queue.put_nowait((channel, message))
+
+    def drop(self) -> None:
+        self._queue.put_nowait(_DROPPED)
+
+    async def subscribe(self, channels: list[str]) -> None:
+        for channel in channels:
+            self.channels.add(channel)
+            self._broker.subscribers[channel].add(self)
+        if self._broker.confirm_delay_seconds:
+            # Routed already, confirmation still on its way (like Redis).
+            await asyncio.sleep(self._broker.confirm_delay_seconds)
+
+    async def unsubscribe(self, channels: list[str]) -> None:
+        for channel in channels:
+            self.channels.discard(channel)
+            self._broker.subscribers[channel].discard(self)
+
+    async def messages(self) -> AsyncIterator[tuple[str, str]]:
+        while True:
+            item = await self._queue.get()
+            if item is _DROPPED:
+                raise ConnectionError("in-memory subscription dropped")
+            yield item
+
+    async def close(self) -> None:
+        await self.unsubscribe(list(self.channels))
+
+
+class InMemoryFanoutBroker:
+    """Broker shared by several fan-outs in one process (tests, load tests)."""
+
+    def __init__(self) -> None:
+        self.subscribers: dict[str, set[_MemorySubscription]] = defaultdict(set)
+        self.publish_calls: int = 0
+        self.available: bool = True
+        self.confirm_delay_seconds: float = 0.0
+
+    async def publish_many(self, messages: list[tuple[str, str]]) -> None:
+        if not self.available:
+            raise ConnectionError("in-memory broker unavailable")
+        self.publish_calls += 1
+        for channel, message in messages:
+            for subscription in list(self.subscribers.get(channel, ())):
+                subscription.put(channel, message)
+
+    def open_subscription(self) -> BrokerSubscription:
+        return _MemorySubscription(self)
+
+    def drop_subscriptions(self) -> None:
+        """Break every open subscription, as a Redis disconnect would."""
+        for subscription in {s for subs in self.subscribers.values() for s in subs}:
+            subscription.drop()
+
+
+# =============================================================================
+# Per-process fan-out
+# =============================================================================
+
+
+class WebSocketFanout:
+    """Local socket registry plus broker publish/subscribe for one process."""
+
+    def __init__(
+        self,
+        deliver: DeliverFn,
+        broker: FanoutBroker | None = None,
+        *,
+        batch_window_seconds: float = PUBLISH_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._deliver = deliver
+        self._broker: FanoutBroker = broker if broker is not None else RedisFanoutBroker()
+        self._batch_window = batch_window_seconds
+        self._local: dict[str, set[Any]] = defaultdict(set)
+        self._listener: asyncio.Task[None] | None = None
+        self._subscription_changed = asyncio.Event()
+        # Channels whose broker subscription is confirmed on the live connection.
+        self._subscribed: set[str] = set()
+        self._connected: bool = False
+        self._confirm_waiters: dict[str, list[asyncio.Future[None]]] = defaultdict(list)
+        # channel -> [(deadline, message)] delivered locally before confirmation.
+        self._local_echoes: dict[str, list[tuple[float, str]]] = {}
+        self.local_fallback_deliveries: int = 0
+        self.subscription_gaps: int = 0
+        self._pending: list[tuple[str, str, asyncio.Future[bool]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Latest delivery per channel; each waits for the previous one, so
+        # a channel keeps its order and a stalled socket delays only its own.
+        self._deliveries: dict[str, asyncio.Task[None]] = {}
+
+    # -- local registry --------------------------------------------------
+
+    async def add(self, channel: str, websocket: Any) -> None:
+        """Register *websocket* on *channel* and wait for the broker subscription.
+
+        Returns once the channel is subscribed, or after
+        ``SUBSCRIBE_CONFIRM_TIMEOUT_SECONDS``; same-process events are
+        delivered locally in the meantime.
+        """
+        sockets = self._local[channel]
+        sockets.add(websocket)
+        if len(sockets) == 1:
+            self._subscription_changed.set()
+        if not self.listening or not self._connected or channel in self._subscribed:
+            # Nothing to wait for, or the subscription is reconnecting.
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._confirm_waiters[channel].append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), SUBSCRIBE_CONFIRM_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Websocket fanout subscription to %s not confirmed in time", channel)
+        finally:
+            waiters = self._confirm_waiters.get(channel)
+            if waiters is not None and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._confirm_waiters[channel]
+
+    def discard(self, channel: str, websocket: Any) -> None:
+        sockets = self._local.get(channel)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self._local[channel]
+            self._subscription_changed.set()
+
+    def local_sockets(self, channel: str) -> set[Any]:
+        return self._local.get(channel, set())
+
+    @property
+    def listening(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    def _confirm_subscribed(self, channels: list[str]) -> None:
+        self._subscribed.update(channels)
+        for channel in channels:
+            for waiter in self._confirm_waiters.pop(channel, []):
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    # -- publishing ------------------------------------------------------
+
+    async def publish(self, channel: str, message: str) -> None:
+        """Send *message* to every socket on *channel*, in any process."""
+        if not await self._enqueue(channel, message):
+            await self.deliver_local(channel, message)
+
+    async def publish_many(self, messages: list[tuple[str, str]]) -> None:
+        results = await asyncio.gather(*(self._enqueue(c, m) for c, m in messages))
+        for (channel, message), published in zip(messages, results):
+            if not published:
+                await self.deliver_local(channel, message)
+
+    async def deliver_local(self, channel: str, message: str) -> None:
+        """Send *message* to this process's sockets on *channel*."""
+        sockets = self._local.get(channel)
+        if not sockets:
+            return
+        dead = await self._deliver(set(sockets), message)
+        for websocket in dead:
+            self.discard(channel, websocket)
+        if dead:
+            logger.debug("fanout removed %d stale websocket(s) on %s", len(dead), channel)
+
+    async def drain(self) -> None:
+        """Wait until every received event has been delivered locally."""
+        while self._deliveries:
+            await asyncio.gather(*self._deliveries.values(), return_exceptions=True)
+
+    def _schedule_delivery(self, channel: str, message: str) -> None:
+        task = asyncio.create_task(
+            self._deliver_in_order(self._deliveries.get(channel), channel, message)
+        )
+        self._deliveries[channel] = task
+        task.add_done_callback(lambda done: self._forget_delivery(channel, done))
+
+    def _forget_delivery(self, channel: str, task: asyncio.Task[None]) -> None:
+        if self._deliveries.get(channel) is task:
+            del self._deliveries[channel]
+
+    async def _deliver_in_order(
+        self, previous: asyncio.Task[None] | None, channel: str, message: str
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await self.deliver_local(channel, message)
+        except Exception:
+            logger.exception("Websocket fanout delivery failed on %s", channel)
+
+    async def _enqueue(self, channel: str, message: str) -> bool:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A new event loop (e.g. a fresh Celery worker loop) cannot reuse
+            # futures or the flush task from the previous one.
+            self._loop = loop
+            self._pending = []
+            self._flush_task = None
+        future: asyncio.Future[bool] = loop.create_future()
+        self._pending.append((channel, message, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._batch_window)
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # Local channels the broker would not route back to us yet: captured
+        # before publishing so an event is delivered either here or via the echo.
+        unconfirmed: set[str] = {
+            channel for channel, _, _ in batch
+            if channel in self._local and channel not in self._subscribed
+        }
+        published = True
+        try:
+            await self._broker.publish_many([(channel, message) for channel, message, _ in batch])
+        except Exception as exc:
+            published = False
+            logger.warning("Websocket fanout publish failed (%d event(s)): %s", len(batch), exc)
+        for channel, message, future in batch:
+            if published and channel in unconfirmed:
+                self._deliver_before_confirmation(channel, message)
+            if not future.done():
+                future.set_result(published)
+
+    def _deliver_before_confirmation(self, channel: str, message: str) -> None:
+        self.local_fallback_deliveries += 1
+        if self.listening:
+            self._local_echoes.setdefault(channel, []).append(
+                (time.monotonic() + _ECHO_GUARD_SECONDS, message)
+            )
+        self._schedule_delivery(channel, message)
+
+    def _is_local_echo(self, channel: str, message: str) -> bool:
+        """Consume a pending echo of an event already delivered locally."""
+        echoes = self._local_echoes.get(channel)
+        if not echoes:
+            return False
+        now = time.monotonic()
+        echoes[:] = [(deadline, m) for deadline, m in echoes if deadline > now]
+        for index, (_, pending) in enumerate(echoes):
+            if pending == message:
+                del echoes[index]
+                break
+        else:
+            if not echoes:
+                del self._local_echoes[channel]
+            return False
+        if not echoes:
+            del self._local_echoes[channel]
+        return True
+
+    # -- subscribing -----------------------------------------------------
+
+    def start(self) -> None:
+        """Start this process's broker subscription (idempotent)."""
+        if self.listening:
+            return
+        self._subscription_changed = asyncio.Event()
+        self._listener = asyncio.create_task(self._listen_forever())
+        logger.info("Websocket fanout subscriber started")
+
+    async def stop(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.cancel()
+        try:
+            await listener
+        except asyncio.CancelledError:
+            pass
+        logger.info("Websocket fanout subscriber stopped")
+
+    async def _listen_forever(self) -> None:
+        failures: int = 0
+        gap_started: float | None = None
+        while True:
+            subscription = self._broker.open_subscription()
+            try:
+                initial: list[str] = sorted(self._local)
+                if initial:
+                    await subscription.subscribe(initial)
+                self._confirm_subscribed(initial)
+                self._connected = True
+                failures = 0
+                if gap_started is not None:
+                    logger.warning(
+                        "Websocket fanout resubscribed after %.1fs; events other processes "
+                        "published on %d channel(s) in that window were not delivered",
+                        time.monotonic() - gap_started, len(initial),
+                    )
+                    gap_started = None
+                sync_task = asyncio.create_task(self._sync_subscriptions(subscription))
+                try:
+                    async for channel, message in subscription.messages():
+                        if self._is_local_echo(channel, message):
+                            continue
+                        self._schedule_delivery(channel, message)
+                finally:
+                    sync_task.cancel()
+            except asyncio.CancelledError:
+                self._connected = False
+                self._subscribed.clear()
+                raise
+            except Exception as exc:
+                failures += 1
+                if failures <= 3:
+                    logger.warning("Websocket fanout subscription error: %s", exc)
+            finally:
+                if self._connected and gap_started is None:
+                    gap_started = time.monotonic()
+                    self.subscription_gaps += 1
+                    logger.warning(
+                        "Websocket fanout subscription lost; delivering this process's events "
+                        "locally until it reconnects"
+                    )
+                self._connected = False
+                self._subscribed.clear()
+                try:
+                    await subscription.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(min(_RECONNECT_BASE_SECONDS * (2 ** failures), _RECONNECT_MAX_SECONDS))
+
+    async def _sync_subscriptions(self, subscription: BrokerSubscription) -> None:
+        """Follow local registrations: subscribe new channels, drop empty ones."""
+        # Channels requested on this connection (confirmed or in flight).
+        requested: set[str] = set(self._subscribed)
+        while True:
+            await self._subscription_changed.wait()
+            self._subscription_changed.clear()
+            wanted = set(self._local)
+            added = sorted(wanted - requested)
+            removed = sorted(requested - wanted)
+            requested = wanted
+            if removed:
+                self._subscribed.difference_update(removed)
+                await subscription.unsubscribe(removed)
+            if added:
+                await subscription.subscribe(added)
+                self._confirm_subscribed(added)
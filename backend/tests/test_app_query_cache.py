@@ -0,0 +1,157 @@
+"""Tests for the app named query result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from services import app_query_cache, app_query_runner
+from services.app_query_runner import AppQueryResponse, run_named_app_query
+
+
+class _Result:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def one(self) -> tuple[Any, ...]:
+        return tuple(self._rows[0].values())
+
+    def mappings(self) -> "_Result":
+        return self
+
+    def all(self) -> list[dict[str, Any]]:
+        return self._rows
+
+    def keys(self) -> list[str]:
+        return list(self._rows[0].keys()) if self._rows else []
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.app_queries: list[dict[str, Any]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any]) -> _Result:
+        self.app_queries.append(params)
+        run_number = len(self.app_queries)
+        await asyncio.sleep(0.01)
+        return _Result([{"stage": "won", "total": run_number}])
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+        self.available = True
+
+    async def get(self, key: str) -> str | None:
+        if not self.available:
+            raise ConnectionError("redis down")
+        value = self.values.get(key)
+        return str(value) if value is not None else None
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def incr(self, key: str) -> None:
+        self.values[key] = self.values.get(key, 0) + 1
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def execute(self) -> list[Any]:
+        return []
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    async def _check_sql(ctx: Any, sql: str, params: dict[str, Any]) -> Any:
+        return SimpleNamespace(allowed=True, transformed_query=None, transformed_params=None, deny_reason=None)
+
+    redis_client = _FakeRedis()
+    monkeypatch.setattr(app_query_runner, "check_sql", _check_sql)
+    monkeypatch.setattr(app_query_cache, "get_redis_client", lambda: redis_client)
+    monkeypatch.setattr(app_query_cache, "_DATA_VERSION_TTL_SECONDS", 0.0)
+    app_query_cache.clear_app_query_cache()
+    return redis_client
+
+
+_ORG_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _app(**query_spec: Any) -> Any:
+    spec = {"sql": "SELECT stage, sum(amount) AS total FROM deals d JOIN accounts a ON a.id = d.account_id", **query_spec}
+    return SimpleNamespace(id=uuid.uuid4(), queries={"pipeline": spec})
+
+
+async def _run(app: Any, session: _FakeSession, **params: Any) -> AppQueryResponse:
+    return await run_named_app_query(
+        app=app, organization_id=_ORG_ID,
+        query_name="pipeline", params=params, session=session,  # type: ignore[arg-type]
+    )
+
+
+def test_concurrent_identical_requests_run_the_query_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app_query_cache, "_DATA_VERSION_TTL_SECONDS", 5.0)
+    app = _app(params={"region": {}})
+    session = _FakeSession()
+    lookups_before = app_query_cache.get_app_query_cache_stats()["version_lookups"]
+
+    async def _burst() -> list[AppQueryResponse]:
+        same = [_run(app, session, region="emea") for _ in range(20)]
+        return await asyncio.gather(*same, _run(app, session, region="apac"))
+
+    results = asyncio.run(_burst())
+
+    assert len(session.app_queries) == 2
+    assert {results[0].data[0]["total"], results[-1].data[0]["total"]} == {1, 2}
+    assert all(result is results[0] for result in results[:20])
+    stats = app_query_cache.get_app_query_cache_stats()
+    assert stats["coalesced"] >= 19
+    assert stats["version_lookups"] - lookups_before == 1
+
+
+def test_new_sync_or_disabled_ttl_bypasses_cached_result() -> None:
+    session = _FakeSession()
+    cached_app = _app()
+
+    async def _scenario() -> None:
+        await _run(cached_app, session)
+        await _run(cached_app, session)
+        assert len(session.app_queries) == 1
+
+        await app_query_cache.invalidate_app_query_results(_ORG_ID)
+        await _run(cached_app, session)
+        assert len(session.app_queries) == 2
+
+        live_app = _app(cache_ttl_seconds=0)
+        await _run(live_app, session)
+        await _run(live_app, session)
+        assert len(session.app_queries) == 4
+
+    asyncio.run(_scenario())
+
+
+def test_redis_outage_runs_queries_uncached(fake_redis: _FakeRedis) -> None:
+    session = _FakeSession()
+    app = _app()
+    fake_redis.available = False
+    uncached_before = app_query_cache.get_app_query_cache_stats()["uncached"]
+
+    async def _scenario() -> None:
+        await _run(app, session)
+        await _run(app, session)
+
+    asyncio.run(_scenario())
+
+    assert len(session.app_queries) == 2
+    assert app_query_cache.get_app_query_cache_stats()["uncached"] - uncached_before == 2
+
+
+def test_ttl_hints_are_clamped() -> None:
+    assert app_query_cache.cache_ttl_seconds({}) == app_query_cache.DEFAULT_TTL_SECONDS
+    assert app_query_cache.cache_ttl_seconds({"cache_ttl_seconds": "120"}) == 120
+    assert app_query_cache.cache_ttl_seconds({"cache_ttl_seconds": -5}) == 0
+    assert app_query_cache.cache_ttl_seconds({"cache_ttl_seconds": 10**9}) == app_query_cache.MAX_TTL_SECONDS
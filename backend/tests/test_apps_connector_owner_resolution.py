@@ -5,6 +5,10 @@ from uuid import UUID
 from connectors.apps import AppsConnector
 
 
+async def _fake_transpile(_code):
+    return (None,)
+
+
 class _FakeExecuteResult:
     def __init__(self, value):
         self._value = value
@@ -119,7 +123,7 @@ def test_create_prefers_conversation_owner_over_turn_user_and_message_user(monke
     monkeypatch.setattr("connectors.apps.get_session", _fake_get_session)
     monkeypatch.setattr("connectors.apps.warm_public_preview_cache", _fake_warm)
     monkeypatch.setattr("connectors.apps.get_alternate_slack_user_ids_for_identity", _fake_alternate)
-    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx", lambda _code: (None,))
+    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx_async", _fake_transpile)
     monkeypatch.setattr("connectors.apps.AppsConnector._test_execute_queries", _fake_test_execute_queries)
 
     connector = AppsConnector(organization_id=org_id, user_id=turn_user_id)
@@ -172,7 +176,7 @@ def test_create_resolves_owner_from_slack_identity_mapping_when_conversation_use
     monkeypatch.setattr("connectors.apps.get_session", _fake_get_session)
     monkeypatch.setattr("connectors.apps.warm_public_preview_cache", _fake_warm)
     monkeypatch.setattr("connectors.apps.get_alternate_slack_user_ids_for_identity", _fake_alternate)
-    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx", lambda _code: (None,))
+    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx_async", _fake_transpile)
     monkeypatch.setattr("connectors.apps.AppsConnector._test_execute_queries", _fake_test_execute_queries)
 
     connector = AppsConnector(organization_id=org_id, user_id=None)
@@ -225,7 +229,7 @@ def test_create_uses_explicit_owner_override_before_other_context(monkeypatch):
     monkeypatch.setattr("connectors.apps.get_session", _fake_get_session)
     monkeypatch.setattr("connectors.apps.warm_public_preview_cache", _fake_warm)
     monkeypatch.setattr("connectors.apps.get_alternate_slack_user_ids_for_identity", _fake_alternate)
-    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx", lambda _code: (None,))
+    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx_async", _fake_transpile)
     monkeypatch.setattr("connectors.apps.AppsConnector._test_execute_queries", _fake_test_execute_queries)
 
     connector = AppsConnector(organization_id=org_id, user_id=turn_user_id)
@@ -312,7 +316,7 @@ def test_create_returns_org_handle_scoped_uri_when_handle_present(monkeypatch):
     monkeypatch.setattr("connectors.apps.get_session", _fake_get_session)
     monkeypatch.setattr("connectors.apps.warm_public_preview_cache", _fake_warm)
     monkeypatch.setattr("connectors.apps.get_alternate_slack_user_ids_for_identity", _fake_alternate)
-    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx", lambda _code: (None,))
+    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx_async", _fake_transpile)
     monkeypatch.setattr("connectors.apps.AppsConnector._test_execute_queries", _fake_test_execute_queries)
 
     connector = AppsConnector(organization_id=org_id, user_id=None)
@@ -355,7 +359,7 @@ def test_create_sets_private_visibility_for_private_conversation(monkeypatch):
     monkeypatch.setattr("connectors.apps.get_session", _fake_get_session)
     monkeypatch.setattr("connectors.apps.warm_public_preview_cache", _fake_warm)
     monkeypatch.setattr("connectors.apps.get_alternate_slack_user_ids_for_identity", _fake_alternate)
-    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx", lambda _code: (None,))
+    monkeypatch.setattr("utils.transpile_jsx.transpile_jsx_async", _fake_transpile)
     monkeypatch.setattr("connectors.apps.AppsConnector._test_execute_queries", _fake_test_execute_queries)
 
     connector = AppsConnector(organization_id=org_id, user_id=None)
@@ -0,0 +1,117 @@
+"""Tests for the two-tier chat attachment store and parsed-block cache."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from services import file_handler
+from services.attachment_store import (
+    AttachmentEntry,
+    AttachmentStore,
+    InMemoryAttachmentBackend,
+    LocalAttachmentStore,
+)
+
+
+def _store(tmp_path: Path, shared: InMemoryAttachmentBackend | None, budget: int = 1024) -> AttachmentStore:
+    return AttachmentStore(
+        LocalAttachmentStore(memory_budget_bytes=budget, ttl_seconds=60, spill_dir=str(tmp_path)),
+        shared,
+        ttl_seconds=60,
+    )
+
+
+def test_oldest_files_spill_to_disk_and_read_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(file_handler, "attachment_store", _store(tmp_path, None, budget=1000))
+
+    first = file_handler.store_file("q3.pdf", b"%PDF" + b"1" * 596)
+    second = file_handler.store_file("notes.txt", b"2" * 600)
+
+    local = file_handler.attachment_store.local
+    assert local.memory_bytes == 600 and local.spilled_bytes == 600
+    spilled = list(tmp_path.glob("attachments-*/*"))
+    assert [path.name for path in spilled] == [first.upload_id]
+
+    restored = file_handler.retrieve_file(first.upload_id)
+    assert restored is not None and restored.data == first.data and restored.mime_type == "application/pdf"
+    assert file_handler.retrieve_file(second.upload_id).data == second.data  # type: ignore[union-attr]
+
+    file_handler.remove_file(first.upload_id)
+    assert file_handler.retrieve_file(first.upload_id) is None
+    assert not os.path.exists(spilled[0]) and local.spilled_bytes == 0
+
+
+def test_upload_from_another_process_is_found_in_the_shared_tier(tmp_path: Path) -> None:
+    shared = InMemoryAttachmentBackend()
+    api_replica = _store(tmp_path, shared)
+    worker = _store(tmp_path, shared)
+
+    async def _run() -> None:
+        entry = AttachmentEntry(
+            upload_id="u-1", filename="deck.pptx", mime_type="application/octet-stream",
+            size=5, created_at=time.time(), data=b"slide",
+        )
+        await api_replica.aput(entry)
+
+        assert worker.get("u-1") is None
+        found = await worker.aget("u-1")
+        assert found is not None and found[1] == b"slide" and found[0].filename == "deck.pptx"
+        # Now cached locally on the worker.
+        assert worker.get("u-1") is not None
+
+        worker.delete("u-1")
+        await asyncio.sleep(0)
+        assert "u-1" not in shared.items
+
+    asyncio.run(_run())
+
+
+def test_expired_uploads_are_not_returned(tmp_path: Path) -> None:
+    store = _store(tmp_path, None)
+    store.put(AttachmentEntry(
+        upload_id="old", filename="a.txt", mime_type="text/plain",
+        size=1, created_at=time.time() - 3600, data=b"a",
+    ))
+
+    assert store.get("old") is None
+    assert len(store.local) == 0
+
+
+def test_xlsx_text_block_is_parsed_once_per_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["region", "amount"])
+    workbook.active.append(["emea", 1200])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    data = buffer.getvalue()
+
+    loads: list[object] = []
+    real_load = openpyxl.load_workbook
+
+    def _counting_load(*args: object, **kwargs: object) -> object:
+        loads.append(args)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, "load_workbook", _counting_load)
+    monkeypatch.setattr(file_handler, "_parsed_blocks", type(file_handler._parsed_blocks)())
+    monkeypatch.setattr(file_handler, "_parsed_chars", 0)
+
+    def _file(upload_id: str) -> file_handler.StoredFile:
+        return file_handler.StoredFile(
+            upload_id=upload_id, filename="pipeline.xlsx", mime_type=file_handler.XLSX_MIME,
+            size=len(data), data=data,
+        )
+
+    first = file_handler.build_claude_content_blocks([_file("a")])
+    second = file_handler.build_claude_content_blocks([_file("b")])
+
+    assert first == second
+    assert "emea,1200" in first[0]["text"]
+    assert len(loads) == 1
@@ -0,0 +1,189 @@
+"""Tests for the batched foreach tool execution path."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+import agents.tools
+import models.database
+import redis.asyncio as aioredis
+import workers.rate_limiter
+from workers.tasks import bulk_operations
+from workers.tasks.bulk_operations import _bulk_tool_run_batch_async, _chunk
+
+
+class _FakeResult:
+    def __init__(self, rows: list[tuple[int]], op: Any) -> None:
+        self._rows = rows
+        self._op = op
+
+    def all(self) -> list[tuple[int]]:
+        return self._rows
+
+    def scalar_one(self) -> Any:
+        return self._op
+
+
+class _FakeDB:
+    def __init__(self, existing: list[int]) -> None:
+        self.existing = existing
+        self.inserts: list[list[dict[str, Any]]] = []
+        self.operation = SimpleNamespace(status="running")
+
+    @asynccontextmanager
+    async def session(self, **_kwargs: Any) -> AsyncIterator[Any]:
+        db = self
+
+        class _Session:
+            async def execute(self, _stmt: Any, params: Any = None) -> _FakeResult:
+                if params is not None:
+                    db.inserts.append(list(params))
+                return _FakeResult([(idx,) for idx in db.existing], db.operation)
+
+            async def commit(self) -> None:
+                return None
+
+        yield _Session()
+
+
+class _FakeRedis:
+    def __init__(self, store: dict[str, int]) -> None:
+        self.store = store
+        self._ops: list[tuple[str, str, int]] = []
+
+    def pipeline(self) -> "_FakeRedis":
+        return self
+
+    def incrby(self, key: str, amount: int) -> None:
+        self._ops.append(("incrby", key, amount))
+
+    def get(self, key: str) -> None:
+        self._ops.append(("get", key, 0))
+
+    async def execute(self) -> list[Any]:
+        out: list[Any] = []
+        for op, key, amount in self._ops:
+            if op == "incrby":
+                self.store[key] = self.store.get(key, 0) + amount
+            out.append(self.store.get(key))
+        self._ops.clear()
+        return out
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def close(self) -> None:
+        return None
+
+
+class _FakeLimiter:
+    def __init__(self, **_kwargs: Any) -> None:
+        pass
+
+    async def acquire(self, timeout: float = 120.0) -> bool:
+        return True
+
+    async def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    state = SimpleNamespace(db=_FakeDB([]), redis={}, calls=[])
+
+    async def _execute_tool(*, tool_name: str, tool_input: dict[str, Any], **_kwargs: Any) -> dict[str, Any]:
+        state.calls.append(tool_input)
+        await asyncio.sleep(0)
+        if tool_input["email"] == "bad@x.com":
+            return {"error": "not found"}
+        return {"ok": True}
+
+    monkeypatch.setattr(models.database, "get_session", lambda **kw: state.db.session(**kw))
+    monkeypatch.setattr(aioredis, "from_url", lambda *_a, **_kw: _FakeRedis(state.redis))
+    monkeypatch.setattr(workers.rate_limiter, "RedisRateLimiter", _FakeLimiter)
+    monkeypatch.setattr(agents.tools, "execute_tool", _execute_tool)
+    monkeypatch.setattr(bulk_operations, "_FLUSH_EVERY_ITEMS", 3)
+    return state
+
+
+def _run_batch(items: list[tuple[int, dict[str, Any]]], operation_id: str) -> dict[str, Any]:
+    return asyncio.run(_bulk_tool_run_batch_async(
+        operation_id=operation_id,
+        items=items,
+        tool_name="enrich_contact",
+        params_template={"email": "{{email}}"},
+        organization_id=str(uuid4()),
+        user_id=None,
+        rate_limit_key="bulk_op:test",
+        rate_limit_per_minute=600,
+        redis_url="redis://unused",
+    ))
+
+
+def test_chunk_keeps_order_and_bounds_size() -> None:
+    pairs = [(i, {"n": i}) for i in range(7)]
+    chunks = _chunk(pairs, 3)
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [idx for c in chunks for idx, _ in c] == list(range(7))
+
+
+def test_batch_runs_items_and_flushes_results_in_groups(env: SimpleNamespace) -> None:
+    operation_id = str(uuid4())
+    env.redis[f"bulk_op:{operation_id}:total"] = 7
+    items = [(i, {"email": "bad@x.com" if i == 4 else f"u{i}@x.com"}) for i in range(7)]
+
+    summary = _run_batch(items, operation_id)
+
+    assert summary == {"processed": 7, "succeeded": 6, "failed": 1, "skipped": 0}
+    assert [len(group) for group in env.db.inserts] == [3, 3, 1]
+    rows = {row["item_index"]: row for group in env.db.inserts for row in group}
+    assert rows[4]["success"] is False and rows[4]["error"] == "not found"
+    assert rows[0]["item_data"] == {"email": "u0@x.com"}
+    # The last flush reached the total: operation finalised and counters cleaned up.
+    assert env.db.operation.status == "completed"
+    assert env.db.operation.succeeded_items == 6
+    assert env.db.operation.failed_items == 1
+    assert env.redis == {}
+
+
+def test_redelivered_batch_skips_items_already_written(env: SimpleNamespace) -> None:
+    env.db.existing = [0, 1]
+    operation_id = str(uuid4())
+    env.redis[f"bulk_op:{operation_id}:total"] = 10
+
+    summary = _run_batch([(i, {"email": f"u{i}@x.com"}) for i in range(3)], operation_id)
+
+    assert summary["skipped"] == 2
+    assert env.calls == [{"email": "u2@x.com"}]
+    assert env.db.operation.status == "running"
+    assert env.redis[f"bulk_op:{operation_id}:completed"] == 1
+
+
+def test_rate_limit_timeout_leaves_item_for_the_batch_retry(
+    env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _StarvedLimiter(_FakeLimiter):
+        async def acquire(self, timeout: float = 120.0) -> bool:
+            return len(env.calls) < 2
+
+    monkeypatch.setattr(workers.rate_limiter, "RedisRateLimiter", _StarvedLimiter)
+    monkeypatch.setattr(bulk_operations, "_BATCH_CONCURRENCY", 1)
+    operation_id = str(uuid4())
+    env.redis[f"bulk_op:{operation_id}:total"] = 3
+
+    with pytest.raises(bulk_operations.RateLimitTimeout):
+        _run_batch([(i, {"email": f"u{i}@x.com"}) for i in range(3)], operation_id)
+
+    # Only the two items that got a token were written; the third is left for the retry.
+    written = [row["item_index"] for group in env.db.inserts for row in group]
+    assert len(written) == 2 and set(written) < {0, 1, 2}
+    assert all(row["success"] for group in env.db.inserts for row in group)
+    assert env.redis[f"bulk_op:{operation_id}:failed"] == 0
+    assert env.db.operation.status == "running"
@@ -0,0 +1,104 @@
+"""Tests for the shared, pooled connector HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from connectors import http_client
+from connectors.http_client import (
+    close_http_clients,
+    get_http_client,
+    pooled_http_client,
+    reset_http_clients,
+)
+
+
+def test_same_provider_and_config_reuses_client() -> None:
+    async def _run() -> None:
+        first = get_http_client("hubspot", timeout=30.0)
+        second = get_http_client("hubspot", timeout=30.0)
+        other_provider = get_http_client("slack", timeout=30.0)
+        other_timeout = get_http_client("hubspot", timeout=60.0)
+        assert first is second
+        assert first is not other_provider
+        assert first is not other_timeout
+        await close_http_clients()
+
+    asyncio.run(_run())
+
+
+def test_pooled_context_manager_does_not_close_client() -> None:
+    async def _run() -> None:
+        async with pooled_http_client("github", follow_redirects=True) as client:
+            assert isinstance(client, httpx.AsyncClient)
+            assert client.follow_redirects is True
+        assert not client.is_closed
+        async with pooled_http_client("github", follow_redirects=True) as again:
+            assert again is client
+        await close_http_clients()
+        assert client.is_closed
+
+    asyncio.run(_run())
+
+
+def test_clients_are_scoped_per_event_loop() -> None:
+    async def _get() -> httpx.AsyncClient:
+        return get_http_client("google_drive")
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+
+
+def test_closed_client_is_replaced() -> None:
+    async def _run() -> None:
+        client = get_http_client("zoom")
+        await client.aclose()
+        replacement = get_http_client("zoom")
+        assert replacement is not client
+        assert not replacement.is_closed
+        await close_http_clients()
+
+    asyncio.run(_run())
+
+
+def test_reset_forgets_all_clients() -> None:
+    async def _run() -> None:
+        client = get_http_client("jira")
+        reset_http_clients()
+        assert len(http_client._clients_by_loop) == 0
+        assert get_http_client("jira") is not client
+        await client.aclose()
+        await close_http_clients()
+
+    asyncio.run(_run())
+
+
+def test_pooled_client_does_not_carry_cookies_between_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen_cookie_headers: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookie_headers.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "session=tenant-a; Path=/"})
+
+    real_async_client = httpx.AsyncClient
+
+    def _client_with_mock_transport(**kwargs: Any) -> httpx.AsyncClient:
+        return real_async_client(transport=httpx.MockTransport(_handler), **kwargs)
+
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", _client_with_mock_transport)
+    monkeypatch.setattr(http_client, "_governance_hooks", lambda _provider: {})
+
+    async def _run() -> None:
+        client = get_http_client("salesforce")
+        await client.get("https://api.example.com/tenant-a")
+        await client.get("https://api.example.com/tenant-b")
+        assert len(client.cookies) == 0
+        await close_http_clients()
+
+    asyncio.run(_run())
+    assert seen_cookie_headers == [None, None]
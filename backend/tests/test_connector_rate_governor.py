@@ -0,0 +1,153 @@
+"""Tests for the provider-aware connector rate governor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from connectors import rate_governor
+from connectors.rate_governor import (
+    bucket_for_request,
+    get_rate_governor,
+    parse_rate_limit_headers,
+    parse_retry_after,
+    policy_for,
+    reset_rate_governors,
+)
+
+
+def _slack_request(method: str, token: str = "xoxb-1") -> httpx.Request:
+    return httpx.Request(
+        "GET",
+        f"https://slack.com/api/{method}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_slack_requests_are_bucketed_by_method_tier() -> None:
+    assert bucket_for_request("slack", _slack_request("conversations.history")) == "tier3"
+    assert bucket_for_request("slack", _slack_request("users.list")) == "tier2"
+    assert bucket_for_request("slack", _slack_request("chat.postMessage")) == "special"
+    assert bucket_for_request("slack", _slack_request("unknown.method")) == "tier3"
+    assert policy_for("slack", "tier2").rate_per_minute == 20
+
+
+def test_non_slack_requests_use_default_bucket() -> None:
+    request = httpx.Request("GET", "https://api.hubapi.com/crm/v3/objects/deals")
+    assert bucket_for_request("hubspot", request) == "default"
+    assert policy_for("hubspot", "default").rate_per_minute == 600
+    assert policy_for("unknown_provider", "default") == rate_governor._DEFAULT_POLICY
+
+
+def test_parse_retry_after_handles_seconds_and_garbage() -> None:
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not-a-date") is None
+
+
+def test_parse_github_style_headers() -> None:
+    reset_epoch = int(time.time()) + 600
+    limits = parse_rate_limit_headers(
+        httpx.Headers({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(reset_epoch)})
+    )
+    assert limits.remaining == 100
+    assert limits.reset_in_seconds is not None
+    assert 590 <= limits.reset_in_seconds <= 600
+
+
+def test_parse_hubspot_window_headers() -> None:
+    limits = parse_rate_limit_headers(
+        httpx.Headers(
+            {
+                "X-HubSpot-RateLimit-Max": "100",
+                "X-HubSpot-RateLimit-Interval-Milliseconds": "10000",
+                "X-HubSpot-RateLimit-Remaining": "40",
+            }
+        )
+    )
+    assert limits.remaining == 40
+    assert limits.reset_in_seconds == 10.0
+    assert limits.window_limit_per_minute == 600.0
+
+
+def test_governors_are_shared_per_provider_bucket_and_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_governor.settings, "REDIS_URL", "redis://127.0.0.1:1")
+
+    async def _run() -> None:
+        a = get_rate_governor("slack", _slack_request("conversations.history"))
+        b = get_rate_governor("slack", _slack_request("conversations.replies"))
+        c = get_rate_governor("slack", _slack_request("users.list"))
+        d = get_rate_governor("slack", _slack_request("conversations.history", token="xoxb-2"))
+        assert a is b
+        assert a is not c
+        assert a is not d
+        reset_rate_governors()
+
+    asyncio.run(_run())
+
+
+def test_falls_back_to_local_limiter_when_redis_is_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_governor.settings, "REDIS_URL", "redis://127.0.0.1:1")
+
+    async def _run() -> None:
+        request = _slack_request("conversations.history")
+        governor = get_rate_governor("slack", request)
+        await governor.acquire()
+        assert governor._redis_down_until > time.monotonic()
+
+        response = httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+        await governor.observe(response)
+        local = governor._local_limiter
+        assert local._blocked_until - time.monotonic() > 6
+        assert await local.current_rate_per_minute() == pytest.approx(25.0)
+        reset_rate_governors()
+
+    asyncio.run(_run())
+
+
+def test_local_limiter_caps_rate_from_remaining_allowance(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_governor.settings, "REDIS_URL", "redis://127.0.0.1:1")
+
+    async def _run() -> None:
+        request = httpx.Request(
+            "GET", "https://api.github.com/repos/a/b/commits", headers={"Authorization": "token t"}
+        )
+        governor = get_rate_governor("github", request)
+        governor._redis_down_until = time.monotonic() + 60
+        response = httpx.Response(
+            200,
+            headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "60"},
+            request=request,
+        )
+        await governor.observe(response)
+        assert await governor._local_limiter.current_rate_per_minute() == pytest.approx(10.0)
+        reset_rate_governors()
+
+    asyncio.run(_run())
+
+
+def test_api_key_credentials_and_hosts_get_their_own_buckets(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_governor.settings, "REDIS_URL", "redis://127.0.0.1:1")
+
+    def _apollo(key: str) -> httpx.Request:
+        return httpx.Request("POST", "https://api.apollo.io/api/v1/people/match", headers={"X-Api-Key": key})
+
+    def _scrapingbee(key: str) -> httpx.Request:
+        return httpx.Request("GET", "https://app.scrapingbee.com/api/v1/", params={"api_key": key, "url": "x"})
+
+    async def _run() -> None:
+        assert get_rate_governor("apollo", _apollo("org-a")) is get_rate_governor("apollo", _apollo("org-a"))
+        assert get_rate_governor("apollo", _apollo("org-a")) is not get_rate_governor("apollo", _apollo("org-b"))
+        assert get_rate_governor("scrapingbee", _scrapingbee("a")) is not get_rate_governor(
+            "scrapingbee", _scrapingbee("b")
+        )
+        mcp_one = httpx.Request("POST", "https://mcp.one.example/rpc")
+        mcp_two = httpx.Request("POST", "https://mcp.two.example/rpc")
+        assert get_rate_governor("mcp", mcp_one) is not get_rate_governor("mcp", mcp_two)
+        reset_rate_governors()
+
+    asyncio.run(_run())
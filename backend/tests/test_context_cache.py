@@ -0,0 +1,110 @@
+"""Tests for the versioned per-organization chat context cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from services import context_cache
+
+
+class _FakeRedis:
+    def __init__(self, store: dict[str, str]) -> None:
+        self._store = store
+        self._ops: list[tuple[str, str]] = []
+
+    async def get(self, key: str) -> str | None:
+        return self._store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._store[key] = value
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def incr(self, key: str) -> None:
+        self._ops.append(("incr", key))
+
+    def expire(self, key: str, _seconds: int) -> None:
+        return None
+
+    async def execute(self) -> list[Any]:
+        for _op, key in self._ops:
+            self._store[key] = str(int(self._store.get(key, "0")) + 1)
+        self._ops.clear()
+        return []
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    data: dict[str, str] = {}
+    monkeypatch.setattr(context_cache, "get_redis_client", lambda: _FakeRedis(data))
+    return data
+
+
+def _loader(calls: list[int], value: Any):
+    async def _load() -> Any:
+        calls.append(1)
+        return value
+
+    return _load
+
+
+def test_entries_are_cached_until_the_org_is_invalidated(store: dict[str, str]) -> None:
+    calls: list[int] = []
+
+    async def _run() -> list[Any]:
+        results = [
+            await context_cache.get_or_load("manifest", "org-1", (), _loader(calls, "- **slack**")),
+            await context_cache.get_or_load("manifest", "org-1", (), _loader(calls, "stale")),
+        ]
+        await context_cache.invalidate_org_context("org-1")
+        results.append(await context_cache.get_or_load("manifest", "org-1", (), _loader(calls, "- **hubspot**")))
+        # Other organizations keep their entries.
+        results.append(await context_cache.get_or_load("manifest", "org-2", (), _loader(calls, None)))
+        results.append(await context_cache.get_or_load("manifest", "org-2", (), _loader(calls, "unused")))
+        return results
+
+    results = asyncio.run(_run())
+
+    assert results == ["- **slack**", "- **slack**", "- **hubspot**", None, None]
+    assert len(calls) == 3
+
+
+def test_profile_entries_are_scoped_by_user_and_conversation(store: dict[str, str]) -> None:
+    calls: list[int] = []
+
+    async def _run() -> None:
+        await context_cache.get_or_load("profile", "org-1", ("user-a", "conv-1", None), _loader(calls, {"a": 1}))
+        await context_cache.get_or_load("profile", "org-1", ("user-b", "conv-1", None), _loader(calls, {"b": 1}))
+        await context_cache.get_or_load("profile", "org-1", ("user-a", "conv-1", None), _loader(calls, {}))
+
+    asyncio.run(_run())
+
+    assert len(calls) == 2
+    assert "chat_context:org-1:v0:profile:user-a:conv-1:-" in store
+
+
+def test_failed_loads_are_not_cached(store: dict[str, str]) -> None:
+    async def _boom() -> str:
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(context_cache.get_or_load("manifest", "org-1", (), _boom))
+    assert not any(":manifest" in key for key in store)
+
+
+def test_redis_outage_loads_directly(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _unavailable() -> _FakeRedis:
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(context_cache, "get_redis_client", _unavailable)
+    calls: list[int] = []
+
+    value = asyncio.run(context_cache.get_or_load("manifest", "org-1", (), _loader(calls, "fresh")))
+    asyncio.run(context_cache.invalidate_org_context("org-1"))
+
+    assert value == "fresh"
+    assert calls == [1]
@@ -0,0 +1,157 @@
+"""Tests for keyset cursors in the data inspector."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, MetaData, Table, asc, create_engine, desc, insert, select
+
+from api.routes import data as data_routes
+from models.activity import Activity
+from services import table_counts
+
+
+def _walk(descending: bool, page_size: int) -> tuple[list[int], list[int]]:
+    """Page through a table with NULLs and ties; return (keyset order, full order)."""
+    metadata = MetaData()
+    table = Table("t", metadata, Column("id", Integer, primary_key=True), Column("v", Integer, nullable=True))
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    values = [3, None, 1, 3, None, 2, 1, 3, None, 2, 5]
+    with engine.begin() as conn:
+        conn.execute(insert(table), [{"id": i + 1, "v": v} for i, v in enumerate(values)])
+
+    order_func = desc if descending else asc
+    # Spell out Postgres' default NULL placement (SQLite differs).
+    value_order = desc(table.c.v).nulls_first() if descending else asc(table.c.v).nulls_last()
+    base = select(table.c.id, table.c.v).order_by(value_order, order_func(table.c.id))
+
+    with engine.connect() as conn:
+        full = [row.id for row in conn.execute(base)]
+        walked: list[int] = []
+        last = None
+        while True:
+            query = base
+            if last is not None:
+                query = query.where(
+                    data_routes._keyset_predicate(table.c.v, table.c.id, descending, last.v, last.id)
+                )
+            rows = list(conn.execute(query.limit(page_size)))
+            if not rows:
+                break
+            walked.extend(row.id for row in rows)
+            last = rows[-1]
+    return walked, full
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("page_size", [1, 2, 4])
+def test_keyset_walk_matches_full_order(descending: bool, page_size: int) -> None:
+    walked, full = _walk(descending, page_size)
+    assert walked == full
+
+
+def test_cursor_round_trips_typed_sort_values() -> None:
+    row_id = UUID(int=42)
+    when = datetime(2026, 3, 4, 5, 6, 7)
+
+    cursor = data_routes._encode_cursor("activity_date", "desc", when, row_id)
+    payload, value, decoded_id = data_routes._decode_cursor(cursor, Activity.activity_date)
+
+    assert value == when
+    assert decoded_id == row_id
+    assert payload["s"] == "activity_date"
+    assert payload["o"] == "desc"
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        data_routes._decode_cursor("not-a-cursor", None)
+    assert excinfo.value.status_code == 400
+
+
+class _FakeCountsRedis:
+    def __init__(self, store: dict[str, dict[str, str]]) -> None:
+        self._store = store
+        self._ops: list[tuple[str, dict[str, int]]] = []
+        self.versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        version = self.versions.get(key)
+        return str(version) if version is not None else None
+
+    def incr(self, key: str) -> None:
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def expire(self, key: str, seconds: int) -> None:
+        return None
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        return [self._store.get(key, {}).get(field) for field in fields]
+
+    def pipeline(self, transaction: bool = True) -> "_FakeCountsRedis":
+        return self
+
+    def hset(self, key: str, mapping: dict[str, int]) -> None:
+        self._ops.append((key, mapping))
+
+    def ttl(self, key: str) -> None:
+        return None
+
+    async def execute(self) -> list[int]:
+        for key, mapping in self._ops:
+            self._store.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+        self._ops.clear()
+        return [1, 300]
+
+
+class _CountingSession:
+    def __init__(self) -> None:
+        self.statements: int = 0
+
+    async def execute(self, _statement: object) -> object:
+        self.statements += 1
+
+        class _Result:
+            def one(self) -> object:
+                return type("Row", (), {"contacts": 1, "accounts": 2, "deals": 3, "activities": 4})()
+
+        return _Result()
+
+
+def test_table_counts_use_one_statement_and_are_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    store: dict[str, dict[str, str]] = {}
+    monkeypatch.setattr(table_counts, "get_redis_client", lambda: _FakeCountsRedis(store))
+    session = _CountingSession()
+    org_id = UUID(int=7)
+
+    first = asyncio.run(table_counts.get_table_counts(session, org_id, "user-a"))  # type: ignore[arg-type]
+    second = asyncio.run(table_counts.get_table_counts(session, org_id, "user-a"))  # type: ignore[arg-type]
+
+    assert first == second == {"contacts": 1, "accounts": 2, "deals": 3, "activities": 4}
+    assert session.statements == 1
+
+
+def test_invalidation_bumps_org_version_instead_of_scanning(monkeypatch: pytest.MonkeyPatch) -> None:
+    store: dict[str, dict[str, str]] = {}
+    redis_client = _FakeCountsRedis(store)
+    monkeypatch.setattr(table_counts, "get_redis_client", lambda: redis_client)
+    session = _CountingSession()
+    org_id = UUID(int=7)
+
+    async def _scenario() -> None:
+        await table_counts.get_table_counts(session, org_id, "user-a")  # type: ignore[arg-type]
+        await table_counts.invalidate_table_counts(str(org_id))
+        await table_counts.get_table_counts(session, org_id, "user-a")  # type: ignore[arg-type]
+
+    asyncio.run(_scenario())
+
+    assert session.statements == 2
+    assert sorted(store) == [
+        f"data_counts:{org_id}:v0:user-a",
+        f"data_counts:{org_id}:v1:user-a",
+    ]
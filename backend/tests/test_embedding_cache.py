@@ -0,0 +1,110 @@
+"""Tests for the two-tier embedding cache and its use by EmbeddingService."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from services import embedding_cache
+from services.embeddings import EMBEDDING_MODEL, EmbeddingService
+
+
+class _FakeRedis:
+    def __init__(self, store: dict[str, bytes], *, fail: bool = False) -> None:
+        self._store = store
+        self._fail = fail
+        self._pending: list[tuple[str, bytes]] = []
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        if self._fail:
+            raise ConnectionError("redis down")
+        return [self._store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self._pending.append((key, value))
+
+    async def execute(self) -> None:
+        if self._fail:
+            raise ConnectionError("redis down")
+        self._store.update(self._pending)
+        self._pending.clear()
+
+
+class _FakeEmbeddingsAPI:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def create(self, model: str, input: list[str]) -> Any:
+        self.calls.append(list(input))
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text)), 0.5]) for text in input]
+        )
+
+
+@pytest.fixture
+def redis_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, bytes]:
+    store: dict[str, bytes] = {}
+    monkeypatch.setattr(embedding_cache, "get_redis_client", lambda **_kw: _FakeRedis(store))
+    embedding_cache.clear_embedding_cache()
+    yield store
+    embedding_cache.clear_embedding_cache()
+
+
+def _service() -> tuple[EmbeddingService, _FakeEmbeddingsAPI]:
+    api = _FakeEmbeddingsAPI()
+    service = EmbeddingService(api_key="test")
+    service._client = SimpleNamespace(embeddings=api)  # type: ignore[assignment]
+    return service, api
+
+
+def test_repeated_text_is_embedded_once(redis_store: dict[str, bytes]) -> None:
+    service, api = _service()
+
+    first = asyncio.run(service.generate_embeddings_batch(["deal won", "deal won", "", "pricing"]))
+    second = asyncio.run(service.generate_embeddings_batch(["pricing", "deal  won "]))
+
+    assert first == [[8.0, 0.5], [8.0, 0.5], [7.0, 0.5]]
+    assert second == [[7.0, 0.5], [8.0, 0.5]]
+    assert api.calls == [["deal won", "pricing"]]
+    stats = embedding_cache.get_embedding_cache_stats()
+    assert stats["misses"] == 3
+    assert stats["l1_hits"] == 2
+    assert stats["stores"] == 2
+
+
+def test_redis_tier_serves_other_processes(redis_store: dict[str, bytes]) -> None:
+    service, api = _service()
+    asyncio.run(service.generate_embedding("quarterly forecast"))
+
+    # A fresh process starts with an empty L1 but shares Redis.
+    embedding_cache.clear_embedding_cache()
+    other, other_api = _service()
+    vector = asyncio.run(other.generate_embedding("quarterly forecast"))
+
+    assert vector == [18.0, 0.5]
+    assert other_api.calls == []
+    assert embedding_cache.get_embedding_cache_stats()["l2_hits"] == 1
+
+
+def test_cache_keys_include_model() -> None:
+    assert embedding_cache.embedding_cache_key("a", "text") != embedding_cache.embedding_cache_key("b", "text")
+    assert embedding_cache.embedding_cache_key(EMBEDDING_MODEL, "Some  text\n") == (
+        embedding_cache.embedding_cache_key(EMBEDDING_MODEL, "Some text")
+    )
+
+
+def test_redis_failure_falls_back_to_openai(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(embedding_cache, "get_redis_client", lambda **_kw: _FakeRedis({}, fail=True))
+    embedding_cache.clear_embedding_cache()
+    service, api = _service()
+
+    assert asyncio.run(service.generate_embeddings_batch(["hello"])) == [[5.0, 0.5]]
+    assert api.calls == [["hello"]]
+    assert embedding_cache.get_embedding_cache_stats()["redis_errors"] == 2
+    embedding_cache.clear_embedding_cache()
@@ -0,0 +1,210 @@
+"""Tests for the streaming activity embedding backfill."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+
+from services import embedding_sync
+
+
+_ORG_ID: str = "00000000-0000-0000-0000-000000000000"
+_SYNC_BASE: datetime = datetime(2026, 10, 1, 12, 0)
+
+
+def _activity_id(n: int) -> UUID:
+    return UUID(int=n)
+
+
+class _FakeStore:
+    """In-memory stand-in for the activities table, cursor and embeddings API."""
+
+    def __init__(self, count: int, *, empty_ids: frozenset[int] = frozenset()) -> None:
+        self.embedded: dict[UUID, list[float]] = {}
+        self.rows: list[SimpleNamespace] = [
+            SimpleNamespace(
+                id=_activity_id(n),
+                type="email",
+                subject=None if n in empty_ids else f"Subject {n}",
+                description=None,
+                custom_fields=None,
+                synced_at=_SYNC_BASE + timedelta(minutes=n % 7),
+            )
+            for n in range(1, count + 1)
+        ]
+        if empty_ids:
+            for row in self.rows:
+                if row.id.int in empty_ids:
+                    row.type = None
+        self.cursor: Optional[UUID] = None
+        self.writes: list[int] = []
+        self.requests: list[int] = []
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.fail_request: Optional[int] = None
+
+    async def fetch_page(
+        self,
+        organization_id: str,
+        after_id: Optional[UUID],
+        until_id: Optional[UUID],
+        page_size: int,
+    ) -> list[Any]:
+        page = [
+            row for row in self.rows
+            if row.id not in self.embedded
+            and (after_id is None or row.id > after_id)
+            and (until_id is None or row.id <= until_id)
+        ]
+        return page[:page_size]
+
+    async def fetch_recent_page(
+        self,
+        organization_id: str,
+        synced_since: datetime,
+        before: Optional[tuple[datetime, UUID]],
+        page_size: int,
+    ) -> list[Any]:
+        page = sorted(
+            (
+                row for row in self.rows
+                if row.id not in self.embedded
+                and row.synced_at >= synced_since
+                and (before is None or (row.synced_at, row.id) < before)
+            ),
+            key=lambda row: (row.synced_at, row.id),
+            reverse=True,
+        )
+        return page[:page_size]
+
+    async def write(self, organization_id: str, updates: list[tuple[UUID, str, list[float]]]) -> None:
+        self.writes.append(len(updates))
+        for activity_id, _searchable, embedding in updates:
+            self.embedded[activity_id] = embedding
+
+    async def load_cursor(self, organization_id: str) -> Optional[UUID]:
+        return self.cursor
+
+    async def save_cursor(self, organization_id: str, cursor: Optional[UUID]) -> None:
+        self.cursor = cursor
+
+    async def generate_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+        self.requests.append(len(texts))
+        request_number = len(self.requests)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if request_number == self.fail_request:
+                raise RuntimeError("embeddings API down")
+            return [[float(len(t))] for t in texts]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def install(monkeypatch: pytest.MonkeyPatch):
+    def _install(store: _FakeStore, *, page_size: int, batch_size: int, in_flight: int = 4) -> None:
+        monkeypatch.setattr(embedding_sync, "_fetch_page", store.fetch_page)
+        monkeypatch.setattr(embedding_sync, "_fetch_recent_page", store.fetch_recent_page)
+        monkeypatch.setattr(embedding_sync, "_write_embeddings", store.write)
+        monkeypatch.setattr(embedding_sync, "_load_cursor", store.load_cursor)
+        monkeypatch.setattr(embedding_sync, "_save_cursor", store.save_cursor)
+        monkeypatch.setattr(embedding_sync, "EMBEDDING_PAGE_SIZE", page_size)
+        monkeypatch.setattr(embedding_sync, "EMBEDDING_BATCH_SIZE", batch_size)
+        monkeypatch.setattr(embedding_sync, "EMBEDDING_MAX_IN_FLIGHT", in_flight)
+
+    return _install
+
+
+def _run(store: _FakeStore, limit: Optional[int] = None) -> int:
+    return asyncio.run(
+        embedding_sync.generate_embeddings_for_organization(
+            _ORG_ID, limit=limit, embedding_service=store  # type: ignore[arg-type]
+        )
+    )
+
+
+def test_pages_are_embedded_concurrently_and_written_in_bulk(install) -> None:
+    store = _FakeStore(25)
+    install(store, page_size=10, batch_size=3, in_flight=2)
+
+    assert _run(store) == 25
+    assert len(store.embedded) == 25
+    assert store.writes == [10, 10, 5]
+    assert sum(store.requests) == 25
+    assert store.max_in_flight == 2
+    # A full pass clears the cursor so the next run starts from the beginning.
+    assert store.cursor is None
+
+
+def test_limit_stops_at_cursor_and_next_run_resumes(install) -> None:
+    store = _FakeStore(25)
+    install(store, page_size=10, batch_size=10)
+
+    assert _run(store, limit=12) == 12
+    assert store.cursor == _activity_id(12)
+    assert store.writes == [10, 2]
+
+    assert _run(store, limit=100) == 13
+    assert len(store.embedded) == 25
+    assert store.cursor is None
+
+
+def test_resumed_run_wraps_around_to_rows_below_cursor(install) -> None:
+    store = _FakeStore(20)
+    install(store, page_size=5, batch_size=5)
+    # A previous run stopped after id 10 with ids 3 and 4 failing to embed.
+    store.cursor = _activity_id(10)
+    for n in range(1, 11):
+        if n not in (3, 4):
+            store.embedded[_activity_id(n)] = [1.0]
+
+    assert _run(store) == 12
+    assert len(store.embedded) == 20
+    assert store.cursor is None
+
+
+def test_failed_request_skips_rows_without_stopping_backfill(install) -> None:
+    store = _FakeStore(9)
+    install(store, page_size=9, batch_size=3)
+    store.fail_request = 2
+
+    assert _run(store) == 6
+    assert _activity_id(4) not in store.embedded
+    assert store.writes == [6]
+
+
+def test_rows_without_text_are_not_sent_for_embedding(install) -> None:
+    store = _FakeStore(4, empty_ids=frozenset({2}))
+    install(store, page_size=10, batch_size=10)
+
+    assert _run(store) == 3
+    assert store.requests == [3]
+    assert _activity_id(2) not in store.embedded
+
+
+def test_post_sync_step_embeds_rows_from_this_sync_newest_first(install) -> None:
+    store = _FakeStore(30)
+    install(store, page_size=4, batch_size=4)
+    store.cursor = _activity_id(2)
+    sync_start = _SYNC_BASE + timedelta(minutes=5)
+    just_synced = {row.id for row in store.rows if row.synced_at >= sync_start}
+
+    embedded = asyncio.run(
+        embedding_sync.embed_recently_synced_activities(
+            _ORG_ID, sync_start, limit=6, embedding_service=store  # type: ignore[arg-type]
+        )
+    )
+
+    assert embedded == 6
+    assert set(store.embedded) < just_synced
+    newest = sorted(just_synced, key=lambda i: (store.rows[i.int - 1].synced_at, i), reverse=True)
+    assert list(store.embedded) == newest[:6]
+    # The backlog cursor belongs to the sweep and is left alone.
+    assert store.cursor == _activity_id(2)
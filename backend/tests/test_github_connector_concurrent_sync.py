@@ -0,0 +1,126 @@
+"""Tests for concurrent per-repo GitHub sync and batched commit/PR upserts."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from connectors.github import GitHubConnector
+
+
+_ORG_ID: str = "11111111-1111-1111-1111-111111111111"
+_REPO_ID: UUID = UUID("33333333-3333-3333-3333-333333333333")
+_USER_ID: UUID = UUID("44444444-4444-4444-4444-444444444444")
+
+
+class _RecordingSession:
+    def __init__(self, statements: list[Any]) -> None:
+        self._statements = statements
+
+    async def execute(self, stmt: Any) -> None:
+        self._statements.append(stmt)
+
+    async def commit(self) -> None:
+        return None
+
+    async def get(self, _model: Any, _id: Any) -> None:
+        return None
+
+
+class _SessionContext:
+    def __init__(self, statements: list[Any]) -> None:
+        self._session = _RecordingSession(statements)
+
+    async def __aenter__(self) -> _RecordingSession:
+        return self._session
+
+    async def __aexit__(self, *_exc: object) -> bool:
+        return False
+
+
+def _repo(name: str = "acme/app") -> dict[str, Any]:
+    return {"id": _REPO_ID, "full_name": name, "default_branch": "main"}
+
+
+def _commit(sha: str, login: str | None) -> dict[str, Any]:
+    return {
+        "sha": sha,
+        "html_url": f"https://github.com/acme/app/commit/{sha}",
+        "author": {"login": login} if login else None,
+        "commit": {
+            "message": f"commit {sha}",
+            "author": {"name": "Dev", "email": f"{login}@acme.test", "date": "2025-01-01T00:00:00Z"},
+            "committer": {"name": "Dev", "date": "2025-01-01T00:00:00Z"},
+        },
+    }
+
+
+def test_run_for_each_repo_bounds_concurrency_and_isolates_failures() -> None:
+    connector = GitHubConnector(organization_id=_ORG_ID)
+    connector._REPO_SYNC_CONCURRENCY = 2
+    in_flight = 0
+    peak = 0
+
+    async def _sync_one(repo: dict[str, Any]) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if repo["full_name"] == "acme/broken":
+            raise RuntimeError("boom")
+        return 3
+
+    repos = [_repo(f"acme/r{i}") for i in range(5)] + [_repo("acme/broken")]
+    total = asyncio.run(connector._run_for_each_repo(repos, _sync_one, "sync commits"))
+
+    assert total == 15
+    assert peak == 2
+
+
+def test_sync_commits_for_repo_uses_one_multi_row_upsert(monkeypatch) -> None:
+    connector = GitHubConnector(organization_id=_ORG_ID)
+    statements: list[Any] = []
+    resolve_calls: list[dict[str, str | None]] = []
+
+    async def _fake_paginated(_path: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        # "b" appears twice (e.g. a page boundary shifted); it must be deduplicated.
+        return [_commit("a", "alice"), _commit("b", "bob"), _commit("b", "bob"), _commit("c", None)]
+
+    async def _fake_resolve(logins: dict[str, str | None]) -> dict[str, UUID | None]:
+        resolve_calls.append(logins)
+        return {login: (_USER_ID if login == "alice" else None) for login in logins}
+
+    monkeypatch.setattr(connector, "_gh_get_paginated", _fake_paginated)
+    monkeypatch.setattr(connector, "_resolve_users_by_logins", _fake_resolve)
+    monkeypatch.setattr(
+        "connectors.github.get_session",
+        lambda organization_id: _SessionContext(statements),
+    )
+
+    count = asyncio.run(connector._sync_commits_for_repo(_repo()))
+
+    assert count == 3
+    assert resolve_calls == [{"alice": "alice@acme.test", "bob": "bob@acme.test"}]
+    assert len(statements) == 1
+    compiled = statements[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT" in str(compiled)
+    assert compiled.params["user_id_m0"] == _USER_ID
+    assert compiled.params["user_id_m1"] is None
+    assert compiled.params["sha_m2"] == "c"
+
+
+def test_resolve_users_by_logins_serves_cached_logins_without_queries(monkeypatch) -> None:
+    connector = GitHubConnector(organization_id=_ORG_ID)
+    connector._login_cache = {"alice": _USER_ID, "ghost": None}
+
+    def _fail_get_session(**_kwargs: Any) -> None:
+        raise AssertionError("cached logins must not hit the database")
+
+    monkeypatch.setattr("connectors.github.get_session", _fail_get_session)
+
+    resolved = asyncio.run(connector._resolve_users_by_logins({"alice": None, "ghost": None}))
+    assert resolved == {"alice": _USER_ID, "ghost": None}
@@ -0,0 +1,229 @@
+"""Tests for Google Drive incremental sync via the Changes API."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from connectors import google_drive
+from connectors.google_drive import GOOGLE_FOLDER_MIME, GoogleDriveConnector
+
+ORG_ID = "00000000-0000-0000-0000-000000000001"
+USER_ID = "00000000-0000-0000-0000-000000000002"
+
+
+def _connector() -> GoogleDriveConnector:
+    connector = GoogleDriveConnector(organization_id=ORG_ID, user_id=USER_ID)
+    connector._token = "token"
+    return connector
+
+
+def _folder(fid: str, name: str, parent: str | None) -> dict[str, Any]:
+    return {"id": fid, "name": name, "mimeType": GOOGLE_FOLDER_MIME, "parents": [parent] if parent else []}
+
+
+class _Result:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+    def scalar_one_or_none(self) -> None:
+        return None
+
+
+class _FakeSession:
+    def __init__(self, folder_rows: list[tuple[str, str, str | None]]) -> None:
+        self.folder_rows = folder_rows
+        self.statements: list[tuple[Any, Any]] = []
+        self.committed = False
+
+    async def execute(self, stmt: Any, params: Any = None) -> _Result:
+        self.statements.append((stmt, params))
+        if "shared_files.external_id, shared_files.name" in str(stmt):
+            return _Result(self.folder_rows)
+        return _Result([])
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+def _patch_io(
+    monkeypatch: pytest.MonkeyPatch,
+    connector: GoogleDriveConnector,
+    session: _FakeSession,
+    handler: Any,
+) -> None:
+    @asynccontextmanager
+    async def _fake_get_session(**_: Any) -> AsyncIterator[_FakeSession]:
+        yield session
+
+    @asynccontextmanager
+    async def _fake_http_client(**_: Any) -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            yield client
+
+    monkeypatch.setattr(google_drive, "get_session", _fake_get_session)
+    monkeypatch.setattr(connector, "http_client", _fake_http_client)
+
+
+def test_folder_rename_repaths_descendants_without_relisting_them() -> None:
+    stored = [
+        ("f-root", "Projects", None),
+        ("f-q1", "Q1", "f-root"),
+        ("f-deep", "Contracts", "f-q1"),
+        ("f-other", "Archive", None),
+    ]
+    changes = [
+        _folder("f-root", "Clients", None),
+        {"id": "doc-1", "name": "Plan", "mimeType": "text/plain", "parents": ["f-deep"]},
+    ]
+
+    paths, moved = GoogleDriveConnector._apply_folder_changes(stored, changes, {"f-other"})
+
+    # The changed file resolves through folders that did not change.
+    assert paths["f-deep"] == "/Clients/Q1/Contracts"
+    assert moved == {
+        "f-root": "/Clients",
+        "f-q1": "/Clients/Q1",
+        "f-deep": "/Clients/Q1/Contracts",
+    }
+    assert "f-other" not in paths
+
+
+def test_upserts_are_multi_row_and_split_under_bind_param_cap() -> None:
+    connector = _connector()
+    files = [{"id": f"file-{n}", "name": f"Doc {n}", "mimeType": "text/plain"} for n in range(6000)]
+    rows = [connector._file_row(f, {}, google_drive.datetime.utcnow()) for f in files]
+
+    statements = GoogleDriveConnector._upsert_statements(rows)
+
+    assert len(statements) == 3
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (organization_id, user_id, source, external_id) DO UPDATE" in sql
+    assert "folder_path = excluded.folder_path" in sql
+    assert GoogleDriveConnector._upsert_statements([]) == []
+
+
+def test_changes_sync_applies_moves_and_removals_and_stores_next_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector = _connector()
+    session = _FakeSession([("f-a", "Sales", None), ("f-b", "2024", "f-a")])
+    requested_tokens: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        token = request.url.params["pageToken"]
+        requested_tokens.append(token)
+        if token == "100":
+            return httpx.Response(200, json={
+                "nextPageToken": "101",
+                "changes": [
+                    {"fileId": "f-b", "file": _folder("f-b", "2024", "f-c")},
+                    {"fileId": "gone", "removed": True},
+                ],
+            })
+        return httpx.Response(200, json={
+            "newStartPageToken": "150",
+            "changes": [
+                {"fileId": "f-c", "file": _folder("f-c", "Archive", None)},
+                {"fileId": "trashed", "file": {"id": "trashed", "trashed": True}},
+                {"driveId": "shared-drive", "changeType": "drive"},
+            ],
+        })
+
+    stored_tokens: list[str] = []
+
+    async def _store(_session: Any, token: str) -> None:
+        stored_tokens.append(token)
+
+    _patch_io(monkeypatch, connector, session, _handler)
+    monkeypatch.setattr(connector, "_store_changes_page_token", _store)
+
+    counts = asyncio.run(connector._sync_changes("100"))
+
+    assert requested_tokens == ["100", "101"]
+    assert counts is not None and counts["folders"] == 2 and sum(counts.values()) == 2
+    assert stored_tokens == ["150"] and session.committed
+
+    upserts = [s for s, _ in session.statements if "INSERT INTO shared_files" in str(s)]
+    assert len(upserts) == 1
+    values = upserts[0].compile(dialect=postgresql.dialect()).params
+    assert {v for k, v in values.items() if k.startswith("folder_path")} == {"/", "/Archive"}
+
+    repath_params = next(p for s, p in session.statements if isinstance(p, list))
+    assert repath_params == [{"folder_id": "f-b", "new_path": "/Archive/2024"}]
+
+    delete_sql = next(s for s, _ in session.statements if "DELETE FROM shared_files" in str(s))
+    assert set(delete_sql.compile().params["external_id_1"]) == {"gone", "trashed"}
+
+
+def test_rejected_page_token_falls_back_to_full_crawl(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector = _connector()
+    session = _FakeSession([])
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/changes"):
+            return httpx.Response(404, json={"error": {"message": "Invalid page token"}})
+        if request.url.path.endswith("/changes/startPageToken"):
+            return httpx.Response(200, json={"startPageToken": "900"})
+        return httpx.Response(200, json={"files": [
+            _folder("f-a", "Sales", None),
+            {"id": "doc", "name": "Forecast", "mimeType": google_drive.GOOGLE_SHEET_MIME, "parents": ["f-a"]},
+        ]})
+
+    async def _token() -> str:
+        return "stale"
+
+    stored_tokens: list[str] = []
+
+    async def _store(_session: Any, token: str) -> None:
+        stored_tokens.append(token)
+
+    async def _oauth() -> tuple[str, str]:
+        return "token", ""
+
+    _patch_io(monkeypatch, connector, session, _handler)
+    monkeypatch.setattr(connector, "get_oauth_token", _oauth)
+    monkeypatch.setattr(connector, "_get_changes_page_token", _token)
+    monkeypatch.setattr(connector, "_store_changes_page_token", _store)
+
+    counts = asyncio.run(connector.sync_file_metadata())
+
+    assert calls == ["/drive/v3/changes", "/drive/v3/changes/startPageToken", "/drive/v3/files"]
+    assert counts == {"folders": 1, "docs": 0, "sheets": 1, "slides": 0, "other": 0}
+    assert stored_tokens == ["900"]
+
+
+def test_full_crawl_upserts_each_file_once_when_listed_on_two_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector = _connector()
+    session = _FakeSession([])
+    doc = {"id": "doc", "name": "Forecast", "mimeType": google_drive.GOOGLE_SHEET_MIME, "parents": ["f-a"]}
+    renamed = {**doc, "name": "Forecast v2"}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/changes/startPageToken"):
+            return httpx.Response(200, json={"startPageToken": "900"})
+        if request.url.params.get("pageToken") == "p2":
+            return httpx.Response(200, json={"files": [renamed]})
+        return httpx.Response(200, json={"files": [_folder("f-a", "Sales", None), doc], "nextPageToken": "p2"})
+
+    async def _store(_session: Any, token: str) -> None:
+        return None
+
+    _patch_io(monkeypatch, connector, session, _handler)
+    monkeypatch.setattr(connector, "_store_changes_page_token", _store)
+
+    counts = asyncio.run(connector._sync_full_crawl())
+
+    assert counts == {"folders": 1, "docs": 0, "sheets": 1, "slides": 0, "other": 0}
+    upsert = next(s for s, _ in session.statements if "INSERT INTO shared_files" in str(s))
+    params = upsert.compile(dialect=postgresql.dialect()).params
+    assert sorted(v for k, v in params.items() if k.startswith("external_id")) == ["doc", "f-a"]
+    assert "Forecast v2" in params.values()
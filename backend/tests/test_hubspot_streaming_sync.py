@@ -0,0 +1,149 @@
+"""Tests for HubSpot syncs writing each fetched page before the next request."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy.sql.dml import Insert
+
+from connectors import hubspot as hubspot_module
+from connectors.hubspot import HubSpotConnector
+
+
+class _Result:
+    def all(self) -> list[Any]:
+        return []
+
+    def scalars(self) -> "_Result":
+        return self
+
+
+class _FakeSession:
+    def __init__(self, events: list[tuple[str, Any]]) -> None:
+        self._events = events
+
+    async def execute(self, statement: Any) -> _Result:
+        if isinstance(statement, Insert):
+            rows = statement.compile().params
+            self._events.append(("upsert", sorted(
+                value for key, value in rows.items() if key.startswith("source_id")
+            )))
+        return _Result()
+
+    async def commit(self) -> None:
+        self._events.append(("commit", None))
+
+
+class _FakeSessionCtx:
+    def __init__(self, events: list[tuple[str, Any]]) -> None:
+        self._session = _FakeSession(events)
+
+    async def __aenter__(self) -> _FakeSession:
+        return self._session
+
+    async def __aexit__(self, *_exc: Any) -> bool:
+        return False
+
+
+def _page(ids: list[str], after: str | None) -> dict[str, Any]:
+    return {
+        "results": [{"id": hs_id, "properties": {"name": f"Company {hs_id}"}} for hs_id in ids],
+        "paging": {"next": {"after": after}} if after else {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_accounts_upserts_each_page_before_fetching_the_next(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[tuple[str, Any]] = []
+    pages = {
+        None: _page(["1", "2"], "p2"),
+        "p2": _page(["3", "4"], "p3"),
+        "p3": _page(["5"], None),
+    }
+
+    async def fake_make_request(
+        self: HubSpotConnector,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        _max_retries: int = 5,
+    ) -> dict[str, Any]:
+        after = (params or {}).get("after")
+        events.append(("request", after))
+        return pages[after]
+
+    async def noop(*_args: Any, **_kwargs: Any) -> None:
+        return None
+
+    monkeypatch.setattr(HubSpotConnector, "_make_request", fake_make_request)
+    monkeypatch.setattr(HubSpotConnector, "_ensure_owner_email_cache", noop)
+    monkeypatch.setattr(HubSpotConnector, "_map_hs_owner_to_user", noop)
+    monkeypatch.setattr(hubspot_module, "broadcast_sync_progress", noop)
+    monkeypatch.setattr(hubspot_module, "get_session", lambda **_kw: _FakeSessionCtx(events))
+    monkeypatch.setattr(hubspot_module, "_UPSERT_BATCH_SIZE", 2)
+
+    connector = HubSpotConnector(
+        "00000000-0000-0000-0000-000000000001",
+        user_id="00000000-0000-0000-0000-000000000002",
+    )
+
+    assert await connector.sync_accounts() == 5
+
+    io_events = [event for event in events if event[0] != "commit"]
+    assert io_events == [
+        ("request", None),
+        ("upsert", ["1", "2"]),
+        ("request", "p2"),
+        ("upsert", ["3", "4"]),
+        ("request", "p3"),
+        ("upsert", ["5"]),
+    ]
+    assert events.count(("commit", None)) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_activities_counts_pages_committed_before_a_failed_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[tuple[str, Any]] = []
+
+    async def fake_make_request(
+        self: HubSpotConnector,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        _max_retries: int = 5,
+    ) -> dict[str, Any]:
+        after = (params or {}).get("after")
+        if endpoint.endswith("/calls") and after is None:
+            return {
+                "results": [{"id": hs_id, "properties": {}} for hs_id in ("c1", "c2")],
+                "paging": {"next": {"after": "p2"}},
+            }
+        request = httpx.Request(method, f"https://api.hubapi.com{endpoint}")
+        raise httpx.HTTPStatusError(
+            "server error", request=request, response=httpx.Response(500, request=request),
+        )
+
+    async def noop(*_args: Any, **_kwargs: Any) -> None:
+        return None
+
+    monkeypatch.setattr(HubSpotConnector, "_make_request", fake_make_request)
+    monkeypatch.setattr(HubSpotConnector, "ensure_sync_active", noop)
+    monkeypatch.setattr(hubspot_module, "broadcast_sync_progress", noop)
+    monkeypatch.setattr(hubspot_module, "get_session", lambda **_kw: _FakeSessionCtx(events))
+    monkeypatch.setattr(hubspot_module, "_UPSERT_BATCH_SIZE", 2)
+
+    connector = HubSpotConnector(
+        "00000000-0000-0000-0000-000000000001",
+        user_id="00000000-0000-0000-0000-000000000002",
+    )
+
+    assert await connector.sync_activities() == 2
+    assert ("upsert", ["c1", "c2"]) in events
@@ -39,7 +39,7 @@ class _FakeIspotResponse:
 
 
 class _FakeIspotHttpClient:
-    """Fake httpx.AsyncClient that returns token for token URL and JSON data for API."""
+    """Fake pooled HTTP client that returns token for token URL and JSON data for API."""
 
     async def __aenter__(self) -> "_FakeIspotHttpClient":
         return self
@@ -153,8 +153,8 @@ async def test_ispot_tv_token_and_sync_accounts(monkeypatch: pytest.MonkeyPatch)
         lambda organization_id: _FakeSessionContext(integration),
     )
     monkeypatch.setattr(
-        "connectors.ispot_tv.httpx.AsyncClient",
-        lambda **kwargs: _FakeIspotHttpClient(),
+        "connectors.ispot_tv.ISpotTvConnector.http_client",
+        lambda self, **kwargs: _FakeIspotHttpClient(),
     )
 
     connector = ISpotTvConnector(
@@ -180,8 +180,8 @@ async def test_ispot_tv_sync_activities(monkeypatch: pytest.MonkeyPatch) -> None
         lambda organization_id: _FakeSessionContext(integration),
     )
     monkeypatch.setattr(
-        "connectors.ispot_tv.httpx.AsyncClient",
-        lambda **kwargs: _FakeIspotHttpClient(),
+        "connectors.ispot_tv.ISpotTvConnector.http_client",
+        lambda self, **kwargs: _FakeIspotHttpClient(),
     )
 
     connector = ISpotTvConnector(
@@ -207,8 +207,8 @@ async def test_ispot_tv_query(monkeypatch: pytest.MonkeyPatch) -> None:
         lambda organization_id: _FakeSessionContext(integration),
     )
     monkeypatch.setattr(
-        "connectors.ispot_tv.httpx.AsyncClient",
-        lambda **kwargs: _FakeIspotHttpClient(),
+        "connectors.ispot_tv.ISpotTvConnector.http_client",
+        lambda self, **kwargs: _FakeIspotHttpClient(),
     )
 
     connector = ISpotTvConnector(
@@ -104,10 +104,7 @@ async def test_upload_bytes_to_linear(monkeypatch: pytest.MonkeyPatch) -> None:
     fake_cm.__aenter__ = AsyncMock(return_value=fake_client)
     fake_cm.__aexit__ = AsyncMock(return_value=None)
 
-    monkeypatch.setattr(
-        "connectors.linear.httpx.AsyncClient",
-        lambda *args, **kwargs: fake_cm,
-    )
+    monkeypatch.setattr(connector, "http_client", lambda **kwargs: fake_cm)
 
     asset: str = await connector._upload_bytes_to_linear(
         data=b"hello",
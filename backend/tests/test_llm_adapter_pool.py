@@ -0,0 +1,87 @@
+"""Tests for the pooled LLM adapters handed out by ``get_adapter``."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from services import llm_adapter
+from services.llm_adapter import (
+    AnthropicAdapter,
+    LLMConfig,
+    OpenAIAdapter,
+    close_llm_clients,
+    get_adapter,
+    reset_llm_clients,
+)
+
+
+def _config(provider: str = "anthropic", api_key: str = "key-1", base_url: str | None = None) -> LLMConfig:
+    return LLMConfig(
+        provider=provider, primary_model="m", cheap_model="m", workflow_model="m",
+        api_key=api_key, base_url=base_url,
+    )
+
+
+def test_adapters_are_shared_per_provider_base_url_and_key() -> None:
+    async def _run() -> None:
+        first = get_adapter(_config())
+        assert get_adapter(_config()) is first
+        other_key = get_adapter(_config(api_key="key-2"))
+        other_url = get_adapter(_config(base_url="https://proxy.example/anthropic"))
+        openai_adapter = get_adapter(_config("openai"))
+        assert other_key is not first and other_url is not first
+        assert isinstance(openai_adapter, OpenAIAdapter)
+        # One keep-alive pool and one request limiter per provider.
+        assert first._client._client is other_key._client._client
+        assert first._limiter is other_key._limiter
+        assert openai_adapter._client._client is not first._client._client
+        await close_llm_clients()
+        assert first._client._client.is_closed
+        assert get_adapter(_config()) is not first
+        await close_llm_clients()
+
+    asyncio.run(_run())
+
+
+def test_adapters_are_scoped_per_event_loop_and_reset() -> None:
+    async def _get() -> AnthropicAdapter | OpenAIAdapter:
+        return get_adapter(_config("qwen"))
+
+    assert asyncio.run(_get()) is not asyncio.run(_get())
+    reset_llm_clients()
+    assert len(llm_adapter._llm_clients_by_loop) == 0
+    # Outside a loop an unpooled adapter is returned.
+    assert get_adapter(_config("qwen")) is not get_adapter(_config("qwen"))
+
+
+class _SlowMessages:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **_kwargs: Any) -> Any:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(content=[], usage=None)
+
+
+def test_concurrent_calls_are_bounded_per_provider(monkeypatch: Any) -> None:
+    monkeypatch.setattr(llm_adapter.settings, "LLM_MAX_CONCURRENT_REQUESTS", 2)
+    fake = _SlowMessages()
+
+    async def _run() -> None:
+        adapters = [get_adapter(_config(api_key=f"key-{i}")) for i in range(3)]
+        for adapter in adapters:
+            adapter._client = SimpleNamespace(messages=fake)  # type: ignore[assignment]
+        await asyncio.gather(*(
+            adapters[i % 3].complete(model="m", system="s", messages=[{"role": "user", "content": "hi"}])
+            for i in range(6)
+        ))
+        await close_llm_clients()
+
+    asyncio.run(_run())
+    assert fake.peak == 2
@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from services.llm_adapter import AnthropicAdapter, LLMConfig, StreamEvent, ToolDef, get_adapter
+
+
+class _FakeStream:
+    def __init__(self, usage: Any) -> None:
+        self._usage = usage
+
+    async def __aenter__(self) -> "_FakeStream":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def __aiter__(self) -> "_FakeStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        raise StopAsyncIteration
+
+    async def get_final_message(self) -> Any:
+        return SimpleNamespace(usage=self._usage)
+
+
+class _FakeMessages:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def stream(self, **kwargs: Any) -> _FakeStream:
+        self.calls.append(kwargs)
+        return _FakeStream(SimpleNamespace(
+            input_tokens=200, output_tokens=50, cache_read_input_tokens=9000, cache_creation_input_tokens=800,
+        ))
+
+
+def _run_stream(adapter: AnthropicAdapter, **kwargs: Any) -> tuple[dict[str, Any], list[StreamEvent]]:
+    fake = _FakeMessages()
+    adapter._client = SimpleNamespace(messages=fake)  # type: ignore[assignment]
+
+    async def _collect() -> list[StreamEvent]:
+        return [event async for event in adapter.stream(model="claude-test", **kwargs)]
+
+    events = asyncio.run(_collect())
+    return fake.calls[0], events
+
+
+_TOOLS = [
+    ToolDef(name="run_sql_query", description="q", input_schema={"type": "object"}),
+    ToolDef(name="web_search", description="s", input_schema={"type": "object"}),
+]
+
+
+def test_breakpoints_cover_tools_system_segments_and_newest_message() -> None:
+    history: list[dict[str, Any]] = [
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": [
+            {"type": "thinking", "thinking": "...", "signature": "sig"},
+            {"type": "tool_use", "id": "t1", "name": "run_sql_query", "input": {}},
+        ]},
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "rows"}]},
+    ]
+
+    api_kwargs, _ = _run_stream(
+        AnthropicAdapter(api_key="k"),
+        system=["static rules", "time: now"],
+        messages=history,
+        tools=_TOOLS,
+    )
+
+    ephemeral = {"type": "ephemeral"}
+    assert "cache_control" not in api_kwargs["tools"][0]
+    assert api_kwargs["tools"][-1]["cache_control"] == ephemeral
+    assert api_kwargs["system"] == [
+        {"type": "text", "text": "static rules", "cache_control": ephemeral},
+        {"type": "text", "text": "time: now", "cache_control": ephemeral},
+    ]
+    assert api_kwargs["messages"][-1]["content"][-1]["cache_control"] == ephemeral
+    assert all("cache_control" not in str(msg) for msg in api_kwargs["messages"][:-1])
+    # The caller's history is not mutated.
+    assert "cache_control" not in history[-1]["content"][0]
+
+
+def test_string_message_and_thinking_blocks_are_handled() -> None:
+    api_kwargs, _ = _run_stream(
+        AnthropicAdapter(api_key="k"), system="one prompt", messages=[{"role": "user", "content": "hi"}],
+    )
+    assert api_kwargs["system"] == [{"type": "text", "text": "one prompt", "cache_control": {"type": "ephemeral"}}]
+    assert api_kwargs["messages"] == [
+        {"role": "user", "content": [{"type": "text", "text": "hi", "cache_control": {"type": "ephemeral"}}]},
+    ]
+
+    thinking_only = [{"role": "assistant", "content": [{"type": "thinking", "thinking": "x", "signature": "s"}]}]
+    api_kwargs, _ = _run_stream(AnthropicAdapter(api_key="k"), system="p", messages=thinking_only)
+    assert api_kwargs["messages"] == thinking_only
+
+
+def test_usage_reports_full_prompt_and_cache_breakdown() -> None:
+    _, events = _run_stream(AnthropicAdapter(api_key="k"), system="p", messages=[{"role": "user", "content": "hi"}])
+
+    (usage,) = [event for event in events if event.type == "usage"]
+    assert usage.input_tokens == 10_000
+    assert usage.cache_read_input_tokens == 9000
+    assert usage.cache_creation_input_tokens == 800
+
+
+def test_providers_without_prompt_caching_get_plain_requests() -> None:
+    adapter = get_adapter(LLMConfig(
+        provider="minimax", primary_model="m", cheap_model="m", workflow_model="m", api_key="k",
+    ))
+    assert isinstance(adapter, AnthropicAdapter)
+
+    api_kwargs, _ = _run_stream(
+        adapter, system=["static", "tail"], messages=[{"role": "user", "content": "hi"}], tools=_TOOLS,
+    )
+
+    assert api_kwargs["system"] == "statictail"
+    assert "cache_control" not in str(api_kwargs)
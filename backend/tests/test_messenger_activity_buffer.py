@@ -0,0 +1,87 @@
+"""Tests for the write-behind messenger activity buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from messengers import activity_buffer as buffer_module
+from messengers.activity_buffer import ActivityWriteBuffer, get_activity_buffer_stats
+
+
+@pytest.fixture
+def writes(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, list[dict[str, Any]]]]:
+    calls: list[tuple[str, list[dict[str, Any]]]] = []
+
+    async def _insert(organization_id: str, rows: list[dict[str, Any]]) -> None:
+        if organization_id == "org-broken":
+            raise RuntimeError("db down")
+        calls.append((organization_id, rows))
+
+    monkeypatch.setattr(buffer_module, "_insert_activity_rows", _insert)
+    return calls
+
+
+def _row(source_id: str, subject: str = "#general") -> dict[str, Any]:
+    return {"source_system": "slack", "source_id": source_id, "subject": subject}
+
+
+def test_rows_are_coalesced_per_org_and_flushed_after_the_delay(
+    writes: list[tuple[str, list[dict[str, Any]]]],
+) -> None:
+    buffer = ActivityWriteBuffer(max_rows=100, max_delay_seconds=0.05)
+
+    async def _run() -> int:
+        await buffer.add("org-1", _row("C1:1"))
+        await buffer.add("org-1", _row("C1:1", subject="#duplicate"))
+        await buffer.add("org-1", _row("C1:2"))
+        await buffer.add("org-2", _row("C9:1"))
+        depth = buffer.depth
+        await asyncio.sleep(0.15)
+        await buffer.close()
+        return depth
+
+    assert asyncio.run(_run()) == 3
+    assert sorted((org, [row["source_id"] for row in rows]) for org, rows in writes) == [
+        ("org-1", ["C1:1", "C1:2"]),
+        ("org-2", ["C9:1"]),
+    ]
+    # The first row for a source id wins, like ON CONFLICT DO NOTHING.
+    assert writes[0][1][0]["subject"] == "#general"
+
+
+def test_size_threshold_flushes_without_waiting(writes: list[tuple[str, list[dict[str, Any]]]]) -> None:
+    buffer = ActivityWriteBuffer(max_rows=3, max_delay_seconds=30.0)
+
+    async def _run() -> None:
+        for n in range(3):
+            await buffer.add("org-1", _row(f"C1:{n}"))
+        await asyncio.sleep(0.05)
+        assert [len(rows) for _, rows in writes] == [3]
+        assert buffer.depth == 0
+        await buffer.close()
+
+    asyncio.run(_run())
+
+
+def test_close_flushes_pending_rows_and_failures_are_counted(
+    writes: list[tuple[str, list[dict[str, Any]]]],
+) -> None:
+    buffer = ActivityWriteBuffer(max_rows=100, max_delay_seconds=30.0)
+    before = get_activity_buffer_stats()
+
+    async def _run() -> None:
+        await buffer.add("org-1", _row("C1:1"))
+        await buffer.add("org-broken", _row("C2:1"))
+        await buffer.close()
+
+    asyncio.run(_run())
+
+    stats = get_activity_buffer_stats()
+    assert writes == [("org-1", [_row("C1:1")])]
+    assert stats["rows_written"] - before["rows_written"] == 1
+    assert stats["rows_dropped"] - before["rows_dropped"] == 1
+    assert stats["flushes"] - before["flushes"] == 1
+    assert stats["last_flush_ms"] >= 0 and "avg_flush_ms" in stats
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+
+from agents.orchestrator import _TurnSetup
+
+
+def test_independent_stages_run_concurrently_and_dependencies_wait() -> None:
+    order: list[str] = []
+
+    async def _load(name: str, seconds: float) -> str:
+        order.append(f"{name}:start")
+        await asyncio.sleep(seconds)
+        order.append(f"{name}:end")
+        return name
+
+    async def _run() -> tuple[dict[str, object], float, _TurnSetup]:
+        setup = _TurnSetup()
+        setup.add("history", lambda: _load("history", 0.1))
+        setup.add("user_context", lambda: _load("user_context", 0.1))
+        setup.add("manifest", lambda: _load("manifest", 0.1))
+        setup.add("profile", lambda: _load("profile", 0.05), after=("user_context", "missing"))
+        started = time.perf_counter()
+        results = await setup.results()
+        return results, time.perf_counter() - started, setup
+
+    results, elapsed, setup = asyncio.run(_run())
+
+    assert results == {"history": "history", "user_context": "user_context", "manifest": "manifest", "profile": "profile"}
+    # Three 100ms loads overlap; the profile runs only after the user context.
+    assert elapsed < 0.25
+    assert order.index("profile:start") > order.index("user_context:end")
+    assert set(setup.timings_ms) == set(results)
+    assert setup.timings_ms["profile"] < 100
+    assert setup.summary().startswith("total=")
+
+
+def test_failed_stage_cancels_the_rest() -> None:
+    cancelled: list[str] = []
+
+    async def _slow() -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def _boom() -> None:
+        raise RuntimeError("db down")
+
+    async def _run() -> None:
+        setup = _TurnSetup()
+        setup.add("slow", _slow)
+        setup.add("boom", _boom)
+        try:
+            await setup.results()
+        finally:
+            await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="db down"):
+        asyncio.run(_run())
+    assert cancelled == ["slow"]
@@ -0,0 +1,127 @@
+"""Tests for off-loop PDF rendering with a content-hash cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional
+
+import pytest
+
+from services import pdf_renderer
+from services.pdf_renderer import PdfRenderBusyError, get_pdf_render_stats, render_pdf
+
+
+@pytest.fixture
+def renders(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def _fake_render(markdown_content: str, custom_css: Optional[str]) -> bytes:
+        with lock:
+            calls.append(markdown_content)
+        time.sleep(0.05)
+        return f"%PDF {markdown_content} {custom_css or ''}".encode()
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(pdf_renderer, "_render", _fake_render)
+    monkeypatch.setattr(pdf_renderer, "_get_executor", lambda: executor)
+    monkeypatch.setattr(pdf_renderer, "_cache", type(pdf_renderer._cache)())
+    monkeypatch.setattr(pdf_renderer, "_cached_bytes", 0)
+    yield calls
+    executor.shutdown(wait=True)
+
+
+def test_identical_exports_share_one_render_and_hit_the_cache(renders: list[str]) -> None:
+    before = get_pdf_render_stats()
+
+    async def _run() -> tuple[list[bytes], bytes, bytes]:
+        burst = await asyncio.gather(*(render_pdf("# Q3 report") for _ in range(5)))
+        again = await render_pdf("# Q3 report")
+        styled = await render_pdf("# Q3 report", custom_css="h1 { color: red; }")
+        return burst, again, styled
+
+    burst, again, styled = asyncio.run(_run())
+
+    assert renders == ["# Q3 report", "# Q3 report"]
+    assert set(burst) == {again} and styled != again
+    stats = get_pdf_render_stats()
+    assert stats["coalesced"] - before["coalesced"] == 4
+    assert stats["cache_hits"] - before["cache_hits"] == 1
+    assert stats["cache_entries"] == 2
+
+
+def test_event_loop_keeps_ticking_and_full_queue_is_rejected(
+    renders: list[str], monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pdf_renderer.settings, "PDF_RENDER_MAX_PENDING", 2)
+
+    async def _run() -> int:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        exports = [asyncio.create_task(render_pdf(f"# Report {n}")) for n in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PdfRenderBusyError):
+            await render_pdf("# One too many")
+        await asyncio.gather(*exports)
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(_run()) >= 3
+    assert sorted(renders) == ["# Report 0", "# Report 1"]
+
+
+def test_cache_evicts_least_recently_used_bytes(renders: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every fake PDF is 16 bytes, so four fit in the budget.
+    monkeypatch.setattr(pdf_renderer.settings, "PDF_RENDER_CACHE_MAX_BYTES", 64)
+
+    async def _run() -> None:
+        for name in ("a", "b", "c", "d", "a", "e", "b"):
+            await render_pdf(name * 10)
+
+    asyncio.run(_run())
+
+    # "a" was touched before "e" arrived, so "b" was the one evicted.
+    assert [doc[0] for doc in renders] == ["a", "b", "c", "d", "e", "b"]
+    assert get_pdf_render_stats()["cached_bytes"] == 64
+
+
+def test_broken_pool_is_replaced_and_the_render_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _BrokenPool(Executor):
+        shut_down = False
+
+        def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def]
+            future: Future[bytes] = Future()
+            future.set_exception(BrokenProcessPool("worker killed"))
+            return future
+
+        def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+            self.shut_down = True
+
+    broken = _BrokenPool()
+    healthy = ThreadPoolExecutor(max_workers=1)
+    pools: list[Executor] = [broken, healthy]
+    monkeypatch.setattr(pdf_renderer, "ProcessPoolExecutor", lambda **_kwargs: pools.pop(0))
+    monkeypatch.setattr(pdf_renderer, "_executor", None)
+    monkeypatch.setattr(pdf_renderer, "_render", lambda markdown, _css: f"%PDF {markdown}".encode())
+    monkeypatch.setattr(pdf_renderer, "_cache", type(pdf_renderer._cache)())
+    monkeypatch.setattr(pdf_renderer, "_cached_bytes", 0)
+    restarts_before = get_pdf_render_stats()["pool_restarts"]
+
+    try:
+        assert asyncio.run(render_pdf("# after crash")) == b"%PDF # after crash"
+        assert broken.shut_down
+        assert pdf_renderer._executor is healthy
+        assert get_pdf_render_stats()["pool_restarts"] - restarts_before == 1
+    finally:
+        healthy.shutdown(wait=True)
@@ -0,0 +1,147 @@
+"""Tests for streaming (batched) persistence of connector sync results."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import pytest
+
+from connectors import persistence
+from connectors.base import BaseConnector
+from connectors.models import DealRecord
+
+
+_ORG_ID: str = "00000000-0000-0000-0000-000000000000"
+
+
+class _FakeSession:
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    async def execute(self, _stmt: Any) -> None:
+        self._log.append("execute")
+
+    async def commit(self) -> None:
+        self._log.append("commit")
+
+
+def _install_fakes(monkeypatch: pytest.MonkeyPatch) -> tuple[list[int], list[str]]:
+    """Capture upserted batch sizes and session calls without a database."""
+    batches: list[int] = []
+    log: list[str] = []
+
+    @asynccontextmanager
+    async def _fake_get_session(**_kwargs: Any) -> AsyncIterator[_FakeSession]:
+        yield _FakeSession(log)
+
+    async def _fake_upsert_rows(
+        session: _FakeSession,
+        entity: str,
+        config: dict[str, Any],
+        rows: list[dict[str, Any]],
+        now: Any,
+    ) -> None:
+        batches.append(len(rows))
+        await session.execute(None)
+
+    monkeypatch.setattr(persistence, "get_session", _fake_get_session)
+    monkeypatch.setattr(persistence, "_upsert_rows", _fake_upsert_rows)
+    return batches, log
+
+
+async def _deal_stream(count: int) -> AsyncIterator[DealRecord]:
+    for i in range(count):
+        yield DealRecord(source_id=str(i), name=f"Deal {i}")
+
+
+def test_stream_flushes_bounded_batches_and_commits_each(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches, log = _install_fakes(monkeypatch)
+    progress: list[tuple[int, int]] = []
+
+    async def _on_batch(batch_count: int, total: int) -> None:
+        progress.append((batch_count, total))
+
+    total = asyncio.run(
+        persistence.persist_record_stream(
+            _ORG_ID, "deals", _deal_stream(25), "test", batch_size=10, on_batch=_on_batch,
+        )
+    )
+
+    assert total == 25
+    assert batches == [10, 10, 5]
+    assert log.count("commit") == 3
+    assert progress == [(10, 10), (10, 20), (5, 25)]
+
+
+def test_stream_batch_size_clamped_by_bind_param_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches, _log = _install_fakes(monkeypatch)
+    monkeypatch.setattr(persistence, "_PG_MAX_BIND_PARAMS", 40)
+
+    total = asyncio.run(
+        persistence.persist_record_stream(
+            _ORG_ID, "deals", _deal_stream(12), "test", batch_size=1000,
+        )
+    )
+
+    # A deal row has 12 columns, so at most 3 rows fit under 40 params.
+    assert total == 12
+    assert batches == [3, 3, 3, 3]
+
+
+def test_stream_unknown_entity_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches, _log = _install_fakes(monkeypatch)
+    total = asyncio.run(
+        persistence.persist_record_stream(_ORG_ID, "widgets", _deal_stream(3), "test")
+    )
+    assert total == 0
+    assert batches == []
+
+
+def test_max_rows_per_statement() -> None:
+    assert persistence._max_rows_per_statement(12) == 32767 // 12
+    assert persistence._max_rows_per_statement(0) == 32767
+    assert persistence._max_rows_per_statement(10**6) == 1
+
+
+class _StreamingConnector(BaseConnector):
+    source_system = "test"
+    _STREAM_BATCH_SIZE = 4
+
+    async def sync_deals(self) -> AsyncIterator[DealRecord]:  # type: ignore[override]
+        for i in range(9):
+            yield DealRecord(source_id=str(i), name=f"Deal {i}")
+
+    async def sync_accounts(self) -> int:
+        return 0
+
+    async def sync_contacts(self) -> int:
+        return 0
+
+    async def sync_activities(self) -> int:
+        return 0
+
+    async def fetch_deal(self, deal_id: str) -> dict[str, Any]:
+        return {"id": deal_id}
+
+
+def test_sync_all_streams_async_generator_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches, _log = _install_fakes(monkeypatch)
+    checkpoints: list[tuple[str, int]] = []
+    connector = _StreamingConnector(organization_id=_ORG_ID)
+
+    async def _noop_ensure(_stage: str) -> None:
+        return None
+
+    async def _fake_checkpoint(entity: str, total: int) -> None:
+        checkpoints.append((entity, total))
+
+    monkeypatch.setattr(connector, "ensure_sync_active", _noop_ensure)
+    monkeypatch.setattr(connector, "_record_stream_checkpoint", _fake_checkpoint)
+
+    result = asyncio.run(connector.sync_all())
+
+    assert result["deals"] == 9
+    assert batches == [4, 4, 1]
+    assert checkpoints == [("deals", 4), ("deals", 8), ("deals", 9)]
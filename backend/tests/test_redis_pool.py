@@ -0,0 +1,37 @@
+"""Tests for the per-event-loop pooled Redis clients."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from services import redis_pool
+
+
+def test_clients_are_pooled_per_loop_and_decode_mode() -> None:
+    async def _clients() -> tuple[Any, Any, Any]:
+        return (
+            redis_pool.get_redis_client(),
+            redis_pool.get_redis_client(),
+            redis_pool.get_redis_client(decode_responses=False),
+        )
+
+    first, again, binary = asyncio.run(_clients())
+    other_loop, _, _ = asyncio.run(_clients())
+
+    assert first is again
+    assert binary is not first
+    assert other_loop is not first
+    redis_pool.reset_redis_clients()
+
+
+def test_close_forgets_the_running_loops_clients() -> None:
+    async def _scenario() -> tuple[Any, Any]:
+        before = redis_pool.get_redis_client()
+        await redis_pool.close_redis_clients()
+        return before, redis_pool.get_redis_client()
+
+    before, after = asyncio.run(_scenario())
+
+    assert after is not before
+    redis_pool.reset_redis_clients()
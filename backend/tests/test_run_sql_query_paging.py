@@ -0,0 +1,162 @@
+"""Tests for streamed, budgeted paging in the run_sql_query tool."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import pytest
+
+from agents import tools
+
+
+_ORG_ID: str = "00000000-0000-0000-0000-000000000001"
+_USER_ID: str = "00000000-0000-0000-0000-000000000002"
+
+
+class _FakeStreamResult:
+    def __init__(self, rows: list[tuple[Any, ...]], consumed: list[int]) -> None:
+        self._rows = rows
+        self._consumed = consumed
+        self.closed = False
+
+    def keys(self) -> list[str]:
+        return ["id", "name"]
+
+    async def __aiter__(self) -> AsyncIterator[tuple[Any, ...]]:
+        for row in self._rows:
+            self._consumed[0] += 1
+            yield row
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSession:
+    def __init__(self, table: list[tuple[Any, ...]], log: dict[str, Any]) -> None:
+        self._table = table
+        self._log = log
+
+    async def stream(self, statement: Any, execution_options: dict[str, Any] | None = None) -> _FakeStreamResult:
+        sql = str(statement)
+        self._log["queries"].append(sql)
+        offset = int(sql.rsplit("OFFSET", 1)[1]) if "OFFSET" in sql else 0
+        limit = int(sql.rsplit("LIMIT", 1)[1].split()[0]) if "LIMIT" in sql else len(self._table)
+        result = _FakeStreamResult(self._table[offset:offset + limit], self._log["consumed"])
+        self._log["results"].append(result)
+        return result
+
+
+@pytest.fixture
+def fake_db(monkeypatch: pytest.MonkeyPatch):
+    def _install(table: list[tuple[Any, ...]]) -> dict[str, Any]:
+        log: dict[str, Any] = {"queries": [], "consumed": [0], "results": [], "cursors": {}}
+
+        @asynccontextmanager
+        async def _fake_get_session(**_kwargs: Any) -> AsyncIterator[_FakeSession]:
+            yield _FakeSession(table, log)
+
+        async def _store(state: dict[str, Any]) -> str:
+            token = f"c{len(log['cursors'])}"
+            log["cursors"][token] = state
+            return token
+
+        async def _load(token: str) -> dict[str, Any] | None:
+            return log["cursors"].get(token)
+
+        monkeypatch.setattr(tools, "get_session", _fake_get_session)
+        monkeypatch.setattr(tools, "_store_sql_cursor", _store)
+        monkeypatch.setattr(tools, "_load_sql_cursor", _load)
+        return log
+
+    return _install
+
+
+def _run(params: dict[str, Any], user_id: str | None = _USER_ID) -> dict[str, Any]:
+    return asyncio.run(tools._run_sql_query(params, _ORG_ID, user_id))
+
+
+def test_small_result_has_no_cursor(fake_db) -> None:
+    log = fake_db([(i, f"deal {i}") for i in range(3)])
+
+    result = _run({"query": "SELECT id, name FROM deals"})
+
+    assert result["row_count"] == 3
+    assert "next_cursor" not in result
+    assert log["results"][0].closed
+
+
+def test_row_cap_applies_even_with_explicit_limit_and_pages_through(fake_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_SQL_PAGE_MAX_ROWS", 10)
+    log = fake_db([(i, f"deal {i}") for i in range(25)])
+
+    first = _run({"query": "SELECT id, name FROM deals ORDER BY id LIMIT 5000"})
+    assert first["row_count"] == 10
+    assert first["has_more"] is True
+    assert first["truncated_reason"] == "row_limit"
+    # Only the page plus one look-ahead row were pulled from the server.
+    assert log["consumed"][0] == 11
+
+    second = _run({"cursor": first["next_cursor"]})
+    assert [row["id"] for row in second["rows"]] == list(range(10, 20))
+    assert second["offset"] == 10
+    assert log["queries"][-1].endswith("AS _sql_page LIMIT 11 OFFSET 10")
+
+    third = _run({"cursor": second["next_cursor"]})
+    assert [row["id"] for row in third["rows"]] == list(range(20, 25))
+    assert "next_cursor" not in third
+
+
+def test_byte_budget_stops_page(fake_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_SQL_PAGE_MAX_BYTES", 250)
+    fake_db([(i, "x" * 100) for i in range(10)])
+
+    result = _run({"query": "SELECT id, name FROM deals"})
+
+    assert result["row_count"] == 2
+    assert result["truncated_reason"] == "size_limit"
+    assert result["next_cursor"]
+
+
+def test_cursor_is_bound_to_org_and_user(fake_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_SQL_PAGE_MAX_ROWS", 1)
+    fake_db([(1, "a"), (2, "b")])
+
+    first = _run({"query": "SELECT id, name FROM deals"})
+    other_user = _run({"cursor": first["next_cursor"]}, user_id="00000000-0000-0000-0000-000000000003")
+
+    assert "expired or not found" in other_user["error"]
+    assert "expired or not found" in _run({"cursor": "missing"})["error"]
+
+
+def test_query_without_limit_is_bounded_in_place(fake_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_SQL_PAGE_MAX_ROWS", 10)
+    log = fake_db([(i, f"deal {i}") for i in range(25)])
+
+    first = _run({"query": "SELECT id, name FROM deals ORDER BY id;"})
+    _run({"cursor": first["next_cursor"]})
+
+    # The bound is appended to the query itself so ORDER BY stays a top-N sort.
+    assert log["queries"] == [
+        "SELECT id, name FROM deals ORDER BY id LIMIT 11 OFFSET 0",
+        "SELECT id, name FROM deals ORDER BY id LIMIT 11 OFFSET 10",
+    ]
+
+
+def test_continuation_reuses_resolved_semantic_embeds(fake_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_SQL_PAGE_MAX_ROWS", 1)
+    fake_db([(1, "a"), (2, "b"), (3, "c")])
+    embed_calls: list[str] = []
+
+    async def _fake_resolve(query: str) -> tuple[str, str | None]:
+        embed_calls.append(query)
+        return query.replace("semantic_embed('x')", "'[0.1]'::vector"), None
+
+    monkeypatch.setattr(tools, "_resolve_semantic_embeds", _fake_resolve)
+
+    first = _run({"query": "SELECT id, name FROM activities ORDER BY embedding <=> semantic_embed('x')"})
+    second = _run({"cursor": first["next_cursor"]})
+
+    assert [row["id"] for row in second["rows"]] == [2]
+    assert len(embed_calls) == 1
@@ -0,0 +1,98 @@
+"""Tests that /api/search issues one joined query per entity type."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.routes import search as search_routes
+
+
+class _FakeResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, responses: list[list[Any]], statements: list[str]) -> None:
+        self._responses = responses
+        self._statements = statements
+
+    async def execute(self, statement: Any) -> _FakeResult:
+        self._statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _FakeResult(self._responses.pop(0))
+
+    async def get(self, *_args: Any) -> None:
+        raise AssertionError("search must not issue per-row lookups")
+
+
+def _run_search(
+    monkeypatch: pytest.MonkeyPatch, responses: list[list[Any]], q: str = "acme"
+) -> tuple[search_routes.SearchResponse, list[str], dict[str, Any]]:
+    statements: list[str] = []
+    session_kwargs: dict[str, Any] = {}
+
+    @asynccontextmanager
+    async def _fake_get_session(**kwargs: Any) -> AsyncIterator[_FakeSession]:
+        session_kwargs.update(kwargs)
+        yield _FakeSession(responses, statements)
+
+    monkeypatch.setattr(search_routes, "get_session", _fake_get_session)
+    auth = SimpleNamespace(organization_id=UUID(int=1), user_id=UUID(int=2))
+    response = asyncio.run(search_routes.search(q=q, limit=10, auth=auth))  # type: ignore[arg-type]
+    return response, statements, session_kwargs
+
+
+def test_search_uses_two_queries_with_sql_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    deal_id, account_id = uuid4(), uuid4()
+    deal_rows = [
+        SimpleNamespace(
+            id=deal_id, name="Acme renewal", amount=1200, stage="won",
+            close_date=date(2026, 1, 2), account_name="Acme", owner_name=None,
+            owner_email="rep@example.com", total=37,
+        )
+    ]
+    account_rows = [
+        SimpleNamespace(
+            id=account_id, name="Acme", domain="acme.com", industry=None,
+            annual_revenue=None, deal_count=4, total=2,
+        )
+    ]
+
+    response, statements, session_kwargs = _run_search(monkeypatch, [deal_rows, account_rows])
+
+    assert len(statements) == 2
+    deals_sql, accounts_sql = statements
+    assert "LEFT OUTER JOIN accounts" in deals_sql
+    assert "LEFT OUTER JOIN users" in deals_sql
+    assert "count(*) OVER ()" in deals_sql
+    assert "count(*) OVER ()" in accounts_sql
+    assert "count(deals.id)" in accounts_sql
+
+    assert response.total_deals == 37
+    assert response.deals[0].owner_name == "rep@example.com"
+    assert response.deals[0].account_name == "Acme"
+    assert response.total_accounts == 2
+    assert response.accounts[0].deal_count == 4
+    assert session_kwargs["organization_id"] == str(UUID(int=1))
+
+
+def test_search_with_no_matches_reports_zero_totals(monkeypatch: pytest.MonkeyPatch) -> None:
+    response, _statements, _kwargs = _run_search(monkeypatch, [[], []])
+
+    assert response.total_deals == 0
+    assert response.total_accounts == 0
+
+
+def test_like_wildcards_in_query_are_escaped() -> None:
+    assert search_routes._escape_like("50%_off\\") == "50\\%\\_off\\\\"
@@ -116,7 +116,7 @@ async def test_gmail_connector_send_email_applies_footer(monkeypatch: pytest.Mon
     async def _mock_get_headers(self: GmailConnector) -> dict[str, str]:
         return {"Authorization": "Bearer test", "Content-Type": "application/json"}
 
-    monkeypatch.setattr("connectors.gmail.httpx.AsyncClient", _MockClient)
+    monkeypatch.setattr(GmailConnector, "http_client", lambda self, **kwargs: _MockClient())
     monkeypatch.setattr(GmailConnector, "_get_headers", _mock_get_headers)
 
     connector = GmailConnector(
@@ -166,7 +166,7 @@ async def test_microsoft_connector_send_email_applies_footer(monkeypatch: pytest
     async def _mock_get_headers(self: MicrosoftMailConnector) -> dict[str, str]:
         return {"Authorization": "Bearer test", "Content-Type": "application/json"}
 
-    monkeypatch.setattr("connectors.microsoft_mail.httpx.AsyncClient", _MockClient)
+    monkeypatch.setattr(MicrosoftMailConnector, "http_client", lambda self, **kwargs: _MockClient())
     monkeypatch.setattr(MicrosoftMailConnector, "_get_headers", _mock_get_headers)
 
     connector = MicrosoftMailConnector(
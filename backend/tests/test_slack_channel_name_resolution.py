@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 
 from messengers.slack import SlackMessenger
+from messengers.activity_buffer import activity_buffer
 from messengers.base import InboundMessage, MessageType
 
 @pytest.mark.asyncio
@@ -87,10 +88,11 @@ async def test_persist_channel_activity_uses_channel_name():
     mock_insert_obj.values.return_value = mock_insert_obj
     mock_insert_obj.on_conflict_do_nothing.return_value = mock_insert_obj
 
-    with patch("messengers._workspace.get_session", return_value=MagicMock(__aenter__=AsyncMock(return_value=mock_session))), \
-         patch("messengers._workspace.pg_insert", return_value=mock_insert_obj):
+    with patch("messengers.activity_buffer.get_session", return_value=MagicMock(__aenter__=AsyncMock(return_value=mock_session))), \
+         patch("messengers.activity_buffer.pg_insert", return_value=mock_insert_obj):
         
         await messenger.persist_channel_activity(message, org_id)
+        await activity_buffer.close()
         
         # Verify pg_insert was called with Activity model
         from models.activity import Activity
@@ -100,7 +102,7 @@ async def test_persist_channel_activity_uses_channel_name():
         # Verify values() was called with correct subject and custom_fields
         assert mock_insert_obj.values.called
         values_args, values_kwargs = mock_insert_obj.values.call_args
-        passed_values = values_args[0] if values_args else values_kwargs
+        (passed_values,) = values_args[0]
         
         assert passed_values["subject"] == f"#{channel_name}"
         assert passed_values["custom_fields"]["channel_name"] == channel_name
@@ -0,0 +1,108 @@
+"""Tests for pushing workflow tool status to websockets over the fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from agents.orchestrator import ChatOrchestrator
+from api import websockets
+from services import websocket_fanout as fanout_module
+
+
+class _FakeWebSocket:
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self._fail = fail
+
+    async def send_text(self, message: str) -> None:
+        if self._fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(json.loads(message))
+
+
+async def _settle(fanout: fanout_module.WebSocketFanout) -> None:
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+        await fanout.drain()
+
+
+def test_worker_tool_progress_reaches_api_sockets_over_the_org_channel(monkeypatch: pytest.MonkeyPatch) -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+    api_fanout = fanout_module.WebSocketFanout(websockets._fanout_message, broker)
+    # The worker process raising the event holds no sockets of its own.
+    worker_fanout = fanout_module.WebSocketFanout(websockets._fanout_message, broker)
+    monkeypatch.setattr(websockets, "sync_broadcaster", websockets.SyncProgressBroadcaster(worker_fanout))
+    ws = _FakeWebSocket()
+
+    async def _scenario() -> None:
+        api_fanout.start()
+        await _settle(api_fanout)
+        await api_fanout.add(fanout_module.org_channel("org-1"), ws)
+        await websockets.broadcast_tool_progress("org-1", "conv-1", "tool-1", "foreach", {"done": 1})
+        await _settle(api_fanout)
+        await api_fanout.stop()
+
+    asyncio.run(_scenario())
+
+    assert ws.sent == [{
+        "type": "tool_progress", "conversation_id": "conv-1", "tool_id": "tool-1",
+        "tool_name": "foreach", "result": {"done": 1}, "status": "running",
+    }]
+
+
+def test_connect_snapshot_sends_running_workflow_tools(monkeypatch: pytest.MonkeyPatch) -> None:
+    update = {
+        "conversation_id": "conv-2", "tool_id": "tool-2", "tool_name": "run_sql_query",
+        "result": {}, "status": "running",
+    }
+
+    async def _collect(organization_id: str) -> list[dict[str, Any]]:
+        assert organization_id == "org-2"
+        return [update]
+
+    monkeypatch.setattr(websockets, "_collect_running_workflow_tool_updates", _collect)
+    ws = _FakeWebSocket()
+
+    asyncio.run(websockets._send_workflow_tool_snapshot(ws, "org-2"))  # type: ignore[arg-type]
+
+    assert ws.sent == [{"type": "tool_progress", **update}]
+
+
+def test_connect_snapshot_failure_is_swallowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _collect(_organization_id: str) -> list[dict[str, Any]]:
+        return [{"tool_id": "tool-3"}]
+
+    monkeypatch.setattr(websockets, "_collect_running_workflow_tool_updates", _collect)
+
+    asyncio.run(websockets._send_workflow_tool_snapshot(_FakeWebSocket(fail=True), "org-3"))  # type: ignore[arg-type]
+
+
+def test_orchestrator_publishes_each_running_workflow_tool(monkeypatch: pytest.MonkeyPatch) -> None:
+    published: list[dict[str, Any]] = []
+
+    async def _broadcast(**kwargs: Any) -> None:
+        if kwargs["tool_id"] == "bad":
+            raise ConnectionError("redis down")
+        published.append(kwargs)
+
+    monkeypatch.setattr(websockets, "broadcast_tool_progress", _broadcast)
+    orchestrator = ChatOrchestrator(
+        user_id=None,
+        organization_id="org-4",
+        conversation_id="conv-4",
+        workflow_context={"is_workflow": True},
+    )
+
+    asyncio.run(orchestrator._publish_running_tools_safe([  # noqa: SLF001
+        {"id": "bad", "name": "foreach"},
+        {"id": "tool-4", "name": "run_sql_query"},
+    ]))
+
+    assert published == [{
+        "organization_id": "org-4", "conversation_id": "conv-4", "tool_id": "tool-4",
+        "tool_name": "run_sql_query", "result": {}, "status": "running",
+    }]
@@ -1,6 +1,15 @@
+import random
 from datetime import date, datetime, timezone
 
-from services.topic_graph import _extract_candidate_nodes, _rank_evidence, _tokenize, iter_date_range, select_watermark_time
+from services.topic_graph import (
+    _canonicalize,
+    _canonicalize_bruteforce,
+    _extract_candidate_nodes,
+    _rank_evidence,
+    _tokenize,
+    iter_date_range,
+    select_watermark_time,
+)
 
 
 def test_watermark_prefers_source_event_time() -> None:
@@ -70,3 +79,23 @@ def test_rank_evidence_balances_sources() -> None:
     out = _rank_evidence(rows, "fundraising")
     slack_rows = [r for r in out if r.get("source") == "slack"]
     assert len(slack_rows) <= 2
+
+
+def test_canonicalize_merges_near_duplicates_into_earliest_best_match() -> None:
+    mapping = _canonicalize(["pitch deck", "pitch", "deck", "seed pitch deck", "kubernetes"], 0.5)
+    # Sorted visit order: deck, kubernetes, pitch, pitch deck, seed pitch deck.
+    assert mapping["pitch"] == "pitch"
+    # Ties ("deck" and "pitch" both score 0.5) go to the earliest canonical.
+    assert mapping["pitch deck"] == "deck"
+    # Below threshold against every canonical, so it becomes canonical itself.
+    assert mapping["seed pitch deck"] == "seed pitch deck"
+    assert mapping["kubernetes"] == "kubernetes"
+
+
+def test_canonicalize_matches_bruteforce_on_random_inputs() -> None:
+    rng = random.Random(42)
+    vocab = [f"t{i}" for i in range(60)]
+    nodes = [" ".join(rng.choices(vocab, k=rng.randint(1, 5))) for _ in range(800)]
+    nodes += ["  padded node  ", "", "   "]
+    for min_conf in (0.0, 0.25, 0.34, 0.5, 0.67, 1.0):
+        assert _canonicalize(nodes, min_conf) == _canonicalize_bruteforce(nodes, min_conf)
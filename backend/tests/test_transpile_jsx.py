@@ -0,0 +1,81 @@
+"""Tests for async, cached JSX transpilation."""
+
+from __future__ import annotations
+
+import asyncio
+import stat
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from utils import transpile_jsx as transpile_module
+from utils.transpile_jsx import transpile_jsx, transpile_jsx_async, transpile_jsx_batch
+
+_FAKE_ESBUILD = """#!{python}
+import sys
+source = sys.stdin.read()
+with open({log!r}, "a") as log:
+    log.write(source.replace("\\n", " ") + "\\n")
+if "SYNTAX_ERROR" in source:
+    sys.stderr.write("✘ [ERROR] Unexpected token")
+    sys.exit(1)
+sys.stdout.write("/* compiled */ " + source)
+"""
+
+
+@pytest.fixture
+def esbuild_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    log = tmp_path / "runs.log"
+    log.touch()
+    binary = tmp_path / "esbuild"
+    binary.write_text(_FAKE_ESBUILD.format(python=sys.executable, log=str(log)))
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(transpile_module, "_find_esbuild", lambda: str(binary))
+    monkeypatch.setattr(transpile_module, "_cache", OrderedDict())
+    return log
+
+
+def _runs(log: Path) -> int:
+    return len(log.read_text().splitlines())
+
+
+def test_async_transpile_strips_modules_and_caches_by_source(esbuild_runs: Path) -> None:
+    source = "import { Spinner } from '@revtops/app-sdk';\nexport default function Dashboard() { return <div/>; }"
+
+    async def _run() -> list[tuple[str, str] | None]:
+        return [await transpile_jsx_async(source), await transpile_jsx_async(source)]
+
+    first, second = asyncio.run(_run())
+
+    assert first == second
+    assert first is not None
+    compiled, component = first
+    assert component == "Dashboard"
+    assert compiled.startswith("/* compiled */") and "import" not in compiled and "export" not in compiled
+    assert _runs(esbuild_runs) == 1
+    # The sync path shares the cache.
+    assert transpile_jsx(source) == first and _runs(esbuild_runs) == 1
+
+
+def test_batch_dedupes_sources_and_reports_failures_in_order(esbuild_runs: Path) -> None:
+    good = "export default function App() { return <p/>; }"
+    other = "function Chart() { return <svg/>; }\nexport default Chart;"
+    broken = "export default function App() { SYNTAX_ERROR }"
+
+    results = asyncio.run(transpile_jsx_batch([good, broken, other, good]))
+
+    assert [r[1] if r else None for r in results] == ["App", None, "Chart", "App"]
+    assert results[0] is results[3]
+    assert _runs(esbuild_runs) == 3
+    # Failures are not cached.
+    assert asyncio.run(transpile_jsx_async(broken)) is None
+    assert _runs(esbuild_runs) == 4
+
+
+def test_missing_esbuild_returns_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(transpile_module, "_find_esbuild", lambda: None)
+    monkeypatch.setattr(transpile_module, "_cache", OrderedDict())
+
+    assert asyncio.run(transpile_jsx_async("export default function App() {}")) is None
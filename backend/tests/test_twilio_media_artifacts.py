@@ -0,0 +1,34 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+from messengers import _twilio_phone
+from services import attachment_store as attachment_store_module
+from services import file_handler
+
+
+def test_image_artifact_is_shared_before_its_url_is_returned(monkeypatch: pytest.MonkeyPatch) -> None:
+    shared: list[str] = []
+
+    async def _aput(entry: attachment_store_module.AttachmentEntry) -> None:
+        await asyncio.sleep(0)
+        shared.append(entry.upload_id)
+
+    def _put(_entry: attachment_store_module.AttachmentEntry) -> None:
+        raise AssertionError("store_file only shares in the background")
+
+    monkeypatch.setattr(file_handler.attachment_store, "aput", _aput)
+    monkeypatch.setattr(file_handler.attachment_store, "put", _put)
+    monkeypatch.setattr(_twilio_phone.settings, "TWILIO_WEBHOOK_URL", "https://api.example.com/twilio/webhook")
+    monkeypatch.setattr(file_handler, "generate_media_token", lambda upload_id: f"tok-{upload_id}")
+    chunk = json.dumps({
+        "type": "artifact",
+        "artifact": {"id": "a1", "mime_type": "image/png", "content": base64.b64encode(b"png").decode()},
+    })
+
+    urls = asyncio.run(_twilio_phone._extract_image_artifacts(chunk))
+
+    assert len(shared) == 1
+    assert urls == [f"https://api.example.com/twilio/media/tok-{shared[0]}"]
@@ -6,6 +6,7 @@ from typing import Any
 
 from api import websockets
 from services import task_manager as task_manager_module
+from services import websocket_fanout as fanout_module
 from services.task_manager import TaskManager
 
 
@@ -139,3 +140,184 @@ def test_task_manager_broadcast_snapshots_message_before_session_close(monkeypat
 
     asyncio.run(_run())
     assert captured_payloads == [{"id": "assistant-msg-1", "role": "assistant", "content_blocks": []}]
+
+
+def _fanout_processes(broker: fanout_module.InMemoryFanoutBroker, count: int) -> list[fanout_module.WebSocketFanout]:
+    return [fanout_module.WebSocketFanout(websockets._fanout_message, broker) for _ in range(count)]
+
+
+async def _settle(processes: list[fanout_module.WebSocketFanout]) -> None:
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+        for process in processes:
+            await process.drain()
+
+
+def test_events_reach_every_replica_exactly_once_in_one_batch() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+
+    async def _run() -> tuple[list[_FakeSocket], list[_FakeSocket], _FakeSocket]:
+        replicas = _fanout_processes(broker, 3)
+        worker = fanout_module.WebSocketFanout(websockets._fanout_message, broker)
+        org_sockets = [_FakeSocket() for _ in range(6)]
+        for i, ws in enumerate(org_sockets):
+            await replicas[i % 3].add(fanout_module.org_channel("org-1"), ws)
+        other_org = [_FakeSocket() for _ in range(3)]
+        for replica, ws in zip(replicas, other_org):
+            await replica.add(fanout_module.org_channel("org-2"), ws)
+        user_ws = _FakeSocket()
+        await replicas[2].add(fanout_module.user_channel("user-1"), user_ws)
+        for replica in replicas:
+            replica.start()
+        await _settle(replicas)
+
+        await asyncio.gather(
+            worker.publish(fanout_module.org_channel("org-1"), "a"),
+            worker.publish(fanout_module.org_channel("org-1"), "b"),
+            worker.publish(fanout_module.user_channel("user-1"), "c"),
+        )
+        await _settle(replicas)
+        for replica in replicas:
+            await replica.stop()
+        return org_sockets, other_org, user_ws
+
+    org_sockets, other_org, user_ws = asyncio.run(_run())
+
+    assert broker.publish_calls == 1
+    assert all(ws.messages == ["a", "b"] for ws in org_sockets)
+    assert all(ws.messages == [] for ws in other_org)
+    assert user_ws.messages == ["c"]
+
+
+def test_replica_subscribes_only_to_channels_with_local_sockets() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+
+    async def _run() -> tuple[int, int]:
+        (replica,) = _fanout_processes(broker, 1)
+        replica.start()
+        ws = _FakeSocket()
+        await replica.add(fanout_module.org_channel("org-1"), ws)
+        await _settle([replica])
+        subscribed = len(broker.subscribers[fanout_module.org_channel("org-1")])
+        replica.discard(fanout_module.org_channel("org-1"), ws)
+        await _settle([replica])
+        remaining = len(broker.subscribers[fanout_module.org_channel("org-1")])
+        await replica.stop()
+        return subscribed, remaining
+
+    assert asyncio.run(_run()) == (1, 0)
+
+
+def test_broker_outage_falls_back_to_local_sockets() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+    broker.available = False
+
+    async def _run() -> tuple[_FakeSocket, _FakeSocket, _FakeSocket]:
+        local, remote = _fanout_processes(broker, 2)
+        local_ws, stale_ws, remote_ws = _FakeSocket(), _FakeSocket(should_fail=True), _FakeSocket()
+        await local.add(fanout_module.org_channel("org-1"), local_ws)
+        await local.add(fanout_module.org_channel("org-1"), stale_ws)
+        await remote.add(fanout_module.org_channel("org-1"), remote_ws)
+        await local.publish(fanout_module.org_channel("org-1"), "event")
+        assert local.local_sockets(fanout_module.org_channel("org-1")) == {local_ws}
+        return local_ws, stale_ws, remote_ws
+
+    local_ws, stale_ws, remote_ws = asyncio.run(_run())
+
+    assert local_ws.messages == ["event"]
+    assert stale_ws.messages == []
+    assert remote_ws.messages == []
+
+
+def test_conversation_broadcast_skips_sender_and_batches_recipients() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+
+    async def _run() -> dict[str, list[str]]:
+        replicas = _fanout_processes(broker, 2)
+        broadcasters = [websockets.ConversationBroadcaster(replica) for replica in replicas]
+        sockets = {user: _FakeSocket() for user in ("u1", "u2", "u3")}
+        await broadcasters[0].register("u1", sockets["u1"])  # type: ignore[arg-type]
+        await broadcasters[1].register("u2", sockets["u2"])  # type: ignore[arg-type]
+        await broadcasters[1].register("u3", sockets["u3"])  # type: ignore[arg-type]
+        for replica in replicas:
+            replica.start()
+        await _settle(replicas)
+        await broadcasters[0].broadcast_to_users(["u1", "u2", "u3", "u2"], "new_message", {"x": 1}, exclude_user_id="u3")
+        await _settle(replicas)
+        for replica in replicas:
+            await replica.stop()
+        return {user: ws.messages for user, ws in sockets.items()}
+
+    received = asyncio.run(_run())
+
+    expected = '{"type": "new_message", "x": 1}'
+    assert received == {"u1": [expected], "u2": [expected], "u3": []}
+    assert broker.publish_calls == 1
+
+
+def test_add_returns_once_the_channel_is_subscribed() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+    broker.confirm_delay_seconds = 0.05
+
+    async def _run() -> tuple[int, list[str]]:
+        replica, worker = _fanout_processes(broker, 2)
+        replica.start()
+        await _settle([replica])
+        ws = _FakeSocket()
+        await replica.add(fanout_module.org_channel("org-1"), ws)
+        subscribed = len(broker.subscribers[fanout_module.org_channel("org-1")])
+        # Published by another process right after registration: not lost.
+        await worker.publish(fanout_module.org_channel("org-1"), "first")
+        await _settle([replica])
+        await replica.stop()
+        return subscribed, ws.messages
+
+    assert asyncio.run(_run()) == (1, ["first"])
+
+
+def test_same_process_publish_before_confirmation_is_delivered_once() -> None:
+    broker = fanout_module.InMemoryFanoutBroker()
+    broker.confirm_delay_seconds = 0.05
+
+    async def _run() -> tuple[list[str], int]:
+        (replica,) = _fanout_processes(broker, 1)
+        replica.start()
+        await _settle([replica])
+        ws = _FakeSocket()
+        registering = asyncio.create_task(replica.add(fanout_module.org_channel("org-1"), ws))
+        await asyncio.sleep(0.01)  # SUBSCRIBE routed, confirmation pending
+        await replica.publish(fanout_module.org_channel("org-1"), "early")
+        await registering
+        await _settle([replica])
+        await replica.stop()
+        return ws.messages, replica.local_fallback_deliveries
+
+    assert asyncio.run(_run()) == (["early"], 1)
+
+
+def test_reconnect_gap_is_counted_and_local_events_still_delivered(monkeypatch: Any) -> None:
+    monkeypatch.setattr(fanout_module, "_RECONNECT_BASE_SECONDS", 0.05)
+    broker = fanout_module.InMemoryFanoutBroker()
+
+    async def _run() -> tuple[list[str], list[str], int]:
+        replica, worker = _fanout_processes(broker, 2)
+        ws = _FakeSocket()
+        replica.start()
+        await _settle([replica])
+        await replica.add(fanout_module.org_channel("org-1"), ws)
+        broker.drop_subscriptions()
+        await _settle([replica])
+        await replica.publish(fanout_module.org_channel("org-1"), "during-gap")
+        await _settle([replica])
+        before_reconnect = list(ws.messages)
+        await asyncio.sleep(0.3)
+        await worker.publish(fanout_module.org_channel("org-1"), "after-reconnect")
+        await _settle([replica])
+        await replica.stop()
+        return before_reconnect, ws.messages, replica.subscription_gaps
+
+    before_reconnect, messages, gaps = asyncio.run(_run())
+
+    assert before_reconnect == ["during-gap"]
+    assert messages == ["during-gap", "after-reconnect"]
+    assert gaps == 1
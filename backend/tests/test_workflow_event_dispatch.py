@@ -0,0 +1,150 @@
+"""Tests for batched, indexed workflow event dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from workers import events
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = {}
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any, **kwargs: Any) -> None:
+            self._ops.append((name, args, kwargs))
+
+        return _queue
+
+    async def execute(self) -> list[Any]:
+        ops, self._ops = self._ops, []
+        return [getattr(self, f"_{name}")(*args, **kwargs) for name, args, kwargs in ops]
+
+    def _rpush(self, key: str, value: str) -> int:
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def _lrange(self, key: str, start: int, end: int) -> list[str]:
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def _ltrim(self, key: str, start: int, end: int) -> bool:
+        self.lists[key] = self._lrange(key, start, end)
+        return True
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        return True
+
+    def _set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def _get(self, key: str) -> str | None:
+        return self.strings.get(key)
+
+    def _delete(self, key: str) -> int:
+        return 1 if self.strings.pop(key, None) is not None else 0
+
+    def _incr(self, key: str) -> int:
+        self.strings[key] = str(int(self.strings.get(key, "0")) + 1)
+        return int(self.strings[key])
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    state: dict[str, Any] = {"redis": _FakeRedis(), "kicks": 0, "loads": []}
+
+    async def _client() -> _FakeRedis:
+        return state["redis"]
+
+    def _kick() -> None:
+        state["kicks"] += 1
+
+    async def _load(org_ids: list[str]) -> dict[str, dict[str, list[str]]]:
+        state["loads"].append(sorted(org_ids))
+        return {org_id: {"sync.completed": [f"wf-{org_id}"]} for org_id in org_ids}
+
+    monkeypatch.setattr(events, "get_redis_client", _client)
+    monkeypatch.setattr(events, "_schedule_dispatch", _kick)
+    monkeypatch.setattr(events, "_load_event_triggers", _load)
+    return state
+
+
+def test_emit_kicks_dispatch_once_per_batch_and_caps_history(
+    fake: dict[str, Any], monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(events, "EVENT_HISTORY_MAX_ENTRIES", 2)
+
+    async def _run() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        for n in range(3):
+            await events.emit_event("sync.completed", "org-1", {"n": n})
+        first = await events.get_pending_events(limit=2)
+        # Popping clears the kick flag, so the next event schedules again.
+        await events.emit_event("sync.failed", "org-1", {})
+        second = await events.get_pending_events(limit=10)
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert [event["data"] for event in first] == [{"n": 0}, {"n": 1}]
+    assert [event["type"] for event in second] == ["sync.completed", "sync.failed"]
+    assert fake["kicks"] == 2
+    assert len(fake["redis"].lists["revtops:events:history:org-1"]) == 2
+
+
+def test_trigger_index_is_cached_until_invalidated(fake: dict[str, Any]) -> None:
+    async def _run() -> list[dict[str, dict[str, list[str]]]]:
+        results = [
+            await events.get_event_triggers(["org-1", "org-2"]),
+            await events.get_event_triggers(["org-2", "org-1", "org-1"]),
+        ]
+        await events.invalidate_event_triggers("org-1")
+        results.append(await events.get_event_triggers(["org-1", "org-2"]))
+        return results
+
+    results = asyncio.run(_run())
+
+    assert results[0] == results[1] == results[2]
+    assert results[0]["org-1"] == {"sync.completed": ["wf-org-1"]}
+    assert fake["loads"] == [["org-1", "org-2"], ["org-1"]]
+
+
+def test_process_pending_events_dispatches_indexed_workflows(
+    fake: dict[str, Any], monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from workers.tasks import workflows
+
+    delayed: list[dict[str, Any]] = []
+
+    async def _not_paused() -> None:
+        return None
+
+    monkeypatch.setattr(workflows, "get_workflow_execution_pause_until", _not_paused)
+    monkeypatch.setattr(workflows.execute_workflow, "delay", lambda **kwargs: delayed.append(kwargs))
+    monkeypatch.setattr(workflows, "_EVENT_BATCH_SIZE", 2)
+
+    async def _run() -> dict[str, Any]:
+        await events.emit_event("sync.completed", "org-1", {"provider": "hubspot"})
+        await events.emit_event("deal.created", "org-1", {})
+        await events.emit_event("sync.completed", "org-2", {"provider": "slack"})
+        return await workflows._process_pending_events()
+
+    summary = asyncio.run(_run())
+
+    assert summary["events_processed"] == 3
+    assert [(call["workflow_id"], call["trigger_data"]) for call in delayed] == [
+        ("wf-org-1", {"provider": "hubspot"}),
+        ("wf-org-2", {"provider": "slack"}),
+    ]
+    assert delayed[0]["triggered_by"] == "event:sync.completed"
@@ -0,0 +1,101 @@
+"""Tests for the next_run_at-driven scheduled workflow checker."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import models.database
+from models.workflow import Workflow
+from workers.tasks import workflows
+
+
+def _workflow(cron: str | None, **kwargs: Any) -> Workflow:
+    return Workflow(
+        id=uuid.uuid4(),
+        organization_id=uuid.uuid4(),
+        trigger_type=kwargs.pop("trigger_type", "schedule"),
+        trigger_config={"cron": cron} if cron else {},
+        is_enabled=kwargs.pop("is_enabled", True),
+        created_at=kwargs.pop("created_at", datetime(2026, 1, 1, 0, 0)),
+        **kwargs,
+    )
+
+
+def test_compute_next_run_at_counts_from_last_run_or_creation() -> None:
+    hourly = _workflow("0 * * * *")
+    assert hourly.compute_next_run_at() == datetime(2026, 1, 1, 1, 0)
+
+    hourly.last_run_at = datetime(2026, 3, 5, 10, 30)
+    assert hourly.compute_next_run_at() == datetime(2026, 3, 5, 11, 0)
+    assert hourly.compute_next_run_at(after=datetime(2026, 3, 5, 12, 0)) == datetime(2026, 3, 5, 13, 0)
+
+    assert _workflow("0 * * * *", is_enabled=False).compute_next_run_at() is None
+    assert _workflow(None).compute_next_run_at() is None
+    assert _workflow("0 * * * *", trigger_type="event").compute_next_run_at() is None
+
+
+class _FakeSession:
+    def __init__(self, rows: list[Workflow]) -> None:
+        self.rows = rows
+        self.statements: list[Any] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        rows = self.rows if len(self.statements) == 1 else []
+
+        class _Result:
+            def scalars(self) -> Any:
+                class _Scalars:
+                    def all(self) -> list[Workflow]:
+                        return rows
+
+                return _Scalars()
+
+        return _Result()
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def test_scheduler_fires_due_rows_and_advances_next_run_at(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime.utcnow()
+    due = _workflow("*/5 * * * *", next_run_at=now - timedelta(minutes=1))
+    uncomputed_future = _workflow("0 0 1 1 *", last_run_at=now - timedelta(minutes=1))
+    uncomputed_overdue = _workflow("* * * * *", last_run_at=now - timedelta(hours=2))
+    no_cron = _workflow(None)
+    session = _FakeSession([due, uncomputed_future, uncomputed_overdue, no_cron])
+    delayed: list[dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def _admin_session() -> AsyncIterator[_FakeSession]:
+        yield session
+
+    async def _not_paused() -> None:
+        return None
+
+    monkeypatch.setattr(models.database, "get_admin_session", _admin_session)
+    monkeypatch.setattr(workflows, "get_workflow_execution_pause_until", _not_paused)
+    monkeypatch.setattr(workflows.execute_workflow, "delay", lambda **kwargs: delayed.append(kwargs))
+
+    summary = asyncio.run(workflows._check_scheduled_workflows())
+
+    assert summary["workflows_triggered"] == [str(due.id), str(uncomputed_overdue.id)]
+    assert all(call["triggered_by"] == "schedule" for call in delayed)
+    assert due.next_run_at > now and due.last_run_at is not None
+    assert uncomputed_overdue.next_run_at > now
+    assert uncomputed_future.next_run_at > now and uncomputed_future.last_run_at < now
+    assert no_cron.next_run_at > now + timedelta(minutes=30)
+    assert session.commits == 1
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "workflows.next_run_at IS NULL OR workflows.next_run_at <=" in sql
+    assert "NULLS FIRST" in sql and "LIMIT" in sql
@@ -0,0 +1,105 @@
+"""New thread participants must drop the org's cached chat context."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from messengers import _workspace as workspace_module
+from messengers._workspace import WorkspaceMessenger
+from messengers.base import InboundMessage, MessageType, MessengerMeta, ResponseMode
+
+_ORG_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class _TestWorkspaceMessenger(WorkspaceMessenger):
+    meta = MessengerMeta(
+        name="Test",
+        slug="test",
+        response_mode=ResponseMode.STREAMING,
+    )
+
+    async def resolve_organization(self, user, message):  # type: ignore[override]
+        raise NotImplementedError
+
+    async def download_attachments(self, message):  # type: ignore[override]
+        raise NotImplementedError
+
+    def format_text(self, markdown: str) -> str:
+        return markdown
+
+    async def post_message(self, channel_id, text, thread_id=None, **_kwargs):  # type: ignore[override]
+        return None
+
+
+class _Result:
+    def __init__(self, conversation: Any) -> None:
+        self._conversation = conversation
+
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[Any]:
+        return [self._conversation]
+
+
+class _FakeSession:
+    def __init__(self, conversation: Any) -> None:
+        self._conversation = conversation
+        self.commits = 0
+
+    async def execute(self, _statement: Any) -> _Result:
+        return _Result(self._conversation)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class _SessionCtx:
+    def __init__(self, session: _FakeSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> _FakeSession:
+        return self._session
+
+    async def __aexit__(self, *_exc: Any) -> bool:
+        return False
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, participants: list[UUID], user_id: UUID) -> list[str | None]:
+    invalidated: list[str | None] = []
+
+    async def _invalidate(organization_id: str | None) -> None:
+        invalidated.append(organization_id)
+
+    conversation = SimpleNamespace(
+        id=uuid4(), source_user_id="U1", participating_user_ids=participants,
+        user_id=participants[0], scope="shared",
+    )
+    session = _FakeSession(conversation)
+    monkeypatch.setattr(workspace_module, "get_session", lambda **_kw: _SessionCtx(session))
+    monkeypatch.setattr(workspace_module, "_resolve_conversation_scope", lambda *_args: "shared")
+    monkeypatch.setattr(workspace_module, "invalidate_org_context", _invalidate)
+    message = InboundMessage(
+        external_user_id="U1", text="hi", message_type=MessageType.THREAD_REPLY,
+        messenger_context={"channel_id": "C1", "thread_ts": "1.0"},
+    )
+
+    asyncio.run(_TestWorkspaceMessenger().find_or_create_conversation(
+        _ORG_ID, SimpleNamespace(id=user_id, name="User"), message,  # type: ignore[arg-type]
+    ))
+    return invalidated
+
+
+def test_new_participant_invalidates_org_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner, newcomer = uuid4(), uuid4()
+
+    assert _run(monkeypatch, [owner], newcomer) == [_ORG_ID]
+
+
+def test_existing_participant_keeps_cached_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = uuid4()
+
+    assert _run(monkeypatch, [owner], owner) == []
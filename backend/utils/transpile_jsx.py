@@ -3,13 +3,26 @@ Pre-transpile JSX → JS using esbuild so the frontend can skip Babel Standalone
 
 Returns (compiled_code, component_name) on success, None on failure.
 Failures are logged but never raised — the frontend falls back to runtime Babel.
+
+Async callers (the apps connector) use :func:`transpile_jsx_async`, which
+pipes the source through ``esbuild`` on stdin via an asyncio subprocess, so
+the event loop never waits on the process spawn. At most
+:data:`_MAX_CONCURRENT_ESBUILD` esbuild processes run per event loop.
+:func:`transpile_jsx_batch` transpiles many sources concurrently (backfills).
+
+Successful results are cached by source hash (LRU, :data:`_CACHE_MAX_ENTRIES`),
+so re-saving an app whose frontend code did not change skips esbuild.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
 import shutil
 import subprocess
-import tempfile
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
 
 import structlog
@@ -18,6 +31,13 @@ logger = structlog.get_logger()
 
 # Timeout for esbuild subprocess (seconds)
 _ESBUILD_TIMEOUT = 10
+_MAX_CONCURRENT_ESBUILD = 4
+_CACHE_MAX_ENTRIES = 256
+
+_cache: "OrderedDict[str, tuple[str, str]]" = OrderedDict()
+_limiters_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def _find_esbuild() -> str | None:
@@ -53,6 +73,44 @@ def _extract_component_name(code: str) -> str:
     return "App"
 
 
+def _esbuild_args(esbuild: str) -> list[str]:
+    # No entry point: esbuild reads the source from stdin.
+    return [
+        esbuild,
+        "--bundle=false",
+        "--loader=jsx",
+        "--jsx=transform",
+        "--target=es2020",
+    ]
+
+
+def _cache_key(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> tuple[str, str] | None:
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+    return cached
+
+
+def _cache_put(key: str, result: tuple[str, str]) -> None:
+    _cache[key] = result
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def _limiter() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters_by_loop.get(loop)
+    if limiter is None:
+        limiter = asyncio.Semaphore(_MAX_CONCURRENT_ESBUILD)
+        _limiters_by_loop[loop] = limiter
+    return limiter
+
+
 def transpile_jsx(source: str) -> tuple[str, str] | None:
     """
     Transpile Basebase app JSX source into plain JS.
@@ -62,7 +120,13 @@ def transpile_jsx(source: str) -> tuple[str, str] | None:
     3. Run esbuild to convert JSX → JS.
 
     Returns (compiled_js, component_name) on success, None on failure.
+    Blocks for the esbuild run; use :func:`transpile_jsx_async` from async code.
     """
+    key = _cache_key(source)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
     esbuild = _find_esbuild()
     if not esbuild:
         logger.warning("[transpile_jsx] esbuild binary not found, skipping transpilation")
@@ -72,21 +136,9 @@ def transpile_jsx(source: str) -> tuple[str, str] | None:
     stripped = _strip_module_syntax(source)
 
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".jsx", delete=False
-        ) as tmp:
-            tmp.write(stripped)
-            tmp_path = tmp.name
-
         result = subprocess.run(
-            [
-                esbuild,
-                tmp_path,
-                "--bundle=false",
-                "--loader=jsx",
-                "--jsx=transform",
-                "--target=es2020",
-            ],
+            _esbuild_args(esbuild),
+            input=stripped,
             capture_output=True,
             text=True,
             timeout=_ESBUILD_TIMEOUT,
@@ -100,8 +152,9 @@ def transpile_jsx(source: str) -> tuple[str, str] | None:
             )
             return None
 
-        compiled = result.stdout
-        return (compiled, component_name)
+        compiled = (result.stdout, component_name)
+        _cache_put(key, compiled)
+        return compiled
 
     except subprocess.TimeoutExpired:
         logger.warning("[transpile_jsx] esbuild timed out")
@@ -109,8 +162,75 @@ def transpile_jsx(source: str) -> tuple[str, str] | None:
     except Exception:
         logger.exception("[transpile_jsx] unexpected error during transpilation")
         return None
-    finally:
+
+
+async def transpile_jsx_async(source: str) -> tuple[str, str] | None:
+    """Async :func:`transpile_jsx`: same result, without blocking the event loop."""
+    key = _cache_key(source)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    esbuild = _find_esbuild()
+    if not esbuild:
+        logger.warning("[transpile_jsx] esbuild binary not found, skipping transpilation")
+        return None
+
+    component_name = _extract_component_name(source)
+    stripped = _strip_module_syntax(source)
+
+    async with _limiter():
         try:
-            Path(tmp_path).unlink(missing_ok=True)
+            proc = await asyncio.create_subprocess_exec(
+                *_esbuild_args(esbuild),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except Exception:
+            logger.exception("[transpile_jsx] unexpected error during transpilation")
+            return None
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(stripped.encode("utf-8")), timeout=_ESBUILD_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.warning("[transpile_jsx] esbuild timed out")
+            return None
+        except asyncio.CancelledError:
+            proc.kill()
+            raise
         except Exception:
-            pass
+            logger.exception("[transpile_jsx] unexpected error during transpilation")
+            return None
+
+    if proc.returncode != 0:
+        logger.warning(
+            "[transpile_jsx] esbuild failed",
+            returncode=proc.returncode,
+            stderr=stderr.decode("utf-8", errors="replace")[:500],
+        )
+        return None
+
+    compiled = (stdout.decode("utf-8"), component_name)
+    _cache_put(key, compiled)
+    return compiled
+
+
+async def transpile_jsx_batch(sources: Sequence[str]) -> list[tuple[str, str] | None]:
+    """
+    Transpile many sources concurrently; results are in input order.
+
+    Identical sources are transpiled once. Concurrency is bounded by the
+    same per-loop limit as :func:`transpile_jsx_async`.
+    """
+    unique: dict[str, str] = {}
+    for source in sources:
+        unique.setdefault(_cache_key(source), source)
+    keys = list(unique)
+    results = await asyncio.gather(*(transpile_jsx_async(unique[key]) for key in keys))
+    by_key = dict(zip(keys, results))
+    return [by_key[_cache_key(source)] for source in sources]
@@ -204,14 +204,38 @@ def setup_backend_path(**kwargs) -> None:
     except Exception:
         pass
 
+    try:
+        from connectors.http_client import reset_http_clients
+        reset_http_clients()
+    except Exception:
+        pass
+
+    try:
+        from services.llm_adapter import reset_llm_clients
+        reset_llm_clients()
+    except Exception:
+        pass
+
+    try:
+        from services.redis_pool import reset_redis_clients
+        reset_redis_clients()
+    except Exception:
+        pass
+
 
 @worker_process_shutdown.connect
 def cleanup_db_connections(**kwargs) -> None:
-    """Clean up database connections when a Celery worker process shuts down.
+    """Clean up pooled HTTP and database connections when a worker process shuts down.
     
     This ensures connections are properly released back to Supabase's pool
     when worker processes exit (during shutdown or restarts).
     """
+    try:
+        from workers.run_async import close_worker_loop
+        close_worker_loop()
+    except Exception as e:
+        print(f"[Celery] Error closing pooled HTTP clients: {e}")
+
     try:
         from models.database import dispose_engine
         dispose_engine()
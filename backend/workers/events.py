@@ -8,31 +8,67 @@ This allows workflows to be triggered by events like:
 - deal.created
 - call.recorded
 - linear.issue.done (Linear issue moved to Done)
+
+Dispatch path:
+
+- :func:`emit_event` appends to the queue and the org's (capped) history in
+  one pipeline, then schedules ``process_pending_events`` shortly after,
+  at most once per kick window, so triggers fire without waiting for the
+  10-second beat (which stays as a safety net).
+- :func:`get_pending_events` pops a whole batch atomically.
+- :func:`get_event_triggers` maps each org's event types to the ids of its
+  enabled event-triggered workflows. The map is cached in Redis under a
+  per-org version; :func:`invalidate_event_triggers` bumps the version and
+  must be called whenever a workflow is created, edited or deleted.
+
+Redis clients come from the per-event-loop pool in :mod:`services.redis_pool`.
 """
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import redis.asyncio as redis
 
-from config import get_redis_connection_kwargs, settings
+from services import redis_pool
 
 logger = logging.getLogger(__name__)
 
 # Redis key prefixes
 EVENT_QUEUE_KEY = "revtops:events:queue"
 EVENT_HISTORY_KEY = "revtops:events:history:{org_id}"
+EVENT_TRIGGERS_VERSION_KEY = "revtops:events:triggers:{org_id}:version"
+EVENT_TRIGGERS_KEY = "revtops:events:triggers:{org_id}:v{version}"
+EVENT_DISPATCH_KICK_KEY = "revtops:events:dispatch_scheduled"
+
+# Most recent events kept per organization in the history list.
+EVENT_HISTORY_MAX_ENTRIES = 1000
+EVENT_HISTORY_TTL_SECONDS = 60 * 60 * 24 * 7  # 7 days
 
+# A missed invalidation is corrected within this window.
+_TRIGGERS_TTL_SECONDS = 60 * 60
+_TRIGGERS_VERSION_TTL_SECONDS = 60 * 60 * 24 * 7
+
+# Events emitted within this window share one dispatch task.
+_DISPATCH_KICK_DELAY_SECONDS = 0.5
+_PROCESS_EVENTS_TASK = "workers.tasks.workflows.process_pending_events"
 
 async def get_redis_client() -> redis.Redis:
-    """Get an async Redis client."""
-    return redis.from_url(
-        settings.REDIS_URL, **get_redis_connection_kwargs(decode_responses=True)
-    )
+    """Return the pooled async Redis client for the running loop.
+
+    Callers must not close it.
+    """
+    return redis_pool.get_redis_client()
+
+
+def _schedule_dispatch() -> None:
+    from workers.celery_app import celery_app
+
+    celery_app.send_task(_PROCESS_EVENTS_TASK, countdown=_DISPATCH_KICK_DELAY_SECONDS)
 
 
 async def emit_event(
@@ -42,12 +78,12 @@ async def emit_event(
 ) -> str:
     """
     Emit an event that can trigger workflows.
-    
+
     Args:
         event_type: Type of event (e.g., 'sync.completed', 'deal.created')
         organization_id: UUID of the organization
         data: Event payload data
-    
+
     Returns:
         Event ID
     """
@@ -59,51 +95,57 @@ async def emit_event(
         "data": data,
         "timestamp": datetime.utcnow().isoformat(),
     }
-    
+
     try:
         client = await get_redis_client()
-        
-        # Add to event queue for processing
-        await client.rpush(EVENT_QUEUE_KEY, json.dumps(event))
-        
-        # Also store in history (with TTL)
+        payload = json.dumps(event)
         history_key = EVENT_HISTORY_KEY.format(org_id=organization_id)
-        await client.rpush(history_key, json.dumps(event))
-        await client.expire(history_key, 60 * 60 * 24 * 7)  # 7 days
-        
+
+        pipe = client.pipeline(transaction=False)
+        # Add to event queue for processing
+        pipe.rpush(EVENT_QUEUE_KEY, payload)
+        # Also store in history (capped, with TTL)
+        pipe.rpush(history_key, payload)
+        pipe.ltrim(history_key, -EVENT_HISTORY_MAX_ENTRIES, -1)
+        pipe.expire(history_key, EVENT_HISTORY_TTL_SECONDS)
+        # The dispatcher clears this flag before popping, so any event pushed
+        # after that schedules the next run.
+        pipe.set(EVENT_DISPATCH_KICK_KEY, event_id, nx=True, ex=60)
+        results = await pipe.execute()
+
+        if results[-1]:
+            _schedule_dispatch()
+
         logger.info(f"Emitted event {event_type} for org {organization_id}: {event_id}")
-        await client.aclose()
-        
+
     except Exception as e:
         logger.error(f"Failed to emit event: {e}")
         # Don't fail the calling operation if event emission fails
-    
+
     return event_id
 
 
 async def get_pending_events(limit: int = 100) -> list[dict[str, Any]]:
     """
-    Get pending events from the queue.
-    
+    Pop up to *limit* pending events from the queue in one round trip.
+
     Args:
         limit: Maximum number of events to retrieve
-    
+
     Returns:
         List of event dictionaries
     """
     try:
         client = await get_redis_client()
-        
-        events: list[dict[str, Any]] = []
-        for _ in range(limit):
-            event_json = await client.lpop(EVENT_QUEUE_KEY)
-            if not event_json:
-                break
-            events.append(json.loads(event_json))
-        
-        await client.aclose()
-        return events
-        
+
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(EVENT_DISPATCH_KICK_KEY)
+        pipe.lrange(EVENT_QUEUE_KEY, 0, limit - 1)
+        pipe.ltrim(EVENT_QUEUE_KEY, limit, -1)
+        _, events_json, _ = await pipe.execute()
+
+        return [json.loads(event_json) for event_json in events_json]
+
     except Exception as e:
         logger.error(f"Failed to get pending events: {e}")
         return []
@@ -114,25 +156,116 @@ async def get_event_history(
 ) -> list[dict[str, Any]]:
     """
     Get recent event history for an organization.
-    
+
     Args:
         organization_id: UUID of the organization
         limit: Maximum number of events to retrieve
-    
+
     Returns:
         List of event dictionaries (most recent first)
     """
     try:
         client = await get_redis_client()
         history_key = EVENT_HISTORY_KEY.format(org_id=organization_id)
-        
+
         # Get last N events (most recent last in list)
         events_json = await client.lrange(history_key, -limit, -1)
         events = [json.loads(e) for e in events_json]
-        
-        await client.aclose()
+
         return list(reversed(events))  # Most recent first
-        
+
     except Exception as e:
         logger.error(f"Failed to get event history: {e}")
         return []
+
+
+async def _load_event_triggers(org_ids: list[str]) -> dict[str, dict[str, list[str]]]:
+    """Query enabled event-triggered workflows for *org_ids*, grouped by event type."""
+    from sqlalchemy import select
+    from models.database import get_admin_session
+    from models.workflow import Workflow
+
+    triggers: dict[str, dict[str, list[str]]] = {org_id: {} for org_id in org_ids}
+    # Admin session: covers events from several organizations at once
+    async with get_admin_session() as session:
+        result = await session.execute(
+            select(Workflow.id, Workflow.organization_id, Workflow.trigger_config).where(
+                Workflow.organization_id.in_([UUID(org_id) for org_id in org_ids]),
+                Workflow.is_enabled == True,  # noqa: E712
+                Workflow.trigger_type == "event",
+            )
+        )
+        for workflow_id, org_uuid, trigger_config in result.all():
+            event_type = (trigger_config or {}).get("event")
+            if event_type:
+                triggers[str(org_uuid)].setdefault(event_type, []).append(str(workflow_id))
+    return triggers
+
+
+async def get_event_triggers(org_ids: Iterable[str]) -> dict[str, dict[str, list[str]]]:
+    """
+    Return ``{org_id: {event_type: [workflow_id, ...]}}`` for *org_ids*.
+
+    Served from the Redis index; organizations without a current entry are
+    loaded from the database in one query and written back.
+    """
+    org_list = sorted(set(org_ids))
+    if not org_list:
+        return {}
+
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        for org_id in org_list:
+            pipe.get(EVENT_TRIGGERS_VERSION_KEY.format(org_id=org_id))
+        versions: list[str] = [version or "0" for version in await pipe.execute()]
+
+        pipe = client.pipeline(transaction=False)
+        for org_id, version in zip(org_list, versions):
+            pipe.get(EVENT_TRIGGERS_KEY.format(org_id=org_id, version=version))
+        cached: list[str | None] = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Event trigger index unavailable, loading from the database: {e}")
+        return await _load_event_triggers(org_list)
+
+    triggers: dict[str, dict[str, list[str]]] = {}
+    missing: list[tuple[str, str]] = []
+    for org_id, version, raw in zip(org_list, versions, cached):
+        if raw is None:
+            missing.append((org_id, version))
+        else:
+            triggers[org_id] = json.loads(raw)
+    if not missing:
+        return triggers
+
+    loaded = await _load_event_triggers([org_id for org_id, _ in missing])
+    triggers.update(loaded)
+    try:
+        # Written under the version read before the query, so an
+        # invalidation that raced the load orphans this entry.
+        pipe = client.pipeline(transaction=False)
+        for org_id, version in missing:
+            pipe.set(
+                EVENT_TRIGGERS_KEY.format(org_id=org_id, version=version),
+                json.dumps(loaded[org_id]),
+                ex=_TRIGGERS_TTL_SECONDS,
+            )
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to store event trigger index: {e}")
+    return triggers
+
+
+async def invalidate_event_triggers(organization_id: str | UUID | None) -> None:
+    """Drop the cached event trigger index for an organization."""
+    if not organization_id:
+        return
+    version_key = EVENT_TRIGGERS_VERSION_KEY.format(org_id=str(organization_id))
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(version_key)
+        pipe.expire(version_key, _TRIGGERS_VERSION_TTL_SECONDS)
+        await pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to invalidate event triggers for org {organization_id}: {e}")
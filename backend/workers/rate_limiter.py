@@ -8,6 +8,10 @@ Usage:
     limiter = RedisRateLimiter(redis_url, key="perplexity", rate_per_minute=200)
     await limiter.acquire()  # Blocks until a token is available
     # ... make API call ...
+
+``AdaptiveRedisRateLimiter`` additionally lets callers feed back what the
+upstream reported (``Retry-After``, rate-limit headers); see
+``connectors.rate_governor`` for the per-provider governor built on it.
 """
 
 import asyncio
@@ -85,6 +89,7 @@ class RedisRateLimiter:
         rate_per_minute: int,
         *,
         burst: Optional[int] = None,
+        redis_client: Optional[aioredis.Redis] = None,
     ) -> None:
         """
         Args:
@@ -92,8 +97,11 @@ class RedisRateLimiter:
             key: Unique key for this rate limiter bucket (e.g., "bulk_op:abc:perplexity").
             rate_per_minute: Maximum requests per minute.
             burst: Maximum burst size (defaults to rate_per_minute / 6, i.e. 10 seconds worth).
+            redis_client: Existing client to share instead of opening a new
+                connection (``close()`` then leaves it open).
         """
-        self._redis: aioredis.Redis = aioredis.from_url(
+        self._owns_redis: bool = redis_client is None
+        self._redis: aioredis.Redis = redis_client or aioredis.from_url(
             redis_url, decode_responses=True
         )
         self._key: str = f"rate_limit:{key}"
@@ -149,5 +157,152 @@ class RedisRateLimiter:
             await asyncio.sleep(sleep_time)
 
     async def close(self) -> None:
-        """Close the Redis connection."""
-        await self._redis.close()
+        """Close the Redis connection (unless it was shared by the caller)."""
+        if self._owns_redis:
+            await self._redis.close()
+
+
+class AdaptiveRedisRateLimiter(RedisRateLimiter):
+    """
+    Token bucket whose rate adapts to what the upstream API reports.
+
+    On top of :class:`RedisRateLimiter` the bucket hash carries two shared
+    fields that every process honours:
+
+    - ``blocked_until`` — set by :meth:`block_for` (e.g. from ``Retry-After``);
+      no tokens are handed out before this timestamp.
+    - ``rate_cap`` — a lowered refill rate set by :meth:`cap_rate` (e.g. from
+      rate-limit headers or after a 429). Each granted token nudges the cap
+      back up by ``recovery_ratio`` of the configured rate until it is
+      removed, so the bucket probes back to the configured ceiling (AIMD).
+    """
+
+    _LUA_SCRIPT: str = """
+    local key = KEYS[1]
+    local max_tokens = tonumber(ARGV[1])
+    local refill_rate = tonumber(ARGV[2])  -- configured tokens per second
+    local now = tonumber(ARGV[3])
+    local recovery = tonumber(ARGV[4]) or 0
+
+    local data = redis.call('HMGET', key, 'tokens', 'last_refill', 'blocked_until', 'rate_cap')
+    local tokens = tonumber(data[1])
+    local last_refill = tonumber(data[2])
+    local blocked_until = tonumber(data[3])
+    local rate_cap = tonumber(data[4])
+
+    if blocked_until ~= nil and now < blocked_until then
+        return tostring(blocked_until - now)
+    end
+
+    local rate = refill_rate
+    if rate_cap ~= nil and rate_cap < refill_rate then
+        rate = rate_cap
+    end
+
+    if tokens == nil then
+        tokens = max_tokens
+        last_refill = now
+    end
+
+    local elapsed = now - last_refill
+    if elapsed > 0 then
+        tokens = math.min(max_tokens, tokens + elapsed * rate)
+        last_refill = now
+    end
+
+    redis.call('EXPIRE', key, 3600)
+    if tokens >= 1 then
+        tokens = tokens - 1
+        redis.call('HSET', key, 'tokens', tostring(tokens), 'last_refill', tostring(last_refill))
+        if rate_cap ~= nil then
+            local next_cap = rate_cap + refill_rate * recovery
+            if next_cap >= refill_rate then
+                redis.call('HDEL', key, 'rate_cap')
+            else
+                redis.call('HSET', key, 'rate_cap', tostring(next_cap))
+            end
+        end
+        return '0'
+    end
+
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'last_refill', tostring(last_refill))
+    return tostring((1 - tokens) / rate)
+    """
+
+    _BLOCK_LUA_SCRIPT: str = """
+    local current = tonumber(redis.call('HGET', KEYS[1], 'blocked_until'))
+    local until_ts = tonumber(ARGV[1])
+    if current == nil or current < until_ts then
+        redis.call('HSET', KEYS[1], 'blocked_until', tostring(until_ts))
+    end
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return 1
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        key: str,
+        rate_per_minute: int,
+        *,
+        burst: Optional[int] = None,
+        redis_client: Optional[aioredis.Redis] = None,
+        recovery_ratio: float = 0.02,
+    ) -> None:
+        super().__init__(
+            redis_url,
+            key,
+            rate_per_minute,
+            burst=burst,
+            redis_client=redis_client,
+        )
+        self._recovery_ratio: float = recovery_ratio
+        self._block_script: Optional[object] = None
+
+    async def acquire(self, timeout: float = 120.0) -> bool:
+        """Block until a token is available, honouring shared blocks and caps."""
+        script = await self._get_script()
+        deadline: float = time.monotonic() + timeout
+
+        while True:
+            wait_seconds: float = float(
+                await script(
+                    keys=[self._key],
+                    args=[self._max_tokens, self._refill_rate, time.time(), self._recovery_ratio],
+                )
+            )
+            if wait_seconds <= 0:
+                return True
+
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    "[RateLimiter] Timed out waiting for token on key=%s",
+                    self._key,
+                )
+                return False
+
+            # Blocks from Retry-After can be long; sleep through them in one go.
+            await asyncio.sleep(min(max(wait_seconds, _MIN_RETRY_SLEEP), remaining))
+
+    async def block_for(self, seconds: float) -> None:
+        """Stop handing out tokens (in every process) for *seconds*."""
+        if self._block_script is None:
+            self._block_script = self._redis.register_script(self._BLOCK_LUA_SCRIPT)
+        await self._block_script(keys=[self._key], args=[time.time() + max(0.0, seconds)])
+
+    async def current_rate_per_minute(self) -> float:
+        """Return the effective shared rate (cap if set, else configured)."""
+        raw = await self._redis.hget(self._key, "rate_cap")
+        if raw is None:
+            return float(self._rate_per_minute)
+        return min(float(raw), self._refill_rate) * 60.0
+
+    async def cap_rate(self, rate_per_minute: float) -> None:
+        """Cap the shared refill rate; a cap at or above the configured rate clears it."""
+        cap: float = max(rate_per_minute, 1.0) / 60.0
+        if cap >= self._refill_rate:
+            await self._redis.hdel(self._key, "rate_cap")
+            return
+        await self._redis.hset(self._key, "rate_cap", str(cap))
+        await self._redis.expire(self._key, 3600)
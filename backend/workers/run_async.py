@@ -31,9 +31,15 @@ def run_async(coro: Any) -> Any:
     global _worker_loop
 
     if _worker_loop is None or _worker_loop.is_closed():
+        from connectors.http_client import reset_http_clients
         from models.database import dispose_engine
+        from services.llm_adapter import reset_llm_clients
+        from services.redis_pool import reset_redis_clients
 
         dispose_engine()
+        reset_http_clients()
+        reset_llm_clients()
+        reset_redis_clients()
         _worker_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(_worker_loop)
         logger.debug("Created new worker event loop id=%s", id(_worker_loop))
@@ -49,3 +55,27 @@ def reset_worker_loop() -> None:
     """
     global _worker_loop
     _worker_loop = None
+
+
+def close_worker_loop() -> None:
+    """Close pooled HTTP/LLM/Redis clients and the shared loop on worker process exit.
+
+    Called from the ``worker_process_shutdown`` signal handler so keep-alive
+    connections are closed cleanly instead of being dropped mid-stream.
+    """
+    global _worker_loop
+
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+
+    from connectors.http_client import close_http_clients
+    from services.llm_adapter import close_llm_clients
+    from services.redis_pool import close_redis_clients
+
+    try:
+        _worker_loop.run_until_complete(close_http_clients())
+        _worker_loop.run_until_complete(close_llm_clients())
+        _worker_loop.run_until_complete(close_redis_clients())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
@@ -4,16 +4,25 @@ Celery tasks for the ``foreach`` tool's distributed tool-execution path.
 Architecture
 ------------
 ``bulk_tool_run_coordinator``
-    Reads the item list (from inline data or a SQL query), fans out one
-    ``bulk_tool_run_item`` task per item via ``celery.group()``, then updates
-    the BulkOperation record when all items are processed.
+    Reads the item list (from inline data or a SQL query) and fans out one
+    ``bulk_tool_run_batch`` task per chunk of ``BULK_BATCH_SIZE`` items via
+    ``celery.group()``.
+
+``bulk_tool_run_batch``
+    Runs its chunk with up to ``_BATCH_CONCURRENCY`` items in flight, all
+    drawing from the operation's shared rate-limit bucket over one Redis
+    connection. Finished results are bulk-inserted and the Redis counters
+    bumped in one pipeline per flush; the batch that completes the last
+    item flips the BulkOperation to ``completed``. Items that time out
+    waiting for a token write no row; the batch then raises so Celery's
+    retry runs them again.
 
 ``bulk_tool_run_item``
-    Acquires a rate-limit token, calls ``execute_tool`` with the rendered
-    params, writes a ``BulkOperationResult`` row, and increments Redis
-    counters.
+    The original one-task-per-item path (rate-limit token, ``execute_tool``,
+    one ``BulkOperationResult`` row, counters). Kept so item tasks queued
+    before the switch to batches still drain.
 
-Both tasks run on the ``enrichment`` queue.  Progress polling is handled
+All tasks run on the ``enrichment`` queue.  Progress polling is handled
 inline by ``_poll_bulk_operation`` in ``agents/tools.py``.
 """
 
@@ -46,6 +55,24 @@ _PROGRESS_BROADCAST_INTERVAL: float = 5.0
 # Maximum items that can be processed in a single bulk operation
 MAX_BULK_ITEMS: int = 50_000
 
+# Items per bulk_tool_run_batch task, and how many of them run at once.
+# The shared token bucket, not the batch shape, sets the overall item rate.
+BULK_BATCH_SIZE: int = 50
+_BATCH_CONCURRENCY: int = 10
+# A batch writes its finished results and counters once this many items or
+# seconds have accumulated, whichever comes first.
+_FLUSH_EVERY_ITEMS: int = 25
+_FLUSH_EVERY_SECONDS: float = 5.0
+
+# Transient tool errors (rate limits, 5xx) are retried with exponential backoff.
+_ITEM_MAX_RETRIES: int = 5
+_ITEM_BASE_BACKOFF_SECONDS: float = 5.0
+
+
+class RateLimitTimeout(RuntimeError):
+    """No rate-limit token arrived in time; the item was not attempted."""
+
+
 # Redis key helpers
 def _redis_key(operation_id: str, field: str) -> str:
     return f"bulk_op:{operation_id}:{field}"
@@ -93,6 +120,291 @@ def _render_template(template: dict[str, Any], item: dict[str, Any]) -> dict[str
     return rendered
 
 
+def _chunk(
+    items: list[tuple[int, dict[str, Any]]],
+    size: int,
+) -> list[list[tuple[int, dict[str, Any]]]]:
+    """Split ``(index, item)`` pairs into consecutive chunks of at most *size*."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _is_transient_tool_error(error: str) -> bool:
+    lowered: str = error.lower()
+    return "429" in error or "rate limit" in lowered or "500" in error or "502" in error or "503" in error
+
+
+async def _run_tool_for_item(
+    *,
+    limiter: Any,
+    operation_id: str,
+    item_index: int,
+    tool_name: str,
+    rendered_params: dict[str, Any],
+    organization_id: str,
+    user_id: Optional[str],
+) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
+    """Rate-limit and run one item's tool call, retrying transient errors.
+
+    Returns ``(success, error, result_data)``.
+    """
+    from agents.tools import execute_tool
+
+    result_data: Optional[dict[str, Any]] = None
+    for attempt in range(_ITEM_MAX_RETRIES + 1):
+        # Acquire rate-limit token before each attempt
+        acquired: bool = await limiter.acquire(timeout=300)
+        if not acquired:
+            raise RateLimitTimeout("Rate-limit token acquisition timed out (300s)")
+
+        try:
+            result_data = await execute_tool(
+                tool_name=tool_name,
+                tool_input=rendered_params,
+                organization_id=organization_id,
+                user_id=user_id,
+            )
+        except Exception as exc:
+            logger.error(
+                "[BulkOp] Item %d failed for op %s: %s",
+                item_index, operation_id[:8], exc,
+            )
+            return False, str(exc), result_data
+
+        # Treat result with "error" key as failure
+        if isinstance(result_data, dict) and "error" in result_data:
+            error_str: str = str(result_data["error"])
+            if attempt < _ITEM_MAX_RETRIES and _is_transient_tool_error(error_str):
+                backoff: float = _ITEM_BASE_BACKOFF_SECONDS * (2 ** attempt)
+                logger.warning(
+                    "[BulkOp] Item %d transient error (attempt %d/%d), retrying in %.1fs: %s",
+                    item_index, attempt + 1, _ITEM_MAX_RETRIES, backoff, error_str[:200],
+                )
+                await asyncio.sleep(backoff)
+                continue
+            return False, error_str, result_data
+        return True, None, result_data
+
+    return False, "Exhausted retries", result_data
+
+
+async def _record_progress(
+    r: Any,
+    *,
+    operation_id: str,
+    organization_id: str,
+    succeeded: int,
+    failed: int,
+) -> None:
+    """Bump the Redis counters and finalise the operation if this finished it."""
+    from models.database import get_session
+    from models.bulk_operation import BulkOperation
+
+    pipe = r.pipeline()
+    pipe.incrby(_redis_key(operation_id, "completed"), succeeded + failed)
+    pipe.incrby(_redis_key(operation_id, "succeeded"), succeeded)
+    pipe.incrby(_redis_key(operation_id, "failed"), failed)
+    pipe.get(_redis_key(operation_id, "total"))
+    new_completed, final_succeeded, final_failed, total_raw = await pipe.execute()
+    total_items: int = int(total_raw) if total_raw else 0
+
+    # Exactly one writer sees its increment cross the total.
+    if total_items <= 0 or new_completed < total_items or new_completed - (succeeded + failed) >= total_items:
+        return
+
+    logger.info(
+        "[BulkOp] Last item done for operation %s — finalising",
+        operation_id[:8],
+    )
+    async with get_session(organization_id=organization_id) as session:
+        op_result = await session.execute(
+            select(BulkOperation).where(BulkOperation.id == UUID(operation_id))
+        )
+        op: BulkOperation = op_result.scalar_one()
+        op.status = "completed"
+        op.completed_items = int(new_completed)
+        op.succeeded_items = int(final_succeeded)
+        op.failed_items = int(final_failed)
+        op.completed_at = datetime.now(timezone.utc)
+        await session.commit()
+
+    # Clean up Redis keys
+    await r.delete(*(_redis_key(operation_id, field) for field in ("completed", "succeeded", "failed", "total")))
+
+
+# ---------------------------------------------------------------------------
+# Batch worker task
+# ---------------------------------------------------------------------------
+
+@celery_app.task(
+    bind=True,
+    name="workers.tasks.bulk_operations.bulk_tool_run_batch",
+    acks_late=True,          # Re-deliver on worker crash
+    reject_on_worker_lost=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    max_retries=3,
+    soft_time_limit=30 * 60,
+    time_limit=30 * 60 + 60,
+)
+def bulk_tool_run_batch(
+    self: Any,
+    *,
+    operation_id: str,
+    items: list[list[Any]],
+    tool_name: str,
+    params_template: dict[str, Any],
+    organization_id: str,
+    user_id: Optional[str],
+    rate_limit_key: str,
+    rate_limit_per_minute: int,
+    redis_url: str,
+) -> dict[str, Any]:
+    """Process a chunk of ``[item_index, item_data]`` pairs concurrently."""
+    return run_async(
+        _bulk_tool_run_batch_async(
+            operation_id=operation_id,
+            items=[(int(idx), item) for idx, item in items],
+            tool_name=tool_name,
+            params_template=params_template,
+            organization_id=organization_id,
+            user_id=user_id,
+            rate_limit_key=rate_limit_key,
+            rate_limit_per_minute=rate_limit_per_minute,
+            redis_url=redis_url,
+        )
+    )
+
+
+async def _bulk_tool_run_batch_async(
+    *,
+    operation_id: str,
+    items: list[tuple[int, dict[str, Any]]],
+    tool_name: str,
+    params_template: dict[str, Any],
+    organization_id: str,
+    user_id: Optional[str],
+    rate_limit_key: str,
+    rate_limit_per_minute: int,
+    redis_url: str,
+) -> dict[str, Any]:
+    """Async implementation of batch processing."""
+    import redis.asyncio as aioredis
+    from sqlalchemy import insert
+    from models.database import get_session
+    from models.bulk_operation import BulkOperationResult
+    from workers.rate_limiter import RedisRateLimiter
+
+    # A redelivered batch skips items whose results were already written.
+    async with get_session(organization_id=organization_id) as session:
+        existing = await session.execute(
+            select(BulkOperationResult.item_index).where(
+                BulkOperationResult.bulk_operation_id == UUID(operation_id),
+                BulkOperationResult.item_index.in_([idx for idx, _ in items]),
+            )
+        )
+        done_indices: set[int] = {row[0] for row in existing.all()}
+    pending: list[tuple[int, dict[str, Any]]] = [
+        (idx, item) for idx, item in items if idx not in done_indices
+    ]
+    if not pending:
+        return {"processed": 0, "succeeded": 0, "failed": 0, "skipped": len(items)}
+
+    r: aioredis.Redis = aioredis.from_url(redis_url, decode_responses=True)
+    limiter = RedisRateLimiter(
+        redis_url=redis_url,
+        key=rate_limit_key,
+        rate_per_minute=rate_limit_per_minute,
+        redis_client=r,
+    )
+    # At low rates, keep no more than ~10s of tokens waiting per batch so
+    # items are not queued past the acquire timeout.
+    slots = asyncio.Semaphore(max(1, min(_BATCH_CONCURRENCY, rate_limit_per_minute // 6)))
+
+    async def _run(idx: int, item: dict[str, Any]) -> Optional[dict[str, Any]]:
+        async with slots:
+            try:
+                success, error_msg, result_data = await _run_tool_for_item(
+                    limiter=limiter,
+                    operation_id=operation_id,
+                    item_index=idx,
+                    tool_name=tool_name,
+                    rendered_params=_render_template(params_template, item),
+                    organization_id=organization_id,
+                    user_id=user_id,
+                )
+            except RateLimitTimeout:
+                # Not attempted: no row, so the batch retry picks it up.
+                return None
+            except Exception as exc:
+                success, error_msg, result_data = False, str(exc), None
+        return {
+            "bulk_operation_id": UUID(operation_id),
+            "item_index": idx,
+            "item_data": item,
+            "result_data": result_data,
+            "success": success,
+            "error": error_msg,
+        }
+
+    rows: list[dict[str, Any]] = []
+    unflushed: list[dict[str, Any]] = []
+    not_attempted: int = 0
+
+    async def _flush() -> None:
+        if not unflushed:
+            return
+        batch, unflushed[:] = list(unflushed), []
+        async with get_session(organization_id=organization_id) as session:
+            await session.execute(insert(BulkOperationResult), batch)
+            await session.commit()
+        ok: int = sum(1 for row in batch if row["success"])
+        await _record_progress(
+            r,
+            operation_id=operation_id,
+            organization_id=organization_id,
+            succeeded=ok,
+            failed=len(batch) - ok,
+        )
+
+    try:
+        # Results are written in groups, but often enough that the foreach
+        # poller's stale-progress check keeps seeing movement at low rates.
+        last_flush: float = time.monotonic()
+        for finished in asyncio.as_completed([_run(idx, item) for idx, item in pending]):
+            row = await finished
+            if row is None:
+                not_attempted += 1
+                continue
+            rows.append(row)
+            unflushed.append(row)
+            if len(unflushed) >= _FLUSH_EVERY_ITEMS or time.monotonic() - last_flush >= _FLUSH_EVERY_SECONDS:
+                await _flush()
+                last_flush = time.monotonic()
+        await _flush()
+    finally:
+        await limiter.close()
+        await r.close()
+
+    if not_attempted:
+        # Celery autoretry re-runs the batch; written items are skipped.
+        raise RateLimitTimeout(
+            f"{not_attempted} item(s) timed out waiting for a rate-limit token"
+        )
+
+    succeeded: int = sum(1 for row in rows if row["success"])
+    logger.info(
+        "[BulkOp] Batch done for op %s: %d items (%d ok, %d skipped)",
+        operation_id[:8], len(rows), succeeded, len(items) - len(pending),
+    )
+    return {
+        "processed": len(rows),
+        "succeeded": succeeded,
+        "failed": len(rows) - succeeded,
+        "skipped": len(items) - len(pending),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Per-item worker task
 # ---------------------------------------------------------------------------
@@ -157,120 +469,49 @@ async def _bulk_tool_run_item_async(
     import redis.asyncio as aioredis
     from models.database import get_session
     from models.bulk_operation import BulkOperationResult
-    from agents.tools import execute_tool
     from workers.rate_limiter import RedisRateLimiter
 
-    # Retry config for transient errors (rate-limit 429, server errors, etc.)
-    max_retries: int = 5
-    base_backoff: float = 5.0  # seconds
-
-    success: bool = False
-    error_msg: Optional[str] = None
-    result_data: Optional[dict[str, Any]] = None
-
-    for attempt in range(max_retries + 1):
-        # Acquire rate-limit token before each attempt
-        limiter = RedisRateLimiter(
-            redis_url=redis_url,
-            key=rate_limit_key,
-            rate_per_minute=rate_limit_per_minute,
+    r: aioredis.Redis = aioredis.from_url(redis_url, decode_responses=True)
+    limiter = RedisRateLimiter(
+        redis_url=redis_url,
+        key=rate_limit_key,
+        rate_per_minute=rate_limit_per_minute,
+        redis_client=r,
+    )
+    try:
+        success, error_msg, result_data = await _run_tool_for_item(
+            limiter=limiter,
+            operation_id=operation_id,
+            item_index=item_index,
+            tool_name=tool_name,
+            rendered_params=rendered_params,
+            organization_id=organization_id,
+            user_id=user_id,
         )
-        try:
-            acquired: bool = await limiter.acquire(timeout=300)
-            if not acquired:
-                raise RuntimeError("Rate-limit token acquisition timed out (300s)")
-        finally:
-            await limiter.close()
 
-        # Execute the tool
-        try:
-            result_data = await execute_tool(
-                tool_name=tool_name,
-                tool_input=rendered_params,
-                organization_id=organization_id,
-                user_id=user_id,
-            )
-            # Treat result with "error" key as failure
-            if isinstance(result_data, dict) and "error" in result_data:
-                error_str: str = str(result_data["error"])
-                # Retry on rate-limit (429) or server errors (5xx)
-                if attempt < max_retries and ("429" in error_str or "rate limit" in error_str.lower() or "500" in error_str or "502" in error_str or "503" in error_str):
-                    backoff: float = base_backoff * (2 ** attempt)
-                    logger.warning(
-                        "[BulkOp] Item %d transient error (attempt %d/%d), retrying in %.1fs: %s",
-                        item_index, attempt + 1, max_retries, backoff, error_str[:200],
-                    )
-                    await asyncio.sleep(backoff)
-                    continue
-                error_msg = error_str
-                success = False
-            else:
-                success = True
-        except Exception as exc:
-            error_msg = str(exc)
-            success = False
-            logger.error(
-                "[BulkOp] Item %d failed for op %s: %s",
-                item_index, operation_id[:8], error_msg,
+        # Persist result row
+        async with get_session(organization_id=organization_id) as session:
+            result_row = BulkOperationResult(
+                bulk_operation_id=UUID(operation_id),
+                item_index=item_index,
+                item_data=item_data,
+                result_data=result_data,
+                success=success,
+                error=error_msg,
             )
-        break  # Exit retry loop on success or non-retryable error
+            session.add(result_row)
+            await session.commit()
 
-    # Persist result row
-    async with get_session(organization_id=organization_id) as session:
-        result_row = BulkOperationResult(
-            bulk_operation_id=UUID(operation_id),
-            item_index=item_index,
-            item_data=item_data,
-            result_data=result_data,
-            success=success,
-            error=error_msg,
+        # Increment Redis progress counters and finalise if we're the last item
+        await _record_progress(
+            r,
+            operation_id=operation_id,
+            organization_id=organization_id,
+            succeeded=1 if success else 0,
+            failed=0 if success else 1,
         )
-        session.add(result_row)
-        await session.commit()
-
-    # Increment Redis progress counters (atomic) and check if we're the last item
-    r: aioredis.Redis = aioredis.from_url(redis_url, decode_responses=True)
-    try:
-        pipe = r.pipeline()
-        pipe.incr(_redis_key(operation_id, "completed"))
-        if success:
-            pipe.incr(_redis_key(operation_id, "succeeded"))
-        else:
-            pipe.incr(_redis_key(operation_id, "failed"))
-        counters: list[int] = await pipe.execute()
-        new_completed: int = counters[0]  # result of INCR completed
-
-        # If this was the last item, finalise the operation
-        total_raw: str | None = await r.get(_redis_key(operation_id, "total"))
-        total_items: int = int(total_raw) if total_raw else 0
-
-        if total_items > 0 and new_completed >= total_items:
-            logger.info(
-                "[BulkOp] Last item done for operation %s — finalising",
-                operation_id[:8],
-            )
-            succeeded_raw: str | None = await r.get(_redis_key(operation_id, "succeeded"))
-            failed_raw: str | None = await r.get(_redis_key(operation_id, "failed"))
-            final_succeeded: int = int(succeeded_raw) if succeeded_raw else 0
-            final_failed: int = int(failed_raw) if failed_raw else 0
-
-            async with get_session(organization_id=organization_id) as session:
-                from models.bulk_operation import BulkOperation
-                op_result = await session.execute(
-                    select(BulkOperation).where(BulkOperation.id == UUID(operation_id))
-                )
-                op: BulkOperation = op_result.scalar_one()
-                op.status = "completed"
-                op.completed_items = new_completed
-                op.succeeded_items = final_succeeded
-                op.failed_items = final_failed
-                op.completed_at = datetime.now(timezone.utc)
-                await session.commit()
-
-            # Clean up Redis keys
-            for field in ("completed", "succeeded", "failed", "total"):
-                await r.delete(_redis_key(operation_id, field))
     finally:
+        await limiter.close()
         await r.close()
 
     return {
@@ -460,38 +701,37 @@ async def _bulk_tool_run_coordinator_async(
     finally:
         await r.close()
 
-    # --- Fan out per-item tasks ---
+    # --- Fan out batch tasks ---
     rate_limit_key: str = f"bulk_op:{operation_id}"
 
     task_signatures = [
-        bulk_tool_run_item.s(
+        bulk_tool_run_batch.s(
             operation_id=operation_id,
-            item_index=idx,
-            item_data=item,
+            items=[[idx, item] for idx, item in chunk],
             tool_name=tool_name,
-            rendered_params=_render_template(params_template, item),
+            params_template=params_template,
             organization_id=organization_id,
             user_id=user_id,
             rate_limit_key=rate_limit_key,
             rate_limit_per_minute=rate_limit_per_minute,
             redis_url=redis_url,
         )
-        for idx, item in remaining_items
+        for chunk in _chunk(remaining_items, BULK_BATCH_SIZE)
     ]
 
     if task_signatures:
         job = celery_group(task_signatures)
         job.apply_async()
         logger.info(
-            "[BulkOp] Dispatched %d tasks for operation %s",
-            len(task_signatures), operation_id[:8],
+            "[BulkOp] Dispatched %d batch tasks (%d items) for operation %s",
+            len(task_signatures), remaining_count, operation_id[:8],
         )
 
     # Coordinator returns immediately after dispatch.
     # Progress polling is handled by _poll_bulk_operation in agents/tools.py
-    # (called inline by the foreach tool).  Each bulk_tool_run_item updates
-    # Redis counters; the last item to finish checks if completed == total
-    # and flips the DB status to "completed".
+    # (called inline by the foreach tool).  Each batch updates the Redis
+    # counters; the one whose increment reaches the total flips the DB
+    # status to "completed".
     logger.info(
         "[BulkOp] Coordinator done for operation %s — dispatched %d items, returning",
         operation_id[:8], remaining_count,
@@ -179,7 +179,13 @@ async def _sync_integration(
     """
     from connectors.base import SyncCancelledError
     from connectors.registry import Capability, discover_connectors
-    from services.embedding_sync import generate_embeddings_for_organization
+    from services.embedding_sync import (
+        POST_SYNC_EMBEDDING_LIMIT,
+        embed_recently_synced_activities,
+        generate_embeddings_for_organization,
+    )
+    from services.app_query_cache import invalidate_app_query_results
+    from services.table_counts import invalidate_table_counts
     from workers.events import emit_event
 
     connectors = discover_connectors()
@@ -233,14 +239,22 @@ async def _sync_integration(
         await _clear_last_errors_for_integration(organization_id, provider, user_id)
 
         await connector.mark_sync_started()
+        sync_started_at: datetime = datetime.utcnow()
         counts = await connector.sync_all()
         await connector.update_last_sync(counts)
+        await invalidate_table_counts(organization_id)
+        await invalidate_app_query_results(organization_id)
 
-        # Generate embeddings for newly synced activities
+        # Embed what this sync wrote first, then spend any budget left on the backlog
         try:
-            embedded_count = await generate_embeddings_for_organization(
-                organization_id, limit=500
+            embedded_count = await embed_recently_synced_activities(
+                organization_id, sync_started_at, limit=POST_SYNC_EMBEDDING_LIMIT
             )
+            backlog_limit: int = POST_SYNC_EMBEDDING_LIMIT - embedded_count
+            if backlog_limit > 0:
+                embedded_count += await generate_embeddings_for_organization(
+                    organization_id, limit=backlog_limit
+                )
             logger.info(f"Generated embeddings for {embedded_count} activities")
         except Exception as embed_err:
             logger.warning(f"Embedding generation failed: {embed_err}")
@@ -20,17 +20,28 @@ if str(_backend_dir) not in sys.path:
 
 import json
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from workers.celery_app import celery_app
 from services.automated_agent_footer import ensure_automated_agent_footer
+from services.context_cache import invalidate_org_context
 from services.anthropic_health import report_anthropic_call_failure, report_anthropic_call_success
 from services.workflow_pause import get_workflow_execution_pause_until
 
 logger = logging.getLogger(__name__)
 
+# Events popped per Redis round trip, and batches drained per task run.
+_EVENT_BATCH_SIZE = 500
+_EVENT_MAX_BATCHES_PER_RUN = 20
+
+# Due schedule workflows locked per transaction, and transactions per check.
+_SCHEDULER_BATCH_SIZE = 200
+_SCHEDULER_MAX_BATCHES = 10
+# Rows with a missing or unparsable cron are skipped until then.
+_SCHEDULER_RECHECK_INVALID = timedelta(hours=1)
+
 WORKFLOW_NESTING_GUARDRAIL = (
     "Execution guardrail: Do NOT create or invoke child workflows (via "
     "create_workflow, run_workflow, or foreach) unless the user or workflow "
@@ -710,14 +721,15 @@ from workers.run_async import run_async
 async def _check_scheduled_workflows() -> dict[str, Any]:
     """
     Check for workflows scheduled to run now.
-    
-    Queries the database for enabled workflows with schedule triggers
-    that are due to run.
+
+    Selects only enabled schedule workflows whose ``next_run_at`` is due or
+    not yet computed, locking them with ``FOR UPDATE SKIP LOCKED`` so
+    concurrent beat instances split the work instead of double-firing.
+    Each row's ``next_run_at`` is advanced before the lock is released.
     """
-    from sqlalchemy import select, and_
+    from sqlalchemy import select, and_, or_
     from models.database import get_admin_session
     from models.workflow import Workflow
-    from croniter import croniter
     
     now = datetime.utcnow()
     pause_until = await get_workflow_execution_pause_until()
@@ -736,47 +748,54 @@ async def _check_scheduled_workflows() -> dict[str, Any]:
     
     # Admin session: iterates across ALL organizations' workflows
     async with get_admin_session() as session:
-        # Get all enabled scheduled workflows
-        result = await session.execute(
-            select(Workflow).where(
-                and_(
-                    Workflow.is_enabled == True,
-                    Workflow.trigger_type == "schedule",
+        for _ in range(_SCHEDULER_MAX_BATCHES):
+            result = await session.execute(
+                select(Workflow)
+                .where(
+                    and_(
+                        Workflow.is_enabled == True,
+                        Workflow.trigger_type == "schedule",
+                        or_(Workflow.next_run_at.is_(None), Workflow.next_run_at <= now),
+                    )
                 )
+                .order_by(Workflow.next_run_at.asc().nulls_first())
+                .limit(_SCHEDULER_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
             )
-        )
-        workflows = result.scalars().all()
-        
-        for workflow in workflows:
-            try:
-                # Check if workflow should run based on cron schedule
-                cron_expr = workflow.trigger_config.get("cron")
-                if not cron_expr:
-                    continue
-                
-                # Get the last scheduled run time
-                cron = croniter(cron_expr, workflow.last_run_at or workflow.created_at)
-                next_run = cron.get_next(datetime)
-                
-                if next_run <= now:
-                    # Queue workflow for execution
-                    execute_workflow.delay(
-                        workflow_id=str(workflow.id),
-                        triggered_by="schedule",
-                        trigger_data=None,
-                        conversation_id=None,
-                        organization_id=str(workflow.organization_id),
-                    )
-                    triggered.append(str(workflow.id))
+            workflows = result.scalars().all()
+            
+            for workflow in workflows:
+                try:
+                    next_run = workflow.next_run_at or workflow.compute_next_run_at()
+                    if next_run is None:
+                        # No cron: look again later (edits reset next_run_at).
+                        workflow.next_run_at = now + _SCHEDULER_RECHECK_INVALID
+                        continue
                     
-                    # Update last_run_at
-                    workflow.last_run_at = now
+                    if next_run <= now:
+                        # Queue workflow for execution
+                        execute_workflow.delay(
+                            workflow_id=str(workflow.id),
+                            triggered_by="schedule",
+                            trigger_data=None,
+                            conversation_id=None,
+                            organization_id=str(workflow.organization_id),
+                        )
+                        triggered.append(str(workflow.id))
+                        
+                        # Update last_run_at
+                        workflow.last_run_at = now
+                        next_run = workflow.compute_next_run_at(after=now)
                     
-            except Exception as e:
-                logger.error(f"Error checking workflow {workflow.id}: {e}")
-        
-        if triggered:
+                    workflow.next_run_at = next_run
+                        
+                except Exception as e:
+                    logger.error(f"Error checking workflow {workflow.id}: {e}")
+                    workflow.next_run_at = now + _SCHEDULER_RECHECK_INVALID
+            
             await session.commit()
+            if len(workflows) < _SCHEDULER_BATCH_SIZE:
+                break
     
     return {
         "checked_at": now.isoformat(),
@@ -787,12 +806,12 @@ async def _check_scheduled_workflows() -> dict[str, Any]:
 async def _process_pending_events() -> dict[str, Any]:
     """
     Process pending events and trigger matching workflows.
+
+    Drains the queue in batches of ``_EVENT_BATCH_SIZE``; matching uses the
+    cached event-type index from ``workers.events.get_event_triggers``.
     """
-    from sqlalchemy import select, and_
-    from models.database import get_admin_session
-    from models.workflow import Workflow
-    from workers.events import get_pending_events
-    
+    from workers.events import get_event_triggers, get_pending_events
+
     pause_until = await get_workflow_execution_pause_until()
     if pause_until is not None:
         logger.warning(
@@ -805,48 +824,39 @@ async def _process_pending_events() -> dict[str, Any]:
             "paused_until": pause_until.isoformat(),
         }
 
-    events = await get_pending_events(limit=100)
-    if not events:
-        return {"events_processed": 0, "workflows_triggered": []}
-    
+    processed = 0
     triggered: list[dict[str, str]] = []
-    
-    # Admin session: iterates across events from ALL organizations
-    async with get_admin_session() as session:
+
+    for _ in range(_EVENT_MAX_BATCHES_PER_RUN):
+        events = await get_pending_events(limit=_EVENT_BATCH_SIZE)
+        if not events:
+            break
+        processed += len(events)
+
+        triggers = await get_event_triggers(event["organization_id"] for event in events)
         for event in events:
             event_type = event["type"]
             org_id = event["organization_id"]
-            
-            # Find workflows triggered by this event type
-            result = await session.execute(
-                select(Workflow).where(
-                    and_(
-                        Workflow.organization_id == UUID(org_id),
-                        Workflow.is_enabled == True,
-                        Workflow.trigger_type == "event",
-                    )
+
+            for workflow_id in triggers.get(org_id, {}).get(event_type, []):
+                # Queue workflow for execution with event data
+                execute_workflow.delay(
+                    workflow_id=workflow_id,
+                    triggered_by=f"event:{event_type}",
+                    trigger_data=event["data"],
+                    conversation_id=None,
+                    organization_id=org_id,
                 )
-            )
-            workflows = result.scalars().all()
-            
-            for workflow in workflows:
-                trigger_event = workflow.trigger_config.get("event")
-                if trigger_event == event_type:
-                    # Queue workflow for execution with event data
-                    execute_workflow.delay(
-                        workflow_id=str(workflow.id),
-                        triggered_by=f"event:{event_type}",
-                        trigger_data=event["data"],
-                        conversation_id=None,
-                        organization_id=org_id,
-                    )
-                    triggered.append({
-                        "workflow_id": str(workflow.id),
-                        "event_type": event_type,
-                    })
-    
+                triggered.append({
+                    "workflow_id": workflow_id,
+                    "event_type": event_type,
+                })
+
+        if len(events) < _EVENT_BATCH_SIZE:
+            break
+
     return {
-        "events_processed": len(events),
+        "events_processed": processed,
         "workflows_triggered": triggered,
     }
 
@@ -1191,6 +1201,11 @@ async def _fail_workflow_run(
 
     await session.commit()
 
+    if is_first_run_attempt:
+        from workers.events import invalidate_event_triggers
+
+        await invalidate_event_triggers(workflow.organization_id)
+
 
 async def _execute_workflow_via_agent(
     workflow: Any,
@@ -1237,6 +1252,7 @@ async def _execute_workflow_via_agent(
         workflow_creator_user_id=workflow.created_by_user_id,
         triggered_by_user_id=triggered_by_user_id,
     )
+    participants_changed: bool = False
 
     # Use existing conversation or create a new one
     if existing_conversation_id:
@@ -1274,6 +1290,7 @@ async def _execute_workflow_via_agent(
             )
             if merged_participants != (conversation.participating_user_ids or []):
                 conversation.participating_user_ids = merged_participants
+                participants_changed = True
                 logger.info(
                     "[Workflow] Updated existing workflow conversation participants "
                     "workflow_id=%s conversation_id=%s participants=%s",
@@ -1321,6 +1338,9 @@ async def _execute_workflow_via_agent(
     # IMPORTANT: Commit the conversation so the orchestrator's separate session can see it
     # The orchestrator uses its own sessions for saving messages, which won't see uncommitted data
     await session.commit()
+    if participants_changed:
+        # Cached context profiles embed the participants' job memories.
+        await invalidate_org_context(str(workflow.organization_id))
     
     # Set conversation_id in output early so UI can link to it while running
     run.output = {"conversation_id": str(conversation.id)}
@@ -1559,8 +1579,9 @@ async def _execute_workflow_via_agent(
         )
     run.completed_at = datetime.utcnow()
     
-    # Update workflow last_run_at
+    # Update workflow last_run_at (the cron schedule counts from it)
     workflow.last_run_at = datetime.utcnow()
+    workflow.next_run_at = workflow.compute_next_run_at()
     
     await session.commit()
     
@@ -1618,8 +1639,9 @@ async def _execute_workflow_legacy(
         run.steps_completed = steps_completed
         run.completed_at = datetime.utcnow()
         
-        # Update workflow last_run_at
+        # Update workflow last_run_at (the cron schedule counts from it)
         workflow.last_run_at = datetime.utcnow()
+        workflow.next_run_at = workflow.compute_next_run_at()
         
         await session.commit()
         
@@ -2337,7 +2359,8 @@ def process_pending_events(self: Any) -> dict[str, Any]:
     """
     Celery task to process pending events.
     
-    This runs frequently to handle event-triggered workflows.
+    Scheduled by ``emit_event`` right after new events arrive, and every
+    10 seconds via Beat as a fallback.
     """
     return run_async(_process_pending_events())
 